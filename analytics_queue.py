@@ -0,0 +1,212 @@
+# analytics_queue.py - Gepufferte Analytics-Ingestion für Didis Trading Academy
+"""
+Asynchrones, gebündeltes Visitor-Tracking:
+- Requests legen Analytics-Events nur in eine begrenzte In-Process-Queue
+- Ein Hintergrund-Thread schreibt die Events gesammelt per Bulk-Insert
+- Flush wird ausgelöst durch Batch-Größe ODER Zeitintervall
+- Bei voller Queue werden Events verworfen (Backpressure) und gezählt
+- Beim Worker-Shutdown wird der Rest-Puffer sauber geschrieben
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_WAKEUP = object()  # weckt den Writer beim Shutdown aus queue.get()
+
+
+class AnalyticsQueue:
+    """Bounded Queue + Background-Writer für VisitorAnalytics-Einträge"""
+
+    def __init__(self, app=None, db=None, model=None, maxsize=10000, batch_size=200, flush_interval=2.0):
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.app = None
+        self.db = None
+        self.model = None
+        self.enabled = True
+
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._pid = None
+
+        # Zähler für Monitoring
+        self.enqueued = 0
+        self.dropped = 0
+        self.flushed = 0
+        self.failed = 0
+        self.batches = 0
+        self.last_flush_at = None
+
+        if app is not None:
+            self.init_app(app, db, model)
+
+    def init_app(self, app, db, model):
+        """Konfiguriert die Queue aus app.config und registriert den Shutdown-Flush"""
+        self.app = app
+        self.db = db
+        self.model = model
+
+        self.enabled = app.config.get('ANALYTICS_ASYNC', True)
+        self.batch_size = app.config.get('ANALYTICS_BATCH_SIZE', self.batch_size)
+        self.flush_interval = app.config.get('ANALYTICS_FLUSH_INTERVAL', self.flush_interval)
+
+        maxsize = app.config.get('ANALYTICS_QUEUE_SIZE', self.maxsize)
+        if maxsize != self.maxsize:
+            self.maxsize = maxsize
+            self._queue = queue.Queue(maxsize=maxsize)
+
+        atexit.register(self.shutdown)
+
+    # === PRODUCER-SEITE (Request-Thread) ===
+
+    def push(self, row):
+        """
+        Legt ein Analytics-Event (dict mit Spaltenwerten) in die Queue.
+
+        Returns:
+            bool: True wenn angenommen, False wenn verworfen (Queue voll)
+        """
+        if not self.enabled:
+            self._write_batch([row])
+            return True
+
+        self._ensure_worker()
+
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+        with self._lock:
+            self.enqueued += 1
+        return True
+
+    # === CONSUMER-SEITE (Background-Writer) ===
+
+    def _ensure_worker(self):
+        """Startet den Writer-Thread lazy - auch nach einem Gunicorn-Fork neu"""
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+
+            self._pid = os.getpid()
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='analytics-writer')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        """Writer-Loop: sammelt bis batch_size oder flush_interval erreicht ist"""
+        while not self._stop_event.is_set():
+            batch = self._collect_batch()
+            if batch:
+                self._write_batch(batch)
+
+        # Rest-Puffer nach Stop-Signal leeren
+        self._drain()
+
+    def _collect_batch(self):
+        """Blockiert bis zum ersten Event und sammelt dann bis Größe/Zeit-Limit"""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0 or self._stop_event.is_set():
+                break
+            try:
+                row = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if row is _WAKEUP:
+                break
+            batch.append(row)
+
+        return batch
+
+    def _drain(self):
+        """Schreibt alle noch gepufferten Events in Batches"""
+        while True:
+            batch = []
+            try:
+                while len(batch) < self.batch_size:
+                    row = self._queue.get_nowait()
+                    if row is not _WAKEUP:
+                        batch.append(row)
+            except queue.Empty:
+                pass
+
+            if not batch:
+                if self._queue.empty():
+                    return
+                continue
+            self._write_batch(batch)
+
+    def _write_batch(self, batch):
+        """Ein Bulk-Insert pro Batch in eigener Session-Transaktion"""
+        with self.app.app_context():
+            try:
+                self.db.session.execute(self.model.__table__.insert(), batch)
+                self.db.session.commit()
+                with self._lock:
+                    self.flushed += len(batch)
+                    self.batches += 1
+                    self.last_flush_at = time.time()
+            except Exception as e:
+                # Fehler beim Tracking sollen die App nicht crashen
+                logger.error(f"Analytics Bulk-Insert Fehler ({len(batch)} Events): {e}")
+                self.db.session.rollback()
+                with self._lock:
+                    self.failed += len(batch)
+            finally:
+                self.db.session.remove()
+
+    # === STEUERUNG & MONITORING ===
+
+    def flush(self):
+        """Schreibt den aktuellen Puffer synchron (z.B. für Tests oder Admin-Aktionen)"""
+        self._drain()
+
+    def shutdown(self, timeout=5.0):
+        """Stoppt den Writer und schreibt verbleibende Events (atexit)"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and self._pid == os.getpid():
+            # Writer wartet evtl. in queue.get() auf das Zeitlimit - aufwecken, damit er
+            # seinen angefangenen Batch schreibt (bei voller Queue kehrt get() ohnehin sofort zurück)
+            try:
+                self._queue.put_nowait(_WAKEUP)
+            except queue.Full:
+                pass
+            thread.join(timeout)
+        self._drain()
+
+    def stats(self):
+        """Zähler für Monitoring/Admin-Dashboard"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'queue_size': self._queue.qsize(),
+                'queue_capacity': self.maxsize,
+                'enqueued': self.enqueued,
+                'dropped': self.dropped,
+                'flushed': self.flushed,
+                'failed': self.failed,
+                'batches': self.batches,
+                'last_flush_at': self.last_flush_at
+            }
@@ -0,0 +1,199 @@
+# analytics_retention.py - Indizes und Aufbewahrung für visitor_analytics
+"""
+Hält die Rohdaten-Tabelle visitor_analytics klein:
+- module_slug wird beim Tracking normalisiert gespeichert (statt LIKE '%/module/%')
+- Bestehende Datenbanken bekommen Spalte + Indizes per Migration nachgerüstet
+- Rohdaten älter als ANALYTICS_RETENTION_DAYS werden in komprimierte
+  Monatsdateien (JSON Lines, gzip) archiviert und batchweise gelöscht
+- Es wird nur archiviert, was bereits in die Rollups verdichtet wurde
+- ANALYTICS_ARCHIVE_DIR muss auf ein persistentes Volume zeigen (z.B. Railway-Volume):
+  das Container-Dateisystem geht beim Redeploy verloren, die Rohdaten sind dann weg.
+  Ohne explizit gesetztes Verzeichnis wird nichts gelöscht; relative Pfade gelten
+  relativ zu app.root_path (nicht zum Arbeitsverzeichnis des Prozesses)
+"""
+
+import gzip
+import json
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+
+from sqlalchemy import bindparam, inspect, text
+
+logger = logging.getLogger(__name__)
+
+MODULE_PATH_PREFIX = '/module/'
+
+
+def module_slug_from_url(url):
+    """Modul-Slug aus einer Seiten-URL (/module/<slug>) oder None"""
+    if not url:
+        return None
+    path = urlsplit(url).path
+    if not path.startswith(MODULE_PATH_PREFIX):
+        return None
+    slug = path[len(MODULE_PATH_PREFIX):].strip('/').split('/')[0]
+    return slug[:200] or None
+
+
+def migrate_visitor_analytics(db, VisitorAnalytics, batch_size=5000):
+    """
+    Rüstet module_slug und die Indizes in bestehenden Datenbanken nach
+    (create_all legt beides nur für neue Tabellen an).
+    """
+    table = VisitorAnalytics.__table__
+    inspector = inspect(db.engine)
+    columns = [col['name'] for col in inspector.get_columns(table.name)]
+
+    if 'module_slug' not in columns:
+        logger.info("[MIGRATION] Füge visitor_analytics.module_slug hinzu...")
+        db.session.execute(text(f"ALTER TABLE {table.name} ADD COLUMN module_slug VARCHAR(200)"))
+        db.session.commit()
+        backfill_module_slugs(db, VisitorAnalytics, batch_size)
+
+    existing = {index['name'] for index in inspector.get_indexes(table.name)}
+    for index in table.indexes:
+        if index.name not in existing:
+            logger.info(f"[MIGRATION] Erstelle Index {index.name}...")
+            index.create(bind=db.engine, checkfirst=True)
+
+
+def backfill_module_slugs(db, VisitorAnalytics, batch_size=5000):
+    """Befüllt module_slug für Alt-Daten (nur Zeilen mit /module/ in der URL)"""
+    table = VisitorAnalytics.__table__
+    last_id = 0
+    updated = 0
+    while True:
+        rows = db.session.execute(
+            table.select().with_only_columns(table.c.id, table.c.page_url)
+            .where(table.c.id > last_id, table.c.page_url.like(f'%{MODULE_PATH_PREFIX}%'))
+            .order_by(table.c.id).limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        values = [
+            {'row_id': row.id, 'slug': slug}
+            for row in rows
+            if (slug := module_slug_from_url(row.page_url))
+        ]
+        if values:
+            db.session.execute(
+                table.update().where(table.c.id == bindparam('row_id')).values(module_slug=bindparam('slug')),
+                values
+            )
+        db.session.commit()
+        updated += len(values)
+    if updated:
+        logger.info(f"[MIGRATION] module_slug für {updated} Einträge nachgetragen")
+    return updated
+
+
+class AnalyticsRetention:
+    """Archiviert alte Rohdaten in Monatsdateien und löscht sie batchweise"""
+
+    def __init__(self, app=None, db=None, VisitorAnalytics=None):
+        self.retention_days = 400
+        self.archive_dir = 'analytics_archive'
+        self.archive_configured = False  # nur mit explizitem ANALYTICS_ARCHIVE_DIR wird gelöscht
+        self.batch_size = 5000
+
+        # Zähler für Monitoring
+        self.archived = 0
+        self.last_run_at = None
+
+        if app is not None:
+            self.init_app(app, db, VisitorAnalytics)
+
+    def init_app(self, app, db, VisitorAnalytics):
+        self.db = db
+        self.VisitorAnalytics = VisitorAnalytics
+        self.retention_days = app.config.get('ANALYTICS_RETENTION_DAYS', self.retention_days)
+        archive_dir = app.config.get('ANALYTICS_ARCHIVE_DIR')
+        self.archive_configured = bool(archive_dir)
+        self.archive_dir = os.path.join(app.root_path, archive_dir or self.archive_dir)
+        self.batch_size = app.config.get('ANALYTICS_RETENTION_BATCH_SIZE', self.batch_size)
+
+    def archive_path(self, month):
+        return os.path.join(self.archive_dir, f'visitor_analytics_{month}.jsonl.gz')
+
+    def run(self, now=None, not_after=None):
+        """
+        Archiviert und löscht Rohdaten älter als retention_days.
+
+        Args:
+            now: Referenzzeitpunkt (Standard: jetzt)
+            not_after: Obergrenze, z.B. der Rollup-Watermark (nie Unverdichtetes löschen)
+
+        Returns:
+            int: Anzahl archivierter Einträge
+        """
+        if not self.retention_days:
+            return 0
+        if not self.archive_configured:
+            logger.warning(
+                "⚠️ ANALYTICS_ARCHIVE_DIR ist nicht gesetzt - Analytics-Rohdaten werden NICHT archiviert "
+                "und gelöscht. Auf ein persistentes Volume setzen oder ANALYTICS_RETENTION_DAYS=0."
+            )
+            return 0
+
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=self.retention_days)
+        if not_after is not None:
+            cutoff = min(cutoff, not_after)
+
+        table = self.VisitorAnalytics.__table__
+        os.makedirs(self.archive_dir, exist_ok=True)
+
+        archived = 0
+        while True:
+            rows = self.db.session.execute(
+                table.select().where(table.c.visited_at < cutoff).order_by(table.c.id).limit(self.batch_size)
+            ).mappings().all()
+            if not rows:
+                break
+
+            by_month = defaultdict(list)
+            for row in rows:
+                by_month[row['visited_at'].strftime('%Y-%m')].append(row)
+
+            # Erst archivieren (fsync), dann löschen - bei Abbruch höchstens doppelt archiviert
+            for month, month_rows in by_month.items():
+                self._append(month, month_rows)
+
+            self.db.session.execute(table.delete().where(table.c.id.in_([row['id'] for row in rows])))
+            self.db.session.commit()
+            archived += len(rows)
+
+        self.archived += archived
+        self.last_run_at = now
+        if archived:
+            logger.info(f"🗄️ {archived} Analytics-Einträge vor {cutoff:%Y-%m-%d} archiviert ({self.archive_dir})")
+        return archived
+
+    def _append(self, month, rows):
+        """Hängt ein gzip-Member an die Monatsdatei an (gzip.open liest alle Member am Stück)"""
+        lines = ''.join(json.dumps(dict(row), default=_json_default, ensure_ascii=False) + '\n' for row in rows)
+        with open(self.archive_path(month), 'ab') as raw:
+            with gzip.GzipFile(fileobj=raw, mode='wb') as archive:
+                archive.write(lines.encode('utf-8'))
+            raw.flush()
+            os.fsync(raw.fileno())
+
+    def stats(self):
+        """Zähler für Monitoring"""
+        return {
+            'retention_days': self.retention_days,
+            'archive_dir': self.archive_dir,
+            'archive_configured': self.archive_configured,
+            'archived': self.archived,
+            'last_run_at': self.last_run_at.isoformat() if self.last_run_at else None
+        }
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
@@ -0,0 +1,475 @@
+# analytics_rollup.py - Vorverdichtete Analytics für das Admin-Dashboard
+"""
+Stündliche/tägliche Rollups statt Full-Scans über visitor_analytics:
+- Ein Hintergrund-Job verdichtet abgeschlossene Stunden zu Rollup-Zeilen
+  (Page Views + Unique Visitors pro Gesamt/Seite/Gerät/Referrer)
+- Abgeschlossene Tage werden aus den Stunden-Rollups zu Tages-Rollups verdichtet
+- Unique Visitors werden als HyperLogLog-Sketch gespeichert und sind damit
+  über beliebige Zeiträume mergebar (~3% Schätzfehler)
+- Das Dashboard liest Rollups und scannt Rohdaten nur noch ab dem Watermark
+  (aktuelle, noch nicht verdichtete Stunde)
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import zlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.exc import IntegrityError
+
+logger = logging.getLogger(__name__)
+
+# HyperLogLog: 2^10 Register → Standardfehler ~1.04/sqrt(1024) ≈ 3.3%
+HLL_PRECISION = 10
+HLL_REGISTERS = 1 << HLL_PRECISION
+_HLL_VALUE_BITS = 64 - HLL_PRECISION
+_HLL_ALPHA = 0.7213 / (1 + 1.079 / HLL_REGISTERS)
+
+# Dimensionen der Rollup-Zeilen
+TOTAL = 'total'
+PAGE = 'page'
+DEVICE = 'device'
+REFERRER = 'referrer'
+
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+
+
+class HyperLogLog:
+    """Minimaler HyperLogLog-Sketch für Unique-Visitor-Schätzungen"""
+
+    def __init__(self, registers=None):
+        self.registers = bytearray(registers) if registers else bytearray(HLL_REGISTERS)
+
+    def add(self, value):
+        digest = hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest()
+        hashed = int.from_bytes(digest, 'big')
+        index = hashed >> _HLL_VALUE_BITS
+        rank = _HLL_VALUE_BITS - (hashed & ((1 << _HLL_VALUE_BITS) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        """Vereinigung zweier Sketches (registerweises Maximum)"""
+        registers = other.registers if isinstance(other, HyperLogLog) else other
+        self.registers = bytearray(map(max, self.registers, registers))
+
+    def count(self):
+        estimate = _HLL_ALPHA * HLL_REGISTERS * HLL_REGISTERS / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        # Kleine Mengen: Linear Counting ist deutlich genauer
+        if estimate <= 2.5 * HLL_REGISTERS and zeros:
+            estimate = HLL_REGISTERS * math.log(HLL_REGISTERS / zeros)
+        return int(round(estimate))
+
+    def to_bytes(self):
+        # Dünn besetzte Sketches (wenige Besucher) komprimieren sehr gut
+        return zlib.compress(bytes(self.registers))
+
+    @classmethod
+    def from_bytes(cls, data):
+        return cls(zlib.decompress(data)) if data else cls()
+
+
+def floor_hour(value):
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def floor_day(value):
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class _Aggregate:
+    """Views + Sketch pro (Dimension, Wert)"""
+
+    __slots__ = ('views', 'title', 'sketch')
+
+    def __init__(self):
+        self.views = 0
+        self.title = None
+        self.sketch = None
+
+    def add_sketch(self, sketch):
+        if self.sketch is None:
+            self.sketch = HyperLogLog()
+        self.sketch.merge(sketch)
+
+    @property
+    def unique_visitors(self):
+        return self.sketch.count() if self.sketch is not None else 0
+
+
+def _raw_keys(row):
+    """Rollup-Schlüssel eines Rohdaten-Events"""
+    keys = [(TOTAL, ''), (PAGE, row.page_url or ''), (DEVICE, row.device_type or '')]
+    if row.referrer:
+        keys.append((REFERRER, row.referrer))
+    return keys
+
+
+class AnalyticsRollup:
+    """Pflegt und liest die Rollup-Tabelle (analytics_rollups)"""
+
+    def __init__(self, app=None, db=None, VisitorAnalytics=None, AnalyticsRollupBucket=None, AppState=None):
+        self.grace = timedelta(seconds=60)
+        self.hourly_retention = timedelta(days=7)
+
+        self._lock = threading.Lock()
+        self.last_run_at = None
+        self.hours_rolled = 0
+        self.days_rolled = 0
+
+        if app is not None:
+            self.init_app(app, db, VisitorAnalytics, AnalyticsRollupBucket, AppState)
+
+    def init_app(self, app, db, VisitorAnalytics, AnalyticsRollupBucket, AppState):
+        self.db = db
+        self.VisitorAnalytics = VisitorAnalytics
+        self.Bucket = AnalyticsRollupBucket
+        self.AppState = AppState
+        # Wartezeit bis eine Stunde verdichtet wird (gepufferte Events müssen geschrieben sein)
+        self.grace = timedelta(seconds=app.config.get('ANALYTICS_ROLLUP_GRACE', 60))
+        self.hourly_retention = timedelta(days=app.config.get('ANALYTICS_ROLLUP_HOURLY_DAYS', 7))
+
+    # === WATERMARKS ===
+
+    def _get_watermark(self, key):
+        value = self.AppState.get_value(key)
+        return datetime.fromisoformat(value) if value else None
+
+    def _set_watermark(self, key, value):
+        self.AppState.set_value(key, value.isoformat())
+
+    def watermarks(self):
+        """(Stunden-Watermark, Tages-Watermark) - alles davor ist verdichtet"""
+        return self._get_watermark('analytics_rollup_hour'), self._get_watermark('analytics_rollup_day')
+
+    # === VERDICHTUNG (Hintergrund-Job) ===
+
+    def run(self, now=None):
+        """
+        Verdichtet alle abgeschlossenen Stunden und Tage seit dem letzten Lauf.
+
+        Returns:
+            dict: Anzahl verdichteter Stunden/Tage
+        """
+        now = now or datetime.utcnow()
+        with self._lock:
+            try:
+                hours = self._rollup_hours(now)
+                days = self._rollup_days()
+                self._prune_hourly(now)
+                self.db.session.commit()
+            except IntegrityError:
+                # Ein anderer Worker hat denselben Bucket gerade verdichtet
+                self.db.session.rollback()
+                logger.warning("Analytics-Rollup übersprungen: paralleler Lauf in einem anderen Worker")
+                return {'hours': 0, 'days': 0}
+            self.last_run_at = now
+            self.hours_rolled += hours
+            self.days_rolled += days
+        if hours or days:
+            logger.info(f"📊 Analytics-Rollup: {hours} Stunden, {days} Tage verdichtet")
+        return {'hours': hours, 'days': days}
+
+    def _rollup_hours(self, now):
+        VisitorAnalytics = self.VisitorAnalytics
+        target = floor_hour(now - self.grace)
+        start, _ = self.watermarks()
+
+        if start is None:
+            first_visit = self.db.session.query(func.min(VisitorAnalytics.visited_at)).scalar()
+            start = floor_hour(first_visit) if first_visit else target
+            self._set_watermark('analytics_rollup_hour', start)
+            self._set_watermark('analytics_rollup_day', floor_day(start))
+
+        rolled = 0
+        while start < target:
+            # Rohdaten tageweise lesen (eine Query pro Chunk statt pro Stunde)
+            chunk_end = min(floor_day(start) + DAY, target)
+            buckets = defaultdict(lambda: defaultdict(_Aggregate))
+
+            rows = self.db.session.query(
+                VisitorAnalytics.ip_address,
+                VisitorAnalytics.page_url,
+                VisitorAnalytics.page_title,
+                VisitorAnalytics.device_type,
+                VisitorAnalytics.referrer,
+                VisitorAnalytics.visited_at
+            ).filter(
+                VisitorAnalytics.visited_at >= start,
+                VisitorAnalytics.visited_at < chunk_end
+            ).yield_per(1000)
+
+            for row in rows:
+                bucket = buckets[floor_hour(row.visited_at)]
+                for key in _raw_keys(row):
+                    aggregate = bucket[key]
+                    aggregate.views += 1
+                    if key[0] == PAGE:
+                        aggregate.title = row.page_title
+                    if aggregate.sketch is None:
+                        aggregate.sketch = HyperLogLog()
+                    aggregate.sketch.add(row.ip_address)
+
+            self.db.session.query(self.Bucket).filter(
+                self.Bucket.granularity == 'hour',
+                self.Bucket.bucket_start >= start,
+                self.Bucket.bucket_start < chunk_end
+            ).delete(synchronize_session=False)
+            self._insert('hour', buckets)
+
+            rolled += int((chunk_end - start) / HOUR)
+            start = chunk_end
+            self._set_watermark('analytics_rollup_hour', start)
+            self.db.session.commit()
+
+        return rolled
+
+    def _rollup_days(self):
+        """Verdichtet vollständig abgedeckte Tage aus den Stunden-Rollups"""
+        hour_watermark, day = self.watermarks()
+        if hour_watermark is None or day is None:
+            return 0
+
+        rolled = 0
+        while day + DAY <= hour_watermark:
+            buckets = {day: defaultdict(_Aggregate)}
+            hourly = self.Bucket.query.filter(
+                self.Bucket.granularity == 'hour',
+                self.Bucket.bucket_start >= day,
+                self.Bucket.bucket_start < day + DAY
+            ).all()
+            for row in hourly:
+                aggregate = buckets[day][(row.dimension, row.dimension_value)]
+                aggregate.views += row.views
+                aggregate.title = row.page_title or aggregate.title
+                aggregate.add_sketch(HyperLogLog.from_bytes(row.visitors_sketch))
+
+            self.db.session.query(self.Bucket).filter_by(granularity='day', bucket_start=day).delete(synchronize_session=False)
+            self._insert('day', buckets)
+
+            day += DAY
+            rolled += 1
+            self._set_watermark('analytics_rollup_day', day)
+            self.db.session.commit()
+
+        return rolled
+
+    def _insert(self, granularity, buckets):
+        rows = [
+            {
+                'granularity': granularity,
+                'bucket_start': bucket_start,
+                'dimension': dimension,
+                'dimension_value': value[:500],
+                'page_title': (aggregate.title or '')[:200] or None,
+                'views': aggregate.views,
+                'unique_visitors': aggregate.unique_visitors,
+                'visitors_sketch': aggregate.sketch.to_bytes() if aggregate.sketch is not None else None
+            }
+            for bucket_start, aggregates in buckets.items()
+            for (dimension, value), aggregate in aggregates.items()
+        ]
+        if rows:
+            self.db.session.execute(self.Bucket.__table__.insert(), rows)
+
+    def _prune_hourly(self, now):
+        """Stunden-Rollups werden nur für Tagesgrenzen der letzten Tage gebraucht"""
+        _, day_watermark = self.watermarks()
+        if day_watermark is None:
+            return
+        cutoff = min(floor_day(now - self.hourly_retention), day_watermark)
+        self.db.session.query(self.Bucket).filter(
+            self.Bucket.granularity == 'hour',
+            self.Bucket.bucket_start < cutoff
+        ).delete(synchronize_session=False)
+
+    # === LESEN (Dashboard/API) ===
+
+    def _segments(self, start, end):
+        """
+        Zerlegt [start, end) in Tages-Rollups, Stunden-Rollups und einen Rohdaten-Rest.
+
+        Returns:
+            (Liste von (granularity, von, bis), (raw_von, raw_bis))
+        """
+        hour_watermark, day_watermark = self.watermarks()
+        if hour_watermark is None:
+            return [], (start, end)
+
+        # Stunden-Rollups existieren nur für die letzten Tage → ältere Starts auf den Tag runden
+        if start < end - self.hourly_retention:
+            start = floor_day(start)
+        else:
+            start = floor_hour(start)
+
+        segments = []
+        rolled_end = min(hour_watermark, end)
+        if start < rolled_end:
+            first_day = floor_day(start) if start == floor_day(start) else floor_day(start) + DAY
+            last_day = min(day_watermark or first_day, floor_day(rolled_end))
+            if first_day < last_day:
+                segments.append(('hour', start, first_day))
+                segments.append(('day', first_day, last_day))
+                segments.append(('hour', last_day, rolled_end))
+            else:
+                segments.append(('hour', start, rolled_end))
+
+        segments = [segment for segment in segments if segment[1] < segment[2]]
+        return segments, (max(start, hour_watermark), end)
+
+    def _segment_filter(self, segments):
+        Bucket = self.Bucket
+        return or_(*[
+            and_(Bucket.granularity == granularity, Bucket.bucket_start >= seg_start, Bucket.bucket_start < seg_end)
+            for granularity, seg_start, seg_end in segments
+        ])
+
+    def window(self, start, end=None, top_pages=5, top_referrers=5):
+        """
+        Kennzahlen für einen Zeitraum - Format wie die bisherigen Dashboard-Queries.
+
+        Returns:
+            dict mit unique_visitors, page_views, top_pages, device_stats, referrer_stats
+        """
+        end = end or datetime.utcnow()
+        Bucket = self.Bucket
+        VisitorAnalytics = self.VisitorAnalytics
+        segments, (raw_start, raw_end) = self._segments(start, end)
+        aggregates = defaultdict(_Aggregate)
+
+        # 1) Views pro Schlüssel aus den Rollups (ohne Sketches)
+        if segments:
+            view_rows = self.db.session.query(
+                Bucket.dimension,
+                Bucket.dimension_value,
+                func.max(Bucket.page_title).label('page_title'),
+                func.sum(Bucket.views).label('views')
+            ).filter(self._segment_filter(segments)).group_by(Bucket.dimension, Bucket.dimension_value).all()
+            for row in view_rows:
+                aggregate = aggregates[(row.dimension, row.dimension_value)]
+                aggregate.views += row.views or 0
+                aggregate.title = row.page_title
+
+        # 2) Noch nicht verdichtete Rohdaten (aktuelle Stunde) direkt lesen
+        if raw_start < raw_end:
+            rows = self.db.session.query(
+                VisitorAnalytics.ip_address,
+                VisitorAnalytics.page_url,
+                VisitorAnalytics.page_title,
+                VisitorAnalytics.device_type,
+                VisitorAnalytics.referrer
+            ).filter(
+                VisitorAnalytics.visited_at >= raw_start,
+                VisitorAnalytics.visited_at < raw_end
+            ).all()
+            for row in rows:
+                for key in _raw_keys(row):
+                    aggregate = aggregates[key]
+                    aggregate.views += 1
+                    if key[0] == PAGE:
+                        aggregate.title = aggregate.title or row.page_title
+                    if aggregate.sketch is None:
+                        aggregate.sketch = HyperLogLog()
+                    aggregate.sketch.add(row.ip_address)
+
+        def top(dimension, limit):
+            keys = [key for key in aggregates if key[0] == dimension]
+            keys.sort(key=lambda key: aggregates[key].views, reverse=True)
+            return keys if limit is None else keys[:limit]
+
+        pages = top(PAGE, top_pages)
+        devices = top(DEVICE, None)
+        referrers = top(REFERRER, top_referrers)
+
+        # 3) Sketches nur für die angezeigten Schlüssel laden und mergen
+        if segments:
+            wanted = [(TOTAL, '')] + pages + devices + referrers
+            by_dimension = defaultdict(list)
+            for dimension, value in wanted:
+                by_dimension[dimension].append(value)
+            sketch_rows = self.db.session.query(
+                Bucket.dimension, Bucket.dimension_value, Bucket.visitors_sketch
+            ).filter(
+                self._segment_filter(segments),
+                or_(*[
+                    and_(Bucket.dimension == dimension, Bucket.dimension_value.in_(values))
+                    for dimension, values in by_dimension.items()
+                ])
+            ).all()
+            for row in sketch_rows:
+                if row.visitors_sketch:
+                    aggregates[(row.dimension, row.dimension_value)].add_sketch(HyperLogLog.from_bytes(row.visitors_sketch))
+
+        total = aggregates.get((TOTAL, '')) or _Aggregate()
+        return {
+            'unique_visitors': total.unique_visitors,
+            'page_views': total.views,
+            'top_pages': [
+                {
+                    'page_url': key[1],
+                    'page_title': aggregates[key].title,
+                    'views': aggregates[key].views,
+                    'unique_visitors': aggregates[key].unique_visitors
+                } for key in pages
+            ],
+            'device_stats': [
+                {
+                    'device_type': key[1] or 'unknown',
+                    'unique_visitors': aggregates[key].unique_visitors,
+                    'total_views': aggregates[key].views
+                } for key in devices
+            ],
+            'referrer_stats': [
+                {
+                    'referrer': key[1],
+                    'unique_visitors': aggregates[key].unique_visitors,
+                    'total_visits': aggregates[key].views
+                } for key in referrers
+            ]
+        }
+
+    def daily_series(self, days=30, now=None):
+        """Tägliche Unique Visitors / Page Views (Tages-Rollups + Rest für die letzten Tage)"""
+        now = now or datetime.utcnow()
+        first_day = floor_day(now - timedelta(days=days))
+        _, day_watermark = self.watermarks()
+        rolled_until = max(first_day, day_watermark) if day_watermark else first_day
+
+        series = []
+        if day_watermark:
+            rows = self.Bucket.query.filter(
+                self.Bucket.granularity == 'day',
+                self.Bucket.dimension == TOTAL,
+                self.Bucket.bucket_start >= first_day,
+                self.Bucket.bucket_start < rolled_until
+            ).order_by(self.Bucket.bucket_start).all()
+            series = [
+                {'date': row.bucket_start.date(), 'unique_visitors': row.unique_visitors, 'page_views': row.views}
+                for row in rows if row.views
+            ]
+
+        # Noch nicht als Tag verdichtete Tage (i.d.R. nur heute)
+        day = rolled_until
+        while day < now:
+            stats = self.window(day, min(day + DAY, now), top_pages=0, top_referrers=0)
+            if stats['page_views']:
+                series.append({'date': day.date(), 'unique_visitors': stats['unique_visitors'], 'page_views': stats['page_views']})
+            day += DAY
+        return series
+
+    def stats(self):
+        """Zähler für Monitoring"""
+        hour_watermark, day_watermark = self.watermarks()
+        return {
+            'hour_watermark': hour_watermark.isoformat() if hour_watermark else None,
+            'day_watermark': day_watermark.isoformat() if day_watermark else None,
+            'last_run_at': self.last_run_at.isoformat() if self.last_run_at else None,
+            'hours_rolled': self.hours_rolled,
+            'days_rolled': self.days_rolled
+        }
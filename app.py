@@ -1,10 +1,11 @@
 # app.py - Didis Premium Trading Academy mit Menüsystem
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash, send_from_directory
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash, send_from_directory, has_request_context, Response, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
 from flask_wtf.csrf import CSRFProtect
 import os
 import enum
 import secrets
+import time
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
@@ -51,18 +52,6 @@ app.config.update(
 # CSRF-Schutz aktivieren
 csrf = CSRFProtect(app)
 
-# Rate Limiting aktivieren (Schutz vor Brute-Force)
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
-
-limiter = Limiter(
-    app=app,
-    key_func=get_remote_address,
-    default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://",  # In-Memory für Development, für Production: Redis
-    strategy="fixed-window"
-)
-
 # Database-Pfad konfigurieren
 basedir = os.path.abspath(os.path.dirname(__file__))
 
@@ -82,6 +71,38 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 # Database initialisieren
 db = SQLAlchemy(app)
 
+# Rate Limiting aktivieren (Schutz vor Brute-Force)
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+import ratelimit_storage  # registriert das Storage-Schema sql:// bei limits
+
+# sql (Standard) = gemeinsam in der App-Datenbank für alle Worker, memory = pro Worker-Prozess
+# (Opt-out, z.B. Development), sonst eine limits-URI (z.B. redis://...)
+app.config.setdefault('RATELIMIT_STORAGE', os.environ.get('RATELIMIT_STORAGE', 'sql'))
+app.config.setdefault('RATELIMIT_EXACT_WINDOW', int(os.environ.get('RATELIMIT_EXACT_WINDOW', 60)))
+app.config.setdefault('RATELIMIT_SYNC_INTERVAL', float(os.environ.get('RATELIMIT_SYNC_INTERVAL', 1.0)))
+
+ratelimit_storage_uri = app.config['RATELIMIT_STORAGE']
+ratelimit_storage_options = {}
+if ratelimit_storage_uri == 'memory':
+    ratelimit_storage_uri = 'memory://'
+elif ratelimit_storage_uri in ('sql', 'db'):  # 'db': frühere Bezeichnung
+    ratelimit_storage_uri = 'sql://'
+    ratelimit_storage_options = {
+        'url': app.config['SQLALCHEMY_DATABASE_URI'],
+        'exact_window': app.config['RATELIMIT_EXACT_WINDOW'],
+        'sync_interval': app.config['RATELIMIT_SYNC_INTERVAL']
+    }
+
+limiter = Limiter(
+    app=app,
+    key_func=get_remote_address,
+    default_limits=["200 per day", "50 per hour"],
+    storage_uri=ratelimit_storage_uri,
+    storage_options=ratelimit_storage_options,
+    strategy="fixed-window"
+)
+
 # === FLASK-MAIL KONFIGURATION ===
 
 from flask_mail import Mail, Message
@@ -93,6 +114,7 @@ app.config['MAIL_USE_TLS'] = os.environ.get('MAIL_USE_TLS', 'True') == 'True'
 app.config['MAIL_USERNAME'] = os.environ.get('MAIL_USERNAME')
 app.config['MAIL_PASSWORD'] = os.environ.get('MAIL_PASSWORD')
 app.config['MAIL_DEFAULT_SENDER'] = os.environ.get('MAIL_DEFAULT_SENDER', 'noreply@didis-academy.com')
+app.config['MAIL_SUPPRESS_SEND'] = os.environ.get('MAIL_SUPPRESS_SEND', 'False') == 'True'
 
 mail = Mail(app)
 print(f"📧 Flask-Mail konfiguriert (Server: {app.config['MAIL_SERVER']})")
@@ -101,6 +123,12 @@ print(f"📧 Flask-Mail konfiguriert (Server: {app.config['MAIL_SERVER']})")
 class VisitorAnalytics(db.Model):
     """Tracking für Besucher-Analytics mit IP-basierter Deduplizierung"""
     __tablename__ = 'visitor_analytics'
+    __table_args__ = (
+        # Dashboards filtern nach Zeitraum, User und Modul (siehe analytics_retention.py)
+        db.Index('ix_visitor_analytics_visited_at', 'visited_at'),
+        db.Index('ix_visitor_analytics_user_visited', 'user_id', 'visited_at'),
+        db.Index('ix_visitor_analytics_module_visited', 'module_slug', 'visited_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     
@@ -112,6 +140,7 @@ class VisitorAnalytics(db.Model):
     page_url = db.Column(db.String(500), nullable=False)
     page_title = db.Column(db.String(200))
     referrer = db.Column(db.String(500))
+    module_slug = db.Column(db.String(200))  # Normalisiert aus /module/<slug> beim Tracking
     
     # Session Information
     session_id = db.Column(db.String(100))
@@ -135,6 +164,7 @@ class VisitorAnalytics(db.Model):
             'ip_address': self.ip_address,
             'page_url': self.page_url,
             'page_title': self.page_title,
+            'module_slug': self.module_slug,
             'visited_at': self.visited_at.isoformat() if self.visited_at else None,
             'user_id': self.user_id,
             'device_type': self.device_type,
@@ -142,6 +172,25 @@ class VisitorAnalytics(db.Model):
             'os': self.os
         }
 
+class AnalyticsRollupBucket(db.Model):
+    """Vorverdichtete Analytics pro Stunde/Tag und Dimension (siehe analytics_rollup.py)"""
+    __tablename__ = 'analytics_rollups'
+    __table_args__ = (
+        db.UniqueConstraint('granularity', 'bucket_start', 'dimension', 'dimension_value', name='unique_analytics_rollup_bucket'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    granularity = db.Column(db.String(10), nullable=False)  # hour, day
+    bucket_start = db.Column(db.DateTime, nullable=False, index=True)
+    
+    dimension = db.Column(db.String(20), nullable=False)  # total, page, device, referrer
+    dimension_value = db.Column(db.String(500), nullable=False, default='')
+    page_title = db.Column(db.String(200))
+    
+    views = db.Column(db.Integer, default=0, nullable=False)
+    unique_visitors = db.Column(db.Integer, default=0, nullable=False)  # HLL-Schätzung für diesen Bucket
+    visitors_sketch = db.Column(db.LargeBinary)  # HyperLogLog-Register (zlib-komprimiert)
+
 print("VisitorAnalytics-Modell definiert")
 
 # Analytics-Middleware direkt implementieren
@@ -194,27 +243,38 @@ def track_visitor():
             '/trading-tools': 'Trading-Tools - Didis Premium Trading Academy'
         }
         
-        # Analytics-Eintrag erstellen
-        analytics_entry = VisitorAnalytics(
-            ip_address=ip_address,
-            user_agent=user_agent_string[:500] if user_agent_string else None,  # Limit für DB
-            page_url=request.url,
-            page_title=page_titles.get(request.path, f"Seite {request.path} - Didis Premium Trading Academy"),
-            referrer=request.headers.get('Referer'),
-            session_id=session['analytics_session_id'],
-            user_id=session.get('user_id'),
-            device_type=device_type,
-            browser='Unknown',
-            os='Unknown'
-        )
-        
-        db.session.add(analytics_entry)
-        db.session.commit()
+        # Analytics-Eintrag in die Queue legen (Bulk-Insert im Hintergrund)
+        # Nur echte DB-User-IDs speichern (Demo-/Fallback-Admins haben String-IDs)
+        user_id = str(session.get('user_id') or '')
+        analytics_queue.push({
+            'ip_address': ip_address,
+            'user_agent': user_agent_string[:500] if user_agent_string else None,  # Limit für DB
+            'page_url': request.url[:500],
+            'page_title': page_titles.get(request.path, f"Seite {request.path} - Didis Premium Trading Academy"),
+            'referrer': (request.headers.get('Referer') or '')[:500] or None,
+            'module_slug': module_slug_from_url(request.path),
+            'session_id': session['analytics_session_id'],
+            'user_id': int(user_id) if user_id.isdigit() else None,
+            'visited_at': datetime.utcnow(),
+            'device_type': device_type,
+            'browser': 'Unknown',
+            'os': 'Unknown'
+        })
         
     except Exception as e:
         # Fehler beim Tracking sollen die App nicht crashen
         print(f"Analytics Tracking Error: {e}")
-        db.session.rollback()
+
+# Gepufferte Analytics-Ingestion (Queue + Background-Writer)
+from analytics_queue import AnalyticsQueue
+from analytics_retention import AnalyticsRetention, migrate_visitor_analytics, module_slug_from_url
+
+app.config.setdefault('ANALYTICS_ASYNC', os.environ.get('ANALYTICS_ASYNC', 'True') == 'True')
+app.config.setdefault('ANALYTICS_QUEUE_SIZE', int(os.environ.get('ANALYTICS_QUEUE_SIZE', 10000)))
+app.config.setdefault('ANALYTICS_BATCH_SIZE', int(os.environ.get('ANALYTICS_BATCH_SIZE', 200)))
+app.config.setdefault('ANALYTICS_FLUSH_INTERVAL', float(os.environ.get('ANALYTICS_FLUSH_INTERVAL', 2.0)))
+
+analytics_queue = AnalyticsQueue(app, db, VisitorAnalytics)
 
 # Registriere die Tracking-Funktion
 app.before_request(track_visitor)
@@ -223,65 +283,81 @@ print("Analytics-Tracking aktiviert")
 # === EMAIL HELPER FUNCTIONS ===
 import threading
 
-def send_email(to, subject, template, **kwargs):
+class OutboxEmail(db.Model):
+    """Persistente Mail-Outbox (siehe mail_outbox.py)"""
+    __tablename__ = 'mail_outbox'
+    __table_args__ = (
+        db.Index('ix_mail_outbox_due', 'status', 'next_attempt_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    recipient = db.Column(db.String(120), nullable=False)
+    subject = db.Column(db.String(200), nullable=False)
+    html = db.Column(db.Text, nullable=False)
+    
+    status = db.Column(db.String(20), default='pending', nullable=False)  # pending, sending, sent, failed
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    last_error = db.Column(db.String(500))
+    
+    # Claim eines Workers (verwaiste Claims werden nach locked_until neu vergeben)
+    claim_token = db.Column(db.String(32), index=True)
+    locked_until = db.Column(db.DateTime)
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime)
+
+# Outbox + Worker-Pool statt Thread und SMTP-Verbindung pro Email
+from mail_outbox import MailOutbox
+
+app.config.setdefault('MAIL_OUTBOX_ASYNC', os.environ.get('MAIL_OUTBOX_ASYNC', 'True') == 'True')
+app.config.setdefault('MAIL_WORKERS', int(os.environ.get('MAIL_WORKERS', 2)))
+app.config.setdefault('MAIL_BATCH_SIZE', int(os.environ.get('MAIL_BATCH_SIZE', 50)))
+app.config.setdefault('MAIL_MAX_ATTEMPTS', int(os.environ.get('MAIL_MAX_ATTEMPTS', 5)))
+app.config.setdefault('MAIL_RETRY_BACKOFF', int(os.environ.get('MAIL_RETRY_BACKOFF', 30)))
+
+mail_outbox = MailOutbox(app, db, mail, OutboxEmail)
+
+def queue_email(to, subject, template, commit=True, **kwargs):
     """
-    Sendet eine Email mit HTML-Template (SYNCHRON)
+    Rendert ein Email-Template und legt die Email in die Outbox
     
     Args:
         to: Empfänger-Email
         subject: Email-Betreff
         template: Name des Templates (ohne .html)
+        commit: False wenn der Aufrufer selbst committet (Batch-Versand)
         **kwargs: Variablen für Template-Rendering
     
     Returns:
-        bool: True wenn erfolgreich, False bei Fehler
+        bool: True wenn eingereiht, False bei Fehler
     """
     try:
-        msg = Message(
-            subject=subject,
-            recipients=[to],
-            html=render_template(f'emails/{template}.html', **kwargs)
-        )
-        mail.send(msg)
-        print(f"✅ Email gesendet: {subject} → {to}")
+        mail_outbox.enqueue(to, subject, render_template(f'emails/{template}.html', **kwargs), commit=commit)
+        print(f"📨 Email eingereiht: {subject} → {to}")
         return True
     except Exception as e:
         print(f"❌ Email-Fehler: {e}")
         import traceback
         traceback.print_exc()
+        if commit:
+            db.session.rollback()
         return False
 
-def send_email_async(to, subject, template, **kwargs):
+def send_email(to, subject, template, **kwargs):
     """
-    Sendet eine Email mit HTML-Template im Background-Thread (ASYNCHRON)
-    Verhindert Timeouts bei langsamen SMTP-Servern (z.B. Gmail)
+    Sendet eine Email mit HTML-Template über die Outbox
     
-    Args:
-        to: Empfänger-Email
-        subject: Email-Betreff
-        template: Name des Templates (ohne .html)
-        **kwargs: Variablen für Template-Rendering
-    """
-    def send_async():
-        with app.app_context():
-            try:
-                msg = Message(
-                    subject=subject,
-                    recipients=[to],
-                    html=render_template(f'emails/{template}.html', **kwargs)
-                )
-                mail.send(msg)
-                print(f"✅ [ASYNC] Email gesendet: {subject} → {to}")
-            except Exception as e:
-                print(f"❌ [ASYNC] Email-Fehler: {e}")
-                import traceback
-                traceback.print_exc()
+    Der Versand erfolgt im Worker-Pool (wiederverwendete SMTP-Verbindung, Retry mit Backoff).
     
-    # Starte Email-Versand in separatem Thread
-    thread = threading.Thread(target=send_async, name=f"email-{to}")
-    thread.daemon = True  # Thread beendet sich mit Hauptprozess
-    thread.start()
-    print(f"📨 [ASYNC] Email-Versand gestartet: {subject} → {to}")
+    Returns:
+        bool: True wenn eingereiht, False bei Fehler
+    """
+    return queue_email(to, subject, template, **kwargs)
+
+def send_email_async(to, subject, template, **kwargs):
+    """Kompatibilität: Versand läuft ohnehin asynchron über die Outbox"""
+    return queue_email(to, subject, template, **kwargs)
 
 # === EMAIL DEBUG ROUTE ===
 @app.route('/admin/test-email')
@@ -520,14 +596,20 @@ class User(db.Model):
         new_dates = dict(self.subscription_started_at)
         new_dates[subscription_level] = start_date.isoformat()
         self.subscription_started_at = new_dates
+        
+        # Neues Start-Datum → Freischaltungs-Stand des Levels verwerfen (User wird im nächsten Lauf fällig)
+        if self.id is not None:
+            UserUnlockState.query.filter_by(
+                user_id=self.id, subscription_type=SubscriptionType(subscription_level)
+            ).delete(synchronize_session=False)
     
-    def get_days_since_subscription_start(self, subscription_level):
+    def get_days_since_subscription_start(self, subscription_level, now=None):
         """Berechnet die Anzahl der Tage seit Subscription-Start"""
         start_date = self.get_subscription_start_date(subscription_level)
         if not start_date:
             return 0
         
-        delta = datetime.utcnow() - start_date
+        delta = (now or datetime.utcnow()) - start_date
         return max(1, delta.days + 1)  # Mindestens Tag 1
 
 class EmailVerificationToken(db.Model):
@@ -567,6 +649,88 @@ class AdminAuditLog(db.Model):
     def __repr__(self):
         return f'<AdminAuditLog {self.admin_username} {self.action_type} on {self.target_username}>'
 
+class AppState(db.Model):
+    """Key-Value-Speicher für App-weite Zustände (z.B. Content-Version des Bootstraps)"""
+    __tablename__ = 'app_state'
+
+    key = db.Column(db.String(100), primary_key=True)
+    value = db.Column(db.Text)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @classmethod
+    def get_value(cls, key, default=None):
+        entry = db.session.get(cls, key)
+        return entry.value if entry else default
+
+    @classmethod
+    def set_value(cls, key, value):
+        """Setzt einen Wert (Commit durch den Aufrufer)"""
+        entry = db.session.get(cls, key)
+        if entry:
+            entry.value = value
+        else:
+            db.session.add(cls(key=key, value=value))
+
+class JobLease(db.Model):
+    """Lease für Scheduler-Jobs: nur der Halter führt den Job aus (mehrere Worker/Replicas)"""
+    __tablename__ = 'job_leases'
+
+    job_id = db.Column(db.String(100), primary_key=True)
+    owner = db.Column(db.String(200), nullable=False)  # Lauf-Token hostname:pid:zufall
+    acquired_at = db.Column(db.DateTime, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+class JobRun(db.Model):
+    """Lauf-Historie der Scheduler-Jobs"""
+    __tablename__ = 'job_runs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.String(100), nullable=False)
+    slot = db.Column(db.String(50))  # geplanter Zeitraum (z.B. Tag), None = manuell ausgelöst
+    owner = db.Column(db.String(200), nullable=False)
+    status = db.Column(db.String(20), nullable=False)  # running, success, failed, aborted
+
+    started_at = db.Column(db.DateTime, nullable=False)
+    finished_at = db.Column(db.DateTime)
+    duration_seconds = db.Column(db.Float)
+
+    rows_processed = db.Column(db.Integer)
+    emails_sent = db.Column(db.Integer)
+    result = db.Column(db.JSON)
+    error = db.Column(db.String(500))
+
+    # Pro Job und Slot höchstens ein Lauf (fehlgeschlagene Läufe werden wiederholt)
+    __table_args__ = (
+        db.UniqueConstraint('job_id', 'slot', name='unique_job_run_slot'),
+        db.Index('ix_job_runs_job_started', 'job_id', 'started_at'),
+    )
+
+class UnlockCheckpoint(db.Model):
+    """Fertig bearbeitete Shards eines Unlock-Laufs (Wiederaufnahme nach Abbruch)"""
+    __tablename__ = 'unlock_checkpoints'
+
+    id = db.Column(db.Integer, primary_key=True)
+    run_key = db.Column(db.String(50), nullable=False)  # Slot des Laufs, z.B. '2026-01-31'
+    shard_start = db.Column(db.Integer, nullable=False)  # User-IDs shard_start <= id < shard_end
+    shard_end = db.Column(db.Integer, nullable=False)
+    unlocks = db.Column(db.Integer, default=0)
+    emails = db.Column(db.Integer, default=0)
+    finished_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('run_key', 'shard_start', name='unique_unlock_checkpoint'),
+    )
+
+class UserUnlockState(db.Model):
+    """Stand der täglichen Freischaltung pro User und Level (inkrementeller Unlock-Job)"""
+    __tablename__ = 'user_unlock_states'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    subscription_type = db.Column(db.Enum(SubscriptionType), primary_key=True)
+    last_unlock_day = db.Column(db.Integer, default=0, nullable=False)  # bis zu diesem Tag ausgewertet
+    # Ab hier ist der nächste Tag erreicht (None = alle Module frei / kein Start-Datum)
+    next_unlock_at = db.Column(db.DateTime, index=True)
+
 class UserModuleUnlock(db.Model):
     """Tägliche Modul-Freischaltung: Speichert freigeschaltete Module pro User"""
     __tablename__ = 'user_module_unlocks'
@@ -760,65 +924,10 @@ class LearningModule(db.Model):
             user_subscription: Subscription-Level des Users ("free", "premium", etc.)
             user_id: Optional - User-ID für Prüfung der täglichen Freischaltung
         """
-        # Lead-Magnete sind immer verfügbar
-        if self.is_lead_magnet:
-            return True
-        
-        # Keine Subscription-Anforderungen = für alle verfügbar
-        required_levels = self.required_subscription_levels or []
-        if not required_levels:
-            return True
-        
-        # FIX: 'free' als Subscription-Level ist ein Datenbankfehler
-        # 'free' sollte NICHT als required_level verwendet werden - stattdessen is_lead_magnet=True
-        # Module mit nur ['free'] sollten als Premium behandelt werden (Datenmigration erforderlich)
-        required_levels_lower = [level.lower() for level in required_levels if level]
-        if 'free' in required_levels_lower:
-            # Entferne 'free' aus den Levels - es ist semantisch falsch
-            required_levels_lower = [l for l in required_levels_lower if l != 'free']
-            if not required_levels_lower:
-                # Wenn nur 'free' war, setze auf Premium (konservativ - erfordert Subscription)
-                required_levels_lower = ['premium']
-            required_levels = required_levels_lower
-        
-        # Hierarchie der Subscription-Levels (Index = Rang, höher = besser)
-        level_hierarchy = ['free', 'basic', 'premium', 'elite', 'elite_pro', 'masterclass']
-        
-        # User-Level-Rang ermitteln
-        user_level = user_subscription.lower() if user_subscription else 'free'
-        user_rank = level_hierarchy.index(user_level) if user_level in level_hierarchy else 0
-        
-        # SPEZIALREGEL: Elite Pro hat Zugriff auf ALLE Module
-        if user_level == 'elite_pro':
-            return True
-        
-        # Prüfe ob Modul Elite Pro erfordert - dann haben andere Subscription-Stufen keinen Zugriff
-        if 'elite_pro' in [level.lower() for level in required_levels]:
-            return False
-        
-        # Minimales erforderliches Level ermitteln
-        min_required_rank = 999
-        for req_level in required_levels:
-            req_level_lower = req_level.lower() if req_level else 'free'
-            if req_level_lower in level_hierarchy:
-                rank = level_hierarchy.index(req_level_lower)
-                min_required_rank = min(min_required_rank, rank)
-        
-        # User hat Zugriff wenn sein Rang >= dem erforderlichen Rang ist
-        if user_rank < min_required_rank:
-            return False
-        
-        # Wenn keine User-ID übergeben wurde, nur Subscription-Level prüfen (Rückwärtskompatibilität)
-        if user_id is None:
-            return True
-        
-        # Prüfe ob Modul für diesen User freigeschaltet wurde
-        unlock = UserModuleUnlock.query.filter_by(
-            user_id=user_id,
-            module_id=self.id
-        ).first()
-        
-        return unlock is not None
+        # Zentrale Zugriffslogik mit normalisiertem Rang und gecachten Freischaltungen
+        # (siehe module_access.py - dort auch filter_accessible() für Listen)
+        context = module_access.for_user(user_subscription, user_id, check_unlocks=user_id is not None)
+        return context.can_access(self)
     
     def is_unlocked_for_user(self, user_id):
         """
@@ -830,15 +939,7 @@ class LearningModule(db.Model):
         Returns:
             True wenn freigeschaltet, False sonst
         """
-        if self.is_lead_magnet:
-            return True
-        
-        unlock = UserModuleUnlock.query.filter_by(
-            user_id=user_id,
-            module_id=self.id
-        ).first()
-        
-        return unlock is not None
+        return module_access.for_user(user_id=user_id).is_unlocked(self)
 
 class ModuleProgress(db.Model):
     """User Progress Tracking"""
@@ -853,48 +954,238 @@ class ModuleProgress(db.Model):
     completed_at = db.Column(db.DateTime, nullable=True)
     last_accessed = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+class ModuleContent(db.Model):
+    """Aus einem Modul-Template extrahierter Lerninhalt (module_content.py), aktualisiert per Datei-Hash"""
+    __tablename__ = 'module_contents'
+
+    template_file = db.Column(db.String(200), primary_key=True)  # wie LearningModule.template_file
+    file_hash = db.Column(db.String(64), nullable=False)  # SHA-256
+    file_mtime = db.Column(db.Float)  # mtime/Größe: unveränderte Dateien gar nicht erst lesen
+    file_size = db.Column(db.Integer)
+
+    title = db.Column(db.String(300))
+    description = db.Column(db.Text)
+    headings = db.Column(db.JSON, default=list)  # [{"level": 2, "text": "..."}]
+    text = db.Column(db.Text)
+    word_count = db.Column(db.Integer, default=0)
+    reading_minutes = db.Column(db.Integer, default=0)
+    images = db.Column(db.JSON, default=list)  # ["/static/screenshots/...png"]
+    extracted_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+# === MODUL-ZUGRIFFSKONTROLLE ===
+
+# Normalisierte Zugriffsregeln + einmal geladene Freischaltungen pro User (kurzer TTL-Cache)
+from module_access import ModuleAccessControl
+
+app.config.setdefault('UNLOCK_CACHE_TTL', int(os.environ.get('UNLOCK_CACHE_TTL', 30)))
+app.config.setdefault('UNLOCK_CACHE_SIZE', int(os.environ.get('UNLOCK_CACHE_SIZE', 5000)))
+
+module_access = ModuleAccessControl(app, db, UserModuleUnlock)
+
+# === TÄGLICHE FREISCHALTUNG (Bulk) ===
+
+# Ein Plan pro Lauf statt User × Module Einzel-Queries (siehe scheduler.run_daily_unlock_job)
+from unlock_engine import UnlockEngine
+
+app.config.setdefault('UNLOCK_CHUNK_SIZE', int(os.environ.get('UNLOCK_CHUNK_SIZE', 1000)))
+app.config.setdefault('UNLOCK_SHARD_SIZE', int(os.environ.get('UNLOCK_SHARD_SIZE', 1000)))
+app.config.setdefault('UNLOCK_WORKERS', int(os.environ.get('UNLOCK_WORKERS', 4)))
+# Nur User auswerten, deren next_unlock_at erreicht ist (False = jede Nacht alle aktiven User)
+app.config.setdefault('UNLOCK_INCREMENTAL', os.environ.get('UNLOCK_INCREMENTAL', 'True') == 'True')
+
+unlock_engine = UnlockEngine(app, db, User, LearningModule, UserModuleUnlock, UnlockCheckpoint, UserUnlockState, AppState)
+
+# Scheduler-Jobs laufen unter einer DB-Lease (job_leases) mit Historie (job_runs), siehe scheduler.py
+from job_lock import JobRunner
+
+app.config.setdefault('SCHEDULER_LEASE_SECONDS', int(os.environ.get('SCHEDULER_LEASE_SECONDS', 3600)))
+# Intervall, in dem fehlgeschlagene Läufe des aktuellen Slots nachgeholt werden
+app.config.setdefault('SCHEDULER_RETRY_MINUTES', int(os.environ.get('SCHEDULER_RETRY_MINUTES', 15)))
+# Lauf-Historie (job_runs) aufbewahren, älteres löscht der Aufbewahrungs-Job (0 = nie)
+app.config.setdefault('SCHEDULER_RUN_HISTORY_DAYS', int(os.environ.get('SCHEDULER_RUN_HISTORY_DAYS', 90)))
+# True = jeder Web-Worker startet einen Scheduler (sicher dank Lease); sonst eigener Prozess: python scheduler.py
+app.config.setdefault('SCHEDULER_EMBEDDED', os.environ.get('SCHEDULER_EMBEDDED', 'False') == 'True')
+
+job_runner = JobRunner(app, db, JobLease, JobRun)
+
+# === MODUL-AUFRUFE (Write-Behind) ===
+
+# view_count und ModuleProgress.last_accessed werden gesammelt und periodisch gebündelt geschrieben
+from view_counter import ViewCounter
+
+app.config.setdefault('VIEW_COUNTER_ASYNC', os.environ.get('VIEW_COUNTER_ASYNC', 'True') == 'True')
+app.config.setdefault('VIEW_COUNTER_FLUSH_INTERVAL', float(os.environ.get('VIEW_COUNTER_FLUSH_INTERVAL', 10.0)))
+
+view_counter = ViewCounter(app, db, LearningModule, ModuleProgress)
+
+def record_module_view(module, track_progress=True):
+    """Zählt einen Modul-Aufruf (+ Fortschritt für eingeloggte User) ohne Commit im Request"""
+    # Temporäre Module (SimpleNamespace-Fallbacks) haben keine DB-Zeile
+    if not isinstance(module, LearningModule):
+        return
+    user_id = None
+    if track_progress and session.get('logged_in'):
+        user_id = session.get('user_id', 'anonymous')
+    view_counter.record(module.id, user_id)
+
 # === MENÜ HELPER FUNCTIONS ===
 
+# Versionierter Menü-Cache (wird bei Änderungen an Kategorien/Modulen automatisch invalidiert)
+from menu_cache import MenuCache
+
+app.config.setdefault('MENU_CACHE_TTL', int(os.environ.get('MENU_CACHE_TTL', 60)))
+
+menu_cache = MenuCache()
+menu_cache.init_app(app, ModuleCategory, ModuleSubcategory, LearningModule)
+
+from render_cache import RenderCache
+
+app.config.setdefault('RENDER_CACHE', os.environ.get('RENDER_CACHE', 'True') == 'True')
+app.config.setdefault('RENDER_CACHE_TTL', int(os.environ.get('RENDER_CACHE_TTL', 300)))
+app.config.setdefault('RENDER_CACHE_MAX_BYTES', int(os.environ.get('RENDER_CACHE_MAX_BYTES', 32 * 1024 * 1024)))
+app.config.setdefault('RENDER_CACHE_DIR', os.environ.get('RENDER_CACHE_DIR'))
+
+render_cache = RenderCache()
+# Menü-Version: prev/next-Navigation und Menü ändern sich mit jeder Modul-/Kategorie-Änderung
+render_cache.init_app(app, version_sources=[lambda: menu_cache.version, lambda: CONTENT_VERSION])
+
+def _current_username():
+    return session.get('user', {}).get('username', '') if session.get('logged_in') else ''
+
+def _csrf_token():
+    from flask_wtf.csrf import generate_csrf
+    return generate_csrf()
+
+render_cache.register_fragment('username', _current_username)
+render_cache.register_fragment('csrf_token', _csrf_token)
+
+# Lerninhalte der Templates (Text, Überschriften, Lesezeit, Bilder) - einmal extrahiert, per Datei-Hash aktuell
+import click
+from module_content import ModuleContentStore
+
+module_content = ModuleContentStore(app, db, ModuleContent)
+
+@app.cli.command('extract-content')
+@click.option('--force', is_flag=True, help='Alle Templates neu parsen')
+def extract_content_command(force):
+    """CLI: flask --app app extract-content (nur neue/geänderte Templates)"""
+    stats = module_content.refresh(force=force)
+    print(f"[CONTENT] {stats['templates']} Templates, {stats['parsed']} extrahiert, "
+          f"{stats['unchanged']} unverändert, {stats['removed']} entfernt")
+
+# Inkrementeller Template-Scan (Admin, init_db_tables.py, Deploy-Hooks): ein Diff, eine Transaktion
+from template_registry import TemplateRegistry
+
+template_registry = TemplateRegistry(app, db, LearningModule, ModuleCategory, module_content)
+
+@app.cli.command('scan-templates')
+@click.option('--dry-run', is_flag=True, help='Nur den Diff anzeigen')
+@click.option('--unpublish-orphans', is_flag=True, help='Veröffentlichte Module ohne Template-Datei depublizieren')
+def scan_templates_command(dry_run, unpublish_orphans):
+    """CLI: flask --app app scan-templates (neue Templates als unveröffentlichte Module registrieren)"""
+    result = template_registry.scan(dry_run=dry_run, unpublish_orphans=unpublish_orphans)
+    for name in result['created']:
+        print(f"  + {name}")
+    for slug, old_file, new_file in result['updated']:
+        print(f"  ~ {slug}: {old_file or '(leer)'} → {new_file}")
+    for slug in result['orphans']:
+        print(f"  ! {slug}: Template-Datei fehlt" + (' (depubliziert)' if slug in result['unpublished'] else ''))
+    print(f"[SCAN] {len(result['created'])} neu, {len(result['updated'])} aktualisiert, "
+          f"{len(result['orphans'])} ohne Datei, {result['content']['parsed']} Templates geparst "
+          f"in {result['seconds']}s" + (' (Dry-Run)' if dry_run else ''))
+
+# Export/Import der Menüstruktur (Admin-Export, Umgebungs-Syncs)
+from module_export import EXPORT_FORMATS, StructureExport
+
+structure_export = StructureExport(db, ModuleCategory, ModuleSubcategory, LearningModule)
+
+# Deklarativer Modul-Katalog (module_catalogue.json): ein Bulk-Diff, eine Transaktion
+from module_catalogue import CatalogueError, ModuleCatalogue
+
+app.config.setdefault('MODULE_CATALOGUE', os.environ.get('MODULE_CATALOGUE'))
+app.config.setdefault('MODULE_CATALOGUE_UPDATE', os.environ.get('MODULE_CATALOGUE_UPDATE', 'False') == 'True')
+
+module_catalogue = ModuleCatalogue(app, db, ModuleCategory, ModuleSubcategory, LearningModule)
+
+@app.cli.command('sync-catalogue')
+@click.option('--update', is_flag=True, help='Abweichende Felder bestehender Datensätze auf die Katalog-Werte setzen')
+@click.option('--dry-run', is_flag=True, help='Nur den Diff anzeigen')
+@click.option('--file', 'path', type=click.Path(exists=True, dir_okay=False), help='Anderer Katalog als MODULE_CATALOGUE')
+def sync_catalogue_command(update, dry_run, path):
+    """CLI: flask --app app sync-catalogue (ersetzt die register_*.py-Migrationen)"""
+    try:
+        result = module_catalogue.sync(update=update, dry_run=dry_run, path=path)
+    except CatalogueError as e:
+        raise click.ClickException(str(e))
+    created = updated = 0
+    for kind, label in (('categories', 'Kategorie'), ('subcategories', 'Unterkategorie'), ('modules', 'Modul')):
+        for slug in result[kind]['created']:
+            print(f"  + {label} {slug}")
+        for slug, changes in result[kind]['updated']:
+            print(f"  ~ {label} {slug}: " + ', '.join(f"{key} {old!r} → {new!r}" for key, (old, new) in changes.items()))
+        created += len(result[kind]['created'])
+        updated += len(result[kind]['updated'])
+    print(f"[KATALOG] {created} neu, {updated} aktualisiert in {result['seconds']}s" + (' (Dry-Run)' if dry_run else ''))
+
+# Backup der Modul-Definitionen: Journal pro Commit + verdichtete Snapshots (ersetzt modules_backup.json)
+from module_backup import ModuleBackupStore
+
+app.config.setdefault('MODULE_BACKUP', os.environ.get('MODULE_BACKUP', 'True') == 'True')
+app.config.setdefault('MODULE_BACKUP_DIR', os.environ.get('MODULE_BACKUP_DIR'))
+app.config.setdefault('MODULE_BACKUP_SNAPSHOT_EVERY', int(os.environ.get('MODULE_BACKUP_SNAPSHOT_EVERY', 500)))
+
+module_backup = ModuleBackupStore(app, db, LearningModule, ModuleCategory)
+
+@app.cli.command('snapshot-modules')
+@click.option('--from-db', is_flag=True, help='Snapshot aus dem aktuellen DB-Stand statt aus dem Journal')
+def snapshot_modules_command(from_db):
+    """CLI: flask --app app snapshot-modules (verdichtet das Backup-Journal)"""
+    count = module_backup.snapshot(from_database=from_db)
+    print(f"[BACKUP] Snapshot mit {count} Modulen geschrieben ({module_backup.snapshot_path})")
+
+@app.cli.command('restore-modules')
+@click.option('--dry-run', is_flag=True, help='Nur anzeigen, was wiederhergestellt würde')
+def restore_modules_command(dry_run):
+    """CLI: flask --app app restore-modules (legt fehlende Module aus dem Backup an)"""
+    result = module_backup.restore(dry_run=dry_run)
+    for slug in result['restored']:
+        print(f"  + {slug}")
+    for slug in result['missing_category']:
+        print(f"  ! {slug}: Kategorie fehlt")
+    print(f"[BACKUP] {len(result['restored'])} wiederhergestellt, {result['existing']} vorhanden"
+          + (' (Dry-Run)' if dry_run else ''))
+
+# Volltext-Suche über Titel, Beschreibung und Lerninhalte der Module
+from search_index import SearchIndex
+
+app.config.setdefault('SEARCH_INDEX_TTL', int(os.environ.get('SEARCH_INDEX_TTL', 60)))
+
+search_index = SearchIndex()
+search_index.init_app(app, db, LearningModule, ModuleCategory, content=module_content)
+
 def get_menu_structure():
-    """Lädt die komplette Menüstruktur für die Navigation"""
+    """Lädt die komplette Menüstruktur für die Navigation (aus dem Menü-Cache, nur lesend verwenden)"""
     try:
-        categories = ModuleCategory.query.filter_by(is_active=True).order_by(ModuleCategory.sort_order).all()
-        return [cat.to_dict() for cat in categories]
+        return menu_cache.get_structure()
     except:
         return []
 
 def get_accessible_modules_count(user_subscription="free"):
-    """Zählt verfügbare Module für User"""
+    """Zählt verfügbare Module für User (pro Subscription-Level gecacht)"""
     try:
-        all_modules = LearningModule.query.filter_by(is_published=True).all()
-        accessible = 0
-        lead_magnets = 0
-        
-        for module in all_modules:
-            if module.is_lead_magnet:
-                lead_magnets += 1
-                accessible += 1
-            elif user_subscription in module.required_subscription_levels:
-                accessible += 1
-        
-        return {
-            'total': len(all_modules),
-            'accessible': accessible,
-            'lead_magnets': lead_magnets
-        }
+        return menu_cache.get_stats(user_subscription)
     except:
         return {'total': 0, 'accessible': 0, 'lead_magnets': 0}
 
 @app.context_processor
 def inject_menu():
     """Template-Kontext für alle Templates verfügbar machen"""
-    from flask_wtf.csrf import generate_csrf
-
     menu_structure = get_menu_structure()
 
     # User Subscription ermitteln
     user_subscription = "free"
-    if session.get('logged_in'):
+    # Emails werden auch ohne Request gerendert (Scheduler, Outbox)
+    if has_request_context() and session.get('logged_in'):
         user_subscription = session.get('user', {}).get('membership', 'free')
 
     # Modul-Statistiken
@@ -905,7 +1196,8 @@ def inject_menu():
         'total_modules': stats['total'],
         'accessible_modules': stats['accessible'],
         'lead_magnets': stats['lead_magnets'],
-        'csrf_token': generate_csrf  # CSRF-Token für alle Templates verfügbar machen
+        # CSRF-Token für alle Templates - als Fragment, damit gecachte Seiten pro User korrekt bleiben
+        'csrf_token': render_cache.fragment_function('csrf_token')
     }
 
 # === ROUTES ===
@@ -982,15 +1274,7 @@ def init_database_route():
 def home():
     """Startseite mit verfügbaren Modulen"""
     try:
-        # Ensure database is initialized
-        db.create_all()
-        
-        # Initialize demo modules if database is empty
-        if not LearningModule.query.first():
-            init_demo_modules()
-        
-        # Auto-sync: Check if local modules need to be synced to Railway
-        sync_modules_from_local()
+        # Schema, Demo-Module und Auto-Sync laufen einmalig im Bootstrap (ensure_bootstrapped)
         
         # Lead-Magnete für nicht-eingeloggte User
         if not session.get('logged_in'):
@@ -1022,7 +1306,7 @@ def home():
             ).order_by(LearningModule.view_count.desc()).limit(3).all()
             
             # Nur Module mit Zugriff
-            accessible_recommended = [mod for mod in recommended if mod.user_has_access(user_subscription)]
+            accessible_recommended = module_access.for_request().filter_accessible(recommended)
             
         except Exception as e:
             print(f"Database error for logged in user: {e}")
@@ -1567,50 +1851,49 @@ def modules():
                 print(f"Fehler beim Laden der Progress-Daten: {e}")
     
     # Erweiterte Menüstruktur mit direkten Modulen
+    # Feste Anzahl Queries: Kategorien, Unterkategorien und Module werden per selectinload
+    # gebündelt geladen und danach nur noch im Speicher zusammengesetzt (kein N+1)
     try:
-        categories = ModuleCategory.query.filter_by(is_active=True).order_by(ModuleCategory.sort_order).all()
+        from sqlalchemy.orm import selectinload
+        
+        categories = ModuleCategory.query.options(
+            selectinload(ModuleCategory.subcategories).selectinload(ModuleSubcategory.modules),
+            selectinload(ModuleCategory.modules)
+        ).filter_by(is_active=True).order_by(ModuleCategory.sort_order).all()
         menu_structure = []
         
+        # Zugriffskontext einmal pro Request (Admin und Didi haben immer Zugriff)
+        access = module_access.for_request()
+        
+        def apply_user_fields(module_data, module):
+            module_data['user_has_access'] = access.can_access(module)
+            # Progress-Status hinzufügen
+            module_data['is_completed'] = user_progress.get(module.id, {}).get('completed', False)
+            # FIX: Korrigiere 'free' in required_subscription_levels für Frontend-Anzeige
+            if module_data.get('required_subscription_levels'):
+                fixed_levels = [l for l in module_data['required_subscription_levels'] if l.lower() != 'free']
+                if not fixed_levels and not module_data.get('is_lead_magnet'):
+                    fixed_levels = ['premium']  # Fallback für ungültige ['free'] Einträge
+                module_data['required_subscription_levels'] = fixed_levels
+            return module_data
+        
         for category in categories:
             cat_data = category.to_dict()
+            modules_by_id = {module.id: module for module in category.modules}
             
             # Direkte Module (ohne Unterkategorie) hinzufügen
-            direct_modules = LearningModule.query.filter_by(
-                category_id=category.id, 
-                subcategory_id=None,
-                is_published=True
-            ).order_by(LearningModule.sort_order).all()
-            
-            cat_data['direct_modules'] = []
-            for module in direct_modules:
-                module_data = module.to_dict()
-                # Admin und Didi haben immer Zugriff
-                module_data['user_has_access'] = is_admin or module.user_has_access(user_subscription)
-                # Progress-Status hinzufügen
-                module_data['is_completed'] = user_progress.get(module.id, {}).get('completed', False)
-                # FIX: Korrigiere 'free' in required_subscription_levels für Frontend-Anzeige
-                if module_data.get('required_subscription_levels'):
-                    fixed_levels = [l for l in module_data['required_subscription_levels'] if l.lower() != 'free']
-                    if not fixed_levels and not module_data.get('is_lead_magnet'):
-                        fixed_levels = ['premium']  # Fallback für ungültige ['free'] Einträge
-                    module_data['required_subscription_levels'] = fixed_levels
-                cat_data['direct_modules'].append(module_data)
+            direct_modules = sorted(
+                (module for module in category.modules if module.subcategory_id is None and module.is_published),
+                key=lambda module: module.sort_order or 0
+            )
+            cat_data['direct_modules'] = [apply_user_fields(module.to_dict(), module) for module in direct_modules]
             
             # Auch für Module in Unterkategorien den Zugriff prüfen
             for subcat in cat_data['subcategories']:
                 for module_data in subcat['modules']:
-                    module_obj = LearningModule.query.get(module_data['id'])
+                    module_obj = modules_by_id.get(module_data['id'])
                     if module_obj:
-                        # Admin und Didi haben immer Zugriff
-                        module_data['user_has_access'] = is_admin or module_obj.user_has_access(user_subscription)
-                        # Progress-Status hinzufügen
-                        module_data['is_completed'] = user_progress.get(module_data['id'], {}).get('completed', False)
-                        # FIX: Korrigiere 'free' in required_subscription_levels für Frontend-Anzeige
-                        if module_data.get('required_subscription_levels'):
-                            fixed_levels = [l for l in module_data['required_subscription_levels'] if l.lower() != 'free']
-                            if not fixed_levels and not module_data.get('is_lead_magnet'):
-                                fixed_levels = ['premium']  # Fallback für ungültige ['free'] Einträge
-                            module_data['required_subscription_levels'] = fixed_levels
+                        apply_user_fields(module_data, module_obj)
             
             menu_structure.append(cat_data)
             
@@ -1674,31 +1957,8 @@ def module_view(slug):
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug=slug))
     
-    # Progress tracking (optional)
-    if session.get('logged_in'):
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    try:
-        module.view_count += 1
-        db.session.commit()
-    except:
-        pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
 
     # Content-Type bestimmen
@@ -1708,32 +1968,20 @@ def module_view(slug):
     elif module.template_file:
         # Prüfe ob es eine standalone HTML-Seite ist (z.B. better-volume-lernseite.html)
         # Diese Seiten haben DOCTYPE und sind komplett eigenständig
-        if module.template_file in ['better-volume-lernseite.html', 'trading_archetypen.html']:
+        if module.template_file in RAW_TEMPLATES:
             # Standalone HTML direkt ausliefern ohne Template-Engine
             try:
-                return send_from_directory('templates', module.template_file)
+                return send_standalone_page(module.template_file)
             except Exception as e:
                 # Fallback: Versuche als reguläres Template
                 print(f"Fehler beim Laden von standalone HTML: {e}")
                 pass
         
         # Bestehende HTML-Templates nutzen (wie magic_line.html)
-        # Navigation-Daten ermitteln
-        prev_module, next_module = get_module_navigation(module)
-        return render_template(module.template_file, 
-                             module=module, 
-                             prev_module=prev_module, 
-                             next_module=next_module,
-                             is_admin=is_admin)
+        return render_module_page(module.template_file, module, is_admin=is_admin)
     else:
         # Standard-Template für neue Module
-        # Navigation-Daten ermitteln
-        prev_module, next_module = get_module_navigation(module)
-        return render_template('module_default.html', 
-                             module=module, 
-                             prev_module=prev_module, 
-                             next_module=next_module,
-                             is_admin=is_admin)
+        return render_module_page('module_default.html', module, is_admin=is_admin)
 
 @app.route('/admin/module-preview/<int:module_id>')
 @admin_required
@@ -1767,9 +2015,9 @@ def admin_module_preview(module_id):
                                  is_admin=True)
         
         # Prüfe ob es eine standalone HTML-Seite ist
-        if module.template_file in ['better-volume-lernseite.html', 'trading_archetypen.html']:
+        if module.template_file in RAW_TEMPLATES:
             try:
-                return send_from_directory('templates', module.template_file)
+                return send_standalone_page(module.template_file)
             except Exception as e:
                 print(f"Fehler beim Laden von standalone HTML: {e}")
                 pass
@@ -1801,8 +2049,8 @@ def better_volume_indicator():
     # Kein Login erforderlich - Lead Magnet
     import os
     try:
-        # Lese die HTML-Datei direkt
-        template_path = os.path.join(app.root_path, 'templates', 'better-volume-lernseite.html')
+        # Lese die HTML-Datei direkt (gebaute Version mit Bundles, falls vorhanden)
+        template_path = os.path.join(template_bundles.page_directory('better-volume-lernseite.html'), 'better-volume-lernseite.html')
         with open(template_path, 'r', encoding='utf-8') as f:
             html_content = f.read()
         
@@ -1947,39 +2195,10 @@ def marktampel_allokation():
             flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
             return redirect(url_for('upgrade_required', module_slug=module_slug))
         
-        # Progress tracking (optional)
-        if session.get('logged_in'):
-            user_id = session.get('user_id', 'anonymous')
-            try:
-                progress = ModuleProgress.query.filter_by(
-                    user_id=str(user_id), 
-                    module_id=module.id
-                ).first()
-                
-                if not progress:
-                    progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                    db.session.add(progress)
-                    db.session.commit()
-                else:
-                    progress.last_accessed = datetime.utcnow()
-                    db.session.commit()
-            except:
-                pass
-        
-        # View count erhöhen
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
+        # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+        record_module_view(module)
     
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
-    return render_template('marktampel_allokation_standalone.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('marktampel_allokation_standalone.html', module)
 
 @app.route('/expected-value')
 def expected_value():
@@ -2006,40 +2225,10 @@ def expected_value():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='expected-value'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in') and module:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    return render_template('expected_value.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('expected_value.html', module)
 
 @app.route('/breakout-trading')
 def breakout_trading():
@@ -2068,40 +2257,10 @@ def breakout_trading():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='breakout-trading'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in') and module:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    return render_template('breakout-trading.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('breakout-trading.html', module)
 
 @app.route('/stop-loss-strategien')
 def stop_loss_strategien():
@@ -2130,40 +2289,10 @@ def stop_loss_strategien():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='stop-loss-strategien'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in') and module:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
-    return render_template('stop-loss-strategien.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('stop-loss-strategien.html', module)
 
 @app.route('/traders-journey')
 def traders_journey():
@@ -2192,40 +2321,10 @@ def traders_journey():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='traders-journey'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in') and module:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
-    return render_template('traders-journey.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('traders-journey.html', module)
 
 @app.route('/einfluss-geld-beziehung')
 def einfluss_geld_beziehung():
@@ -2254,40 +2353,10 @@ def einfluss_geld_beziehung():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='einfluss-geld-beziehung'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in') and module:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
-    return render_template('einfluss-geld-beziehung.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('einfluss-geld-beziehung.html', module)
 
 @app.route('/wichtigste-variable-trading')
 def wichtigste_variable_trading():
@@ -2316,40 +2385,10 @@ def wichtigste_variable_trading():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='wichtigste-variable-trading'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in') and module:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
-    return render_template('wichtigste-variable-trading.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('wichtigste-variable-trading.html', module)
 
 @app.route('/breaking-news-trading')
 def breaking_news_trading():
@@ -2378,40 +2417,10 @@ def breaking_news_trading():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='breaking-news-trading'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in') and module:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    return render_template('breaking-news-trading.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('breaking-news-trading.html', module)
 
 # Route /how-to-find-dep entfernt - verwende /dep-trading stattdessen
 # Das Modul wurde durch dep-trading.html ersetzt
@@ -2443,40 +2452,10 @@ def trading_strategie_typen():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='trading-strategie-typen'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in') and module:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
-    return render_template('trading-strategie-typen.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('trading-strategie-typen.html', module)
 
 @app.route('/trading-psychologie-hormone')
 def trading_psychologie_hormone():
@@ -2505,40 +2484,10 @@ def trading_psychologie_hormone():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='trading-psychologie-hormone'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in') and module:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
-    return render_template('trading-psychologie-hormone.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('trading-psychologie-hormone.html', module)
 
 @app.route('/makrobasierte-marktampel')
 def makrobasierte_marktampel():
@@ -2567,40 +2516,10 @@ def makrobasierte_marktampel():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='makrobasierte-marktampel'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in') and module:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
-    return render_template('marktampel_allokation_v2.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('marktampel_allokation_v2.html', module)
 
 @app.route('/sugar-babies')
 def sugar_babies():
@@ -2668,40 +2587,10 @@ def vcp_pattern():
         flash('Für dieses Modul benötigst du ein Elite-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug=module_slug))
     
-    # Progress tracking
-    if session.get('logged_in') and module:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    return render_template('vcp-pattern.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('vcp-pattern.html', module)
     
     return render_template('ev_calculator.html')
 
@@ -2731,41 +2620,65 @@ def bouncy_ball_setup():
     except:
         module = None
     
-    # Progress tracking für eingeloggte User
-    if session.get('logged_in') and module:
-        try:
-            user_id = session.get('user_id')
-            progress = ModuleProgress.query.filter_by(user_id=user_id, module_id=module.id).first()
-            if not progress:
-                progress = ModuleProgress(user_id=user_id, module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if module:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
-    return render_template('bouncy-ball-setup.html',
-                         module=module,
-                         prev_module=prev_module,
-                         next_module=next_module)
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
+    
+    return render_module_page('bouncy-ball-setup.html', module)
+
+# === RESPONSIVE SCREENSHOTS ===
+# WebP/AVIF-Varianten werden zur Build-Zeit erzeugt (Dockerfile bzw. flask --app app build-images)
+from responsive_images import ResponsiveImages, build_variants
+
+app.config.setdefault('RESPONSIVE_IMAGES', os.environ.get('RESPONSIVE_IMAGES', 'True') == 'True')
+app.config.setdefault('RESPONSIVE_IMAGES_SIZES', os.environ.get('RESPONSIVE_IMAGES_SIZES', '(max-width: 768px) 100vw, 900px'))
+responsive_images = ResponsiveImages(app)
+
+@app.cli.command('build-images')
+def build_images_command():
+    """CLI: flask --app app build-images (erzeugt/aktualisiert static/responsive/)"""
+    stats = build_variants(app.root_path)
+    print(f"[IMAGES] {stats['images']} Bilder, {stats['built']} neu gebaut, {stats['skipped']} unverändert")
+
+# === ASSET-FINGERPRINTS & LANGZEIT-CACHING ===
+# Manifest + .br/.gz werden zur Build-Zeit erzeugt (nach build-images, da deren Varianten mitgehasht werden)
+from asset_manifest import AssetManifest, build_manifest
+
+app.config.setdefault('ASSET_FINGERPRINTS', os.environ.get('ASSET_FINGERPRINTS', 'True') == 'True')
+app.config.setdefault('ASSET_MAX_AGE', int(os.environ.get('ASSET_MAX_AGE', 365 * 24 * 3600)))
+asset_manifest = AssetManifest(app)
+
+@app.cli.command('build-assets')
+def build_assets_command():
+    """CLI: flask --app app build-assets (schreibt static/assets-manifest.json und static/precompressed/)"""
+    stats = build_manifest(app.root_path)
+    print(f"[ASSETS] {stats['files']} Dateien, {stats['compressed']} vorkomprimiert, {stats['skipped']} unverändert")
+
+# === KOMPRESSION & MINIFIZIERTE LERNSEITEN ===
+# Inline-CSS/JS großer Templates als Bundles: optionaler Build-Schritt (flask --app app build-bundles)
+from response_compression import ResponseCompression
+from template_bundles import RAW_TEMPLATES, TemplateBundles, build_bundles
+
+app.config.setdefault('COMPRESS_RESPONSES', os.environ.get('COMPRESS_RESPONSES', 'True') == 'True')
+app.config.setdefault('COMPRESS_MIN_SIZE', int(os.environ.get('COMPRESS_MIN_SIZE', 1024)))
+app.config.setdefault('TEMPLATE_BUNDLES', os.environ.get('TEMPLATE_BUNDLES', 'True') == 'True')
+response_compression = ResponseCompression(app)
+template_bundles = TemplateBundles(app)
+
+@app.cli.command('build-bundles')
+def build_bundles_command():
+    """CLI: flask --app app build-bundles (vor build-assets, damit die Bundles gehasht werden)"""
+    stats = build_bundles(app.root_path)
+    print(f"[BUNDLES] {stats['templates']} Templates, {stats['bundles']} Bundles, "
+          f"{stats['bytes_before'] // 1024} KB → {stats['bytes_after'] // 1024} KB HTML")
+
+def send_standalone_page(template_file):
+    """Standalone-HTML ohne Template-Engine ausliefern (gebaute Version, falls vorhanden)"""
+    return send_from_directory(template_bundles.page_directory(template_file), template_file)
 
 @app.route('/Screenshots/<filename>')
 def serve_screenshots(filename):
-    """Serve screenshot files from templates/Screenshots directory"""
-    return send_from_directory('templates/Screenshots', filename)
+    """Serve screenshot files from templates/Screenshots directory (mit ?v=<hash> immutable gecacht)"""
+    return asset_manifest.send('serve_screenshots', 'templates/Screenshots', filename)
 
 @app.route('/boersencrash-maerz-2025')
 def boersencrash_maerz_2025():
@@ -2799,42 +2712,10 @@ def boersencrash_maerz_2025():
         user_subscription = session.get('user', {}).get('membership', 'free')
         username = session.get('user', {}).get('username')
     
-    # Progress tracking (optional)
-    if session.get('logged_in') and hasattr(module, 'id') and module.id != 999:
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            progress = ModuleProgress.query.filter_by(
-                user_id=str(user_id), 
-                module_id=module.id
-            ).first()
-            
-            if not progress:
-                progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                db.session.add(progress)
-                db.session.commit()
-            else:
-                progress.last_accessed = datetime.utcnow()
-                db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen (nur für echte DB-Module)
-    if hasattr(module, 'id') and module.id != 999:
-        try:
-            real_module = LearningModule.query.get(module.id)
-            if real_module:
-                real_module.view_count += 1
-                db.session.commit()
-        except:
-            pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if hasattr(module, 'id') and module.id != 999 else (None, None)
-    
-    return render_template('boersencrash_maerz_2025.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('boersencrash_maerz_2025.html', module, navigation=hasattr(module, 'id') and module.id != 999)
 
 @app.route('/playbook')
 def playbook():
@@ -2869,41 +2750,10 @@ def playbook():
     #     flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
     #     return redirect(url_for('upgrade_required', module_slug='playbook'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in'):
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            if hasattr(module, 'id'):
-                progress = ModuleProgress.query.filter_by(
-                    user_id=str(user_id), 
-                    module_id=module.id
-                ).first()
-                
-                if not progress:
-                    progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                    db.session.add(progress)
-                    db.session.commit()
-                else:
-                    progress.last_accessed = datetime.utcnow()
-                    db.session.commit()
-        except:
-            pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    # View count erhöhen
-    if hasattr(module, 'id'):
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
-    return render_template('Playbook.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('Playbook.html', module)
 
 @app.route('/trading-tools')
 def trading_tools():
@@ -3035,21 +2885,10 @@ def position_sizing_kelly():
     # if user_subscription not in ['premium', 'elite']:
     #     return redirect(url_for('upgrade_required', module_slug='kelly-kriterium'))
     
-    # View Count erhöhen
-    try:
-        if hasattr(module, 'view_count'):
-            module.view_count += 1
-            db.session.commit()
-    except:
-        pass
+    # View Count erhöhen (Write-Behind, kein Commit im Request)
+    record_module_view(module, track_progress=False)
     
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
-    return render_template('Position_Sizing_Kelly.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('Position_Sizing_Kelly.html', module)
 
 @app.route('/trading-playbook-system-iii')
 def trading_playbook_system_iii():
@@ -3086,41 +2925,10 @@ def trading_playbook_system_iii():
     #     flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
     #     return redirect(url_for('upgrade_required', module_slug='trading-playbook-system-iii'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in'):
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            if hasattr(module, 'id'):
-                progress = ModuleProgress.query.filter_by(
-                    user_id=str(user_id), 
-                    module_id=module.id
-                ).first()
-                
-                if not progress:
-                    progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                    db.session.add(progress)
-                    db.session.commit()
-                else:
-                    progress.last_accessed = datetime.utcnow()
-                    db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if hasattr(module, 'id'):
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if hasattr(module, 'id') else (None, None)
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    return render_template('trading_playbook_system_iii.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('trading_playbook_system_iii.html', module, navigation=hasattr(module, 'id'))
 
 @app.route('/trading-playbook-masterclass')
 def trading_playbook_masterclass():
@@ -3156,41 +2964,10 @@ def trading_playbook_masterclass():
         flash('Für diese Elite-Masterclass benötigst du ein Elite-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='trading-playbook-masterclass'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in'):
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            if hasattr(module, 'id'):
-                progress = ModuleProgress.query.filter_by(
-                    user_id=str(user_id), 
-                    module_id=module.id
-                ).first()
-                
-                if not progress:
-                    progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                    db.session.add(progress)
-                    db.session.commit()
-                else:
-                    progress.last_accessed = datetime.utcnow()
-                    db.session.commit()
-        except:
-            pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    # View count erhöhen
-    if hasattr(module, 'id'):
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if hasattr(module, 'id') else (None, None)
-    
-    return render_template('trading_playbook_masterclass.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('trading_playbook_masterclass.html', module, navigation=hasattr(module, 'id'))
 
 @app.route('/bridgewater-quadranten')
 def bridgewater_quadranten():
@@ -3223,41 +3000,10 @@ def bridgewater_quadranten():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='bridgewater-quadranten'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in'):
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            if hasattr(module, 'id'):
-                progress = ModuleProgress.query.filter_by(
-                    user_id=str(user_id), 
-                    module_id=module.id
-                ).first()
-                
-                if not progress:
-                    progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                    db.session.add(progress)
-                    db.session.commit()
-                else:
-                    progress.last_accessed = datetime.utcnow()
-                    db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if hasattr(module, 'id'):
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    return render_template('bridgewater_quadranten_complete.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('bridgewater_quadranten_complete.html', module)
 
 @app.route('/tirone-quadrant-lines')
 def tirone_quadrant_lines():
@@ -3290,41 +3036,10 @@ def tirone_quadrant_lines():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='tirone-quadrant-lines'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in'):
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            if hasattr(module, 'id'):
-                progress = ModuleProgress.query.filter_by(
-                    user_id=str(user_id), 
-                    module_id=module.id
-                ).first()
-                
-                if not progress:
-                    progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                    db.session.add(progress)
-                    db.session.commit()
-                else:
-                    progress.last_accessed = datetime.utcnow()
-                    db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if hasattr(module, 'id'):
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if hasattr(module, 'id') else (None, None)
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    return render_template('tirone_quadrant_lines.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('tirone_quadrant_lines.html', module, navigation=hasattr(module, 'id'))
 
 @app.route('/s-kurven-lifecycle')
 def s_kurven_lifecycle():
@@ -3366,41 +3081,10 @@ def s_kurven_lifecycle():
         flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
         return redirect(url_for('upgrade_required', module_slug='s-kurven-lifecycle'))
     
-    # Progress tracking (optional)
-    if session.get('logged_in'):
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            if hasattr(module, 'id') and module.id:
-                progress = ModuleProgress.query.filter_by(
-                    user_id=str(user_id), 
-                    module_id=module.id
-                ).first()
-                
-                if not progress:
-                    progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                    db.session.add(progress)
-                    db.session.commit()
-                else:
-                    progress.last_accessed = datetime.utcnow()
-                    db.session.commit()
-        except:
-            pass
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    # View count erhöhen
-    if hasattr(module, 'id') and module.id:
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
-    
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if hasattr(module, 'id') else (None, None)
-    
-    return render_template('s-kurven-lifecycle.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('s-kurven-lifecycle.html', module, navigation=hasattr(module, 'id'))
 
 @app.route('/position-sizing-abcd-calculator')
 def position_sizing_abcd_calculator():
@@ -3428,49 +3112,40 @@ def position_sizing_abcd_calculator():
     # Zugriff prüfen (Premium Content)
     user_subscription = session.get('user', {}).get('membership', 'free') if session.get('logged_in') else 'free'
     
-    # Für Demo-Zwecke: Premium und Elite können zugreifen
-    if user_subscription not in ['premium', 'elite'] and hasattr(module, 'required_subscription_levels'):
-        flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
-        return redirect(url_for('upgrade_required', module_slug='position-sizing-abcd-calculator'))
-    
-    # Progress tracking (optional)
-    if session.get('logged_in'):
-        user_id = session.get('user_id', 'anonymous')
-        try:
-            if hasattr(module, 'id'):
-                progress = ModuleProgress.query.filter_by(
-                    user_id=str(user_id), 
-                    module_id=module.id
-                ).first()
-                
-                if not progress:
-                    progress = ModuleProgress(user_id=str(user_id), module_id=module.id)
-                    db.session.add(progress)
-                    db.session.commit()
-                else:
-                    progress.last_accessed = datetime.utcnow()
-                    db.session.commit()
-        except:
-            pass
-    
-    # View count erhöhen
-    if hasattr(module, 'id'):
-        try:
-            module.view_count += 1
-            db.session.commit()
-        except:
-            pass
+    # Für Demo-Zwecke: Premium und Elite können zugreifen
+    if user_subscription not in ['premium', 'elite'] and hasattr(module, 'required_subscription_levels'):
+        flash('Für dieses Modul benötigst du ein Premium-Abonnement.', 'warning')
+        return redirect(url_for('upgrade_required', module_slug='position-sizing-abcd-calculator'))
     
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if hasattr(module, 'id') else (None, None)
+    # Modul-Aufruf + Fortschritt zählen (Write-Behind, kein Commit im Request)
+    record_module_view(module)
     
-    return render_template('position_sizing_abcd_calculator.html', 
-                         module=module, 
-                         prev_module=prev_module, 
-                         next_module=next_module)
+    return render_module_page('position_sizing_abcd_calculator.html', module, navigation=hasattr(module, 'id'))
 
 # === HELPER FUNCTIONS ===
 
+def render_module_page(template_file, module, navigation=None, is_admin=False):
+    """
+    Rendert eine Modulseite - für Nicht-Admins über den Render-Cache.
+
+    Die prev/next-Navigation wird nur bei einem Cache-Miss ermittelt.
+    navigation=None: Navigation, sobald ein Modul vorhanden ist.
+    """
+    def render():
+        show_navigation = bool(module) if navigation is None else navigation
+        prev_module, next_module = get_module_navigation(module) if show_navigation else (None, None)
+        context = {'is_admin': True} if is_admin else {}
+        return render_template(template_file,
+                             module=module,
+                             prev_module=prev_module,
+                             next_module=next_module,
+                             **context)
+
+    username = session.get('user', {}).get('username') if session.get('logged_in') else None
+    tier = session.get('user', {}).get('membership', 'free') if session.get('logged_in') else 'anonymous'
+    return render_cache.render(request.endpoint, module, template_file, tier, render,
+                               bypass=is_admin or username in ['admin', 'didi'])
+
 def get_module_navigation(current_module):
     """Ermittelt vorheriges und nächstes Modul für Navigation"""
     if not current_module:
@@ -3775,14 +3450,8 @@ def poker_cards_comparison():
     except:
         pass
     
-    # Navigation-Daten ermitteln
-    prev_module, next_module = get_module_navigation(module) if module else (None, None)
-    
     # Lead-Magnet - kein Login erforderlich
-    return render_template('poker-cards-comparison.html', 
-                         module=module,
-                         prev_module=prev_module,
-                         next_module=next_module)
+    return render_module_page('poker-cards-comparison.html', module)
 
 @app.route('/wie-man-trader-wird')
 def wie_man_trader_wird():
@@ -4286,13 +3955,7 @@ def add_module():
         )
         
         db.session.add(module)
-        db.session.commit()
-        
-        # JSON-Backup erstellen
-        try:
-            backup_module_to_json(module)
-        except Exception as backup_error:
-            print(f"⚠️ JSON-Backup fehlgeschlagen: {str(backup_error)}")
+        db.session.commit()  # Backup-Journal wird beim Commit geschrieben (module_backup.py)
         
         flash(f'Modul "{title}" erfolgreich erstellt!', 'success')
         
@@ -4550,105 +4213,32 @@ def scan_new_modules():
         return redirect(url_for('home'))
 
     try:
-        import os
-        from pathlib import Path
-
-        # 1. Stelle sicher dass "Neue Module" Kategorie existiert
-        neue_module_cat = ModuleCategory.query.filter_by(slug='neue-module').first()
-        if not neue_module_cat:
-            neue_module_cat = ModuleCategory(
-                name='🆕 Neue Module',
-                slug='neue-module',
-                icon='🆕',
-                description='Neu gefundene Module - Bitte in richtige Kategorie verschieben',
-                sort_order=999,
-                is_active=True
-            )
-            db.session.add(neue_module_cat)
-            db.session.commit()
-            flash('✅ Kategorie "🆕 Neue Module" erstellt', 'success')
+        # Manifest-basiert: nur neue/geänderte Templates werden gelesen, Diff in einer Transaktion
+        result = template_registry.scan()
 
-        # 2. System-Templates die wir ignorieren
-        excluded_files = {
-            'base.html', 'home.html', 'login.html', 'register.html',
-            'modules_overview.html', 'upgrade_required.html', 'module_default.html',
-            '_navigation.html', 'Banner5.html'
-        }
+        if result.get('category_created'):
+            flash('✅ Kategorie "🆕 Neue Module" erstellt', 'success')
 
-        # 3. Scanne templates/*.html
-        templates_dir = Path('templates')
-        all_html_files = list(templates_dir.glob('*.html'))
+        if result['updated']:
+            for slug, old_file, new_file in result['updated']:
+                flash(f'  🔄 Aktualisiert: {slug} → template_file={new_file}', 'info')
+            flash(f'🔄 {len(result["updated"])} Module aktualisiert (template_file ergänzt)', 'success')
 
-        # 4. Filtere System-Dateien
-        module_templates = [f for f in all_html_files if f.name not in excluded_files]
+        if result['created']:
+            flash(f'✅ {len(result["created"])} neue Module gefunden und in "🆕 Neue Module" eingefügt!', 'success')
+            for module_name in result['created']:
+                flash(f'  ➕ {module_name}', 'info')
 
-        # 5. Finde fehlende Module UND Module die aktualisiert werden müssen
-        new_modules = []
-        modules_to_update = []
-        
-        for template_file in module_templates:
-            # Generiere Slug aus Dateiname
-            slug = template_file.name.replace('.html', '')
-            
-            # Prüfe ob bereits in DB (nach template_file ODER slug)
-            existing_by_file = LearningModule.query.filter_by(template_file=template_file.name).first()
-            existing_by_slug = LearningModule.query.filter_by(slug=slug).first()
-            
-            if existing_by_slug and not existing_by_slug.template_file:
-                # Modul existiert aber template_file fehlt → UPDATE
-                modules_to_update.append((existing_by_slug, template_file.name))
-            elif existing_by_slug and existing_by_slug.template_file != template_file.name:
-                # Modul existiert aber falsches template_file → UPDATE
-                modules_to_update.append((existing_by_slug, template_file.name))
-            elif not existing_by_file and not existing_by_slug:
-                # Komplett neues Modul → CREATE
-                new_modules.append(template_file.name)
-
-        # 6. Aktualisiere bestehende Module mit fehlendem template_file
-        updated_count = 0
-        if modules_to_update:
-            for module, template_name in modules_to_update:
-                old_file = module.template_file or '(leer)'
-                module.template_file = template_name
-                updated_count += 1
-                flash(f'  🔄 Aktualisiert: {module.title} → template_file={template_name}', 'info')
-            
-            db.session.commit()
-            flash(f'🔄 {updated_count} Module aktualisiert (template_file ergänzt)', 'success')
-
-        # 7. Füge komplett neue Module ein
-        if new_modules:
-            for idx, template_name in enumerate(new_modules):
-                # Erstelle einfachen Titel aus Dateiname
-                title = template_name.replace('.html', '').replace('_', ' ').replace('-', ' ').title()
-                slug = template_name.replace('.html', '')
-
-                new_module = LearningModule(
-                    category_id=neue_module_cat.id,
-                    title=title,
-                    slug=slug,
-                    description=f'Automatisch gefunden: {template_name} - Bitte Details ergänzen',
-                    icon='📄',
-                    template_file=template_name,
-                    content_type='html',
-                    is_published=False,  # Nicht veröffentlicht bis Admin prüft
-                    is_lead_magnet=False,
-                    required_subscription_levels=['premium', 'elite'],
-                    estimated_duration=30,
-                    difficulty_level='intermediate',
-                    sort_order=100 + idx
-                )
-                db.session.add(new_module)
+        for slug in result['orphans']:
+            flash(f'⚠️ Template-Datei fehlt: {slug}', 'warning')
 
-            db.session.commit()
-            flash(f'✅ {len(new_modules)} neue Module gefunden und in "🆕 Neue Module" eingefügt!', 'success')
-            for module_name in new_modules:
-                flash(f'  ➕ {module_name}', 'info')
-        
-        if not new_modules and not modules_to_update:
+        if not result['created'] and not result['updated']:
             flash('ℹ️ Keine neuen Module gefunden - alle Templates sind bereits registriert', 'info')
 
-        flash(f'📊 Gescannt: {len(module_templates)} Templates (ohne System-Dateien)', 'info')
+        content_stats = result['content']
+        flash(f'📊 Gescannt: {content_stats["templates"]} Templates (ohne System-Dateien), '
+              f'{content_stats["parsed"]} neu geparst, {content_stats["unchanged"]} unverändert '
+              f'in {result["seconds"]}s', 'info')
 
     except Exception as e:
         db.session.rollback()
@@ -4667,11 +4257,9 @@ def scan_new_modules():
 # Alte Routen jetzt durch /admin/scan-new-modules ersetzt - siehe Kommentar oben
 
 def extract_module_metadata(html_file):
-    """Extrahiert Meta-Informationen aus HTML-Template"""
-    import re
+    """Extrahiert Meta-Informationen aus HTML-Template (Inhalt aus der Content-Pipeline)"""
     try:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = module_content.get(html_file.name) or {}
         
         # Standard-Defaults
         info = {
@@ -4684,26 +4272,11 @@ def extract_module_metadata(html_file):
             'is_premium': True
         }
         
-        # Title aus HTML <title> Tag extrahieren
-        title_match = re.search(r'<title[^>]*>(.*?)</title>', content, re.IGNORECASE | re.DOTALL)
-        if title_match:
-            title_text = title_match.group(1).strip()
-            if " - " in title_text:
-                info['title'] = title_text.split(" - ")[0].strip()
-            else:
-                info['title'] = title_text
-        
-        # Description aus Meta-Tags extrahieren
-        desc_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)["\']', content, re.IGNORECASE)
-        if desc_match:
-            info['description'] = desc_match.group(1).strip()
-        
-        # Hero-Subtitle als Fallback für Description
-        hero_match = re.search(r'class=["\']hero-subtitle["\'][^>]*>(.*?)</[^>]+>', content, re.IGNORECASE | re.DOTALL)
-        if hero_match and not desc_match:
-            hero_text = re.sub(r'<[^>]+>', '', hero_match.group(1)).strip()
-            if hero_text and len(hero_text) > 10:
-                info['description'] = hero_text
+        # Title aus <title>, Description aus meta description bzw. .hero-subtitle
+        if content.get('title'):
+            info['title'] = content['title']
+        if content.get('description') and len(content['description']) > 10:
+            info['description'] = content['description']
         
         # Kategorie aus Dateiname ableiten
         filename_lower = html_file.stem.lower()
@@ -4733,10 +4306,9 @@ def extract_module_metadata(html_file):
                 info['icon'] = mapping['icon']
                 break
         
-        # Duration aus HTML-Kommentaren extrahieren
-        duration_match = re.search(r'<!-- duration: (\d+) -->', content, re.IGNORECASE)
-        if duration_match:
-            info['duration'] = int(duration_match.group(1))
+        # Duration aus der geschätzten Lesezeit (Text + Charts)
+        if content.get('reading_minutes'):
+            info['duration'] = content['reading_minutes']
         elif 'complete' in filename_lower or 'masterclass' in filename_lower:
             info['duration'] = 120
         elif 'basic' in filename_lower or 'intro' in filename_lower:
@@ -4793,131 +4365,17 @@ def generate_title_from_filename(filename):
     # Standard Title Case
     return title.title()
 
-def backup_module_to_json(module):
-    """💾 Sichert Modul-Definition in JSON-Backup-Datei"""
-    import json
-    import os
-    from datetime import datetime
-    
-    backup_file = 'modules_backup.json'
-    
-    try:
-        # Lade existierende Backups
-        if os.path.exists(backup_file):
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                backups = json.load(f)
-        else:
-            backups = {'modules': [], 'last_updated': None}
-        
-        # Modul-Definition erstellen
-        module_def = {
-            'id': module.id,
-            'title': module.title,
-            'slug': module.slug,
-            'description': module.description,
-            'icon': module.icon,
-            'template_file': module.template_file,
-            'external_url': module.external_url,
-            'content_type': module.content_type,
-            'category_slug': module.category.slug if module.category else None,
-            'subcategory_id': module.subcategory_id,
-            'is_published': module.is_published,
-            'is_lead_magnet': module.is_lead_magnet,
-            'required_subscription_levels': module.required_subscription_levels,
-            'estimated_duration': module.estimated_duration,
-            'difficulty_level': module.difficulty_level,
-            'sort_order': module.sort_order,
-            'created_at': module.created_at.isoformat() if module.created_at else None,
-            'backed_up_at': datetime.utcnow().isoformat()
-        }
-        
-        # Prüfe ob Modul bereits existiert (Update statt Duplicate)
-        existing_idx = None
-        for idx, existing_module in enumerate(backups['modules']):
-            if existing_module.get('slug') == module.slug:
-                existing_idx = idx
-                break
-        
-        if existing_idx is not None:
-            # Update existing
-            backups['modules'][existing_idx] = module_def
-            print(f"💾 JSON-Backup aktualisiert: {module.title}")
-        else:
-            # Add new
-            backups['modules'].append(module_def)
-            print(f"💾 JSON-Backup erstellt: {module.title}")
-        
-        backups['last_updated'] = datetime.utcnow().isoformat()
-        
-        # Speichere Backup
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            json.dump(backups, f, indent=2, ensure_ascii=False)
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ JSON-Backup Fehler: {str(e)}")
-        return False
-
 def restore_modules_from_json():
-    """📥 Stellt Module aus JSON-Backup wieder her"""
-    import json
-    import os
-    
-    backup_file = 'modules_backup.json'
-    
-    if not os.path.exists(backup_file):
-        print("ℹ️ Keine JSON-Backup-Datei gefunden")
-        return 0
-    
+    """📥 Stellt fehlende Module aus dem Backup (Snapshot + Journal) wieder her"""
     try:
-        with open(backup_file, 'r', encoding='utf-8') as f:
-            backups = json.load(f)
-        
-        restored_count = 0
-        
-        for module_def in backups.get('modules', []):
-            # Prüfe ob Modul bereits existiert
-            existing = LearningModule.query.filter_by(slug=module_def['slug']).first()
-            if existing:
-                continue
-            
-            # Kategorie finden
-            category = ModuleCategory.query.filter_by(slug=module_def['category_slug']).first()
-            if not category:
-                print(f"⚠️ Kategorie nicht gefunden für {module_def['title']}: {module_def['category_slug']}")
-                continue
-            
-            # Modul wiederherstellen
-            new_module = LearningModule(
-                title=module_def['title'],
-                slug=module_def['slug'],
-                description=module_def['description'],
-                icon=module_def['icon'],
-                template_file=module_def.get('template_file'),
-                external_url=module_def.get('external_url'),
-                content_type=module_def.get('content_type', 'html'),
-                category_id=category.id,
-                subcategory_id=module_def.get('subcategory_id'),
-                is_published=module_def.get('is_published', False),
-                is_lead_magnet=module_def.get('is_lead_magnet', False),
-                required_subscription_levels=module_def.get('required_subscription_levels', []),
-                estimated_duration=module_def.get('estimated_duration', 60),
-                difficulty_level=module_def.get('difficulty_level', 'intermediate'),
-                sort_order=module_def.get('sort_order', 100)
-            )
-            
-            db.session.add(new_module)
-            restored_count += 1
-            print(f"📥 Wiederhergestellt: {module_def['title']}")
-        
-        db.session.commit()
-        print(f"✅ {restored_count} Module aus JSON-Backup wiederhergestellt")
-        return restored_count
+        result = module_backup.restore()
+        for slug in result['missing_category']:
+            print(f"⚠️ Kategorie nicht gefunden für {slug}")
+        print(f"✅ {len(result['restored'])} Module aus dem Backup wiederhergestellt")
+        return len(result['restored'])
         
     except Exception as e:
-        print(f"❌ JSON-Restore Fehler: {str(e)}")
-        db.session.rollback()
+        print(f"❌ Restore Fehler: {str(e)}")
         return 0
 
 def find_or_create_category_for_module(category_slug):
@@ -5003,80 +4461,45 @@ def create_auto_module(html_file, module_info, category):
 
 @app.route('/admin/export-structure')
 def export_structure():
-    """Exportiere die komplette Menüstruktur als JSON"""
+    """
+    Exportiert die Menüstruktur als Stream (drei Queries, kategorieweise serialisiert).
+
+    Query-Parameter:
+        format: json (Standard, {"success", "structure"}), ndjson oder import (kompaktes Katalog-Format)
+        include_unpublished: 1 = auch unveröffentlichte Module
+        category: Kategorie-Slug (mehrfach möglich)
+    """
     if not session.get('logged_in') or session.get('user', {}).get('username') not in ['admin', 'didi']:
         return jsonify({'success': False, 'error': 'Admin-Zugriff erforderlich'})
     
+    export_format = request.args.get('format', 'json')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'success': False, 'error': f'Unbekanntes Format: {export_format}'}), 400
+    
     try:
-        categories = ModuleCategory.query.filter_by(is_active=True).order_by(ModuleCategory.sort_order).all()
-        structure = []
-        
-        for category in categories:
-            cat_data = {
-                'name': category.name,
-                'slug': category.slug,
-                'icon': category.icon,
-                'description': category.description,
-                'sort_order': category.sort_order,
-                'subcategories': [],
-                'modules': []
-            }
-            
-            # Subkategorien
-            for subcat in category.subcategories:
-                if subcat.is_active:
-                    subcat_data = {
-                        'name': subcat.name,
-                        'slug': subcat.slug,
-                        'icon': subcat.icon,
-                        'sort_order': subcat.sort_order,
-                        'modules': []
-                    }
-                    
-                    # Module in Subkategorie
-                    for module in subcat.modules:
-                        if module.is_published:
-                            subcat_data['modules'].append({
-                                'title': module.title,
-                                'slug': module.slug,
-                                'description': module.description,
-                                'icon': module.icon,
-                                'template_file': module.template_file,
-                                'external_url': module.external_url,
-                                'is_published': module.is_published,
-                                'is_lead_magnet': module.is_lead_magnet,
-                                'required_subscription_levels': module.required_subscription_levels,
-                                'estimated_duration': module.estimated_duration,
-                                'difficulty_level': module.difficulty_level,
-                                'sort_order': module.sort_order
-                            })
-                    
-                    cat_data['subcategories'].append(subcat_data)
-            
-            # Module direkt in Kategorie
-            for module in category.modules:
-                if not module.subcategory_id and module.is_published:
-                    cat_data['modules'].append({
-                        'title': module.title,
-                        'slug': module.slug,
-                        'description': module.description,
-                        'icon': module.icon,
-                        'template_file': module.template_file,
-                        'external_url': module.external_url,
-                        'is_published': module.is_published,
-                        'is_lead_magnet': module.is_lead_magnet,
-                        'required_subscription_levels': module.required_subscription_levels,
-                        'estimated_duration': module.estimated_duration,
-                        'difficulty_level': module.difficulty_level,
-                        'sort_order': module.sort_order
-                    })
-            
-            structure.append(cat_data)
-        
-        return jsonify({'success': True, 'structure': structure})
-        
+        # Queries laufen hier (vor dem Stream) - Fehler ergeben weiterhin eine JSON-Fehlerantwort
+        chunks = structure_export.stream(
+            export_format,
+            include_unpublished=request.args.get('include_unpublished') in ('1', 'true', 'True'),
+            categories=request.args.getlist('category') or None
+        )
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+        db.session.rollback()
+        return jsonify({'success': False, 'error': str(e)}), 500
+    response = Response(stream_with_context(chunks), mimetype=EXPORT_FORMATS[export_format])
+    if export_format == 'import':
+        filename = f"didis-catalogue-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.json"
+        response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+@app.cli.command('export-catalogue')
+@click.option('--output', '-o', type=click.File('w', encoding='utf-8'), default='-', help='Zieldatei (Standard: stdout)')
+@click.option('--include-unpublished', is_flag=True, help='Auch unveröffentlichte Module')
+@click.option('--category', multiple=True, help='Nur diese Kategorie(n)')
+def export_catalogue_command(output, include_unpublished, category):
+    """CLI: flask --app app export-catalogue -o katalog.json (Import: python migrate_modules.py config katalog.json)"""
+    for chunk in structure_export.stream('import', include_unpublished, list(category) or None):
+        output.write(chunk)
 
 # === API ENDPOINTS ===
 
@@ -5084,29 +4507,19 @@ def export_structure():
 def api_modules_search():
     """API für Modul-Suche"""
     query = request.args.get('q', '')
-    user_subscription = session.get('user', {}).get('membership', 'free')
     
     if not query:
         return jsonify({'modules': []})
     
     try:
-        modules = LearningModule.query.filter(
-            LearningModule.title.contains(query),
-            LearningModule.is_published == True
-        ).limit(10).all()
-        
-        results = []
-        for module in modules:
-            if module.user_has_access(user_subscription):
-                results.append({
-                    'title': module.title,
-                    'slug': module.slug,
-                    'description': module.description,
-                    'icon': module.icon,
-                    'category': module.category.name if module.category else '',
-                    'url': url_for('module_view', slug=module.slug)
-                })
-    except:
+        # Gerankte Treffer aus dem Suchindex, Zugriffsprüfung ohne weitere DB-Abfrage
+        results = search_index.search(
+            query, limit=10, accessible=module_access.for_request().filter_accessible
+        )
+        for result in results:
+            result['url'] = url_for('module_view', slug=result['slug'])
+    except Exception as e:
+        app.logger.error(f"Modul-Suche fehlgeschlagen: {e}")
         results = []
     
     return jsonify({'modules': results})
@@ -5578,484 +4991,18 @@ def init_demo_modules():
     print("[OK] Demo-Module erfolgreich erstellt!")
 
 def sync_modules_from_local():
-    """🔄 Auto-Sync: Synchronisiert lokale Module-Strukturen mit Railway-Datenbank
-    
-    WICHTIG: Füge hier neue Kategorien/Module hinzu, damit sie automatisch online übertragen werden!
+    """🔄 Auto-Sync: Gleicht module_catalogue.json mit der Datenbank ab (Standard: nur Fehlendes anlegen)
+
+    WICHTIG: Neue Kategorien/Module in module_catalogue.json eintragen!
+    Läuft nur im Bootstrap (siehe bootstrap_app_data), wenn sich CONTENT_VERSION geändert hat.
     """
     try:
-        # 🔧 HIER LOKALE KATEGORIEN DEFINIEREN - Werden automatisch zu Railway synced!
-        local_categories = [
-            {
-                'name': '0. Grundlagen',
-                'slug': 'grundlagen', 
-                'icon': '🎓',
-                'description': 'Fundamentale Konzepte und Frameworks für erfolgreiches Trading und Investieren',
-                'sort_order': 0
-            },
-            {
-                'name': '1. Trading-Grundlagen',
-                'slug': 'trading-grundlagen',
-                'icon': '📊', 
-                'description': 'Grundlegende Trading-Konzepte und -Strategien',
-                'sort_order': 1
-            },
-            {
-                'name': '2. Technische Analyse',
-                'slug': 'technische-analyse',
-                'icon': '📈',
-                'description': 'Chartanalyse und technische Indikatoren', 
-                'sort_order': 2
-            },
-            {
-                'name': '3. Fundamentalanalyse',
-                'slug': 'fundamentalanalyse',
-                'icon': '💼',
-                'description': 'Unternehmensbewertung und fundamentale Analyse',
-                'sort_order': 3
-            },
-            {
-                'name': '4. Trading-Psychologie', 
-                'slug': 'trading-psychologie',
-                'icon': '🧠',
-                'description': 'Mentale Aspekte des Tradings und Emotionskontrolle',
-                'sort_order': 4
-            },
-            # 5. Elite - System III wurde ENTFERNT - Kategorie existiert nicht mehr
-            {
-                'name': '🆕 Neue Module',
-                'slug': 'neue-module',
-                'icon': '🆕',
-                'description': 'Automatisch erkannte Module - Bitte in die richtige Kategorie verschieben',
-                'sort_order': 999
-            }
-            # 🆕 NEUE KATEGORIEN HIER HINZUFÜGEN → Automatisch online!
-        ]
-        
-        # 🔧 HIER LOKALE MODULE DEFINIEREN - Werden automatisch zu Railway synced!
-        local_modules = [
-            # Elite System III Module wurden ENTFERNT - Kategorie existiert nicht mehr
-            # Module befinden sich jetzt in "🆕 Neue Module" und können manuell zugewiesen werden
-            
-            # Technische Analyse
-            {
-                'title': 'Magic Line Strategie',
-                'slug': 'magic-line',
-                'category_slug': 'technische-analyse',
-                'subcategory_name': '2.1 Chart-Patterns', 
-                'description': 'Meistere die Kunst des perfekten Ein- und Ausstiegs - Didis bewährte Verkaufssignale',
-                'icon': '🎯',
-                'template_file': 'magic_line.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 120,
-                'difficulty_level': 'advanced',
-                'sort_order': 1
-            },
-            {
-                'title': 'AVWAP Pinch Strategie',
-                'slug': 'avwap-pinch',
-                'category_slug': 'technische-analyse',
-                'description': 'Die Pinch-Strategie mit AVWAP für präzise Entry- und Exit-Points',
-                'icon': '📌',
-                'template_file': 'avwap_pinch.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 80,
-                'difficulty_level': 'advanced',
-                'sort_order': 2
-            },
-            {
-                'title': 'Tirone Levels & Quadrant Lines',
-                'slug': 'tirone-quadrant-lines',
-                'category_slug': 'technische-analyse',
-                'description': 'Meistere die wichtigsten TC2000-Indikatoren für präzise Unterstützungs- und Widerstandsanalysen',
-                'icon': '📊',
-                'template_file': 'tirone_quadrant_lines.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 75,
-                'difficulty_level': 'intermediate',
-                'sort_order': 3
-            },
-            {
-                'title': 'Symmetrie im Trading',
-                'slug': 'symmetrie-trading',
-                'category_slug': 'technische-analyse',
-                'description': 'Eine der einfachsten und mächtigsten Heuristiken zur Vorhersage von Kursbewegungen',
-                'icon': '🔄',
-                'template_file': 'symmetrie-trading.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['free'],
-                'estimated_duration': 45,
-                'difficulty_level': 'intermediate',
-                'sort_order': 4
-            },
-            {
-                'title': 'Volume-Analyse Grundlagen',
-                'slug': 'volume-analyse-grundlagen',
-                'category_slug': 'technische-analyse',
-                'description': 'Verstehe Volumen-Patterns und nutze sie für bessere Trading-Entscheidungen',
-                'icon': '📊',
-                'template_file': 'volume-analyse-grundlagen.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 90,
-                'difficulty_level': 'intermediate',
-                'sort_order': 5
-            },
-            # Risikomanagement & Position Sizing
-            {
-                'title': 'Position Sizing Kelly',
-                'slug': 'position-sizing-kelly',
-                'category_slug': 'grundlagen',
-                'description': 'Kelly-Kriterium für optimales Position Sizing mit interaktivem Rechner',
-                'icon': '🎯',
-                'template_file': 'Position_Sizing_Kelly.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 90,
-                'difficulty_level': 'intermediate',
-                'sort_order': 1
-            },
-            {
-                'title': 'Position Sizing ABCD Calculator',
-                'slug': 'position-sizing-abcd-calculator',
-                'category_slug': 'grundlagen',
-                'description': 'Der ultimative ABCD Position Sizing Rechner mit Didis-Charts Grading-System',
-                'icon': '🎯',
-                'template_file': 'position_sizing_abcd_calculator.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 120,
-                'difficulty_level': 'advanced',
-                'sort_order': 2
-            },
-            {
-                'title': 'Kelly Simulator',
-                'slug': 'kelly-simulator',
-                'category_slug': 'grundlagen',
-                'description': 'Interaktiver Kelly-Kriterium Simulator zum Experimentieren',
-                'icon': '⚖️',
-                'template_file': 'Kelly_Simulator.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 45,
-                'difficulty_level': 'intermediate',
-                'sort_order': 3
-            },
-            {
-                'title': 'Positioning & Risikomanagement',
-                'slug': 'positioning-risikomanagement',
-                'category_slug': 'grundlagen',
-                'description': 'Professionelles Risikomanagement und Position Sizing für Trading-Erfolg',
-                'icon': '⚠️',
-                'template_file': 'positioning_risikomanagement.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 90,
-                'difficulty_level': 'intermediate',
-                'sort_order': 4
-            },
-            {
-                'title': 'Expected Value (EV)',
-                'slug': 'expected-value',
-                'category_slug': 'grundlagen',
-                'description': 'Das fundamentale Konzept für rationale Trading-Entscheidungen',
-                'icon': '📊',
-                'template_file': 'expected_value.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 90,
-                'difficulty_level': 'intermediate',
-                'sort_order': 5
-            },
-            {
-                'title': 'EV Calculator',
-                'slug': 'ev-calculator',
-                'category_slug': 'grundlagen',
-                'description': 'Interaktiver Expected Value Rechner für Trading-Entscheidungen',
-                'icon': '🧮',
-                'template_file': 'ev_calculator.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['free'],
-                'estimated_duration': 45,
-                'difficulty_level': 'beginner',
-                'sort_order': 6
-            },
-            {
-                'title': 'Marktampel & Asset Allokation',
-                'slug': 'marktampel-allokation',
-                'category_slug': 'grundlagen',
-                'description': 'Systematisches Marktampel-System für optimale Asset-Allokation',
-                'icon': '🚦',
-                'template_file': 'marktampel_allokation.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['free'],
-                'estimated_duration': 45,
-                'difficulty_level': 'beginner',
-                'sort_order': 7
-            },
-            {
-                'title': 'Marktampel Standalone',
-                'slug': 'marktampel-standalone',
-                'category_slug': 'grundlagen',
-                'description': 'Standalone Version des Marktampel-Systems',
-                'icon': '🚦',
-                'template_file': 'marktampel_allokation_standalone.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['free'],
-                'estimated_duration': 30,
-                'difficulty_level': 'beginner',
-                'sort_order': 8
-            },
-            {
-                'title': 'Bridgewater Quadranten',
-                'slug': 'bridgewater-quadranten',
-                'category_slug': 'grundlagen',
-                'description': 'Ray Dalios All-Weather-Portfolio und die vier Wirtschaftsquadranten',
-                'icon': '🏛️',
-                'template_file': 'bridgewater_quadranten_complete.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 120,
-                'difficulty_level': 'advanced',
-                'sort_order': 9
-            },
-            # Trading-Psychologie
-            {
-                'title': 'Meta-Learning Quiz',
-                'slug': 'meta-learning-quiz',
-                'category_slug': 'trading-psychologie',
-                'description': 'Interaktives Quiz zum Meta-Learning für Trader',
-                'icon': '🧠',
-                'template_file': 'meta_learning_quiz.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['free'],
-                'estimated_duration': 30,
-                'difficulty_level': 'beginner',
-                'sort_order': 1
-            },
-            {
-                'title': 'Die Wahrheit über die Lernkurve',
-                'slug': 'die-wahrheit-lernkurve',
-                'category_slug': 'trading-psychologie',
-                'description': 'Wie du wirklich besser wirst im Trading - Die Realität der Lernkurve',
-                'icon': '📈',
-                'template_file': 'die_wahrheit_lernkurve.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['free'],
-                'estimated_duration': 45,
-                'difficulty_level': 'beginner',
-                'sort_order': 2
-            },
-            {
-                'title': 'Finde deinen Trading-Weg',
-                'slug': 'finde-deinen-trading-weg',
-                'category_slug': 'trading-psychologie',
-                'description': 'Entdecke deinen persönlichen Trading-Stil und -Ansatz',
-                'icon': '🧭',
-                'template_file': 'finde_deinen_trading_weg.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['free'],
-                'estimated_duration': 60,
-                'difficulty_level': 'beginner',
-                'sort_order': 3
-            },
-            {
-                'title': 'Darwin Investing',
-                'slug': 'darwin-investing',
-                'category_slug': 'trading-psychologie',
-                'description': 'Evolution und Adaption im Trading - Survival of the Fittest',
-                'icon': '🧬',
-                'template_file': 'darwin_investing.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 75,
-                'difficulty_level': 'intermediate',
-                'sort_order': 4
-            },
-            {
-                'title': 'Daily Trading Report Card',
-                'slug': 'daily-report-card',
-                'category_slug': 'trading-psychologie',
-                'description': 'Systematische Selbstreflexion für kontinuierliche Verbesserung',
-                'icon': '📋',
-                'template_file': 'daily_report_card_lernseite.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['free'],
-                'estimated_duration': 45,
-                'difficulty_level': 'beginner',
-                'sort_order': 5
-            },
-            # Trading-Grundlagen
-            {
-                'title': 'Börsencrash März 2025 Analyse',
-                'slug': 'boersencrash-maerz-2025',
-                'category_slug': 'trading-grundlagen',
-                'description': 'Detaillierte Analyse des Börsencrashs vom März 2025 und was wir daraus lernen',
-                'icon': '💥',
-                'template_file': 'boersencrash_maerz_2025.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['free'],
-                'estimated_duration': 60,
-                'difficulty_level': 'intermediate',
-                'sort_order': 1
-            },
-            {
-                'title': 'Trading Tools Übersicht',
-                'slug': 'trading-tools',
-                'category_slug': 'trading-grundlagen',
-                'description': 'Sammlung professioneller Trading-Werkzeuge und Kalkulatoren',
-                'icon': '🛠️',
-                'template_file': 'trading_tools.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['free'],
-                'estimated_duration': 30,
-                'difficulty_level': 'beginner',
-                'sort_order': 2
-            },
-            {
-                'title': 'Poker vs Trading - Der Vergleich',
-                'slug': 'poker-cards-comparison',
-                'category_slug': 'trading-grundlagen',
-                'description': 'Was Poker und Trading gemeinsam haben und wie du davon profitieren kannst',
-                'icon': '🃏',
-                'template_file': 'poker-cards-comparison.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['free'],
-                'estimated_duration': 40,
-                'difficulty_level': 'beginner',
-                'sort_order': 3
-            },
-            # 🆕 Neu gefundene Module - automatisch in "Neue Module" einsortiert
-            {
-                'title': 'Better Volume Indicator',
-                'slug': 'better-volume-lernseite',
-                'category_slug': 'neue-module',
-                'description': 'Interaktive Präsentation zum Better Volume Indicator - Verstehe Volumen-Patterns im Detail',
-                'icon': '📊',
-                'template_file': 'better-volume-lernseite.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 60,
-                'difficulty_level': 'intermediate',
-                'sort_order': 1
-            },
-            {
-                'title': 'Defining Trend',
-                'slug': 'defining-trend',
-                'category_slug': 'neue-module',
-                'description': 'Die Kunst, Trends richtig zu identifizieren und zu definieren',
-                'icon': '📈',
-                'template_file': 'defining-trend.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 75,
-                'difficulty_level': 'intermediate',
-                'sort_order': 2
-            },
-            {
-                'title': 'Risikomanagement',
-                'slug': 'risikomanagement',
-                'category_slug': 'neue-module',
-                'description': 'Umfassender Guide zum professionellen Risikomanagement im Trading',
-                'icon': '⚠️',
-                'template_file': 'risikomanagement.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['premium', 'elite'],
-                'estimated_duration': 90,
-                'difficulty_level': 'intermediate',
-                'sort_order': 3
-            },
-            {
-                'title': '99% Noise vs. 0,1% Edge',
-                'slug': 'noise-vs-edge',
-                'category_slug': 'neue-module',
-                'description': 'Die Kunst der Setup-Selektion - Erkenne den Unterschied zwischen Noise und echtem Edge',
-                'icon': '🔍',
-                'template_file': 'noise-vs-edge.html',
-                'content_type': 'html',
-                'required_subscription_levels': ['elite'],
-                'estimated_duration': 80,
-                'difficulty_level': 'advanced',
-                'sort_order': 4
-            }
-            # 🆕 NEUE MODULE HIER HINZUFÜGEN → Automatisch online!
-        ]
-        
-        synced_categories = 0
-        synced_modules = 0
-        
-        # Kategorien synchronisieren
-        for cat_data in local_categories:
-            existing_cat = ModuleCategory.query.filter_by(slug=cat_data['slug']).first()
-            if not existing_cat:
-                new_category = ModuleCategory(
-                    name=cat_data['name'],
-                    slug=cat_data['slug'],
-                    icon=cat_data['icon'],
-                    description=cat_data['description'],
-                    sort_order=cat_data['sort_order']
-                )
-                db.session.add(new_category)
-                synced_categories += 1
-                print(f"🆕 Auto-synced new category: {cat_data['name']}")
-        
-        if synced_categories > 0:
-            db.session.commit()
-        
-        # Module synchronisieren
-        for mod_data in local_modules:
-            existing_mod = LearningModule.query.filter_by(slug=mod_data['slug']).first()
-            if not existing_mod:
-                # Kategorie finden
-                category = ModuleCategory.query.filter_by(slug=mod_data['category_slug']).first()
-                if category:
-                    # Subcategory finden oder erstellen
-                    subcategory = None
-                    if mod_data.get('subcategory_name'):
-                        subcategory_slug = mod_data['subcategory_name'].lower().replace(' ', '-').replace('.', '')
-                        subcategory = ModuleSubcategory.query.filter_by(
-                            category_id=category.id,
-                            slug=subcategory_slug
-                        ).first()
-                        
-                        if not subcategory:
-                            subcategory = ModuleSubcategory(
-                                category_id=category.id,
-                                name=mod_data['subcategory_name'],
-                                slug=subcategory_slug,
-                                icon=mod_data.get('icon', '📄'),
-                                sort_order=1
-                            )
-                            db.session.add(subcategory)
-                            db.session.flush()
-                    
-                    new_module = LearningModule(
-                        category_id=category.id,
-                        subcategory_id=subcategory.id if subcategory else None,
-                        title=mod_data['title'],
-                        slug=mod_data['slug'],
-                        description=mod_data['description'],
-                        icon=mod_data['icon'],
-                        template_file=mod_data.get('template_file'),
-                        content_type=mod_data.get('content_type', 'html'),
-                        is_published=True,
-                        required_subscription_levels=mod_data.get('required_subscription_levels', ['premium', 'elite']),
-                        estimated_duration=mod_data.get('estimated_duration', 60),
-                        difficulty_level=mod_data.get('difficulty_level', 'intermediate'),
-                        sort_order=mod_data.get('sort_order', 1)
-                    )
-                    db.session.add(new_module)
-                    synced_modules += 1
-                    print(f"🆕 Auto-synced new module: {mod_data['title']}")
-        
-        if synced_modules > 0:
-            db.session.commit()
-        
-        if synced_categories > 0 or synced_modules > 0:
-            print(f"[INFO] Auto-Sync completed: {synced_categories} categories, {synced_modules} modules synced to Railway")
-            
+        result = module_catalogue.sync(update=app.config['MODULE_CATALOGUE_UPDATE'])
+        created = {kind: len(result[kind]['created']) for kind in ('categories', 'subcategories', 'modules')}
+        updated = sum(len(result[kind]['updated']) for kind in ('categories', 'subcategories', 'modules'))
+        if any(created.values()) or updated:
+            print(f"[INFO] Katalog-Sync: {created['categories']} Kategorien, {created['subcategories']} Unterkategorien, "
+                  f"{created['modules']} Module angelegt, {updated} aktualisiert")
     except Exception as e:
         print(f"[ERROR] Auto-sync error: {str(e)}")
         db.session.rollback()
@@ -6170,6 +5117,112 @@ def init_database():
         print(f"[ERROR] Database-Initialisierung fehlgeschlagen: {e}")
         return False
 
+# === BOOTSTRAP (einmalig pro Content-Version statt bei jedem Request) ===
+
+def compute_content_version():
+    """Hash über Tabellen-Schema + Modul-Katalog - ändert sich nur bei Deploys"""
+    import hashlib
+    import json
+    
+    schema = sorted(
+        (table.name, sorted(column.name for column in table.columns))
+        for table in db.metadata.sorted_tables
+    )
+    payload = json.dumps([schema, module_catalogue.version()], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+CONTENT_VERSION = compute_content_version()
+BOOTSTRAP_LOCK_ID = 720501  # Postgres Advisory-Lock-ID für den Bootstrap
+
+app.config.setdefault('BOOTSTRAP_RETRY_SECONDS', int(os.environ.get('BOOTSTRAP_RETRY_SECONDS', 30)))
+
+_bootstrap_lock = threading.Lock()
+_bootstrap_done = False
+_bootstrap_failed_at = None  # monotonic() des letzten Fehlschlags - Retry frühestens nach BOOTSTRAP_RETRY_SECONDS
+
+def get_stored_content_version():
+    """Liest die zuletzt gebootstrapte Content-Version (None wenn Tabelle fehlt)"""
+    try:
+        return AppState.get_value('content_version')
+    except Exception:
+        db.session.rollback()
+        return None
+
+def bootstrap_app_data(force=False):
+    """
+    Einmaliger Bootstrap: Tabellen anlegen, Demo-Module bei leerer DB, lokale Module syncen.
+    
+    Lock-geschützt (Postgres Advisory Lock bzw. Prozess-Lock für SQLite) und über
+    CONTENT_VERSION in app_state markiert - andere Worker überspringen den Bootstrap.
+    
+    Returns:
+        bool: True wenn der Bootstrap ausgeführt wurde, False wenn bereits aktuell
+    """
+    from sqlalchemy import text
+    
+    if not force and get_stored_content_version() == CONTENT_VERSION:
+        return False
+    
+    use_advisory_lock = db.engine.dialect.name == 'postgresql'
+    with _bootstrap_lock:
+        connection = db.engine.connect() if use_advisory_lock else None
+        try:
+            if use_advisory_lock:
+                connection.execute(text('SELECT pg_advisory_lock(:id)'), {'id': BOOTSTRAP_LOCK_ID})
+            
+            # Nach dem Warten auf den Lock: evtl. hat ein anderer Worker schon gebootstrapt
+            if not force and get_stored_content_version() == CONTENT_VERSION:
+                return False
+            
+            print(f"[BOOTSTRAP] Starte Bootstrap für Content-Version {CONTENT_VERSION}...")
+            db.create_all()
+            migrate_visitor_analytics(db, VisitorAnalytics)
+            
+            if not LearningModule.query.first():
+                init_demo_modules()
+            
+            sync_modules_from_local()
+            module_content.refresh()
+            
+            AppState.set_value('content_version', CONTENT_VERSION)
+            db.session.commit()
+            print(f"[BOOTSTRAP] ✅ Content-Version {CONTENT_VERSION} gespeichert")
+            return True
+        finally:
+            if use_advisory_lock:
+                connection.execute(text('SELECT pg_advisory_unlock(:id)'), {'id': BOOTSTRAP_LOCK_ID})
+                connection.close()
+
+@app.before_request
+def ensure_bootstrapped():
+    """Prüft einmal pro Worker-Prozess die Content-Version (danach nur noch ein Flag-Check)"""
+    global _bootstrap_done, _bootstrap_failed_at
+    if _bootstrap_done:
+        return
+    # Nach einem Fehlschlag nicht jeden Request mit Lock, create_all und Katalog-Sync belasten
+    if _bootstrap_failed_at is not None and \
+            time.monotonic() - _bootstrap_failed_at < app.config['BOOTSTRAP_RETRY_SECONDS']:
+        return
+    try:
+        bootstrap_app_data()
+        _bootstrap_done = True
+        _bootstrap_failed_at = None
+        # Liegengebliebene Outbox-Emails (z.B. vor einem Deploy) abarbeiten
+        mail_outbox.start()
+        if app.config['SCHEDULER_EMBEDDED']:
+            from scheduler import init_scheduler
+            init_scheduler(app)
+    except Exception as e:
+        db.session.rollback()
+        _bootstrap_failed_at = time.monotonic()
+        print(f"[ERROR] Bootstrap fehlgeschlagen (nächster Versuch in {app.config['BOOTSTRAP_RETRY_SECONDS']}s): {e}")
+
+@app.cli.command('bootstrap')
+def bootstrap_command():
+    """CLI: flask --app app bootstrap (z.B. als Deploy-Hook vor dem Start der Worker)"""
+    if bootstrap_app_data(force=True):
+        print(f"[BOOTSTRAP] Fertig (Content-Version {CONTENT_VERSION})")
+
 # === NEUE KATEGORIE-MANAGEMENT ROUTEN ===
 
 @app.route('/admin/add-category', methods=['POST'])
@@ -6748,6 +5801,45 @@ def admin_update_module_sort_order():
 
 # === ANALYTICS DASHBOARD ===
 
+# Stündliche/tägliche Rollups mit HyperLogLog-Uniques statt Full-Scans über visitor_analytics
+from analytics_rollup import AnalyticsRollup
+
+app.config.setdefault('ANALYTICS_ROLLUP_GRACE', int(os.environ.get('ANALYTICS_ROLLUP_GRACE', 60)))
+app.config.setdefault('ANALYTICS_ROLLUP_HOURLY_DAYS', int(os.environ.get('ANALYTICS_ROLLUP_HOURLY_DAYS', 7)))
+
+analytics_rollup = AnalyticsRollup(app, db, VisitorAnalytics, AnalyticsRollupBucket, AppState)
+
+# Aufbewahrung: alte Rohdaten in Monatsdateien archivieren (0 = nie löschen)
+app.config.setdefault('ANALYTICS_RETENTION_DAYS', int(os.environ.get('ANALYTICS_RETENTION_DAYS', 400)))
+# Archiv muss auf einem persistenten Volume liegen - ohne gesetztes Verzeichnis wird nichts gelöscht
+app.config.setdefault('ANALYTICS_ARCHIVE_DIR', os.environ.get('ANALYTICS_ARCHIVE_DIR'))
+
+analytics_retention = AnalyticsRetention(app, db, VisitorAnalytics)
+
+def archive_old_analytics():
+    """Verdichtet zuerst, archiviert dann nur bereits verdichtete Rohdaten"""
+    analytics_rollup.run()
+    hour_watermark, _ = analytics_rollup.watermarks()
+    if hour_watermark is None:
+        return 0
+    return analytics_retention.run(not_after=hour_watermark)
+
+@app.cli.command('archive-analytics')
+def archive_analytics_command():
+    """CLI: flask --app app archive-analytics"""
+    archived = archive_old_analytics()
+    print(f"[ANALYTICS] {archived} Einträge archiviert ({analytics_retention.archive_dir})")
+
+@app.cli.command('rollup-analytics')
+def rollup_analytics_command():
+    """CLI: flask --app app rollup-analytics (Nachholen unter der Scheduler-Lease)"""
+    from scheduler import run_locked_job
+    result = run_locked_job(app, 'analytics_rollup', manual=True)
+    if result is None:
+        print("[ANALYTICS] Rollup läuft bereits in einem anderen Prozess - übersprungen")
+    else:
+        print(f"[ANALYTICS] {result['hours']} Stunden, {result['days']} Tage verdichtet")
+
 @app.route('/admin/analytics-test')
 def admin_analytics_test():
     """Einfacher Analytics Test"""
@@ -6769,8 +5861,6 @@ def admin_analytics():
         return redirect(url_for('login'))
     
     try:
-        # Verwende das lokale VisitorAnalytics-Modell
-        from sqlalchemy import func, distinct, cast, Date
         from datetime import datetime, timedelta
         
         # Zeiträume für verschiedene Statistiken
@@ -6781,91 +5871,22 @@ def admin_analytics():
             'quarter': 90
         }
         
-        # Grundstatistiken sammeln
-        stats = {}
-        for period_name, days in periods.items():
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-            
-            # Unique Visitors
-            unique_visitors = db.session.query(
-                func.count(distinct(VisitorAnalytics.ip_address))
-            ).filter(
-                VisitorAnalytics.visited_at >= cutoff_date
-            ).scalar() or 0
-            
-            # Page Views
-            page_views = VisitorAnalytics.query.filter(
-                VisitorAnalytics.visited_at >= cutoff_date
-            ).count()
-            
-            # Top Pages
-            top_pages = db.session.query(
-                VisitorAnalytics.page_url,
-                VisitorAnalytics.page_title,
-                func.count(VisitorAnalytics.id).label('views'),
-                func.count(func.distinct(VisitorAnalytics.ip_address)).label('unique_visitors')
-            ).filter(
-                VisitorAnalytics.visited_at >= cutoff_date
-            ).group_by(
-                VisitorAnalytics.page_url,
-                VisitorAnalytics.page_title
-            ).order_by(
-                func.count(VisitorAnalytics.id).desc()
-            ).limit(5).all()
-            
-            # Device Stats
-            device_stats = db.session.query(
-                VisitorAnalytics.device_type,
-                func.count(func.distinct(VisitorAnalytics.ip_address)).label('unique_visitors'),
-                func.count(VisitorAnalytics.id).label('total_views')
-            ).filter(
-                VisitorAnalytics.visited_at >= cutoff_date
-            ).group_by(
-                VisitorAnalytics.device_type
-            ).all()
-            
-            # Referrer Stats
-            referrer_stats = db.session.query(
-                VisitorAnalytics.referrer,
-                func.count(func.distinct(VisitorAnalytics.ip_address)).label('unique_visitors'),
-                func.count(VisitorAnalytics.id).label('total_visits')
-            ).filter(
-                VisitorAnalytics.visited_at >= cutoff_date,
-                VisitorAnalytics.referrer.isnot(None),
-                VisitorAnalytics.referrer != ''
-            ).group_by(
-                VisitorAnalytics.referrer
-            ).order_by(
-                func.count(VisitorAnalytics.id).desc()
-            ).limit(5).all()
-            
-            stats[period_name] = {
-                'unique_visitors': unique_visitors,
-                'page_views': page_views,
-                'top_pages': top_pages,
-                'device_stats': device_stats,
-                'referrer_stats': referrer_stats
-            }
+        # Grundstatistiken aus den Rollups + noch nicht verdichteten Rohdaten; verdichtet wird
+        # nur im Scheduler-Job unter der Lease (analytics_rollup) bzw. per flask rollup-analytics
+        now = datetime.utcnow()
+        stats = {
+            period_name: analytics_rollup.window(now - timedelta(days=days), now)
+            for period_name, days in periods.items()
+        }
         
         # Tägliche Statistiken für Charts (letzte 30 Tage)
-        cutoff_date = datetime.utcnow() - timedelta(days=30)
-        daily_stats = db.session.query(
-            cast(VisitorAnalytics.visited_at, Date).label('date'),
-            func.count(func.distinct(VisitorAnalytics.ip_address)).label('unique_visitors'),
-            func.count(VisitorAnalytics.id).label('page_views')
-        ).filter(
-            VisitorAnalytics.visited_at >= cutoff_date
-        ).group_by(
-            cast(VisitorAnalytics.visited_at, Date)
-        ).order_by(
-            cast(VisitorAnalytics.visited_at, Date)
-        ).all()
+        daily_stats = analytics_rollup.daily_series(days=30, now=now)
         
         # Chart-Daten für JavaScript vorbereiten
         chart_data = {
-            'dates': [stat.date.strftime('%Y-%m-%d') for stat in daily_stats],
-            'unique_visitors': [stat.unique_visitors for stat in daily_stats],
-            'page_views': [stat.page_views for stat in daily_stats]
+            'dates': [stat['date'].strftime('%Y-%m-%d') for stat in daily_stats],
+            'unique_visitors': [stat['unique_visitors'] for stat in daily_stats],
+            'page_views': [stat['page_views'] for stat in daily_stats]
         }
         
         return render_template('admin/analytics.html', 
@@ -6886,8 +5907,6 @@ def admin_analytics_api():
         return jsonify({'error': 'Unauthorized'}), 401
     
     try:
-        # Verwende das lokale VisitorAnalytics-Modell
-        from sqlalchemy import func, distinct, cast, Date
         from datetime import datetime, timedelta
         
         # Parameter aus Request
@@ -6896,87 +5915,60 @@ def admin_analytics_api():
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
         if metric == 'overview':
-            # Unique Visitors
-            unique_visitors = db.session.query(
-                func.count(distinct(VisitorAnalytics.ip_address))
-            ).filter(
-                VisitorAnalytics.visited_at >= cutoff_date
-            ).scalar() or 0
-            
-            # Page Views
-            page_views = VisitorAnalytics.query.filter(
-                VisitorAnalytics.visited_at >= cutoff_date
-            ).count()
-            
-            # Top Pages
-            top_pages_query = db.session.query(
-                VisitorAnalytics.page_url,
-                VisitorAnalytics.page_title,
-                func.count(VisitorAnalytics.id).label('views'),
-                func.count(func.distinct(VisitorAnalytics.ip_address)).label('unique_visitors')
-            ).filter(
-                VisitorAnalytics.visited_at >= cutoff_date
-            ).group_by(
-                VisitorAnalytics.page_url,
-                VisitorAnalytics.page_title
-            ).order_by(
-                func.count(VisitorAnalytics.id).desc()
-            ).limit(10).all()
-            
+            overview = analytics_rollup.window(cutoff_date, top_pages=10)
             data = {
-                'unique_visitors': unique_visitors,
-                'page_views': page_views,
+                'unique_visitors': overview['unique_visitors'],
+                'page_views': overview['page_views'],
                 'top_pages': [
                     {
-                        'url': page.page_url,
-                        'title': page.page_title,
-                        'views': page.views,
-                        'unique_visitors': page.unique_visitors
-                    } for page in top_pages_query
+                        'url': page['page_url'],
+                        'title': page['page_title'],
+                        'views': page['views'],
+                        'unique_visitors': page['unique_visitors']
+                    } for page in overview['top_pages']
                 ]
             }
         elif metric == 'devices':
-            device_stats = db.session.query(
-                VisitorAnalytics.device_type,
-                func.count(func.distinct(VisitorAnalytics.ip_address)).label('unique_visitors'),
-                func.count(VisitorAnalytics.id).label('total_views')
-            ).filter(
-                VisitorAnalytics.visited_at >= cutoff_date
-            ).group_by(
-                VisitorAnalytics.device_type
-            ).all()
-            
+            device_stats = analytics_rollup.window(cutoff_date, top_pages=0, top_referrers=0)['device_stats']
             data = {
                 'devices': [
                     {
-                        'type': stat.device_type,
-                        'unique_visitors': stat.unique_visitors,
-                        'total_views': stat.total_views
+                        'type': stat['device_type'],
+                        'unique_visitors': stat['unique_visitors'],
+                        'total_views': stat['total_views']
                     } for stat in device_stats
                 ]
             }
         elif metric == 'daily':
-            daily_stats = db.session.query(
-                cast(VisitorAnalytics.visited_at, Date).label('date'),
-                func.count(func.distinct(VisitorAnalytics.ip_address)).label('unique_visitors'),
-                func.count(VisitorAnalytics.id).label('page_views')
-            ).filter(
-                VisitorAnalytics.visited_at >= cutoff_date
-            ).group_by(
-                cast(VisitorAnalytics.visited_at, Date)
-            ).order_by(
-                cast(VisitorAnalytics.visited_at, Date)
-            ).all()
-            
             data = {
                 'daily_stats': [
                     {
-                        'date': stat.date.strftime('%Y-%m-%d'),
-                        'unique_visitors': stat.unique_visitors,
-                        'page_views': stat.page_views
-                    } for stat in daily_stats
+                        'date': stat['date'].strftime('%Y-%m-%d'),
+                        'unique_visitors': stat['unique_visitors'],
+                        'page_views': stat['page_views']
+                    } for stat in analytics_rollup.daily_series(days=days)
                 ]
             }
+        elif metric == 'pipeline':
+            # Zustand der gepufferten Analytics-Ingestion und View-Zähler
+            data = {
+                'pipeline': analytics_queue.stats(),
+                'view_counter': view_counter.stats(),
+                'rollup': analytics_rollup.stats(),
+                'retention': analytics_retention.stats(),
+                'mail_outbox': mail_outbox.stats(),
+                'unlocks': unlock_engine.stats(),
+                'jobs': job_runner.stats(),
+                'rate_limits': limiter.storage.stats() if hasattr(limiter.storage, 'stats') else None,
+                'assets': asset_manifest.stats(),
+                'compression': response_compression.stats(),
+                'render_cache': render_cache.stats(),
+                'search_index': search_index.stats(),
+                'module_content': module_content.stats(),
+                'template_scan': template_registry.stats(),
+                'module_backup': module_backup.stats(),
+                'module_catalogue': module_catalogue.stats()
+            }
         else:
             return jsonify({'error': 'Invalid metric'}), 400
         
@@ -7044,8 +6036,10 @@ def admin_trigger_module_unlock():
         db.create_all()
         
         from scheduler import trigger_manual_unlock
-        trigger_manual_unlock(app)
-        flash('✅ Modul-Freischaltung wurde manuell ausgelöst!', 'success')
+        if trigger_manual_unlock(app) is None:
+            flash('⏳ Die Modul-Freischaltung läuft gerade in einem anderen Prozess.', 'warning')
+        else:
+            flash('✅ Modul-Freischaltung wurde manuell ausgelöst!', 'success')
     except Exception as e:
         flash(f'❌ Fehler bei der Freischaltung: {str(e)}', 'error')
         import traceback
@@ -7522,6 +6516,15 @@ def admin_delete_user(user_id):
 
 # === USER ACTIVITY STATISTICS ===
 
+def module_titles_by_slug(slugs):
+    """Slug → Titel für mehrere Module mit einer Query"""
+    slugs = set(slugs)
+    if not slugs:
+        return {}
+    return dict(
+        db.session.query(LearningModule.slug, LearningModule.title).filter(LearningModule.slug.in_(slugs)).all()
+    )
+
 @app.route('/admin/user-activity')
 @admin_required
 def admin_user_activity():
@@ -7534,7 +6537,7 @@ def admin_user_activity():
     - Letzte Anmeldung der User
     - Zeitliche Übersicht der Aktivität
     """
-    from sqlalchemy import func, distinct, desc
+    from sqlalchemy import func, distinct, case, cast, String
     from datetime import datetime, timedelta
     
     try:
@@ -7542,74 +6545,115 @@ def admin_user_activity():
         days = int(request.args.get('days', 30))
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
+        # Pagination & Sortierung (serverseitig)
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 50, type=int), 1), 200)
+        sort = request.args.get('sort', 'page_views')
+        order = 'asc' if request.args.get('order') == 'asc' else 'desc'
+        
         # === USER-ÜBERSICHT MIT AKTIVITÄTS-STATISTIKEN ===
-        users = User.query.filter(User.username.notin_(['admin', 'didi'])).order_by(User.last_login.desc().nullslast()).all()
-        
-        user_stats = []
-        for user in users:
-            # Seitenaufrufe des Users
-            page_views = VisitorAnalytics.query.filter(
-                VisitorAnalytics.user_id == user.id,
-                VisitorAnalytics.visited_at >= cutoff_date
-            ).count()
-            
-            # Module angeschaut (unique)
-            module_pages = VisitorAnalytics.query.filter(
-                VisitorAnalytics.user_id == user.id,
-                VisitorAnalytics.visited_at >= cutoff_date,
-                VisitorAnalytics.page_url.like('%/module/%')
-            ).count()
-            
-            # Letzter Besuch
-            last_visit = VisitorAnalytics.query.filter(
-                VisitorAnalytics.user_id == user.id
-            ).order_by(VisitorAnalytics.visited_at.desc()).first()
-            
-            # Fortschritt-Einträge
-            progress_count = ModuleProgress.query.filter(
-                ModuleProgress.user_id == str(user.id)
-            ).count()
-            
-            user_stats.append({
+        # Ein GROUP-BY-Durchlauf über die Analytics statt vier Queries pro User
+        is_recent = VisitorAnalytics.visited_at >= cutoff_date
+        activity = db.session.query(
+            VisitorAnalytics.user_id.label('user_id'),
+            func.sum(case((is_recent, 1), else_=0)).label('page_views'),
+            func.sum(case((is_recent & VisitorAnalytics.module_slug.isnot(None), 1), else_=0)).label('module_views'),
+            func.max(VisitorAnalytics.visited_at).label('last_visit')
+        ).filter(
+            VisitorAnalytics.user_id.isnot(None)
+        ).group_by(VisitorAnalytics.user_id).subquery()
+        
+        # Ein GROUP-BY-Durchlauf über den Fortschritt (user_id ist dort ein String)
+        progress = db.session.query(
+            ModuleProgress.user_id.label('user_id'),
+            func.count(ModuleProgress.id).label('progress_count')
+        ).group_by(ModuleProgress.user_id).subquery()
+        
+        page_views = func.coalesce(activity.c.page_views, 0)
+        module_views = func.coalesce(activity.c.module_views, 0)
+        progress_count = func.coalesce(progress.c.progress_count, 0)
+        
+        sort_columns = {
+            'page_views': page_views,
+            'module_views': module_views,
+            'last_visit': activity.c.last_visit,
+            'progress': progress_count,
+            'username': User.username
+        }
+        if sort not in sort_columns:
+            sort = 'page_views'
+        sort_column = sort_columns[sort]
+        sort_column = sort_column.asc() if order == 'asc' else sort_column.desc()
+        
+        users_query = db.session.query(
+            User,
+            page_views.label('page_views'),
+            module_views.label('module_views'),
+            activity.c.last_visit,
+            progress_count.label('progress_count')
+        ).outerjoin(
+            activity, activity.c.user_id == User.id
+        ).outerjoin(
+            progress, progress.c.user_id == cast(User.id, String)
+        ).filter(
+            User.username.notin_(['admin', 'didi'])
+        )
+        
+        total_users = User.query.filter(User.username.notin_(['admin', 'didi'])).count()
+        pages = max((total_users + per_page - 1) // per_page, 1)
+        page = min(page, pages)
+        
+        rows = users_query.order_by(
+            sort_column.nullslast(), User.last_login.desc().nullslast(), User.id
+        ).limit(per_page).offset((page - 1) * per_page).all()
+        
+        user_stats = [
+            {
                 'user': user,
-                'page_views': page_views,
-                'module_views': module_pages,
-                'last_visit': last_visit.visited_at if last_visit else None,
-                'progress_count': progress_count
-            })
+                'page_views': user_page_views,
+                'module_views': user_module_views,
+                'last_visit': last_visit,
+                'progress_count': user_progress_count
+            } for user, user_page_views, user_module_views, last_visit, user_progress_count in rows
+        ]
         
-        # Sortieren nach Aktivität (absteigend)
-        user_stats.sort(key=lambda x: x['page_views'], reverse=True)
+        pagination = {
+            'page': page,
+            'per_page': per_page,
+            'pages': pages,
+            'total': total_users,
+            'has_prev': page > 1,
+            'has_next': page < pages,
+            'sort': sort,
+            'order': order
+        }
         
         # === TOP MODULE (am häufigsten angeschaut) ===
         top_modules = db.session.query(
-            VisitorAnalytics.page_url,
+            VisitorAnalytics.module_slug,
             func.count(VisitorAnalytics.id).label('views'),
             func.count(distinct(VisitorAnalytics.user_id)).label('unique_users')
         ).filter(
             VisitorAnalytics.visited_at >= cutoff_date,
-            VisitorAnalytics.page_url.like('%/module/%'),
+            VisitorAnalytics.module_slug.isnot(None),
             VisitorAnalytics.user_id.isnot(None)
         ).group_by(
-            VisitorAnalytics.page_url
+            VisitorAnalytics.module_slug
         ).order_by(
             func.count(VisitorAnalytics.id).desc()
         ).limit(15).all()
         
-        # Modul-Namen extrahieren
-        top_modules_with_names = []
-        for module_url, views, unique_users in top_modules:
-            # Versuche Modul-Slug aus URL zu extrahieren
-            slug = module_url.split('/module/')[-1].split('?')[0].strip('/')
-            module = LearningModule.query.filter_by(slug=slug).first()
-            module_name = module.title if module else slug
-            
-            top_modules_with_names.append({
-                'url': module_url,
-                'name': module_name,
+        # Modul-Namen (eine Query für alle Slugs)
+        module_titles = module_titles_by_slug(slug for slug, _, _ in top_modules)
+        
+        top_modules_with_names = [
+            {
+                'url': f'/module/{slug}',
+                'name': module_titles.get(slug, slug),
                 'views': views,
                 'unique_users': unique_users
-            })
+            } for slug, views, unique_users in top_modules
+        ]
         
         # === GESAMT-STATISTIKEN ===
         total_page_views = VisitorAnalytics.query.filter(
@@ -7640,6 +6684,7 @@ def admin_user_activity():
         
         return render_template('admin/user_activity.html',
                              user_stats=user_stats,
+                             pagination=pagination,
                              top_modules=top_modules_with_names,
                              total_page_views=total_page_views,
                              active_users_count=active_users_count,
@@ -7681,32 +6726,31 @@ def admin_user_activity_detail(user_id):
         
         # Module-Besuche gruppiert
         module_visits = db.session.query(
-            VisitorAnalytics.page_url,
+            VisitorAnalytics.module_slug,
             func.count(VisitorAnalytics.id).label('views'),
             func.max(VisitorAnalytics.visited_at).label('last_visit'),
             func.min(VisitorAnalytics.visited_at).label('first_visit')
         ).filter(
             VisitorAnalytics.user_id == user.id,
             VisitorAnalytics.visited_at >= cutoff_date,
-            VisitorAnalytics.page_url.like('%/module/%')
+            VisitorAnalytics.module_slug.isnot(None)
         ).group_by(
-            VisitorAnalytics.page_url
+            VisitorAnalytics.module_slug
         ).order_by(
             func.count(VisitorAnalytics.id).desc()
         ).all()
         
-        # Modul-Namen hinzufügen
-        module_visits_with_names = []
-        for url, views, last_visit, first_visit in module_visits:
-            slug = url.split('/module/')[-1].split('?')[0].strip('/')
-            module = LearningModule.query.filter_by(slug=slug).first()
-            module_visits_with_names.append({
-                'url': url,
-                'name': module.title if module else slug,
+        # Modul-Namen hinzufügen (eine Query für alle Slugs)
+        module_titles = module_titles_by_slug(slug for slug, _, _, _ in module_visits)
+        module_visits_with_names = [
+            {
+                'url': f'/module/{slug}',
+                'name': module_titles.get(slug, slug),
                 'views': views,
                 'last_visit': last_visit,
                 'first_visit': first_visit
-            })
+            } for slug, views, last_visit, first_visit in module_visits
+        ]
         
         # Modul-Fortschritte
         progress_entries = ModuleProgress.query.filter(
@@ -7742,7 +6786,7 @@ def admin_user_activity_detail(user_id):
         
         total_module_visits = VisitorAnalytics.query.filter(
             VisitorAnalytics.user_id == user.id,
-            VisitorAnalytics.page_url.like('%/module/%')
+            VisitorAnalytics.module_slug.isnot(None)
         ).count()
         
         return render_template('admin/user_activity_detail.html',
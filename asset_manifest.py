@@ -0,0 +1,285 @@
+# asset_manifest.py - Fingerprints, Langzeit-Caching und vorkomprimierte Auslieferung statischer Dateien
+"""
+Damit Browser Screenshots & Co. nicht bei jedem Besuch neu laden:
+- Build-Schritt (python asset_manifest.py bzw. flask --app app build-assets):
+  hasht alle Dateien unter static/ und templates/Screenshots und schreibt
+  static/assets-manifest.json; dazu .br/.gz-Varianten unter static/precompressed/
+  (nur wenn sie mindestens MIN_SAVING kleiner sind - PNG/JPG lohnen sich selten)
+- url_for('static', ...) und url_for('serve_screenshots', ...) hängen automatisch
+  ?v=<hash> an (url_defaults), Templates bleiben unverändert
+- Auslieferung: passt v zum aktuellen Hash → Cache-Control: public, max-age=1 Jahr,
+  immutable; akzeptiert der Client br/gzip, wird die vorkomprimierte Datei geschickt
+- Ohne Manifest (lokale Entwicklung) verhält sich alles wie bisher
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+
+logger = logging.getLogger(__name__)
+
+BASEDIR = os.path.abspath(os.path.dirname(__file__))
+
+MANIFEST_PATH = 'static/assets-manifest.json'
+PRECOMPRESSED_DIR = 'static/precompressed'
+
+# Endpoint → Quellordner (relativ zum App-Verzeichnis)
+SOURCES = {
+    'static': 'static',
+    'serve_screenshots': 'templates/Screenshots',
+}
+
+# Bevorzugte Reihenfolge bei der Aushandlung
+ENCODINGS = {'br': '.br', 'gzip': '.gz'}
+MIN_SAVING = 0.1  # komprimierte Variante nur behalten, wenn sie >= 10% spart
+# Bereits komprimierte Formate gar nicht erst versuchen (spart Build-Zeit)
+ALREADY_COMPRESSED = ('.jpg', '.jpeg', '.webp', '.avif', '.gif', '.woff2', '.br', '.gz', '.zip')
+ONE_YEAR = 365 * 24 * 3600
+
+
+def manifest_key(endpoint, filename):
+    return f'{endpoint}:{filename}'
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()[:12]
+
+
+def _compressors():
+    compressors = {'gzip': lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+        compressors['br'] = lambda data: brotli.compress(data, quality=11)
+    except ImportError:
+        logger.warning("brotli fehlt - es werden nur .gz-Varianten erzeugt")
+    return compressors
+
+
+def _iter_files(basedir, source_dir):
+    """Alle Dateien eines Quellordners (ohne Manifest und vorkomprimierte Varianten)"""
+    root = os.path.join(basedir, source_dir)
+    skip = {os.path.normpath(os.path.join(basedir, MANIFEST_PATH))}
+    skip_dir = os.path.normpath(os.path.join(basedir, PRECOMPRESSED_DIR))
+    for current, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if os.path.normpath(os.path.join(current, d)) != skip_dir)
+        for name in sorted(files):
+            path = os.path.normpath(os.path.join(current, name))
+            if path in skip or name.startswith('.'):
+                continue
+            yield os.path.relpath(path, root).replace(os.sep, '/'), path
+
+
+def build_manifest(basedir=BASEDIR, force=False):
+    """
+    Hasht alle Assets, erzeugt fehlende .br/.gz-Varianten und schreibt das Manifest.
+
+    Returns:
+        dict: files, compressed, skipped, bytes, compressed_bytes
+    """
+    manifest_path = os.path.join(basedir, MANIFEST_PATH)
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as handle:
+            previous = json.load(handle)
+
+    compressors = _compressors()
+    manifest = {}
+    result = {'files': 0, 'compressed': 0, 'skipped': 0, 'bytes': 0, 'compressed_bytes': 0}
+
+    for endpoint, source_dir in SOURCES.items():
+        for filename, path in _iter_files(basedir, source_dir):
+            key = manifest_key(endpoint, filename)
+            file_hash = _file_hash(path)
+            size = os.path.getsize(path)
+            result['files'] += 1
+            result['bytes'] += size
+
+            entry = previous.get(key)
+            if not force and entry and entry['hash'] == file_hash and _variants_exist(basedir, endpoint, filename, entry):
+                result['skipped'] += 1
+            else:
+                entry = {'hash': file_hash, 'encodings': _compress(basedir, endpoint, filename, path, size, compressors)}
+            manifest[key] = entry
+            if entry['encodings']:
+                result['compressed'] += 1
+                result['compressed_bytes'] += os.path.getsize(
+                    _variant_path(basedir, endpoint, filename, entry['encodings'][0])
+                )
+            else:
+                result['compressed_bytes'] += size
+
+    # Atomar ersetzen: laufende Worker lesen nie ein halbes Manifest
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as handle:
+        json.dump(manifest, handle, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+    _remove_orphans(basedir, manifest)
+    return result
+
+
+def _variant_path(basedir, endpoint, filename, encoding):
+    return os.path.join(basedir, PRECOMPRESSED_DIR, endpoint, filename + ENCODINGS[encoding])
+
+
+def _compress(basedir, endpoint, filename, path, size, compressors):
+    """Schreibt die lohnenden Varianten, gibt die Encodings in bevorzugter Reihenfolge zurück"""
+    if filename.lower().endswith(ALREADY_COMPRESSED):
+        compressors = {}
+    with open(path, 'rb') as handle:
+        data = handle.read()
+
+    encodings = []
+    for encoding in ENCODINGS:
+        target = _variant_path(basedir, endpoint, filename, encoding)
+        compress = compressors.get(encoding)
+        compressed = compress(data) if compress and size else None
+        if compressed is not None and len(compressed) <= size * (1 - MIN_SAVING):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as handle:
+                handle.write(compressed)
+            encodings.append(encoding)
+        elif os.path.exists(target):
+            os.remove(target)
+    return encodings
+
+
+def _variants_exist(basedir, endpoint, filename, entry):
+    return all(os.path.exists(_variant_path(basedir, endpoint, filename, e)) for e in entry['encodings'])
+
+
+def _remove_orphans(basedir, manifest):
+    """Vorkomprimierte Dateien löschen, die kein Manifest-Eintrag mehr referenziert"""
+    referenced = {
+        os.path.normpath(_variant_path(basedir, key.split(':', 1)[0], key.split(':', 1)[1], encoding))
+        for key, entry in manifest.items()
+        for encoding in entry['encodings']
+    }
+    for current, _, files in os.walk(os.path.join(basedir, PRECOMPRESSED_DIR)):
+        for name in files:
+            path = os.path.normpath(os.path.join(current, name))
+            if path not in referenced:
+                os.remove(path)
+
+
+class AssetManifest:
+    """Hängt Fingerprints an url_for() und liefert Assets mit Langzeit-Caching aus"""
+
+    def __init__(self, app=None):
+        self.manifest_path = None
+        self._manifest = None
+        self._mtime = None
+
+        # Zähler für Monitoring
+        self.served = 0
+        self.served_immutable = 0
+        self.served_compressed = 0
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.enabled = app.config.get('ASSET_FINGERPRINTS', True)
+        self.max_age = app.config.get('ASSET_MAX_AGE', ONE_YEAR)
+        self.manifest_path = os.path.join(app.root_path, MANIFEST_PATH)
+        self.precompressed_dir = os.path.join(app.root_path, PRECOMPRESSED_DIR)
+        app.url_defaults(self._add_fingerprint)
+
+        # Der eingebaute static-Endpoint läuft ab jetzt über send()
+        if app.has_static_folder:
+            app.view_functions['static'] = lambda filename: self.send('static', app.static_folder, filename)
+
+    @property
+    def manifest(self):
+        """Manifest lazy laden; im Debug-Modus nach einem neuen Build neu einlesen"""
+        if self._manifest is None or self.app.debug:
+            try:
+                mtime = os.path.getmtime(self.manifest_path)
+            except OSError:
+                mtime = None
+            if self._manifest is None or mtime != self._mtime:
+                self._mtime = mtime
+                self._manifest = {}
+                if mtime is not None:
+                    with open(self.manifest_path, encoding='utf-8') as handle:
+                        self._manifest = json.load(handle)
+        return self._manifest
+
+    def version(self, endpoint, filename):
+        """Aktueller Hash einer Datei, None wenn nicht im Manifest"""
+        entry = self.manifest.get(manifest_key(endpoint, filename)) if self.enabled else None
+        return entry['hash'] if entry else None
+
+    def _add_fingerprint(self, endpoint, values):
+        """url_defaults: ?v=<hash> für alle Asset-Endpoints"""
+        if endpoint in SOURCES and 'filename' in values and 'v' not in values:
+            version = self.version(endpoint, values['filename'])
+            if version:
+                values['v'] = version
+
+    def _negotiate(self, encodings):
+        from flask import request
+
+        for encoding in encodings:
+            if request.accept_encodings[encoding]:
+                return encoding
+        return None
+
+    def send(self, endpoint, directory, filename):
+        """
+        Liefert ein Asset aus (static-Endpoint und /Screenshots/<filename>).
+
+        Mit passendem ?v=<hash> ein Jahr immutable cachebar, sonst wie send_from_directory.
+        """
+        from flask import request, send_from_directory
+
+        self.served += 1
+        entry = self.manifest.get(manifest_key(endpoint, filename)) if self.enabled else None
+        fresh = entry is not None and request.args.get('v') == entry['hash']
+        options = {'max_age': self.max_age} if fresh else {}
+
+        encoding = self._negotiate(entry['encodings']) if entry else None
+        if encoding:
+            response = send_from_directory(
+                os.path.join(self.precompressed_dir, endpoint), filename + ENCODINGS[encoding],
+                mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream', **options
+            )
+            response.headers['Content-Encoding'] = encoding
+            self.served_compressed += 1
+        else:
+            response = send_from_directory(directory, filename, **options)
+
+        if entry and entry['encodings']:
+            response.vary.add('Accept-Encoding')
+        if fresh:
+            response.cache_control.public = True
+            response.cache_control.immutable = True
+            self.served_immutable += 1
+        return response
+
+    def stats(self):
+        """Zähler für Monitoring (dieser Prozess)"""
+        return {
+            'enabled': self.enabled,
+            'files': len(self.manifest),
+            'max_age': self.max_age,
+            'served': self.served,
+            'served_immutable': self.served_immutable,
+            'served_compressed': self.served_compressed
+        }
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    stats = build_manifest()
+    print(f"✅ {stats['files']} Assets ({stats['compressed']} mit .br/.gz, {stats['skipped']} unverändert) → {MANIFEST_PATH}")
+    print(f"   Original: {stats['bytes'] / 1e6:.1f} MB, bestes Encoding: {stats['compressed_bytes'] / 1e6:.1f} MB")
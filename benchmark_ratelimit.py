@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Overhead pro Request der Rate-Limit-Storages (ratelimit_storage.py)
+
+Simuliert die Limits eines Login-POSTs (Default-Limits + Login-Limits) über die
+Fixed-Window-Strategie von limits und misst die Zeit pro Request.
+
+    python benchmark_ratelimit.py                      # SQLite-Datei in einem Temp-Ordner
+    python benchmark_ratelimit.py --url postgresql://...  # gegen die echte Datenbank
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+
+import ratelimit_storage  # noqa: F401 - registriert sql://
+
+# Wie /login (POST): Default-Limits + Decorator-Limits
+LOGIN_LIMITS = [parse('200 per day'), parse('50 per hour'), parse('5 per minute'), parse('20 per hour')]
+
+
+def run(storage, requests, clients):
+    """Führt `requests` Requests verteilt auf `clients` IPs aus, gibt Sekunden pro Request zurück"""
+    limiter = FixedWindowRateLimiter(storage)
+    started = time.perf_counter()
+    for i in range(requests):
+        client = f'10.0.{i % clients // 256}.{i % clients % 256}'
+        for limit in LOGIN_LIMITS:
+            limiter.hit(limit, client, 'login')
+    return (time.perf_counter() - started) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', help='SQLAlchemy-URL (Standard: temporäre SQLite-Datei)')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--clients', type=int, default=20, help='verschiedene IPs (wenige = viele Treffer pro Key und Sekunde)')
+    args = parser.parse_args()
+
+    url = args.url or 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='ratelimit_bench_'), 'bench.db')
+
+    backends = [
+        ('memory://', 'memory://', {}),
+        ('sql:// exakt', 'sql://', {'url': url, 'exact_window': 10 ** 9}),
+        ('sql:// gebündelt', 'sql://', {'url': url}),
+    ]
+
+    print(f"📊 Rate-Limit-Benchmark: {args.requests} Requests × {len(LOGIN_LIMITS)} Limits, {args.clients} Clients")
+    print(f"   Datenbank: {url}")
+    print("=" * 60)
+    for name, uri, options in backends:
+        storage = storage_from_string(uri, **options)
+        storage.reset()
+        run(storage, min(200, args.requests), args.clients)  # Aufwärmen (Tabelle, Pool)
+        storage.reset()
+
+        per_request = run(storage, args.requests, args.clients)
+        line = f"   {name:<18} {per_request * 1000:8.3f} ms/Request   {1 / per_request:10.0f} Requests/s"
+        if hasattr(storage, 'stats'):
+            stats = storage.stats()
+            line += f"   ({stats['round_trips'] / (args.requests + min(200, args.requests)):.2f} DB-Roundtrips/Request)"
+            storage.shutdown()
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
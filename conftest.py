@@ -0,0 +1,50 @@
+"""
+Pytest-Konfiguration: Tests laufen gegen eine temporäre SQLite-Datenbank,
+niemals gegen didis_academy.db oder eine per DATABASE_URL konfigurierte Produktions-DB.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+_test_db = os.path.join(tempfile.mkdtemp(prefix='didis_test_'), 'test.db')
+os.environ['DATABASE_URL'] = 'sqlite:///' + _test_db
+os.environ['ANALYTICS_ASYNC'] = 'False'  # Analytics synchron schreiben (deterministisch)
+os.environ['MAIL_OUTBOX_ASYNC'] = 'False'  # Outbox synchron abarbeiten
+os.environ['MAIL_SUPPRESS_SEND'] = 'True'  # Niemals echte Emails versenden
+os.environ['MODULE_BACKUP_DIR'] = tempfile.mkdtemp(prefix='didis_backup_')  # nie ins Repo schreiben
+
+
+@pytest.fixture
+def app():
+    """Flask-App mit frischen Tabellen pro Test"""
+    import app as app_module
+    from app import app as flask_app, db
+
+    # Kein Auto-Bootstrap (Demo-Module/Sync) während der Tests - test_bootstrap.py testet ihn explizit
+    app_module._bootstrap_done = True
+
+    assert flask_app.config['SQLALCHEMY_DATABASE_URI'] == 'sqlite:///' + _test_db
+    flask_app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+
+    with flask_app.app_context():
+        db.drop_all()
+        db.create_all()
+    yield flask_app
+    with flask_app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def login_as(client, user_id, username, membership='free'):
+    """Setzt eine eingeloggte Session wie nach /login"""
+    with client.session_transaction() as sess:
+        sess['logged_in'] = True
+        sess['user_id'] = str(user_id)
+        sess['user'] = {'id': user_id, 'username': username, 'membership': membership}
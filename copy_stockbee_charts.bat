@@ -53,7 +53,7 @@ echo Dateien sind jetzt verfuegbar unter:
 echo   static/screenshots/StockBee Guides/
 echo.
 echo Naechste Schritte:
-echo 1. python migrations/register_momentum_burst.py
+echo 1. flask --app app sync-catalogue
 echo 2. Teste lokal: http://localhost:5000/module/momentum-burst
 echo 3. Git Add + Commit + Push
 echo.
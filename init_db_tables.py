@@ -6,8 +6,6 @@ Database Init + Auto-Register Templates
 """
 
 from app import app, db
-from pathlib import Path
-import re
 
 def init_tables():
     """Erstellt alle Tabellen falls sie nicht existieren"""
@@ -17,8 +15,8 @@ def init_tables():
         print("[DATABASE] Tabellen bereit!")
 
 def auto_register_templates():
-    """Registriert automatisch alle HTML-Templates als Module"""
-    from app import LearningModule, ModuleCategory
+    """Registriert automatisch alle HTML-Templates als Module (inkrementeller Template-Scan)"""
+    from app import LearningModule, template_registry
     
     with app.app_context():
         # Prüfe ob schon Module existieren
@@ -28,78 +26,18 @@ def auto_register_templates():
             return
         
         print("[INFO] Keine Module gefunden - starte Auto-Register...")
-        
-        # Scanne templates/ Ordner
-        templates_dir = Path(__file__).parent / 'templates'
-        html_files = list(templates_dir.glob('*.html'))
-        
-        # Filtere unwichtige Templates
-        exclude = ['base.html', 'home.html', 'modules_overview.html', 'module_default.html', 
-                   'upgrade_required.html', '_navigation.html']
-        
-        registered = 0
-        for html_file in html_files:
-            if html_file.name in exclude:
-                continue
-            
-            try:
-                # Erstelle Slug aus Dateinamen
-                slug = html_file.stem  # z.B. "risikomanagement" aus "risikomanagement.html"
-                
-                # Prüfe ob bereits existiert
-                if LearningModule.query.filter_by(slug=slug).first():
-                    continue
-                
-                # Lese Template um Titel zu extrahieren (optional)
-                content = html_file.read_text(encoding='utf-8')
-                
-                # Versuche Titel zu extrahieren
-                title_match = re.search(r'<title>(.*?)</title>', content)
-                if title_match:
-                    title = title_match.group(1).replace(' - Didis Trading Academy', '').strip()
-                else:
-                    title = slug.replace('-', ' ').title()
-                
-                # Standard-Kategorie finden oder erstellen
-                category = ModuleCategory.query.first()
-                if not category:
-                    category = ModuleCategory(
-                        name='Uncategorized',
-                        slug='uncategorized',
-                        icon='📁',
-                        sort_order=999,
-                        is_active=True
-                    )
-                    db.session.add(category)
-                    db.session.flush()
-                
-                # Modul erstellen (unveröffentlicht!)
-                module = LearningModule(
-                    category_id=category.id,
-                    title=title,
-                    slug=slug,
-                    description=f'Auto-registriert aus {html_file.name}',
-                    icon='📄',
-                    template_file=html_file.name,
-                    content_type='html',
-                    is_published=False,  # Unveröffentlicht bis Admin es aktiviert!
-                    is_lead_magnet=False,
-                    required_subscription_levels='["premium", "elite", "masterclass"]',
-                    sort_order=999,
-                    estimated_duration=30,
-                    difficulty_level='beginner'
-                )
-                db.session.add(module)
-                registered += 1
-                
-            except Exception as e:
-                print(f"[WARN] Fehler bei {html_file.name}: {e}")
-                continue
-        
-        db.session.commit()
-        print(f"[SUCCESS] {registered} Templates automatisch registriert!")
+        result = template_registry.scan()
+        print(f"[SUCCESS] {len(result['created'])} Templates automatisch registriert ({result['seconds']}s)!")
+
+def run_bootstrap():
+    """Einmaliger Bootstrap vor dem Start der Worker (Demo-Module, Auto-Sync, Content-Version)"""
+    from app import bootstrap_app_data
+    
+    with app.app_context():
+        bootstrap_app_data()
 
 if __name__ == '__main__':
     init_tables()
     auto_register_templates()
+    run_bootstrap()
 
@@ -0,0 +1,293 @@
+# job_lock.py - Datenbank-Lease und Lauf-Historie für Scheduler-Jobs
+"""
+Horizontal sichere Ausführung der Scheduler-Jobs:
+- Vor jedem Lauf wird eine Lease in job_leases erworben (atomar per UPDATE/INSERT);
+  nur der Halter führt den Job aus, alle anderen Worker/Replicas überspringen ihn
+- Jeder Lauf hält die Lease mit eigenem Token (hostname:pid:zufall) - auch zwei Läufe
+  im selben Prozess (z.B. Cron-Job und manueller Lauf) schließen sich gegenseitig aus
+- Abgestürzte Halter blockieren nicht: abgelaufene Leases werden übernommen
+- Laufende Jobs verlängern ihre Lease per Heartbeat (alle heartbeat_seconds); ein Lauf,
+  dessen Lease trotzdem übernommen wurde, protokolliert keinen Erfolg
+- Jeder Lauf wird in job_runs protokolliert (Start, Ende, Dauer, Zeilen, Emails);
+  prune() löscht alte Einträge (Aufruf im Aufbewahrungs-Job)
+- Pro Job und Slot (z.B. Kalendertag) läuft ein Job höchstens einmal erfolgreich;
+  fehlgeschlagene/abgebrochene Slots meldet needs_retry() (Nachholen: scheduler.py)
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import IntegrityError
+
+logger = logging.getLogger(__name__)
+
+RUNNING = 'running'
+SUCCESS = 'success'
+FAILED = 'failed'
+ABORTED = 'aborted'
+
+
+class JobRunner:
+    """Führt Jobs unter einer DB-Lease aus und schreibt die Lauf-Historie"""
+
+    def __init__(self, app=None, db=None, JobLease=None, JobRun=None, lease_seconds=3600, heartbeat_seconds=None):
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+
+        # Zähler für Monitoring
+        self.started = 0
+        self.skipped = 0
+
+        if app is not None:
+            self.init_app(app, db, JobLease, JobRun)
+
+    def init_app(self, app, db, JobLease, JobRun):
+        self.app = app
+        self.db = db
+        self.JobLease = JobLease
+        self.JobRun = JobRun
+        self.lease_seconds = app.config.get('SCHEDULER_LEASE_SECONDS', self.lease_seconds)
+        # Standard: dreimal pro Lease-Dauer verlängern
+        self.heartbeat_seconds = self.heartbeat_seconds or self.lease_seconds / 3
+
+    @property
+    def owner(self):
+        # Pro Aufruf ermitteln: nach einem Fork hat der Worker eine neue PID
+        return f'{socket.gethostname()}:{os.getpid()}'
+
+    def new_token(self):
+        """Lease-Token für genau einen Lauf"""
+        return f'{self.owner}:{uuid.uuid4().hex[:8]}'
+
+    # === LEASE ===
+
+    def acquire(self, job_id, token, now=None):
+        """
+        Erwirbt die Lease für einen Job.
+
+        Args:
+            job_id: z.B. 'daily_module_unlock'
+            token: Token des Laufs (new_token()); eine noch gültige Lease wird nie
+                   erneut vergeben, auch nicht an denselben Prozess
+            now: Referenzzeitpunkt (Standard: jetzt)
+
+        Returns:
+            bool: True wenn dieser Lauf den Job ausführen darf
+        """
+        now = now or datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+        table = self.JobLease.__table__
+
+        # Abgelaufene Lease übernehmen ...
+        result = self.db.session.execute(
+            table.update()
+            .where(table.c.job_id == job_id, table.c.expires_at < now)
+            .values(owner=token, acquired_at=now, expires_at=expires_at)
+        )
+        if result.rowcount:
+            self.db.session.commit()
+            return True
+
+        # ... oder neu anlegen - der Primary Key entscheidet, wer gewinnt
+        try:
+            self.db.session.execute(table.insert().values(
+                job_id=job_id, owner=token, acquired_at=now, expires_at=expires_at
+            ))
+            self.db.session.commit()
+            return True
+        except IntegrityError:
+            self.db.session.rollback()
+            return False
+
+    def renew(self, job_id, token, now=None):
+        """
+        Verlängert die Lease dieses Laufs (Heartbeat, eigene Verbindung).
+
+        Returns:
+            bool: False wenn die Lease inzwischen einem anderen Lauf gehört
+        """
+        now = now or datetime.utcnow()
+        table = self.JobLease.__table__
+        with self.db.engine.begin() as connection:
+            result = connection.execute(
+                table.update()
+                .where(table.c.job_id == job_id, table.c.owner == token)
+                .values(expires_at=now + timedelta(seconds=self.lease_seconds))
+            )
+        return result.rowcount == 1
+
+    def _heartbeat(self, job_id, token, stop, lost):
+        """Hintergrund-Thread: verlängert die Lease, solange der Job läuft"""
+        with self.app.app_context():
+            while not stop.wait(self.heartbeat_seconds):
+                try:
+                    if not self.renew(job_id, token):
+                        logger.error(f"Lease für {job_id} wurde übernommen - Lauf {token} gilt nicht mehr als Halter")
+                        lost.set()
+                        return
+                except Exception as e:
+                    # Nächster Versuch im nächsten Intervall (Lease läuft erst nach lease_seconds ab)
+                    logger.error(f"Heartbeat für {job_id} fehlgeschlagen: {e}")
+
+    def release(self, job_id, token):
+        table = self.JobLease.__table__
+        self.db.session.execute(table.delete().where(table.c.job_id == job_id, table.c.owner == token))
+        self.db.session.commit()
+
+    # === AUSFÜHRUNG ===
+
+    def run(self, job_id, func, slot=None, rows_key='rows', emails_key='emails'):
+        """
+        Führt func() aus, wenn die Lease erworben wurde und der Slot noch nicht erledigt ist.
+
+        Args:
+            job_id: z.B. 'daily_module_unlock'
+            func: Job-Funktion ohne Argumente, gibt optional ein dict zurück
+            slot: geplanter Zeitraum (z.B. '2026-01-31'), None = manueller Lauf
+            rows_key/emails_key: Schlüssel im Ergebnis-dict für die Historie
+
+        Returns:
+            dict: Ergebnis von func(), None wenn übersprungen
+        """
+        token = self.new_token()
+        if not self.acquire(job_id, token):
+            logger.info(f"⏭️ Job {job_id} läuft bereits - übersprungen")
+            self.skipped += 1
+            return None
+
+        try:
+            run = self._start_run(job_id, slot, token)
+            if run is None:
+                logger.info(f"⏭️ Job {job_id} für Slot {slot} bereits erfolgreich gelaufen - übersprungen")
+                self.skipped += 1
+                return None
+
+            self.started += 1
+            started = time.monotonic()
+            stop, lost = threading.Event(), threading.Event()
+            heartbeat = threading.Thread(target=self._heartbeat, args=(job_id, token, stop, lost),
+                                         name=f'lease-{job_id}', daemon=True)
+            heartbeat.start()
+            try:
+                result = func()
+            except Exception as e:
+                self.db.session.rollback()
+                if self._still_owner(run, job_id, token, stop, heartbeat, lost):
+                    self._finish_run(run, FAILED, time.monotonic() - started, error=e)
+                raise
+            finally:
+                stop.set()
+
+            if not self._still_owner(run, job_id, token, stop, heartbeat, lost):
+                # Ein anderer Lauf hat übernommen (und den Slot neu gestartet) - kein Erfolg melden
+                raise RuntimeError(f"Lease für {job_id} verloren - Lauf wird nicht als erfolgreich protokolliert")
+            self._finish_run(run, SUCCESS, time.monotonic() - started, result, rows_key, emails_key)
+            return result
+        finally:
+            try:
+                self.release(job_id, token)
+            except Exception as e:
+                # Lease läuft spätestens nach lease_seconds ab
+                logger.error(f"Lease für {job_id} konnte nicht freigegeben werden: {e}")
+                self.db.session.rollback()
+
+    def _still_owner(self, run, job_id, token, stop, heartbeat, lost):
+        """Heartbeat beenden und prüfen, ob Lease und Lauf-Zeile noch diesem Lauf gehören"""
+        stop.set()
+        heartbeat.join()
+        if lost.is_set() or not self.renew(job_id, token):
+            return False
+        self.db.session.refresh(run)
+        return run.owner == token
+
+    def _start_run(self, job_id, slot, token):
+        """Legt den Lauf an (oder übernimmt einen fehlgeschlagenen Lauf desselben Slots)"""
+        JobRun = self.JobRun
+        now = datetime.utcnow()
+
+        # Wer die Lease hält, ist der einzige Läufer - offene Läufe sind verwaist
+        JobRun.query.filter_by(job_id=job_id, status=RUNNING).update(
+            {JobRun.status: ABORTED, JobRun.finished_at: now}, synchronize_session=False
+        )
+
+        run = JobRun.query.filter_by(job_id=job_id, slot=slot).first() if slot is not None else None
+        if run is not None and run.status == SUCCESS:
+            self.db.session.commit()
+            return None
+        if run is None:
+            run = JobRun(job_id=job_id, slot=slot)
+            self.db.session.add(run)
+
+        run.owner = token
+        run.status = RUNNING
+        run.started_at = now
+        run.finished_at = None
+        run.error = None
+        self.db.session.commit()
+        return run
+
+    def _finish_run(self, run, status, duration, result=None, rows_key=None, emails_key=None, error=None):
+        run.status = status
+        run.finished_at = datetime.utcnow()
+        run.duration_seconds = round(duration, 3)
+        if isinstance(result, dict):
+            run.result = result
+            run.rows_processed = result.get(rows_key)
+            run.emails_sent = result.get(emails_key)
+        if error is not None:
+            run.error = str(error)[:500]
+        self.db.session.commit()
+
+    def needs_retry(self, job_id, slot):
+        """True wenn der Lauf des Slots fehlgeschlagen, abgebrochen oder nie beendet wurde"""
+        run = self.JobRun.query.filter_by(job_id=job_id, slot=slot).first()
+        return run is not None and run.status != SUCCESS
+
+    def prune(self, days, now=None):
+        """Löscht beendete Läufe, die älter als days Tage sind (0 = nie)"""
+        if not days:
+            return 0
+        JobRun = self.JobRun
+        cutoff = (now or datetime.utcnow()) - timedelta(days=days)
+        deleted = JobRun.query.filter(JobRun.started_at < cutoff, JobRun.status != RUNNING).delete(
+            synchronize_session=False
+        )
+        self.db.session.commit()
+        return deleted
+
+    # === MONITORING ===
+
+    def recent_runs(self, limit=20):
+        """Letzte Läufe aller Jobs (aus der DB - gilt für alle Prozesse)"""
+        JobRun = self.JobRun
+        return [
+            {
+                'job_id': run.job_id,
+                'slot': run.slot,
+                'owner': run.owner,
+                'status': run.status,
+                'started_at': run.started_at.isoformat() if run.started_at else None,
+                'finished_at': run.finished_at.isoformat() if run.finished_at else None,
+                'duration_seconds': run.duration_seconds,
+                'rows_processed': run.rows_processed,
+                'emails_sent': run.emails_sent,
+                'error': run.error
+            }
+            for run in JobRun.query.order_by(JobRun.started_at.desc()).limit(limit)
+        ]
+
+    def stats(self):
+        """Zähler für Monitoring (dieser Prozess) + Lauf-Historie"""
+        return {
+            'owner': self.owner,
+            'lease_seconds': self.lease_seconds,
+            'heartbeat_seconds': self.heartbeat_seconds,
+            'started': self.started,
+            'skipped': self.skipped,
+            'recent_runs': self.recent_runs()
+        }
@@ -0,0 +1,293 @@
+# mail_outbox.py - Persistente Mail-Outbox mit Worker-Pool
+"""
+Email-Versand über eine Outbox-Tabelle statt Thread pro Email:
+- send_email() rendert das Template und legt nur eine Zeile in mail_outbox an
+- Ein fester Pool von Worker-Threads holt fällige Emails batchweise ab
+  (Claim per UPDATE mit Token → auch mit mehreren Gunicorn-Workern sicher)
+- Pro Batch wird EINE SMTP-Verbindung geöffnet (mail.connect()) und wiederverwendet
+- Fehlgeschlagene Emails werden mit exponentiellem Backoff erneut versucht
+- Pro Batch werden Durchsatz-Metriken gesammelt (Admin-Analytics-API)
+"""
+
+import atexit
+import logging
+import os
+import smtplib
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta
+
+from flask_mail import Message
+from sqlalchemy import and_, or_
+
+logger = logging.getLogger(__name__)
+
+PENDING = 'pending'
+SENDING = 'sending'
+SENT = 'sent'
+FAILED = 'failed'
+
+# Verbindungsfehler: Batch abbrechen, Rest mit Backoff erneut versuchen (neue Verbindung)
+CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError)
+
+
+class MailOutbox:
+    """Outbox-Queue (DB) + Worker-Pool mit wiederverwendeten SMTP-Verbindungen"""
+
+    def __init__(self, app=None, db=None, mail=None, OutboxEmail=None,
+                 workers=2, batch_size=50, poll_interval=5.0, max_attempts=5, backoff=30):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.lease = timedelta(minutes=10)
+        self.enabled = True
+
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._threads = []
+        self._pid = None
+
+        # Zähler für Monitoring
+        self.enqueued = 0
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.connections = 0
+        self.runs = deque(maxlen=20)  # Durchsatz der letzten Batches
+
+        if app is not None:
+            self.init_app(app, db, mail, OutboxEmail)
+
+    def init_app(self, app, db, mail, OutboxEmail):
+        """Konfiguriert die Outbox aus app.config und registriert den Shutdown"""
+        self.app = app
+        self.db = db
+        self.mail = mail
+        self.OutboxEmail = OutboxEmail
+
+        self.enabled = app.config.get('MAIL_OUTBOX_ASYNC', True)
+        self.workers = app.config.get('MAIL_WORKERS', self.workers)
+        self.batch_size = app.config.get('MAIL_BATCH_SIZE', self.batch_size)
+        self.poll_interval = app.config.get('MAIL_POLL_INTERVAL', self.poll_interval)
+        self.max_attempts = app.config.get('MAIL_MAX_ATTEMPTS', self.max_attempts)
+        self.backoff = app.config.get('MAIL_RETRY_BACKOFF', self.backoff)
+
+        atexit.register(self.shutdown)
+
+    # === PRODUCER-SEITE ===
+
+    def enqueue(self, to, subject, html, commit=True):
+        """
+        Legt eine Email in die Outbox.
+
+        Args:
+            commit: False wenn der Aufrufer selbst committet (z.B. Batch im Unlock-Job)
+
+        Returns:
+            OutboxEmail: die angelegte Outbox-Zeile
+        """
+        email = self.OutboxEmail(
+            recipient=to,
+            subject=subject,
+            html=html,
+            status=PENDING,
+            attempts=0,
+            next_attempt_at=datetime.utcnow()
+        )
+        self.db.session.add(email)
+        with self._lock:
+            self.enqueued += 1
+
+        if commit:
+            self.db.session.commit()
+            self.wake()
+        return email
+
+    def wake(self):
+        """Weckt die Worker (nach dem Commit neuer Outbox-Zeilen)"""
+        if not self.enabled:
+            self.process_pending()
+            return
+        self.start()
+        self._wake_event.set()
+
+    # === WORKER-POOL ===
+
+    def start(self):
+        """Startet den Worker-Pool lazy - auch nach einem Gunicorn-Fork neu"""
+        if not self.enabled:
+            return
+        if self._pid == os.getpid() and all(thread.is_alive() for thread in self._threads):
+            return
+
+        with self._lock:
+            if self._pid == os.getpid() and all(thread.is_alive() for thread in self._threads):
+                return
+
+            self._pid = os.getpid()
+            self._stop_event.clear()
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            for i in range(len(self._threads), self.workers):
+                thread = threading.Thread(target=self._run, name=f'mail-worker-{i + 1}')
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                processed = self.process_batch()
+            except Exception as e:
+                logger.error(f"Mail-Worker Fehler: {e}")
+                processed = 0
+
+            # Volle Batches sofort weiter abarbeiten, sonst bis zum Wecken/Poll warten
+            if processed < self.batch_size:
+                self._wake_event.wait(self.poll_interval)
+                self._wake_event.clear()
+
+    def process_pending(self):
+        """Arbeitet alle fälligen Emails synchron ab (Tests, CLI)"""
+        total = 0
+        while True:
+            processed = self.process_batch()
+            total += processed
+            if processed == 0:
+                return total
+
+    def process_batch(self):
+        """
+        Claimt einen Batch fälliger Emails und versendet ihn über eine SMTP-Verbindung.
+
+        Returns:
+            int: Anzahl bearbeiteter Emails
+        """
+        with self.app.app_context():
+            try:
+                batch = self._claim_batch()
+                if not batch:
+                    return 0
+                self._send_batch(batch)
+                return len(batch)
+            finally:
+                self.db.session.remove()
+
+    def _claim_batch(self):
+        """Reserviert fällige Emails per Claim-Token (atomar über UPDATE ... WHERE status)"""
+        OutboxEmail = self.OutboxEmail
+        now = datetime.utcnow()
+        token = uuid.uuid4().hex
+
+        due = self.db.session.query(OutboxEmail.id).filter(
+            or_(
+                and_(OutboxEmail.status == PENDING, OutboxEmail.next_attempt_at <= now),
+                # Verwaiste Claims (Worker abgestürzt) nach Ablauf der Lease neu vergeben
+                and_(OutboxEmail.status == SENDING, OutboxEmail.locked_until < now)
+            )
+        ).order_by(OutboxEmail.id).limit(self.batch_size)
+        ids = [row.id for row in due]
+        if not ids:
+            return []
+
+        OutboxEmail.query.filter(
+            OutboxEmail.id.in_(ids),
+            or_(
+                OutboxEmail.status == PENDING,
+                and_(OutboxEmail.status == SENDING, OutboxEmail.locked_until < now)
+            )
+        ).update({
+            OutboxEmail.status: SENDING,
+            OutboxEmail.claim_token: token,
+            OutboxEmail.locked_until: now + self.lease
+        }, synchronize_session=False)
+        self.db.session.commit()
+
+        return OutboxEmail.query.filter_by(claim_token=token, status=SENDING).order_by(OutboxEmail.id).all()
+
+    def _send_batch(self, batch):
+        started = time.monotonic()
+        sent = 0
+        remaining = list(batch)
+
+        try:
+            with self.mail.connect() as connection:
+                with self._lock:
+                    self.connections += 1
+                while remaining:
+                    email = remaining[0]
+                    try:
+                        connection.send(Message(subject=email.subject, recipients=[email.recipient], html=email.html))
+                    except CONNECTION_ERRORS:
+                        raise
+                    except Exception as e:
+                        self._mark_retry(email, e)
+                    else:
+                        email.status = SENT
+                        email.sent_at = datetime.utcnow()
+                        email.attempts += 1
+                        email.claim_token = None
+                        sent += 1
+                    remaining.pop(0)
+        except Exception as e:
+            # Verbindung weg: der Rest zählt als Fehlversuch und wird mit Backoff erneut versucht
+            logger.warning(f"SMTP-Verbindung fehlgeschlagen ({len(remaining)} Emails zurückgestellt): {e}")
+            for email in remaining:
+                self._mark_retry(email, e)
+
+        self.db.session.commit()
+
+        duration = time.monotonic() - started
+        with self._lock:
+            self.sent += sent
+            self.runs.append({
+                'at': datetime.utcnow().isoformat(),
+                'messages': len(batch),
+                'sent': sent,
+                'seconds': round(duration, 3),
+                'per_second': round(sent / duration, 1) if duration > 0 else None
+            })
+        logger.info(f"📧 Outbox-Batch: {sent}/{len(batch)} Emails über eine SMTP-Verbindung in {duration:.2f}s")
+
+    def _mark_retry(self, email, error):
+        email.attempts += 1
+        email.last_error = str(error)[:500]
+        email.claim_token = None
+        if email.attempts >= self.max_attempts:
+            email.status = FAILED
+            with self._lock:
+                self.failed += 1
+            logger.error(f"❌ Email endgültig fehlgeschlagen nach {email.attempts} Versuchen: {email.subject} → {email.recipient}")
+        else:
+            email.status = PENDING
+            email.next_attempt_at = datetime.utcnow() + timedelta(seconds=self.backoff * 2 ** (email.attempts - 1))
+            with self._lock:
+                self.retried += 1
+
+    # === STEUERUNG & MONITORING ===
+
+    def shutdown(self, timeout=5.0):
+        """Stoppt den Worker-Pool (offene Emails bleiben in der Outbox)"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._pid == os.getpid():
+            for thread in self._threads:
+                thread.join(timeout)
+
+    def stats(self):
+        """Zähler für Monitoring/Admin-Dashboard"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'workers': len([thread for thread in self._threads if thread.is_alive()]),
+                'enqueued': self.enqueued,
+                'sent': self.sent,
+                'retried': self.retried,
+                'failed': self.failed,
+                'connections': self.connections,
+                'recent_runs': list(self.runs)
+            }
@@ -0,0 +1,181 @@
+# menu_cache.py - Versionierter Menü-Cache für Didis Trading Academy
+"""
+In-Memory-Cache für die Navigationsstruktur:
+- Menübaum wird einmal mit Eager-Loading (selectinload) aufgebaut
+- Modul-Statistiken werden pro Subscription-Level einmal berechnet
+- Jede Änderung an Kategorien/Unterkategorien/Modulen erhöht die Version
+  (automatisch über SQLAlchemy-Session-Events nach erfolgreichem Commit)
+- Andere Gunicorn-Worker holen Änderungen spätestens nach MENU_CACHE_TTL Sekunden nach
+"""
+
+import logging
+import threading
+import time
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, selectinload
+
+logger = logging.getLogger(__name__)
+
+# Spalten die sich bei jedem Modul-Aufruf ändern und das Menü nicht beeinflussen
+IGNORED_COLUMNS = {'view_count', 'updated_at'}
+
+
+class MenuCache:
+    """Versionierter Cache für Menübaum und Modul-Statistiken"""
+
+    def __init__(self, app=None, ttl=60):
+        self.ttl = ttl
+        self.version = 0
+
+        self._lock = threading.Lock()
+        self._snapshot = None  # (version, built_at, structure, modules)
+        self._stats = {}
+        self._models = ()
+
+        # Zähler für Monitoring
+        self.hits = 0
+        self.builds = 0
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app, ModuleCategory=None, ModuleSubcategory=None, LearningModule=None):
+        """Registriert Modelle und Session-Events für die automatische Invalidierung"""
+        self.ttl = app.config.get('MENU_CACHE_TTL', self.ttl)
+        self.ModuleCategory = ModuleCategory
+        self.ModuleSubcategory = ModuleSubcategory
+        self.LearningModule = LearningModule
+        self._models = tuple(m for m in (ModuleCategory, ModuleSubcategory, LearningModule) if m is not None)
+
+        event.listen(Session, 'before_flush', self._on_before_flush)
+        event.listen(Session, 'do_orm_execute', self._on_orm_execute)
+        event.listen(Session, 'after_commit', self._on_after_commit)
+        event.listen(Session, 'after_rollback', self._on_after_rollback)
+
+    # === INVALIDIERUNG ===
+
+    def invalidate(self, reason=None):
+        """Erhöht die Version - der nächste Zugriff baut den Cache neu auf"""
+        with self._lock:
+            self.version += 1
+            self._snapshot = None
+            self._stats = {}
+        if reason:
+            logger.info(f"🔄 Menü-Cache invalidiert (v{self.version}): {reason}")
+
+    def _touches_menu(self, obj):
+        """Prüft ob ein geändertes Objekt das Menü betrifft (nicht nur view_count)"""
+        if not isinstance(obj, self._models):
+            return False
+        state = inspect(obj)
+        for attr in state.mapper.column_attrs:
+            if attr.key in IGNORED_COLUMNS:
+                continue
+            if state.attrs[attr.key].history.has_changes():
+                return True
+        return False
+
+    def _on_before_flush(self, session, flush_context, instances):
+        if session.info.get('menu_dirty'):
+            return
+        if any(isinstance(obj, self._models) for obj in session.new) or \
+                any(isinstance(obj, self._models) for obj in session.deleted) or \
+                any(self._touches_menu(obj) for obj in session.dirty):
+            session.info['menu_dirty'] = True
+
+    def _on_orm_execute(self, orm_execute_state):
+        # Bulk-Operationen wie LearningModule.query.delete() umgehen den Flush
+        if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and mapper.class_ in self._models:
+            orm_execute_state.session.info['menu_dirty'] = True
+
+    def _on_after_commit(self, session):
+        if session.info.pop('menu_dirty', False):
+            self.invalidate('Menü-Daten geändert')
+
+    def _on_after_rollback(self, session):
+        session.info.pop('menu_dirty', None)
+
+    # === AUFBAU ===
+
+    def _current_snapshot(self):
+        """Liefert einen gültigen Snapshot oder baut ihn neu auf"""
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == self.version and time.monotonic() - snapshot[1] < self.ttl:
+            self.hits += 1
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot[0] == self.version and time.monotonic() - snapshot[1] < self.ttl:
+                return snapshot
+
+            structure, modules = self._build()
+            snapshot = (self.version, time.monotonic(), structure, modules)
+            self._snapshot = snapshot
+            self._stats = {}
+            self.builds += 1
+            return snapshot
+
+    def _build(self):
+        """Lädt Kategorien → Unterkategorien → Module mit einer festen Anzahl Queries"""
+        ModuleCategory = self.ModuleCategory
+        ModuleSubcategory = self.ModuleSubcategory
+        LearningModule = self.LearningModule
+
+        categories = ModuleCategory.query.options(
+            selectinload(ModuleCategory.subcategories).selectinload(ModuleSubcategory.modules),
+            selectinload(ModuleCategory.modules)
+        ).filter_by(is_active=True).order_by(ModuleCategory.sort_order).all()
+        structure = [cat.to_dict() for cat in categories]
+
+        modules = [
+            (module.is_lead_magnet, tuple(module.required_subscription_levels or []))
+            for module in LearningModule.query.filter_by(is_published=True).all()
+        ]
+        return structure, modules
+
+    # === ZUGRIFF ===
+
+    def get_structure(self):
+        """Menübaum (Liste von Kategorie-Dicts) - nur lesend verwenden!"""
+        return self._current_snapshot()[2]
+
+    def get_stats(self, user_subscription="free"):
+        """Modul-Statistiken für ein Subscription-Level (pro Version einmal berechnet)"""
+        snapshot = self._current_snapshot()
+        key = (snapshot[0], snapshot[1], user_subscription)
+
+        stats = self._stats.get(key)
+        if stats is not None:
+            return stats
+
+        accessible = 0
+        lead_magnets = 0
+        for is_lead_magnet, required_levels in snapshot[3]:
+            if is_lead_magnet:
+                lead_magnets += 1
+                accessible += 1
+            elif user_subscription in required_levels:
+                accessible += 1
+
+        stats = {
+            'total': len(snapshot[3]),
+            'accessible': accessible,
+            'lead_magnets': lead_magnets
+        }
+        self._stats[key] = stats
+        return stats
+
+    def stats(self):
+        """Zähler für Monitoring"""
+        return {
+            'version': self.version,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'builds': self.builds,
+            'cached_levels': len(self._stats)
+        }
@@ -13,6 +13,7 @@ from datetime import datetime
 # Flask-App importieren
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from app import app, db, LearningModule, ModuleCategory, ModuleSubcategory
+from module_export import import_catalogue
 
 class ModuleMigrator:
     def __init__(self):
@@ -172,11 +173,12 @@ class ModuleMigrator:
         self.migrated_count += 1
         print(f"✅ Migriert: {title} -> {file_path.name}")
         
-    def migrate_from_config(self, config_file):
+    def migrate_from_config(self, config_file, update=False):
         """
-        Migriert Module basierend auf einer JSON-Konfigurationsdatei
+        Migriert Module basierend auf einer JSON-Konfigurationsdatei (ein Durchgang, ein Commit)
         
-        config_file Format:
+        Akzeptiert das Katalog-Format aus /admin/export-structure?format=import bzw.
+        flask --app app export-catalogue, das Export-JSON der Admin-Seite und das alte Format:
         {
             "modules": [
                 {
@@ -192,6 +194,9 @@ class ModuleMigrator:
                 }
             ]
         }
+        
+        Args:
+            update: bestehende Module (per Slug) auf die Werte aus der Datei setzen
         """
         print(f"🔄 Migriere Module aus Konfiguration: {config_file}")
         
@@ -202,56 +207,39 @@ class ModuleMigrator:
             
         with open(config_path, 'r', encoding='utf-8') as f:
             config = json.load(f)
-            
-        for module_data in config.get('modules', []):
-            try:
-                self._migrate_from_config_data(module_data)
-            except Exception as e:
-                error_msg = f"Fehler bei {module_data.get('title', 'Unbekannt')}: {str(e)}"
-                self.errors.append(error_msg)
-                print(f"❌ {error_msg}")
-                
-        print(f"✅ {self.migrated_count} Module aus Konfiguration migriert")
         
-    def _migrate_from_config_data(self, module_data):
-        """Migriert ein Modul basierend auf Konfigurationsdaten"""
-        slug = module_data['slug']
+        # Alte Konfigurationen: bisherige Standardwerte statt MODULE_DEFAULTS (veröffentlicht,
+        # Icon 📊, leere Beschreibung, fortlaufende sort_order in Datei-Reihenfolge)
+        if 'format' not in config and 'structure' not in config:
+            for index, module_data in enumerate(config.get('modules', [])):
+                module_data.setdefault('description', '')
+                module_data.setdefault('icon', '📊')
+                module_data.setdefault('sort_order', 100 + self.migrated_count + index)
+                module_data.setdefault('is_published', True)
+                module_data.setdefault('required_subscription_levels', ['premium', 'elite'])
+                module_data.setdefault('estimated_duration', 60)
+                module_data.setdefault('difficulty_level', 'intermediate')
         
-        # Prüfen ob bereits vorhanden
-        existing = LearningModule.query.filter_by(slug=slug).first()
-        if existing:
-            print(f"⏭️  Modul bereits vorhanden: {module_data['title']}")
-            return
-            
-        # Kategorie finden
-        category = ModuleCategory.query.filter_by(slug=module_data['category']).first()
-        if not category:
-            print(f"❌ Kategorie nicht gefunden: {module_data['category']}")
+        try:
+            result = import_catalogue(config, db, ModuleCategory, ModuleSubcategory, LearningModule, update=update)
+        except Exception as e:
+            self.errors.append(f"Import fehlgeschlagen: {str(e)}")
+            print(f"❌ Import fehlgeschlagen: {str(e)}")
             return
-            
-        # Neues Modul erstellen
-        module = LearningModule(
-            category_id=category.id,
-            title=module_data['title'],
-            slug=slug,
-            description=module_data.get('description', ''),
-            icon=module_data.get('icon', '📊'),
-            content_type=module_data.get('content_type', 'html'),
-            external_url=module_data.get('external_url'),
-            template_file=module_data.get('template_file'),
-            is_published=module_data.get('is_published', True),
-            is_lead_magnet=module_data.get('is_lead_magnet', False),
-            required_subscription_levels=module_data.get('required_subscription_levels', ['premium', 'elite']),
-            estimated_duration=module_data.get('estimated_duration', 60),
-            difficulty_level=module_data.get('difficulty_level', 'intermediate'),
-            sort_order=module_data.get('sort_order', 100 + self.migrated_count)
-        )
         
-        db.session.add(module)
-        db.session.commit()
+        for slug in result['categories_created']:
+            print(f"📁 Kategorie angelegt: {slug}")
+        for slug in result['created']:
+            print(f"✅ Migriert: {slug}")
+        for slug in result['updated']:
+            print(f"🔄 Aktualisiert: {slug}")
+        for error in result['errors']:
+            self.errors.append(error)
+            print(f"❌ {error}")
         
-        self.migrated_count += 1
-        print(f"✅ Migriert: {module_data['title']}")
+        self.migrated_count += len(result['created'])
+        print(f"✅ {len(result['created'])} Module aus Konfiguration migriert, "
+              f"{len(result['updated'])} aktualisiert, {result['unchanged']} unverändert")
         
     def print_summary(self):
         """Zeigt Migrations-Zusammenfassung"""
@@ -283,12 +271,13 @@ def main():
 Verwendung:
     python migrate_modules.py streamlit <verzeichnis> [kategorie]
     python migrate_modules.py html <verzeichnis> [kategorie]  
-    python migrate_modules.py config <config.json>
+    python migrate_modules.py config <config.json> [--update]
 
 Beispiele:
     python migrate_modules.py streamlit ./streamlit_modules technische-analyse
     python migrate_modules.py html ./html_templates fundamentalanalyse
     python migrate_modules.py config modules_config.json
+    python migrate_modules.py config didis-catalogue.json --update   (Export aus einer anderen Umgebung)
 
 Verfügbare Kategorien:
     - fundamentalanalyse
@@ -313,7 +302,7 @@ Verfügbare Kategorien:
             
         elif command == "config":
             config_file = sys.argv[2] if len(sys.argv) > 2 else "modules_config.json"
-            migrator.migrate_from_config(config_file)
+            migrator.migrate_from_config(config_file, update='--update' in sys.argv[3:])
             
         else:
             print(f"❌ Unbekannter Befehl: {command}")
@@ -0,0 +1,212 @@
+# module_access.py - Zugriffsentscheidungen für Lernmodule
+"""
+Zentrale Zugriffskontrolle für Module:
+- Das minimale erforderliche Level eines Moduls wird einmal pro Level-Kombination
+  normalisiert (lru_cache) statt bei jedem Aufruf Listen neu aufzubauen
+- Die Freischaltungen (UserModuleUnlock) eines Users werden einmal geladen und
+  kurz gecacht statt pro Modul eine Query auszuführen (LRU, höchstens
+  UNLOCK_CACHE_SIZE User pro Worker)
+- AccessContext beantwortet can_access(module) in O(1) und bietet
+  filter_accessible(modules) für Listen, Suche und Navigation
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from flask import g, has_request_context, session
+
+# Hierarchie der Subscription-Levels (Index = Rang, höher = besser)
+LEVEL_HIERARCHY = ['free', 'basic', 'premium', 'elite', 'elite_pro', 'masterclass']
+LEVEL_RANK = {level: rank for rank, level in enumerate(LEVEL_HIERARCHY)}
+
+# Spezielle Ränge
+OPEN = -1               # Lead-Magnet oder keine Anforderungen → für alle verfügbar
+NO_MATCH = 999          # Nur unbekannte Levels → niemand außer Elite Pro
+ELITE_PRO_ONLY = 1000   # Elite-Pro-Modul → nur Elite Pro
+
+
+@lru_cache(maxsize=512)
+def required_rank(is_lead_magnet, required_levels):
+    """
+    Normalisiert die Zugriffsanforderung eines Moduls auf einen einzigen Rang.
+
+    Args:
+        is_lead_magnet: Lead-Magnet-Flag des Moduls
+        required_levels: Tuple der required_subscription_levels
+
+    Returns:
+        OPEN, ELITE_PRO_ONLY oder den minimal erforderlichen Rang (NO_MATCH wenn unbekannt)
+    """
+    # Lead-Magnete und Module ohne Anforderungen sind immer verfügbar
+    if is_lead_magnet or not required_levels:
+        return OPEN
+
+    # FIX: 'free' als Subscription-Level ist ein Datenbankfehler
+    # Module mit nur ['free'] werden als Premium behandelt (konservativ)
+    lowered = [level.lower() for level in required_levels if level]
+    if 'free' in lowered:
+        levels = [level for level in lowered if level != 'free'] or ['premium']
+    else:
+        levels = [level.lower() if level else 'free' for level in required_levels]
+
+    # Elite-Pro-Module sind für andere Subscription-Stufen gesperrt
+    if 'elite_pro' in levels:
+        return ELITE_PRO_ONLY
+
+    return min((LEVEL_RANK[level] for level in levels if level in LEVEL_RANK), default=NO_MATCH)
+
+
+def module_required_rank(module):
+    """Normalisierter Rang eines LearningModule (oder Modul-Dicts)"""
+    if isinstance(module, dict):
+        return required_rank(bool(module.get('is_lead_magnet')), tuple(module.get('required_subscription_levels') or ()))
+    return required_rank(bool(module.is_lead_magnet), tuple(module.required_subscription_levels or ()))
+
+
+def subscription_allows(user_subscription, rank):
+    """Prüft ob ein Subscription-Level einen normalisierten Rang erfüllt"""
+    if rank == OPEN:
+        return True
+
+    user_level = user_subscription.lower() if user_subscription else 'free'
+
+    # SPEZIALREGEL: Elite Pro hat Zugriff auf ALLE Module
+    if user_level == 'elite_pro':
+        return True
+
+    return LEVEL_RANK.get(user_level, 0) >= rank
+
+
+def normalize_user_id(user_id):
+    """Session-User-IDs sind Strings; nur numerische IDs gehören zu echten DB-Usern"""
+    if isinstance(user_id, int):
+        return user_id
+    user_id = str(user_id or '')
+    return int(user_id) if user_id.isdigit() else None
+
+
+class AccessContext:
+    """Zugriffsentscheidungen für einen User (einmal pro Request aufgebaut)"""
+
+    def __init__(self, control, user_subscription='free', user_id=None, is_admin=False, check_unlocks=False):
+        self.control = control
+        self.user_subscription = user_subscription or 'free'
+        self.user_id = normalize_user_id(user_id)
+        self.is_admin = is_admin
+        self.check_unlocks = check_unlocks and self.user_id is not None
+        self._unlocked_ids = None
+
+    @property
+    def unlocked_ids(self):
+        """Freigeschaltete Modul-IDs (lazy, einmal pro Kontext)"""
+        if self._unlocked_ids is None:
+            self._unlocked_ids = self.control.unlocked_module_ids(self.user_id) if self.user_id is not None else frozenset()
+        return self._unlocked_ids
+
+    def is_unlocked(self, module):
+        """Prüft die tägliche Freischaltung (Lead-Magnete sind immer freigeschaltet)"""
+        if module.is_lead_magnet:
+            return True
+        return module.id in self.unlocked_ids
+
+    def can_access(self, module):
+        """O(1)-Zugriffsprüfung für ein Modul"""
+        if self.is_admin:
+            return True
+
+        rank = module_required_rank(module)
+        if not subscription_allows(self.user_subscription, rank):
+            return False
+
+        # Lead-Magnete und Elite Pro brauchen keine tägliche Freischaltung
+        if not self.check_unlocks or rank == OPEN or self.user_subscription.lower() == 'elite_pro':
+            return True
+
+        return self.is_unlocked(module)
+
+    def filter_accessible(self, modules):
+        """Filtert eine Modul-Liste auf die zugänglichen Module (Reihenfolge bleibt erhalten)"""
+        return [module for module in modules if self.can_access(module)]
+
+
+class ModuleAccessControl:
+    """App-weite Zugriffskontrolle mit kurzlebigem Cache für User-Freischaltungen"""
+
+    def __init__(self, app=None, db=None, UserModuleUnlock=None, ttl=30, max_users=5000):
+        self.ttl = ttl
+        self.max_users = max_users
+        self.db = db
+        self.UserModuleUnlock = UserModuleUnlock
+
+        self._lock = threading.Lock()
+        self._unlocks = OrderedDict()  # user_id → (geladen_um, frozenset(module_ids)), zuletzt genutzt am Ende
+
+        if app is not None:
+            self.init_app(app, db, UserModuleUnlock)
+
+    def init_app(self, app, db, UserModuleUnlock):
+        self.ttl = app.config.get('UNLOCK_CACHE_TTL', self.ttl)
+        self.max_users = app.config.get('UNLOCK_CACHE_SIZE', self.max_users)
+        self.db = db
+        self.UserModuleUnlock = UserModuleUnlock
+
+    # === FREISCHALTUNGEN ===
+
+    def unlocked_module_ids(self, user_id):
+        """Alle freigeschalteten Modul-IDs eines Users (eine Query, TTL-gecacht)"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._unlocks.get(user_id)
+            if cached is not None and now - cached[0] < self.ttl:
+                self._unlocks.move_to_end(user_id)
+                return cached[1]
+
+        rows = self.db.session.query(self.UserModuleUnlock.module_id).filter_by(user_id=user_id).all()
+        module_ids = frozenset(row.module_id for row in rows)
+
+        with self._lock:
+            self._unlocks[user_id] = (now, module_ids)
+            self._unlocks.move_to_end(user_id)
+            # Am längsten nicht genutzte User verdrängen (Cache wächst nicht mit jedem User des Workers)
+            while len(self._unlocks) > self.max_users:
+                self._unlocks.popitem(last=False)
+        return module_ids
+
+    def invalidate_unlocks(self, user_id=None):
+        """Verwirft gecachte Freischaltungen (nach dem Unlock-Job oder Admin-Änderungen)"""
+        with self._lock:
+            if user_id is None:
+                self._unlocks.clear()
+            else:
+                self._unlocks.pop(user_id, None)
+
+    # === KONTEXTE ===
+
+    def for_user(self, user_subscription='free', user_id=None, is_admin=False, check_unlocks=False):
+        return AccessContext(self, user_subscription, user_id, is_admin, check_unlocks)
+
+    def for_request(self, check_unlocks=False):
+        """Zugriffskontext des aktuellen Requests (aus der Session, einmal pro Request in g)"""
+        if not has_request_context():
+            return self.for_user()
+
+        key = f'module_access_{int(check_unlocks)}'
+        context = g.get(key)
+        if context is None:
+            user_subscription = 'free'
+            username = None
+            if session.get('logged_in'):
+                user_subscription = session.get('user', {}).get('membership', 'free')
+                username = session.get('user', {}).get('username')
+
+            context = self.for_user(
+                user_subscription=user_subscription,
+                user_id=session.get('user_id'),
+                # Admin und Didi haben immer Zugriff auf alle Module
+                is_admin=username in ['admin', 'didi'],
+                check_unlocks=check_unlocks
+            )
+            setattr(g, key, context)
+        return context
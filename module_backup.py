@@ -0,0 +1,330 @@
+# module_backup.py - Append-only Backup der Modul-Definitionen
+"""
+Ersetzt das komplette Neuschreiben von modules_backup.json bei jeder Modul-Änderung:
+- Journal (JSON Lines): jede Änderung ist eine angehängte Zeile; pro Commit EIN
+  Schreibvorgang für alle geänderten Module (Session-Events, auch bei Bulk-Aktionen)
+- Snapshot: verdichteter Stand aller Module, alle MODULE_BACKUP_SNAPSHOT_EVERY
+  Journal-Einträge neu geschrieben (Temp-Datei + os.replace, danach leeres Journal)
+- Datei-Lock (fcntl) serialisiert Anhängen und Verdichten über alle Worker;
+  Leser spielen nur die neuen Journal-Zeilen nach (Offset), Slug-Lookup per Dict
+- Restore vergleicht alle Backup-Einträge in einem Durchgang mit der DB
+  (je eine Query für Slugs und Kategorien) und legt fehlende Module in einer
+  Transaktion an
+- Ein altes modules_backup.json wird beim ersten Laden als Snapshot übernommen
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+try:
+    import fcntl
+except ImportError:  # Windows (lokale Entwicklung): nur Prozess-Lock
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_NAME = 'journal.jsonl'
+SNAPSHOT_NAME = 'snapshot.json'
+LOCK_NAME = '.lock'
+LEGACY_FILE = 'modules_backup.json'
+
+# Spalten der Modul-Definition (view_count/updated_at ändern sich ständig und gehören nicht ins Backup)
+BACKUP_COLUMNS = (
+    'id', 'title', 'slug', 'description', 'icon', 'template_file', 'external_url', 'content_type',
+    'category_id', 'subcategory_id', 'is_published', 'is_lead_magnet', 'required_subscription_levels',
+    'estimated_duration', 'difficulty_level', 'sort_order', 'created_at'
+)
+
+
+class ModuleBackupStore:
+    """Journal + Snapshot der Modul-Definitionen mit O(1)-Lookup per Slug"""
+
+    def __init__(self, app=None, db=None, LearningModule=None, ModuleCategory=None, snapshot_every=500):
+        self.snapshot_every = snapshot_every
+
+        self._lock = threading.RLock()
+        self._modules = {}  # slug → Modul-Definition
+        self._offset = 0  # gelesene Bytes des Journals
+        self._journal_id = None  # (st_dev, st_ino) - ändert sich beim Verdichten
+        self._loaded = False
+
+        # Zähler für Monitoring
+        self.appended = 0
+        self.snapshots = 0
+        self.restored = 0
+
+        if app is not None:
+            self.init_app(app, db, LearningModule, ModuleCategory)
+
+    def init_app(self, app, db, LearningModule, ModuleCategory):
+        self.app = app
+        self.db = db
+        self.LearningModule = LearningModule
+        self.ModuleCategory = ModuleCategory
+        self.directory = app.config.get('MODULE_BACKUP_DIR') or os.path.join(app.root_path, 'module_backups')
+        self.snapshot_every = app.config.get('MODULE_BACKUP_SNAPSHOT_EVERY', self.snapshot_every)
+        self.legacy_file = os.path.join(app.root_path, LEGACY_FILE)
+        self.enabled = app.config.get('MODULE_BACKUP', True)
+
+        if self.enabled:
+            event.listen(Session, 'after_flush', self._on_after_flush)
+            event.listen(Session, 'after_commit', self._on_after_commit)
+            event.listen(Session, 'after_rollback', self._on_after_rollback)
+
+    @property
+    def journal_path(self):
+        return os.path.join(self.directory, JOURNAL_NAME)
+
+    @property
+    def snapshot_path(self):
+        return os.path.join(self.directory, SNAPSHOT_NAME)
+
+    # === SESSION-EVENTS ===
+
+    def _on_after_flush(self, session, flush_context):
+        """Definitionen nach dem Flush erfassen (IDs vergeben, SQL noch erlaubt)"""
+        pending = session.info.setdefault('module_backup', {})
+        for obj in session.new | session.dirty:
+            if isinstance(obj, self.LearningModule) and (obj in session.new or self._changed(obj)):
+                pending[obj.slug] = {'op': 'upsert', 'module': self.serialize(obj, session)}
+        for obj in session.deleted:
+            if isinstance(obj, self.LearningModule):
+                pending[obj.slug] = {'op': 'delete'}
+
+    def _changed(self, obj):
+        state = inspect(obj)
+        return any(state.attrs[key].history.has_changes() for key in BACKUP_COLUMNS if key in state.attrs)
+
+    def _on_after_commit(self, session):
+        pending = session.info.pop('module_backup', None)
+        if pending:
+            try:
+                self.append([dict(entry, slug=slug) for slug, entry in pending.items()])
+            except OSError as e:
+                logger.error(f"❌ Modul-Backup Fehler: {e}")
+
+    def _on_after_rollback(self, session):
+        session.info.pop('module_backup', None)
+
+    def serialize(self, module, session=None):
+        """Modul-Definition wie im bisherigen modules_backup.json"""
+        definition = {key: getattr(module, key) for key in BACKUP_COLUMNS if key != 'category_id'}
+        definition['created_at'] = module.created_at.isoformat() if module.created_at else None
+        category = (session or self.db.session).get(self.ModuleCategory, module.category_id) if module.category_id else None
+        definition['category_slug'] = category.slug if category else None
+        definition['backed_up_at'] = datetime.utcnow().isoformat()
+        return definition
+
+    # === DATEIEN ===
+
+    @contextmanager
+    def _file_lock(self):
+        """Exklusiver Lock über alle Worker (Anhängen, Verdichten)"""
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(os.path.join(self.directory, LOCK_NAME), 'a') as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _write_atomic(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _load_snapshot(self):
+        for path in (self.snapshot_path, self.legacy_file):
+            try:
+                with open(path, encoding='utf-8') as handle:
+                    data = json.load(handle)
+            except FileNotFoundError:
+                continue
+            modules = data.get('modules', {})
+            if isinstance(modules, list):  # altes modules_backup.json
+                modules = {module['slug']: module for module in modules if module.get('slug')}
+            return modules
+        return {}
+
+    def _journal_identity(self):
+        try:
+            stat = os.stat(self.journal_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    def _sync(self):
+        """Lädt Snapshot + Journal bzw. spielt nur neue Journal-Zeilen nach (Aufruf unter self._lock)"""
+        identity = self._journal_identity()
+        if not self._loaded or identity != self._journal_id:
+            # Erster Zugriff oder ein anderer Worker hat verdichtet
+            self._modules = self._load_snapshot()
+            self._offset = 0
+            self._journal_id = identity
+            self._loaded = True
+        if identity is None:
+            return
+
+        with open(self.journal_path, 'rb') as handle:
+            handle.seek(self._offset)
+            data = handle.read()
+        # Nur vollständige Zeilen übernehmen (ein Anhängen läuft evtl. gerade)
+        complete = data[:data.rfind(b'\n') + 1]
+        for line in complete.splitlines():
+            if line.strip():
+                self._apply(json.loads(line))
+        self._offset += len(complete)
+
+    def _apply(self, entry):
+        if entry['op'] == 'delete':
+            self._modules.pop(entry['slug'], None)
+        else:
+            self._modules[entry['slug']] = entry['module']
+
+    def append(self, entries):
+        """Hängt Einträge an das Journal an (ein write pro Commit) und verdichtet bei Bedarf"""
+        if not entries:
+            return
+        stamp = datetime.utcnow().isoformat()
+        payload = ''.join(
+            json.dumps(dict(entry, at=stamp), ensure_ascii=False, default=str) + '\n' for entry in entries
+        ).encode('utf-8')
+
+        with self._file_lock():
+            self._sync()
+            with open(self.journal_path, 'ab') as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._journal_id = self._journal_identity()
+            self._sync()
+            self.appended += len(entries)
+            if self._journal_lines() >= self.snapshot_every:
+                self._compact()
+
+        for entry in entries:
+            logger.info(f"💾 Modul-Backup: {entry['op']} {entry['slug']}")
+
+    def _journal_lines(self):
+        with open(self.journal_path, 'rb') as handle:
+            return sum(1 for _ in handle)
+
+    def _compact(self):
+        """Schreibt den aktuellen Stand als Snapshot und beginnt ein leeres Journal (unter Datei-Lock)"""
+        snapshot = {'modules': self._modules, 'last_updated': datetime.utcnow().isoformat()}
+        self._write_atomic(self.snapshot_path, json.dumps(snapshot, ensure_ascii=False, indent=1, default=str))
+        self._write_atomic(self.journal_path, '')
+        self._journal_id = self._journal_identity()
+        self._offset = 0
+        self.snapshots += 1
+
+    def snapshot(self, from_database=False):
+        """
+        Verdichtet Journal + Snapshot.
+
+        Args:
+            from_database: Snapshot aus dem aktuellen DB-Stand aller Module aufbauen
+        """
+        with self._file_lock():
+            self._sync()
+            if from_database:
+                self._modules = {
+                    module.slug: self.serialize(module) for module in self.LearningModule.query.all()
+                }
+            self._compact()
+            return len(self._modules)
+
+    # === LESEN & RESTORE ===
+
+    def get(self, slug):
+        """Gesicherte Definition eines Moduls (O(1))"""
+        with self._lock:
+            self._sync()
+            return self._modules.get(slug)
+
+    def all(self):
+        with self._lock:
+            self._sync()
+            return dict(self._modules)
+
+    def restore(self, dry_run=False):
+        """
+        Legt alle gesicherten Module an, die in der DB fehlen (eine Transaktion).
+
+        Returns:
+            dict: restored, existing, missing_category (Slugs)
+        """
+        backups = self.all()
+        existing = {slug for (slug,) in self.db.session.query(self.LearningModule.slug).all()}
+        categories = dict(self.db.session.query(self.ModuleCategory.slug, self.ModuleCategory.id).all())
+
+        result = {'restored': [], 'existing': 0, 'missing_category': []}
+        new_modules = []
+        for slug, definition in backups.items():
+            if slug in existing:
+                result['existing'] += 1
+                continue
+            category_id = categories.get(definition.get('category_slug'))
+            if category_id is None:
+                result['missing_category'].append(slug)
+                continue
+            new_modules.append(self.LearningModule(
+                title=definition['title'],
+                slug=slug,
+                description=definition.get('description'),
+                icon=definition.get('icon'),
+                template_file=definition.get('template_file'),
+                external_url=definition.get('external_url'),
+                content_type=definition.get('content_type', 'html'),
+                category_id=category_id,
+                subcategory_id=definition.get('subcategory_id'),
+                is_published=definition.get('is_published', False),
+                is_lead_magnet=definition.get('is_lead_magnet', False),
+                required_subscription_levels=definition.get('required_subscription_levels', []),
+                estimated_duration=definition.get('estimated_duration', 60),
+                difficulty_level=definition.get('difficulty_level', 'intermediate'),
+                sort_order=definition.get('sort_order', 100)
+            ))
+            result['restored'].append(slug)
+
+        if new_modules and not dry_run:
+            try:
+                self.db.session.add_all(new_modules)
+                self.db.session.commit()
+            except Exception:
+                self.db.session.rollback()
+                raise
+            self.restored += len(new_modules)
+        return result
+
+    def stats(self):
+        """Zähler für Monitoring (dieser Prozess)"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'directory': self.directory,
+                'modules': len(self._modules) if self._loaded else None,
+                'appended': self.appended,
+                'snapshots': self.snapshots,
+                'restored': self.restored
+            }
@@ -0,0 +1,294 @@
+# module_catalogue.py - Deklarativer Modul-Katalog mit idempotentem Bulk-Sync
+"""
+Ersetzt die register_*.py-Migrationen und die fest verdrahteten LOCAL_CATEGORIES/LOCAL_MODULES:
+- module_catalogue.json beschreibt Kategorien, Unterkategorien und Module im
+  Katalog-Format von module_export.py (Slugs als Referenzen, Standardwerte weggelassen;
+  Vorlage: flask --app app export-catalogue --include-unpublished)
+- sync() lädt den DB-Stand in drei Queries, berechnet einen minimalen Diff (neue
+  Datensätze, geänderte Felder) und wendet ihn in EINER Transaktion an
+- Idempotent: ein zweiter Lauf ergibt einen leeren Diff; dry_run berechnet nur den Diff
+- Standard (Bootstrap): nur Fehlendes anlegen, Änderungen aus dem Admin-Bereich bleiben
+  erhalten; mit update=True werden die Katalog-Werte durchgesetzt (weggelassene Felder
+  = Standardwerte, z.B. is_published False)
+- version() (Hash der Datei) fließt in CONTENT_VERSION ein
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime
+
+from module_export import (
+    CATEGORY_DEFAULTS, CATEGORY_FIELDS, MODULE_DEFAULTS, MODULE_FIELDS, SUBCATEGORY_DEFAULTS,
+    SUBCATEGORY_FIELDS, normalize_catalogue
+)
+
+logger = logging.getLogger(__name__)
+
+CATALOGUE_FILE = 'module_catalogue.json'
+
+
+class CatalogueError(ValueError):
+    """Ungültiger Katalog (doppelte Slugs, unbekannte Felder oder Referenzen)"""
+
+
+def validate_catalogue(catalogue):
+    """
+    Prüft einen normalisierten Katalog.
+
+    Returns:
+        list: Fehlermeldungen (leer = gültig)
+    """
+    errors = []
+
+    def check(kind, record, allowed):
+        if not record.get('slug'):
+            errors.append(f"{kind} ohne Slug: {record}")
+        unknown = set(record) - set(allowed)
+        if unknown:
+            errors.append(f"{kind} {record.get('slug')}: unbekannte Felder {', '.join(sorted(unknown))}")
+
+    categories = set()
+    for record in catalogue['categories']:
+        check('Kategorie', record, CATEGORY_FIELDS + ('is_active',))
+        if record.get('slug') in categories:
+            errors.append(f"Kategorie doppelt: {record['slug']}")
+        categories.add(record.get('slug'))
+
+    subcategories = set()
+    for record in catalogue['subcategories']:
+        check('Unterkategorie', record, SUBCATEGORY_FIELDS + ('is_active', 'category'))
+        key = (record.get('category'), record.get('slug'))
+        if key[0] not in categories:
+            errors.append(f"Unterkategorie {key[1]}: Kategorie nicht im Katalog: {key[0]}")
+        if key in subcategories:
+            errors.append(f"Unterkategorie doppelt: {key[0]}/{key[1]}")
+        subcategories.add(key)
+
+    modules = set()
+    for record in catalogue['modules']:
+        check('Modul', record, MODULE_FIELDS + ('category', 'subcategory'))
+        if record.get('category') not in categories:
+            errors.append(f"Modul {record.get('slug')}: Kategorie nicht im Katalog: {record.get('category')}")
+        elif record.get('subcategory') and (record['category'], record['subcategory']) not in subcategories:
+            errors.append(f"Modul {record.get('slug')}: Unterkategorie nicht im Katalog: "
+                          f"{record['category']}/{record['subcategory']}")
+        if record.get('slug') in modules:
+            errors.append(f"Modul doppelt: {record['slug']}")
+        modules.add(record.get('slug'))
+    return errors
+
+
+def _changes(obj, record, fields, defaults):
+    """Felder, die vom Katalog (weggelassen = Standardwert) abweichen: {Feld: (alt, neu)}"""
+    values = dict(defaults, **record)
+    return {
+        key: (getattr(obj, key), values[key])
+        for key in fields if key in values and getattr(obj, key) != values[key]
+    }
+
+
+def diff_catalogue(catalogue, categories, subcategories, modules, update=False):
+    """
+    Vergleicht den Katalog mit dem DB-Stand.
+
+    Args:
+        catalogue: normalisierter, gültiger Katalog
+        categories: Kategorie-Objekte der DB
+        subcategories: Unterkategorie-Objekte der DB
+        modules: Modul-Objekte der DB
+        update: abweichende Felder bestehender Datensätze in den Diff aufnehmen
+
+    Returns:
+        dict: je 'categories', 'subcategories', 'modules' ein dict mit
+              create [Katalog-Datensätze] und update [(Objekt, {Feld: (alt, neu)})]
+    """
+    category_by_slug = {category.slug: category for category in categories}
+    category_slugs = {category.id: category.slug for category in categories}
+    subcategory_by_key = {(category_slugs.get(sub.category_id), sub.slug): sub for sub in subcategories}
+    subcategory_slugs = {sub.id: sub.slug for sub in subcategories}
+    module_by_slug = {module.slug: module for module in modules}
+
+    diff = {kind: {'create': [], 'update': []} for kind in ('categories', 'subcategories', 'modules')}
+
+    for record in catalogue['categories']:
+        category = category_by_slug.get(record['slug'])
+        if category is None:
+            diff['categories']['create'].append(record)
+        elif update:
+            changes = _changes(category, record, CATEGORY_FIELDS + ('is_active',), CATEGORY_DEFAULTS)
+            if changes:
+                diff['categories']['update'].append((category, changes))
+
+    for record in catalogue['subcategories']:
+        subcategory = subcategory_by_key.get((record['category'], record['slug']))
+        if subcategory is None:
+            diff['subcategories']['create'].append(record)
+        elif update:
+            changes = _changes(subcategory, record, SUBCATEGORY_FIELDS + ('is_active',), SUBCATEGORY_DEFAULTS)
+            if changes:
+                diff['subcategories']['update'].append((subcategory, changes))
+
+    for record in catalogue['modules']:
+        module = module_by_slug.get(record['slug'])
+        if module is None:
+            diff['modules']['create'].append(record)
+        elif update:
+            changes = _changes(module, record, MODULE_FIELDS, MODULE_DEFAULTS)
+            # Zuordnung per Slug vergleichen (IDs neuer Kategorien gibt es erst nach dem Flush)
+            current = (category_slugs.get(module.category_id), subcategory_slugs.get(module.subcategory_id))
+            target = (record['category'], record.get('subcategory'))
+            if current[0] != target[0]:
+                changes['category'] = (current[0], target[0])
+            if current[1] != target[1] or current[0] != target[0]:
+                changes['subcategory'] = (current[1], target[1])
+            if changes:
+                diff['modules']['update'].append((module, changes))
+    return diff
+
+
+class ModuleCatalogue:
+    """Synchronisiert module_catalogue.json mit Kategorien, Unterkategorien und Modulen"""
+
+    def __init__(self, app=None, db=None, ModuleCategory=None, ModuleSubcategory=None, LearningModule=None):
+        self.last_sync = None
+
+        if app is not None:
+            self.init_app(app, db, ModuleCategory, ModuleSubcategory, LearningModule)
+
+    def init_app(self, app, db, ModuleCategory, ModuleSubcategory, LearningModule):
+        self.app = app
+        self.db = db
+        self.ModuleCategory = ModuleCategory
+        self.ModuleSubcategory = ModuleSubcategory
+        self.LearningModule = LearningModule
+        self.path = app.config.get('MODULE_CATALOGUE') or os.path.join(app.root_path, CATALOGUE_FILE)
+
+    def load(self, path=None):
+        """Liest und prüft den Katalog (wirft CatalogueError)"""
+        path = path or self.path
+        try:
+            with open(path, encoding='utf-8') as handle:
+                catalogue = normalize_catalogue(json.load(handle))
+        except (OSError, ValueError) as e:
+            raise CatalogueError(f"Katalog nicht lesbar ({path}): {e}") from e
+        errors = validate_catalogue(catalogue)
+        if errors:
+            raise CatalogueError('; '.join(errors))
+        return catalogue
+
+    def version(self):
+        """Hash der Katalog-Datei (None, wenn sie fehlt)"""
+        try:
+            with open(self.path, 'rb') as handle:
+                return hashlib.sha256(handle.read()).hexdigest()[:16]
+        except FileNotFoundError:
+            return None
+
+    def sync(self, update=False, dry_run=False, path=None):
+        """
+        Gleicht den Katalog mit der DB ab.
+
+        Args:
+            update: abweichende Felder bestehender Datensätze auf die Katalog-Werte setzen
+            dry_run: nur den Diff berechnen, nichts schreiben
+            path: anderer Katalog als MODULE_CATALOGUE
+
+        Returns:
+            dict: je 'categories', 'subcategories', 'modules' die Listen created [Slugs] und
+                  updated [(Slug, {Feld: (alt, neu)})], dazu dry_run und seconds
+        """
+        started = time.monotonic()
+        catalogue = self.load(path)
+        ModuleCategory, ModuleSubcategory, LearningModule = self.ModuleCategory, self.ModuleSubcategory, self.LearningModule
+
+        # 1. DB-Stand in drei Queries
+        categories = ModuleCategory.query.all()
+        subcategories = ModuleSubcategory.query.all()
+        modules = LearningModule.query.all()
+        diff = diff_catalogue(catalogue, categories, subcategories, modules, update=update)
+
+        result = {
+            kind: {
+                'created': [record['slug'] for record in plan['create']],
+                'updated': [(obj.slug, changes) for obj, changes in plan['update']],
+            }
+            for kind, plan in diff.items()
+        }
+        result['dry_run'] = dry_run
+
+        # 2. Diff in einer Transaktion anwenden (ORM-Objekte: Menü-/Render-Cache, Suchindex und
+        #    Modul-Backup werden über die Session-Events mitgezogen)
+        if not dry_run and any(plan['create'] or plan['update'] for plan in diff.values()):
+            session = self.db.session
+            try:
+                self._apply(session, diff, categories, subcategories)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
+        result['seconds'] = round(time.monotonic() - started, 3)
+        self.last_sync = {
+            'at': datetime.utcnow().isoformat(),
+            'created': sum(len(result[kind]['created']) for kind in diff),
+            'updated': sum(len(result[kind]['updated']) for kind in diff),
+            'seconds': result['seconds'],
+            'dry_run': dry_run,
+        }
+        logger.info(f"📚 Katalog-Sync: {self.last_sync['created']} neu, {self.last_sync['updated']} aktualisiert "
+                    f"({result['seconds']}s)" + (' (Dry-Run)' if dry_run else ''))
+        return result
+
+    def _apply(self, session, diff, categories, subcategories):
+        category_by_slug = {category.slug: category for category in categories}
+
+        for record in diff['categories']['create']:
+            category = self.ModuleCategory(**dict(CATEGORY_DEFAULTS, **record))
+            session.add(category)
+            category_by_slug[record['slug']] = category
+        for category, changes in diff['categories']['update']:
+            for key, (_, value) in changes.items():
+                setattr(category, key, value)
+        session.flush()
+
+        category_slugs = {category.id: slug for slug, category in category_by_slug.items()}
+        subcategory_by_key = {(category_slugs.get(sub.category_id), sub.slug): sub for sub in subcategories}
+        for record in diff['subcategories']['create']:
+            values = {key: value for key, value in record.items() if key != 'category'}
+            subcategory = self.ModuleSubcategory(
+                category_id=category_by_slug[record['category']].id, **dict(SUBCATEGORY_DEFAULTS, **values)
+            )
+            session.add(subcategory)
+            subcategory_by_key[(record['category'], record['slug'])] = subcategory
+        for subcategory, changes in diff['subcategories']['update']:
+            for key, (_, value) in changes.items():
+                setattr(subcategory, key, value)
+        session.flush()
+
+        for record in diff['modules']['create']:
+            subcategory = subcategory_by_key.get((record['category'], record.get('subcategory')))
+            values = dict(MODULE_DEFAULTS, **{key: record[key] for key in MODULE_FIELDS if key in record})
+            session.add(self.LearningModule(
+                category_id=category_by_slug[record['category']].id,
+                subcategory_id=subcategory.id if subcategory else None,
+                **values
+            ))
+        for module, changes in diff['modules']['update']:
+            changes = dict(changes)
+            category = changes.pop('category', None)
+            subcategory = changes.pop('subcategory', None)
+            for key, (_, value) in changes.items():
+                setattr(module, key, value)
+            if category is not None:
+                module.category_id = category_by_slug[category[1]].id
+            if subcategory is not None:
+                category_slug = category[1] if category is not None else category_slugs[module.category_id]
+                target = subcategory_by_key.get((category_slug, subcategory[1])) if subcategory[1] else None
+                module.subcategory_id = target.id if target else None
+
+    def stats(self):
+        """Letzter Sync in diesem Prozess (für Monitoring)"""
+        return {'path': self.path, 'last_sync': self.last_sync}
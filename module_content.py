@@ -0,0 +1,340 @@
+# module_content.py - Lerninhalte aus den Modul-Templates extrahieren
+"""
+Die eigentlichen Lerninhalte stecken in großen HTML-Templates (vcp-pattern.html,
+breakout-trading.html, ...). Diese Pipeline liest jedes Template einmal mit einem
+Streaming-HTML-Parser (html.parser, chunkweise) und speichert pro Datei:
+- Titel, Beschreibung (meta description bzw. .hero-subtitle), Überschriften h1-h3
+- Fließtext ohne Markup, Jinja, <script>/<style>/<svg>
+- Wortzahl und geschätzte Lesezeit (inkl. Zeit für Charts/Screenshots)
+- Bild-Referenzen (<img src>, url_for(...) und responsive_image(...) im Jinja-Code)
+
+Gespeichert wird in der Tabelle module_contents mit SHA-256 der Datei: unveränderte
+Templates werden beim nächsten Lauf übersprungen (mtime/Größe gleich → nicht einmal
+gelesen). Nutzer: Volltext-Suche (search_index.py), Admin-Scan (Titel, Beschreibung,
+estimated_duration neuer Module), CLI flask --app app extract-content.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import re
+import time
+from datetime import datetime
+from html.parser import HTMLParser
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+WORDS_PER_MINUTE = 200
+SECONDS_PER_IMAGE = 12  # Charts/Screenshots anschauen
+
+# System-Templates ohne Lerninhalt (werden auch vom Admin-Scan ignoriert)
+EXCLUDED_TEMPLATES = frozenset({
+    'base.html', 'home.html', 'login.html', 'register.html',
+    'modules_overview.html', 'upgrade_required.html', 'module_default.html',
+    '_navigation.html', 'Banner5.html'
+})
+
+HEADING_TAGS = {'h1': 1, 'h2': 2, 'h3': 3}
+SKIP_TAGS = {'script', 'style', 'svg', 'noscript', 'template'}
+INLINE_TAGS = {'a', 'abbr', 'b', 'code', 'em', 'i', 'mark', 'small', 'span', 'strong', 'sub', 'sup', 'u'}
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.svg')
+IMAGE_ENDPOINTS = {'static': '/static/', 'serve_screenshots': '/Screenshots/'}
+
+JINJA_RE = re.compile(r'\{#.*?#\}|\{%.*?%\}|\{\{.*?\}\}', re.S)
+JINJA_OPEN_RE = re.compile(r'\{[{%#]|\{$')
+JINJA_IMAGE_RE = re.compile(
+    r"""(?:url_for\(\s*['"](\w+)['"]\s*,\s*filename\s*=\s*|responsive_image\(\s*)['"]([^'"]+)['"]"""
+)
+SPACE_RE = re.compile(r'\s+')
+WORD_RE = re.compile(r'\w+')
+MAX_PENDING = 1024 * 1024  # unvollständiges Jinja-Tag höchstens so lange zurückhalten
+
+
+class _ContentParser(HTMLParser):
+    """Sammelt Text, Überschriften, Meta-Daten und Bilder eines Templates"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = None
+        self.description = None
+        self.subtitle = None
+        self.headings = []
+        self.images = []
+        self._text = []
+        self._skip = 0
+        self._capture = None  # (End-Tag, Art, Teile)
+
+    def add_image(self, url):
+        url = (url or '').strip()
+        if url and not url.startswith('data:') and url.split('?')[0].lower().endswith(IMAGE_EXTENSIONS):
+            if url not in self.images:
+                self.images.append(url)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip += 1
+            return
+        if tag not in INLINE_TAGS:
+            self._text.append(' ')
+        attrs = dict(attrs)
+        if tag == 'meta' and (attrs.get('name') or '').lower() == 'description':
+            self.description = self.description or (attrs.get('content') or '').strip() or None
+        elif tag == 'img':
+            self.add_image(attrs.get('src'))
+        elif self._capture is None:
+            if tag == 'title' or tag in HEADING_TAGS:
+                self._capture = (tag, tag, [])
+            elif self.subtitle is None and 'hero-subtitle' in (attrs.get('class') or '').split():
+                self._capture = (tag, 'subtitle', [])
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+            return
+        if tag not in INLINE_TAGS:
+            self._text.append(' ')
+        if self._capture is not None and self._capture[0] == tag:
+            _, kind, parts = self._capture
+            self._capture = None
+            value = SPACE_RE.sub(' ', ''.join(parts)).strip()
+            if not value:
+                return
+            if kind == 'title':
+                self.title = self.title or value
+            elif kind == 'subtitle':
+                self.subtitle = value
+            else:
+                self.headings.append({'level': HEADING_TAGS[kind], 'text': value})
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        if self._capture is not None:
+            self._capture[2].append(data)
+            if self._capture[1] == 'title':
+                return  # <title> gehört nicht zum Fließtext
+        self._text.append(data)
+
+    @property
+    def text(self):
+        return SPACE_RE.sub(' ', ''.join(self._text)).strip()
+
+
+def _strip_jinja(chunks, on_expression):
+    """Entfernt Jinja-Tags chunkweise; Tags über Chunk-Grenzen werden zusammengesetzt"""
+    def replace(match):
+        on_expression(match.group(0))
+        return ' '
+
+    pending = ''
+    for chunk in chunks:
+        data = JINJA_RE.sub(replace, pending + chunk)
+        opener = JINJA_OPEN_RE.search(data)
+        if opener and len(data) - opener.start() < MAX_PENDING:
+            data, pending = data[:opener.start()], data[opener.start():]
+        else:
+            pending = ''
+        yield data
+    if pending:
+        yield pending
+
+
+def _read_chunks(path):
+    with open(path, encoding='utf-8', errors='replace') as handle:
+        while True:
+            chunk = handle.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def file_hash(path):
+    """SHA-256 einer Datei (chunkweise gelesen)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def parse_template(path):
+    """
+    Extrahiert den Lerninhalt eines Templates.
+
+    Returns:
+        dict: title, description, headings, text, word_count, images, reading_minutes
+    """
+    parser = _ContentParser()
+
+    def collect_images(expression):
+        for endpoint, filename in JINJA_IMAGE_RE.findall(expression):
+            parser.add_image(IMAGE_ENDPOINTS.get(endpoint or 'static', '/static/') + filename)
+
+    for data in _strip_jinja(_read_chunks(path), collect_images):
+        parser.feed(data)
+    parser.close()
+
+    text = parser.text
+    word_count = len(WORD_RE.findall(text))
+    seconds = word_count / WORDS_PER_MINUTE * 60 + len(parser.images) * SECONDS_PER_IMAGE
+    title = parser.title
+    if title:
+        # "VCP-Pattern | Didis Trading Academy" → "VCP-Pattern"
+        title = re.split(r' [-|] ', title)[0].strip()
+    return {
+        'title': title,
+        'description': parser.description or parser.subtitle,
+        'headings': parser.headings,
+        'text': text,
+        'word_count': word_count,
+        'images': parser.images,
+        'reading_minutes': max(1, math.ceil(seconds / 60)) if word_count else 0
+    }
+
+
+class ModuleContentStore:
+    """Extrahierte Lerninhalte pro Template, persistiert und per Datei-Hash aktualisiert"""
+
+    def __init__(self, app=None, db=None, ModuleContent=None):
+        self._cache = {}  # template_file → (mtime, size, content)
+
+        # Zähler für Monitoring
+        self.parsed = 0
+        self.unchanged = 0
+        self.last_refresh = None
+
+        if app is not None:
+            self.init_app(app, db, ModuleContent)
+
+    def init_app(self, app, db, ModuleContent):
+        self.app = app
+        self.db = db
+        self.ModuleContent = ModuleContent
+        self.template_dir = os.path.join(app.root_path, app.template_folder)
+
+    def template_files(self):
+        """Alle Modul-Templates (templates/*.html ohne System-Templates)"""
+        return sorted(
+            entry.name for entry in os.scandir(self.template_dir)
+            if entry.is_file() and entry.name.endswith('.html') and entry.name not in EXCLUDED_TEMPLATES
+        )
+
+    @staticmethod
+    def _as_dict(row):
+        return {
+            'title': row.title,
+            'description': row.description,
+            'headings': row.headings or [],
+            'text': row.text or '',
+            'word_count': row.word_count or 0,
+            'images': row.images or [],
+            'reading_minutes': row.reading_minutes or 0,
+            'file_hash': row.file_hash
+        }
+
+    def refresh(self, template_files=None, force=False):
+        """
+        Extrahiert neue und geänderte Templates; unveränderte werden übersprungen.
+
+        Args:
+            template_files: nur diese Dateien (Standard: alle Modul-Templates, entfernte
+                            Templates werden dann auch aus der Tabelle gelöscht)
+            force: alle Dateien neu parsen (z.B. nach Änderungen an dieser Pipeline)
+
+        Returns:
+            dict: Statistik des Laufs
+        """
+        started = time.monotonic()
+        full_scan = template_files is None
+        files = self.template_files() if full_scan else list(template_files)
+        rows = {row.template_file: row for row in self.ModuleContent.query.all()}
+        stats = {'templates': len(files), 'parsed': 0, 'unchanged': 0, 'removed': 0, 'missing': 0, 'changed': []}
+
+        for name in files:
+            path = os.path.join(self.template_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stats['missing'] += 1
+                continue
+            row = rows.get(name)
+            if not force and row is not None and row.file_size == stat.st_size and row.file_mtime == stat.st_mtime:
+                stats['unchanged'] += 1
+                continue
+
+            digest = file_hash(path)
+            if not force and row is not None and row.file_hash == digest:
+                # Nur berührt (z.B. git checkout) → Inhalt unverändert
+                row.file_mtime, row.file_size = stat.st_mtime, stat.st_size
+                stats['unchanged'] += 1
+                continue
+
+            content = parse_template(path)
+            if row is None:
+                row = self.ModuleContent(template_file=name)
+                self.db.session.add(row)
+            row.file_hash = digest
+            row.file_mtime, row.file_size = stat.st_mtime, stat.st_size
+            for key, value in content.items():
+                setattr(row, key, value)
+            row.extracted_at = datetime.utcnow()
+            stats['parsed'] += 1
+            stats['changed'].append(name)
+
+        if full_scan:
+            for name in set(rows) - set(files):
+                self.db.session.delete(rows[name])
+                stats['removed'] += 1
+
+        self.db.session.commit()
+        self._cache.clear()
+        self.parsed += stats['parsed']
+        self.unchanged += stats['unchanged']
+        self.last_refresh = datetime.utcnow().isoformat()
+        stats['seconds'] = round(time.monotonic() - started, 3)
+        logger.info(f"📚 Modul-Inhalte: {stats['parsed']} extrahiert, {stats['unchanged']} unverändert, "
+                    f"{stats['removed']} entfernt ({stats['seconds']}s)")
+        return stats
+
+    def get(self, template_file):
+        """
+        Extrahierter Inhalt eines Templates (None wenn die Datei fehlt).
+
+        Liest aus dem Prozess-Cache bzw. der Tabelle; ist die Datei seit dem letzten
+        refresh() geändert, wird sie nur für diesen Prozess neu geparst (kein Commit).
+        """
+        if not template_file:
+            return None
+        path = os.path.join(self.template_dir, template_file)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        cached = self._cache.get(template_file)
+        if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+            return cached[2]
+
+        row = self.db.session.get(self.ModuleContent, template_file)
+        if row is not None and (row.file_mtime, row.file_size) == (stat.st_mtime, stat.st_size):
+            content = self._as_dict(row)
+        else:
+            digest = file_hash(path)
+            if row is not None and row.file_hash == digest:
+                content = self._as_dict(row)
+            else:
+                content = dict(parse_template(path), file_hash=digest)
+                self.parsed += 1
+        self._cache[template_file] = (stat.st_mtime, stat.st_size, content)
+        return content
+
+    def stats(self):
+        """Zähler für Monitoring (dieser Prozess)"""
+        return {
+            'cached': len(self._cache),
+            'parsed': self.parsed,
+            'unchanged': self.unchanged,
+            'last_refresh': self.last_refresh
+        }
@@ -0,0 +1,294 @@
+# module_export.py - Export/Import der Menüstruktur (Kategorien, Unterkategorien, Module)
+"""
+Export-Engine für /admin/export-structure und Umgebungs-Syncs:
+- Drei flache Queries (Kategorien, Unterkategorien, Module) statt Lazy-Loads pro
+  Beziehung; gruppiert wird in Python
+- Die Antwort wird kategorieweise gestreamt: 'json' (bisheriges Format
+  {"success": true, "structure": [...]}), 'ndjson' (ein Datensatz pro Zeile) oder
+  'import' (kompaktes Katalog-Format, ein Modul pro Zeile, Standardwerte weggelassen)
+- Filter: nur veröffentlichte Module (Standard), inkl. unveröffentlichter, pro Kategorie
+- import_catalogue() liest das Katalog-Format (auch das Export-JSON und die alte
+  modules_config.json von migrate_modules.py) und legt Fehlendes in einer Transaktion an
+"""
+
+import json
+from datetime import datetime
+
+CATALOGUE_FORMAT = 'didis-catalogue'
+CATALOGUE_VERSION = 1
+
+CATEGORY_FIELDS = ('name', 'slug', 'icon', 'description', 'sort_order')
+SUBCATEGORY_FIELDS = ('name', 'slug', 'icon', 'description', 'sort_order')
+MODULE_FIELDS = (
+    'title', 'slug', 'description', 'icon', 'template_file', 'external_url', 'content_type',
+    'is_published', 'is_lead_magnet', 'required_subscription_levels', 'estimated_duration',
+    'difficulty_level', 'sort_order'
+)
+# Standardwerte der Modelle: im kompakten Format weggelassen, beim Import ergänzt
+MODULE_DEFAULTS = {
+    'description': None, 'icon': '🎯', 'template_file': None, 'external_url': None, 'content_type': 'html',
+    'is_published': False, 'is_lead_magnet': False, 'required_subscription_levels': [],
+    'estimated_duration': 30, 'difficulty_level': 'beginner', 'sort_order': 100
+}
+CATEGORY_DEFAULTS = {'icon': '📊', 'description': None, 'sort_order': 100, 'is_active': True}
+SUBCATEGORY_DEFAULTS = {'icon': '📋', 'description': None, 'sort_order': 100, 'is_active': True}
+
+EXPORT_FORMATS = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+    'import': 'application/json',
+}
+
+
+def _dump(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+def _compact(record, defaults):
+    return {key: value for key, value in record.items() if key not in defaults or defaults[key] != value}
+
+
+class StructureExport:
+    """Liest die Menüstruktur mit wenigen Queries und serialisiert sie als Stream"""
+
+    def __init__(self, db, ModuleCategory, ModuleSubcategory, LearningModule):
+        self.db = db
+        self.ModuleCategory = ModuleCategory
+        self.ModuleSubcategory = ModuleSubcategory
+        self.LearningModule = LearningModule
+
+    def load(self, include_unpublished=False, categories=None):
+        """
+        Lädt die Struktur in drei Queries.
+
+        Args:
+            include_unpublished: auch unveröffentlichte Module exportieren
+            categories: optional Liste von Kategorie-Slugs
+
+        Returns:
+            (Kategorien, Unterkategorien pro Kategorie-ID, Module pro (Kategorie-ID, Unterkategorie-ID))
+        """
+        ModuleCategory, ModuleSubcategory, LearningModule = self.ModuleCategory, self.ModuleSubcategory, self.LearningModule
+
+        query = ModuleCategory.query.filter_by(is_active=True)
+        if categories:
+            query = query.filter(ModuleCategory.slug.in_(categories))
+        category_list = query.order_by(ModuleCategory.sort_order, ModuleCategory.id).all()
+        category_ids = [category.id for category in category_list]
+
+        subcategories = {}
+        for subcategory in ModuleSubcategory.query.filter(
+            ModuleSubcategory.category_id.in_(category_ids), ModuleSubcategory.is_active == True  # noqa: E712
+        ).order_by(ModuleSubcategory.sort_order, ModuleSubcategory.id):
+            subcategories.setdefault(subcategory.category_id, []).append(subcategory)
+
+        query = LearningModule.query.filter(LearningModule.category_id.in_(category_ids))
+        if not include_unpublished:
+            query = query.filter(LearningModule.is_published == True)  # noqa: E712
+        modules = {}
+        for module in query.order_by(LearningModule.sort_order, LearningModule.id):
+            modules.setdefault((module.category_id, module.subcategory_id), []).append(module)
+
+        return category_list, subcategories, modules
+
+    @staticmethod
+    def _fields(obj, fields):
+        return {field: getattr(obj, field) for field in fields}
+
+    def iter_structure(self, include_unpublished=False, categories=None):
+        """Kategorie-Dicts im bisherigen Export-Format, eine nach der anderen"""
+        return self._iter_structure(self.load(include_unpublished, categories))
+
+    def _iter_structure(self, structure):
+        category_list, subcategories, modules = structure
+        for category in category_list:
+            data = self._fields(category, CATEGORY_FIELDS)
+            data['subcategories'] = [
+                dict(self._fields(subcategory, ('name', 'slug', 'icon', 'sort_order')),
+                     modules=[self._fields(module, MODULE_FIELDS) for module in modules.get((category.id, subcategory.id), [])])
+                for subcategory in subcategories.get(category.id, [])
+            ]
+            data['modules'] = [self._fields(module, MODULE_FIELDS) for module in modules.get((category.id, None), [])]
+            yield data
+
+    def stream(self, export_format='json', include_unpublished=False, categories=None):
+        """
+        Generator mit JSON-Textstücken (für Response(stream_with_context(...))).
+
+        Die Queries laufen sofort (nicht erst im Generator): DB-Fehler fallen vor dem
+        Senden von Status und Headern auf, statt einen abgeschnittenen 200-Body zu liefern.
+        """
+        structure = self.load(include_unpublished, categories)
+        if export_format == 'ndjson':
+            return self._stream_ndjson(structure)
+        if export_format == 'import':
+            return self._stream_catalogue(structure)
+        return self._stream_json(structure)
+
+    def _stream_json(self, structure):
+        yield '{"success":true,"structure":['
+        for index, category in enumerate(self._iter_structure(structure)):
+            yield (',' if index else '') + _dump(category)
+        yield ']}'
+
+    def _stream_ndjson(self, structure):
+        for category in self._iter_structure(structure):
+            subcategories = category.pop('subcategories')
+            modules = category.pop('modules')
+            yield _dump(dict(category, type='category')) + '\n'
+            for module in modules:
+                yield _dump(dict(module, type='module', category=category['slug'])) + '\n'
+            for subcategory in subcategories:
+                sub_modules = subcategory.pop('modules')
+                yield _dump(dict(subcategory, type='subcategory', category=category['slug'])) + '\n'
+                for module in sub_modules:
+                    yield _dump(dict(module, type='module', category=category['slug'],
+                                     subcategory=subcategory['slug'])) + '\n'
+
+    def _stream_catalogue(self, structure):
+        """Kompaktes Katalog-Format: flache Listen, Slugs als Referenzen, ein Datensatz pro Zeile"""
+        category_list, subcategories, modules = structure
+        category_slugs = {category.id: category.slug for category in category_list}
+        subcategory_slugs = {sub.id: sub.slug for subs in subcategories.values() for sub in subs}
+
+        header = {'format': CATALOGUE_FORMAT, 'version': CATALOGUE_VERSION,
+                  'exported_at': datetime.utcnow().isoformat()}
+        yield _dump(header)[:-1]
+
+        yield ',\n"categories":['
+        for index, category in enumerate(category_list):
+            record = _compact(self._fields(category, CATEGORY_FIELDS), CATEGORY_DEFAULTS)
+            yield (',' if index else '') + '\n' + _dump(record)
+
+        yield '],\n"subcategories":['
+        index = 0
+        for category in category_list:
+            for subcategory in subcategories.get(category.id, []):
+                record = _compact(self._fields(subcategory, SUBCATEGORY_FIELDS), SUBCATEGORY_DEFAULTS)
+                yield (',' if index else '') + '\n' + _dump(dict(record, category=category.slug))
+                index += 1
+
+        yield '],\n"modules":['
+        index = 0
+        for category in category_list:
+            groups = [(None, modules.get((category.id, None), []))] + [
+                (sub.id, modules.get((category.id, sub.id), [])) for sub in subcategories.get(category.id, [])
+            ]
+            for subcategory_id, group in groups:
+                for module in group:
+                    record = _compact(self._fields(module, MODULE_FIELDS), MODULE_DEFAULTS)
+                    record['category'] = category_slugs[module.category_id]
+                    if subcategory_id is not None:
+                        record['subcategory'] = subcategory_slugs[subcategory_id]
+                    yield (',' if index else '') + '\n' + _dump(record)
+                    index += 1
+        yield '\n]}\n'
+
+
+def normalize_catalogue(data):
+    """
+    Bringt Export-JSON, Katalog-Format und alte modules_config.json auf das Katalog-Format.
+
+    Returns:
+        dict: categories, subcategories, modules (Listen mit Slug-Referenzen)
+    """
+    if 'structure' in data:
+        catalogue = {'categories': [], 'subcategories': [], 'modules': []}
+        for category in data['structure']:
+            catalogue['categories'].append({key: category.get(key) for key in CATEGORY_FIELDS if key in category})
+            for module in category.get('modules', []):
+                catalogue['modules'].append(dict(module, category=category['slug']))
+            for subcategory in category.get('subcategories', []):
+                catalogue['subcategories'].append(dict(
+                    {key: subcategory.get(key) for key in SUBCATEGORY_FIELDS if key in subcategory},
+                    category=category['slug']
+                ))
+                for module in subcategory.get('modules', []):
+                    catalogue['modules'].append(dict(module, category=category['slug'], subcategory=subcategory['slug']))
+        return catalogue
+    return {
+        'categories': data.get('categories', []),
+        'subcategories': data.get('subcategories', []),
+        'modules': data.get('modules', []),
+    }
+
+
+def import_catalogue(data, db, ModuleCategory, ModuleSubcategory, LearningModule, update=False, dry_run=False):
+    """
+    Importiert einen Katalog in einem Durchgang (je eine Query pro Tabelle, ein Commit).
+
+    Args:
+        update: bestehende Module (per Slug) auf die Katalog-Werte setzen; im kompakten
+                Katalog-Format gelten weggelassene Felder als Standardwert
+        dry_run: nur zählen, nichts schreiben
+
+    Returns:
+        dict: Zähler und Listen der angelegten/aktualisierten Slugs sowie Fehler
+    """
+    catalogue = normalize_catalogue(data)
+    compact = data.get('format') == CATALOGUE_FORMAT
+    session = db.session
+    categories = {category.slug: category for category in ModuleCategory.query.all()}
+    subcategories = {(sub.category_id, sub.slug): sub for sub in ModuleSubcategory.query.all()}
+    existing = {module.slug: module for module in LearningModule.query.all()}
+
+    result = {'categories_created': [], 'subcategories_created': [], 'created': [], 'updated': [],
+              'unchanged': 0, 'errors': []}
+    try:
+        for record in catalogue['categories']:
+            if record['slug'] not in categories:
+                category = ModuleCategory(**dict(CATEGORY_DEFAULTS, **record))
+                session.add(category)
+                categories[record['slug']] = category
+                result['categories_created'].append(record['slug'])
+        session.flush()
+
+        for record in catalogue['subcategories']:
+            category = categories.get(record['category'])
+            if category is None:
+                result['errors'].append(f"Kategorie nicht gefunden: {record['category']} (Unterkategorie {record['slug']})")
+                continue
+            if (category.id, record['slug']) not in subcategories:
+                values = {key: value for key, value in record.items() if key != 'category'}
+                subcategory = ModuleSubcategory(category_id=category.id, **dict(SUBCATEGORY_DEFAULTS, **values))
+                session.add(subcategory)
+                subcategories[(category.id, record['slug'])] = subcategory
+                result['subcategories_created'].append(record['slug'])
+        session.flush()
+
+        for record in catalogue['modules']:
+            category = categories.get(record.get('category'))
+            if category is None:
+                result['errors'].append(f"Kategorie nicht gefunden: {record.get('category')} (Modul {record['slug']})")
+                continue
+            subcategory = subcategories.get((category.id, record.get('subcategory'))) if record.get('subcategory') else None
+            values = dict(MODULE_DEFAULTS, **{key: record[key] for key in MODULE_FIELDS if key in record})
+            values.update(category_id=category.id, subcategory_id=subcategory.id if subcategory else None)
+
+            module = existing.get(record['slug'])
+            if module is None:
+                session.add(LearningModule(**values))
+                result['created'].append(record['slug'])
+            elif update:
+                # Kompaktes Format: fehlende Felder = Standardwert (beim Export weggelassen);
+                # sonst nur Felder aus dem Katalog überschreiben (fehlende Felder = bestehender Wert)
+                changes = {key: value for key, value in values.items()
+                           if (compact or key in record or key in ('category_id', 'subcategory_id'))
+                           and getattr(module, key) != value}
+                if changes:
+                    for key, value in changes.items():
+                        setattr(module, key, value)
+                    result['updated'].append(record['slug'])
+                else:
+                    result['unchanged'] += 1
+            else:
+                result['unchanged'] += 1
+
+        if dry_run:
+            session.rollback()
+        else:
+            session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    return result
@@ -0,0 +1,288 @@
+# ratelimit_storage.py - Gemeinsamer Rate-Limit-Speicher in der Datenbank
+"""
+Storage-Backend für Flask-Limiter (limits) ohne externen Dienst:
+- Zähler liegen in der Tabelle rate_limits (SQLite oder Postgres) und gelten damit
+  für alle Gunicorn-Worker und überstehen Neustarts
+- Kurze Fenster (<= exact_window, z.B. "5 per minute" auf /login) werden pro Treffer
+  mit EINEM atomaren UPSERT ... RETURNING gezählt (exakt über alle Worker)
+- Lange Fenster (z.B. die Default-Limits "50 per hour"/"200 per day") werden pro
+  Prozess gesammelt und periodisch gebündelt geschrieben; der zuletzt gelesene Stand
+  liegt in einem In-Process-Cache (höchstens sync_interval veraltet)
+- Eigene Engine mit kleinem Pool: Limiter-Treffer committen nie die Request-Session
+
+Aktivierung: RATELIMIT_STORAGE=sql (Standard, siehe app.py), Benchmark: benchmark_ratelimit.py
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+
+from limits.storage import Storage
+from sqlalchemy import Column, Float, Index, Integer, MetaData, String, Table, case, create_engine, func, select, text
+from sqlalchemy.exc import SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
+metadata = MetaData()
+
+rate_limits = Table(
+    'rate_limits', metadata,
+    Column('key', String(255), primary_key=True),
+    Column('count', Integer, nullable=False),
+    Column('expires_at', Float, nullable=False),  # Unix-Zeitstempel (wie limits selbst)
+    Index('ix_rate_limits_expires_at', 'expires_at'),
+)
+
+
+def _upsert(dialect_name):
+    """Dialekt-spezifisches INSERT ... ON CONFLICT (Postgres und SQLite >= 3.35)"""
+    if dialect_name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Rate-Limit-Storage unterstützt {dialect_name} nicht (nur postgresql/sqlite)")
+    return insert(rate_limits)
+
+
+class SQLRateLimitStorage(Storage):
+    """
+    limits-Storage für Fixed-Window-Zähler in einer SQL-Tabelle.
+
+    URI: sql://  mit storage_options {'url': <SQLAlchemy-URL>, 'exact_window': 60, 'sync_interval': 1.0}
+    """
+
+    STORAGE_SCHEME = ['sql']
+
+    def __init__(self, uri=None, wrap_exceptions=False, url=None, exact_window=60,
+                 sync_interval=1.0, cleanup_interval=60, **options):
+        if not url:
+            raise ValueError("SQLRateLimitStorage braucht storage_options['url']")
+        self.url = url
+        self.exact_window = int(exact_window)
+        self.sync_interval = float(sync_interval)
+        self.cleanup_interval = float(cleanup_interval)
+
+        self.engine = create_engine(url, pool_pre_ping=True, **self._engine_options(url))
+        self._insert = None
+        self._ready = False
+
+        self._lock = threading.Lock()
+        self._cache = {}     # key → [gemeinsamer Zählerstand, lokal ungeschrieben, expires_at, synced_at]
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._last_cleanup = 0.0
+
+        # Zähler für Monitoring
+        self.exact_hits = 0
+        self.batched_hits = 0
+        self.round_trips = 0
+
+        atexit.register(self.shutdown)
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @staticmethod
+    def _engine_options(url):
+        if url.startswith('sqlite'):
+            # Mehrere Threads/Worker auf einer Datei: auf Sperren warten statt sofort zu scheitern
+            return {'connect_args': {'timeout': 15, 'check_same_thread': False}}
+        return {'pool_size': 2, 'max_overflow': 3}
+
+    @property
+    def base_exceptions(self):
+        return SQLAlchemyError
+
+    def _ensure_table(self):
+        if self._ready:
+            return
+        with self._lock:
+            if not self._ready:
+                metadata.create_all(self.engine, checkfirst=True)
+                self._insert = _upsert(self.engine.dialect.name)
+                self._ready = True
+
+    # === SCHREIBEN ===
+
+    def _write(self, connection, key, expiry, amount, now):
+        """Atomarer UPSERT: abgelaufene Fenster neu starten, sonst hochzählen"""
+        statement = self._insert.values(
+            key=key, count=amount, expires_at=now + expiry
+        ).on_conflict_do_update(
+            index_elements=[rate_limits.c.key],
+            set_={
+                'count': case((rate_limits.c.expires_at <= now, amount), else_=rate_limits.c.count + amount),
+                'expires_at': case((rate_limits.c.expires_at <= now, now + expiry), else_=rate_limits.c.expires_at)
+            }
+        ).returning(rate_limits.c.count, rate_limits.c.expires_at)
+        self.round_trips += 1
+        return connection.execute(statement).one()
+
+    def incr(self, key, expiry, amount=1):
+        """Zählt einen Treffer und gibt den Stand im aktuellen Fenster zurück"""
+        self._ensure_table()
+        now = time.time()
+
+        if expiry > self.exact_window:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None and entry[2] > now and now - entry[3] < self.sync_interval:
+                    # Gebündelt: nur lokal zählen, der Flush-Thread schreibt nach
+                    entry[1] += amount
+                    self.batched_hits += 1
+                    self._ensure_worker()
+                    return entry[0] + entry[1]
+                # Veraltet/unbekannt: Ungeschriebenes mitnehmen (nur aus dem laufenden Fenster)
+                pending = entry[1] if entry is not None and entry[2] > now else 0
+                self._cache.pop(key, None)
+            amount += pending
+        else:
+            self.exact_hits += 1
+
+        with self.engine.begin() as connection:
+            count, expires_at = self._write(connection, key, expiry, amount, now)
+
+        if expiry > self.exact_window:
+            with self._lock:
+                self._cache[key] = [count, 0, expires_at, now]
+        return count
+
+    def flush(self):
+        """Schreibt alle lokal gesammelten Treffer (ein Statement pro Key, eine Transaktion)"""
+        if not self._ready:
+            return 0
+        now = time.time()
+        with self._lock:
+            pending = [(key, entry[1], entry[2]) for key, entry in self._cache.items() if entry[1] and entry[2] > now]
+            for key, _, _ in pending:
+                self._cache[key][1] = 0
+
+        if pending:
+            try:
+                with self.engine.begin() as connection:
+                    # Sortiert → gleiche Sperr-Reihenfolge in allen Workern
+                    for key, amount, expires_at in sorted(pending):
+                        count, expires_at = self._write(connection, key, expires_at - now, amount, now)
+                        with self._lock:
+                            entry = self._cache.get(key)
+                            if entry is not None:
+                                entry[0], entry[2] = count, expires_at
+            except SQLAlchemyError as e:
+                logger.error(f"Rate-Limit-Flush fehlgeschlagen ({len(pending)} Keys): {e}")
+                with self._lock:
+                    for key, amount, _ in pending:
+                        if key in self._cache:
+                            self._cache[key][1] += amount
+                return 0
+
+        if now - self._last_cleanup >= self.cleanup_interval:
+            self._cleanup(now)
+        return len(pending)
+
+    def _cleanup(self, now):
+        """Abgelaufene Fenster löschen (Index auf expires_at) und den Cache ausdünnen"""
+        self._last_cleanup = now
+        with self.engine.begin() as connection:
+            connection.execute(rate_limits.delete().where(rate_limits.c.expires_at <= now))
+        with self._lock:
+            for key in [key for key, entry in self._cache.items() if entry[2] <= now and not entry[1]]:
+                del self._cache[key]
+
+    # === HINTERGRUND-FLUSH ===
+
+    def _ensure_worker(self):
+        """Startet den Flush-Thread lazy - auch nach einem Gunicorn-Fork neu (Aufruf unter self._lock)"""
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='ratelimit-flush')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop_event.wait(self.sync_interval):
+            self.flush()
+
+    def shutdown(self, timeout=5.0):
+        """Stoppt den Flush-Thread und schreibt verbleibende Treffer (atexit)"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and self._pid == os.getpid():
+            thread.join(timeout)
+        try:
+            self.flush()
+        except SQLAlchemyError as e:
+            logger.error(f"Rate-Limit-Flush beim Beenden fehlgeschlagen: {e}")
+
+    # === LESEN ===
+
+    def _read(self, key):
+        """(count, expires_at) aus Cache oder DB, None wenn kein laufendes Fenster"""
+        self._ensure_table()
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[2] > now and now - entry[3] < self.sync_interval:
+                return entry[0] + entry[1], entry[2]
+            pending = entry[1] if entry is not None and entry[2] > now else 0
+
+        self.round_trips += 1
+        with self.engine.connect() as connection:
+            row = connection.execute(
+                select(rate_limits.c.count, rate_limits.c.expires_at)
+                .where(rate_limits.c.key == key, rate_limits.c.expires_at > now)
+            ).first()
+        if row is None:
+            return (pending, now) if pending else None
+        return row.count + pending, row.expires_at
+
+    def get(self, key):
+        row = self._read(key)
+        return row[0] if row else 0
+
+    def get_expiry(self, key):
+        row = self._read(key)
+        return row[1] if row else time.time()
+
+    def check(self):
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(text('SELECT 1'))
+            return True
+        except SQLAlchemyError:
+            return False
+
+    def reset(self):
+        self._ensure_table()
+        with self._lock:
+            self._cache.clear()
+        with self.engine.begin() as connection:
+            count = connection.execute(select(func.count()).select_from(rate_limits)).scalar()
+            connection.execute(rate_limits.delete())
+        return count
+
+    def clear(self, key):
+        self._ensure_table()
+        with self._lock:
+            self._cache.pop(key, None)
+        with self.engine.begin() as connection:
+            connection.execute(rate_limits.delete().where(rate_limits.c.key == key))
+
+    # === MONITORING ===
+
+    def stats(self):
+        """Zähler für Monitoring"""
+        with self._lock:
+            return {
+                'backend': self.engine.dialect.name,
+                'exact_window': self.exact_window,
+                'sync_interval': self.sync_interval,
+                'cached_keys': len(self._cache),
+                'pending_hits': sum(entry[1] for entry in self._cache.values()),
+                'exact_hits': self.exact_hits,
+                'batched_hits': self.batched_hits,
+                'round_trips': self.round_trips
+            }
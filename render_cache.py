@@ -0,0 +1,336 @@
+# render_cache.py - Ganzseiten-Cache für Modulseiten
+"""
+Modulseiten sind fast statisch, wurden aber bei jedem Aufruf komplett neu gerendert
+(Navigation-Queries + 50-160 KB Jinja). Der Render-Cache speichert das fertige HTML:
+- Schlüssel: (Route, Modul-Slug, Subscription-Tier, Content-Version); die Version
+  umfasst die Modul-Spalten (ohne view_count/updated_at), die Template-Datei,
+  die Menü-Version (prev/next) und den Template-Stand beim Start
+- In-Process-LRU mit Byte-Obergrenze, optional zusätzlich ein gemeinsamer
+  Disk-Tier (RENDER_CACHE_DIR) für alle Worker eines Hosts
+- Admins umgehen den Cache; Einträge leben höchstens RENDER_CACHE_TTL Sekunden
+- Benutzerspezifisches (CSRF-Token, Username) wird beim Rendern als Platzhalter
+  geschrieben und bei jeder Auslieferung frisch eingesetzt (user_fragment())
+- Liest ein Template andere Session-Werte als logged_in/user (z.B. Quiz-Fortschritt),
+  wird die Seite nicht gecacht
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from markupsafe import Markup, escape
+
+logger = logging.getLogger(__name__)
+
+# Session-Werte, die über Tier/Login im Schlüssel bzw. über Fragmente abgedeckt sind
+CACHEABLE_SESSION_KEYS = {'logged_in', 'user'}
+# Spalten die sich bei jedem Aufruf ändern und die Seite nicht (wesentlich) beeinflussen
+IGNORED_COLUMNS = {'view_count', 'updated_at'}
+
+PRUNE_EVERY = 100  # Disk-Tier nach so vielen Schreibvorgängen aufräumen
+
+MARKER = '\x00rc:{}\x00'
+MARKER_RE = re.compile('\x00rc:([a-z_]+)\x00')
+
+
+class _TrackingSession:
+    """Session-Proxy für Templates: merkt sich, welche Schlüssel gelesen werden"""
+
+    def __init__(self, session, accessed):
+        self._session = session
+        self._accessed = accessed
+
+    def get(self, key, default=None):
+        self._accessed.add(key)
+        return self._session.get(key, default)
+
+    def __getitem__(self, key):
+        self._accessed.add(key)
+        return self._session[key]
+
+    def __contains__(self, key):
+        self._accessed.add(key)
+        return key in self._session
+
+    def __getattr__(self, key):
+        self._accessed.add(key)
+        try:
+            return self._session[key]
+        except KeyError:
+            raise AttributeError(key)
+
+
+class RenderCache:
+    """LRU-Cache (+ optional Disk) für fertig gerenderte Modulseiten"""
+
+    def __init__(self, app=None, max_bytes=32 * 1024 * 1024, ttl=300):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.directory = None
+        self.version_sources = ()
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key → (html, stored_at)
+        self._size = 0
+        self._fragments = {}
+        self._local = threading.local()
+        self._disk_writes = 0
+
+        # Zähler für Monitoring
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.uncacheable = 0
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app, version_sources=()):
+        """
+        Args:
+            version_sources: Callables, deren Rückgabewerte in jede Content-Version eingehen
+                             (z.B. lambda: menu_cache.version)
+        """
+        self.app = app
+        self.enabled = app.config.get('RENDER_CACHE', True)
+        self.max_bytes = app.config.get('RENDER_CACHE_MAX_BYTES', self.max_bytes)
+        self.ttl = app.config.get('RENDER_CACHE_TTL', self.ttl)
+        self.directory = app.config.get('RENDER_CACHE_DIR') or None
+        self.version_sources = tuple(version_sources)
+        self.template_dir = os.path.join(app.root_path, app.template_folder)
+        self.boot_version = self._templates_version()
+
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+        app.jinja_env.globals['user_fragment'] = self.fragment
+        app.context_processor(self._tracking_context)
+
+    def _templates_version(self):
+        """Neueste mtime aller Templates beim Start (Disk-Tier überlebt Deploys)"""
+        newest = 0.0
+        for root, _, files in os.walk(self.template_dir):
+            for name in files:
+                newest = max(newest, os.path.getmtime(os.path.join(root, name)))
+        return f'{newest:.0f}'
+
+    # === FRAGMENTE ===
+
+    def register_fragment(self, name, func):
+        """Benutzerspezifischer Wert, der erst bei der Auslieferung eingesetzt wird"""
+        self._fragments[name] = func
+
+    def fragment(self, name):
+        """Jinja: {{ user_fragment('username') }} - beim Cache-Rendern nur ein Platzhalter"""
+        if getattr(self._local, 'capturing', False):
+            return Markup(MARKER.format(name))
+        return escape(self._fragments[name]())
+
+    def fragment_function(self, name):
+        """Callable für Kontext-Variablen wie csrf_token()"""
+        return lambda: self.fragment(name)
+
+    def _fill(self, html):
+        if '\x00' not in html:
+            return html
+        values = {}
+
+        def replace(match):
+            name = match.group(1)
+            if name not in values:
+                values[name] = str(escape(self._fragments[name]()))
+            return values[name]
+
+        return MARKER_RE.sub(replace, html)
+
+    def _tracking_context(self):
+        accessed = getattr(self._local, 'session_keys', None)
+        if accessed is None:
+            return {}
+        from flask import session
+        return {'session': _TrackingSession(session, accessed)}
+
+    # === SCHLÜSSEL ===
+
+    def content_version(self, module, template_file):
+        """Hash über Modul-Spalten, Template-mtime, Versionsquellen und Template-Stand beim Start"""
+        parts = [self.boot_version, template_file]
+        try:
+            parts.append(repr(os.path.getmtime(os.path.join(self.template_dir, template_file))))
+        except OSError:
+            parts.append('-')
+        table = getattr(module, '__table__', None)
+        if table is not None:
+            parts.extend(repr(getattr(module, column.key)) for column in table.columns
+                         if column.key not in IGNORED_COLUMNS)
+        elif module is not None:
+            parts.append(repr(sorted(vars(module).items())))
+        parts.extend(repr(source()) for source in self.version_sources)
+        return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+    def make_key(self, endpoint, module, template_file, tier):
+        slug = getattr(module, 'slug', None)
+        return f'{endpoint}|{slug}|{tier}|{self.content_version(module, template_file)}'
+
+    # === ZUGRIFF ===
+
+    def render(self, endpoint, module, template_file, tier, render_func, bypass=False):
+        """
+        Liefert das HTML einer Modulseite - aus dem Cache oder frisch gerendert.
+
+        Args:
+            endpoint: Route (request.endpoint)
+            tier: Subscription-Tier des Besuchers ('anonymous' für nicht eingeloggt)
+            render_func: rendert die Seite (inkl. Navigation) bei einem Cache-Miss
+            bypass: True für Admins - immer frisch, nie gespeichert
+        """
+        if not self.enabled or bypass:
+            self.bypassed += 1
+            return render_func()
+
+        key = self.make_key(endpoint, module, template_file, tier)
+        html = self._get(key)
+        if html is not None:
+            return self._fill(html)
+
+        self.misses += 1
+        self._local.capturing = True
+        self._local.session_keys = set()
+        try:
+            html = render_func()
+            accessed = self._local.session_keys
+        finally:
+            self._local.capturing = False
+            self._local.session_keys = None
+
+        if accessed - CACHEABLE_SESSION_KEYS:
+            # Seite hängt von weiteren Session-Werten ab → nicht teilen
+            self.uncacheable += 1
+        else:
+            self._set(key, html)
+        return self._fill(html)
+
+    def _get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[1] < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                self._discard(key)
+
+        html = self._disk_get(key)
+        if html is not None:
+            self.disk_hits += 1
+            self._set(key, html, disk=False)
+        return html
+
+    def _set(self, key, html, disk=True):
+        size = len(html)  # Zeichen ≈ Bytes (Seiten sind überwiegend ASCII)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (html, time.monotonic())
+            self._size += size
+            while self._size > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+        if disk:
+            self._disk_set(key, html)
+
+    def _discard(self, key):
+        """Entfernt einen Eintrag (Aufruf unter self._lock)"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0])
+
+    # === DISK-TIER ===
+
+    def _disk_path(self, key):
+        return os.path.join(self.directory, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.html')
+
+    def _disk_get(self, key):
+        if not self.directory:
+            return None
+        path = self._disk_path(key)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl:
+                return None
+            with open(path, encoding='utf-8') as handle:
+                return handle.read()
+        except OSError:
+            return None
+
+    def _disk_set(self, key, html):
+        if not self.directory:
+            return
+        try:
+            # Atomar: andere Worker lesen nie eine halbe Datei
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+                handle.write(html)
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError as e:
+            logger.warning(f"Render-Cache: Disk-Eintrag nicht geschrieben: {e}")
+            return
+        self._disk_writes += 1
+        if self._disk_writes % PRUNE_EVERY == 0:
+            self.prune_disk()
+
+    def prune_disk(self):
+        """Löscht abgelaufene Disk-Einträge und hält den Ordner unter max_bytes (älteste zuerst)"""
+        if not self.directory:
+            return 0
+        now = time.time()
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file():
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        files.sort(reverse=True)
+
+        removed = 0
+        total = 0
+        for mtime, size, path in files:
+            total += size
+            if now - mtime >= self.ttl or total > self.max_bytes:
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.directory:
+            for entry in os.scandir(self.directory):
+                if entry.is_file():
+                    os.remove(entry.path)
+
+    def stats(self):
+        """Zähler für Monitoring (dieser Prozess)"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'disk': self.directory,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'bypassed': self.bypassed,
+                'uncacheable': self.uncacheable
+            }
@@ -0,0 +1,147 @@
+# response_compression.py - gzip/Brotli-Kompression für HTML, JSON, CSS und JS
+"""
+after_request-Hook, der Text-Antworten komprimiert:
+- Brotli bevorzugt (falls das Modul installiert ist und der Client es akzeptiert), sonst gzip
+- Erst ab COMPRESS_MIN_SIZE Bytes (kleine Antworten werden durch den Header-Overhead größer)
+- Auch Raw-Seiten aus send_from_directory (better-volume-lernseite.html & Co.)
+- Gestreamte Antworten werden chunkweise komprimiert und sofort weitergereicht
+- Bereits kodierte Antworten (vorkomprimierte Assets aus asset_manifest.py), Teil-
+  und 304-Antworten bleiben unangetastet
+- Komprimierte Antworten tragen ein eigenes ETag (<etag>-<encoding>) und werden
+  dagegen revalidiert (If-None-Match → 304)
+"""
+
+import gzip
+import logging
+import zlib
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_MIMETYPES = (
+    'text/html', 'text/css', 'text/plain', 'text/csv', 'text/javascript', 'text/xml',
+    'application/javascript', 'application/json', 'application/xml', 'image/svg+xml',
+)
+
+
+class ResponseCompression:
+    """Komprimiert Antworten je nach Accept-Encoding"""
+
+    def __init__(self, app=None, min_size=1024, gzip_level=6, brotli_quality=5):
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+        # Zähler für Monitoring
+        self.compressed = 0
+        self.streamed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+        try:
+            import brotli
+            self.brotli = brotli
+        except ImportError:
+            self.brotli = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.enabled = app.config.get('COMPRESS_RESPONSES', True)
+        self.min_size = app.config.get('COMPRESS_MIN_SIZE', self.min_size)
+        self.gzip_level = app.config.get('COMPRESS_GZIP_LEVEL', self.gzip_level)
+        self.brotli_quality = app.config.get('COMPRESS_BROTLI_QUALITY', self.brotli_quality)
+        if self.enabled:
+            app.after_request(self.compress)
+
+    def _negotiate(self, request):
+        if self.brotli is not None and request.accept_encodings['br']:
+            return 'br'
+        if request.accept_encodings['gzip']:
+            return 'gzip'
+        return None
+
+    def compress(self, response):
+        """after_request-Hook"""
+        from flask import request
+
+        if (response.status_code != 200 or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES or request.method == 'HEAD'):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = self._negotiate(request)
+        if encoding is None:
+            return response
+
+        if response.is_streamed and not response.direct_passthrough:
+            # Generator (z.B. stream_with_context): Länge unbekannt → immer komprimieren
+            response.response = self._stream(response.response, encoding)
+            response.headers.pop('Content-Length', None)
+            self.streamed += 1
+        else:
+            # direct_passthrough = Datei aus send_from_directory: einlesen (Seiten sind klein)
+            response.direct_passthrough = False
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            compressed = self._compress(data, encoding)
+            response.set_data(compressed)
+            self.compressed += 1
+            self.bytes_in += len(data)
+            self.bytes_out += len(compressed)
+
+        response.headers['Content-Encoding'] = encoding
+        # Andere Repräsentation → anderes ETag (sonst mischen Caches gzip und Klartext)
+        etag, weak = response.get_etag()
+        if etag:
+            response.set_etag(f'{etag}-{encoding}', weak=weak)
+            # send_from_directory hat If-None-Match noch mit dem Klartext-ETag geprüft -
+            # erst jetzt kann die Revalidierung der komprimierten Fassung ein 304 ergeben
+            response.make_conditional(request)
+        return response
+
+    def _compress(self, data, encoding):
+        if encoding == 'br':
+            return self.brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, compresslevel=self.gzip_level)
+
+    def _stream(self, iterable, encoding):
+        """Komprimiert Chunk für Chunk; Flush nach jedem Chunk, damit der Client sofort etwas bekommt"""
+        if encoding == 'br':
+            compressor = self.brotli.Compressor(quality=self.brotli_quality)
+            process, flush, finish = compressor.process, compressor.flush, compressor.finish
+        else:
+            compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)  # 31 = gzip-Header
+            process = compressor.compress
+            flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)  # noqa: E731
+            finish = compressor.flush
+
+        try:
+            for chunk in iterable:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                self.bytes_in += len(chunk)
+                data = process(chunk) + flush()
+                self.bytes_out += len(data)
+                if data:
+                    yield data
+            data = finish()
+            self.bytes_out += len(data)
+            yield data
+        finally:
+            if hasattr(iterable, 'close'):
+                iterable.close()
+
+    def stats(self):
+        """Zähler für Monitoring (dieser Prozess)"""
+        return {
+            'enabled': self.enabled,
+            'brotli': self.brotli is not None,
+            'min_size': self.min_size,
+            'compressed': self.compressed,
+            'streamed': self.streamed,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'ratio': round(self.bytes_out / self.bytes_in, 3) if self.bytes_in else None
+        }
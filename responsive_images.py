@@ -0,0 +1,264 @@
+# responsive_images.py - Build-Pipeline und Jinja-Helper für responsive Chart-Screenshots
+"""
+Statt voller PNG/JPG-Screenshots bekommen Mobilgeräte passende, kleine Varianten:
+- Build-Schritt (python responsive_images.py bzw. flask --app app build-images):
+  erzeugt aus static/screenshots und templates/Screenshots WebP/AVIF-Varianten
+  in mehreren Breiten unter static/responsive/ (Pillow, nur zur Build-Zeit nötig)
+- manifest.json hält pro Originalbild Größe, Quell-Hash und Varianten;
+  unveränderte Bilder (gleicher Hash) werden beim nächsten Build übersprungen
+- Jinja-Helper responsive_image() rendert <picture> mit srcset/sizes,
+  loading="lazy" und width/height (kein Layout-Springen); ohne Manifest-Eintrag
+  bleibt es ein normales <img> auf das Original
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from markupsafe import Markup, escape
+
+logger = logging.getLogger(__name__)
+
+BASEDIR = os.path.abspath(os.path.dirname(__file__))
+
+OUTPUT_DIR = 'static/responsive'  # relativ zum App-Verzeichnis, per url_for('static') erreichbar
+MANIFEST_NAME = 'manifest.json'
+
+# Quellordner → (Endpoint, Präfix des filename-Arguments für url_for)
+SOURCES = {
+    'static/screenshots': ('static', 'screenshots/'),
+    'templates/Screenshots': ('serve_screenshots', ''),
+}
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+WIDTHS = (480, 960, 1440)
+# Reihenfolge = Reihenfolge der <source>-Elemente (bestes Format zuerst)
+FORMATS = {
+    'avif': {'format': 'AVIF', 'quality': 55},
+    'webp': {'format': 'WEBP', 'quality': 80, 'method': 6},
+}
+DEFAULT_SIZES = '(max-width: 768px) 100vw, 900px'
+
+
+def manifest_key(endpoint, filename):
+    return f'{endpoint}:{filename}'
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def build_variants(basedir=BASEDIR, widths=WIDTHS, formats=None, force=False):
+    """
+    Erzeugt fehlende/veraltete Varianten und schreibt das Manifest.
+
+    Returns:
+        dict: images, built, skipped, source_bytes, variant_bytes
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError("Pillow fehlt - Build-Schritt braucht: pip install Pillow")
+
+    formats = formats or _supported_formats()
+    output_dir = os.path.join(basedir, OUTPUT_DIR)
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    os.makedirs(output_dir, exist_ok=True)
+
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as handle:
+            previous = json.load(handle)
+
+    manifest = {}
+    result = {'images': 0, 'built': 0, 'skipped': 0, 'source_bytes': 0, 'variant_bytes': 0}
+
+    for source_dir, (endpoint, prefix) in SOURCES.items():
+        source_path = os.path.join(basedir, source_dir)
+        if not os.path.isdir(source_path):
+            continue
+        for name in sorted(os.listdir(source_path)):
+            if not name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            path = os.path.join(source_path, name)
+            key = manifest_key(endpoint, prefix + name)
+            source_hash = _file_hash(path)
+            result['images'] += 1
+            result['source_bytes'] += os.path.getsize(path)
+
+            entry = previous.get(key)
+            if not force and entry and entry.get('hash') == source_hash and _variants_exist(basedir, entry):
+                manifest[key] = entry
+                result['skipped'] += 1
+            else:
+                with Image.open(path) as image:
+                    manifest[key] = _build_image(image, basedir, endpoint, name, source_hash, widths, formats)
+                result['built'] += 1
+
+            result['variant_bytes'] += sum(
+                os.path.getsize(os.path.join(basedir, 'static', variant[1]))
+                for variants in manifest[key]['variants'].values()
+                for variant in variants
+            )
+
+    # Atomar ersetzen: laufende Worker lesen nie ein halbes Manifest
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as handle:
+        json.dump(manifest, handle, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+    _remove_orphans(output_dir, manifest)
+    return result
+
+
+def _supported_formats():
+    """AVIF nur, wenn Pillow es schreiben kann (Pillow >= 11.3 oder pillow-avif-plugin)"""
+    from PIL import features
+    supported = {}
+    for name, options in FORMATS.items():
+        if name != 'avif' or features.check('avif'):
+            supported[name] = options
+        else:
+            logger.warning("Pillow ohne AVIF-Unterstützung - es werden nur WebP-Varianten erzeugt")
+    return supported
+
+
+def _build_image(image, basedir, endpoint, name, source_hash, widths, formats):
+    from PIL import Image
+
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+    width, height = image.size
+
+    # Breiten oberhalb des Originals nicht hochskalieren, die Originalbreite als größte Stufe
+    steps = sorted({w for w in widths if w < width} | {min(width, max(widths))})
+
+    stem = os.path.splitext(name)[0]
+    folder = 'screenshots' if endpoint == 'static' else 'templates-screenshots'
+    variants = {}
+    for format_name, options in formats.items():
+        variants[format_name] = []
+        for step in steps:
+            resized = image if step == width else image.resize(
+                (step, round(height * step / width)), Image.LANCZOS
+            )
+            filename = f'responsive/{folder}/{stem}-{source_hash[:8]}-{step}.{format_name}'
+            target = os.path.join(basedir, 'static', filename)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            save_options = {k: v for k, v in options.items() if k != 'format'}
+            resized.save(target, options['format'], **save_options)
+            variants[format_name].append([step, filename])
+
+    logger.info(f"🖼️ {name}: {len(steps)} Breiten × {len(formats)} Formate")
+    return {'hash': source_hash, 'width': width, 'height': height, 'variants': variants}
+
+
+def _variants_exist(basedir, entry):
+    return all(
+        os.path.exists(os.path.join(basedir, 'static', variant[1]))
+        for variants in entry['variants'].values()
+        for variant in variants
+    )
+
+
+def _remove_orphans(output_dir, manifest):
+    """Varianten löschen, die kein Manifest-Eintrag mehr referenziert (geänderte/gelöschte Bilder)"""
+    referenced = {
+        os.path.normpath(os.path.join(os.path.dirname(output_dir), variant[1]))
+        for entry in manifest.values()
+        for variants in entry['variants'].values()
+        for variant in variants
+    }
+    for root, _, files in os.walk(output_dir):
+        for name in files:
+            path = os.path.normpath(os.path.join(root, name))
+            if name != MANIFEST_NAME and path not in referenced:
+                os.remove(path)
+
+
+class ResponsiveImages:
+    """Liest das Manifest und stellt responsive_image() in allen Templates bereit"""
+
+    def __init__(self, app=None):
+        self.manifest_path = None
+        self._manifest = None
+        self._mtime = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.enabled = app.config.get('RESPONSIVE_IMAGES', True)
+        self.default_sizes = app.config.get('RESPONSIVE_IMAGES_SIZES', DEFAULT_SIZES)
+        self.manifest_path = os.path.join(app.root_path, OUTPUT_DIR, MANIFEST_NAME)
+        app.jinja_env.globals['responsive_image'] = self.render
+
+    @property
+    def manifest(self):
+        """Manifest lazy laden; im Debug-Modus nach einem neuen Build neu einlesen"""
+        if self._manifest is None or self.app.debug:
+            try:
+                mtime = os.path.getmtime(self.manifest_path)
+            except OSError:
+                mtime = None
+            if self._manifest is None or mtime != self._mtime:
+                self._mtime = mtime
+                self._manifest = {}
+                if mtime is not None:
+                    with open(self.manifest_path, encoding='utf-8') as handle:
+                        self._manifest = json.load(handle)
+        return self._manifest
+
+    def render(self, filename, alt='', sizes=None, endpoint='static', lazy=True, **attrs):
+        """
+        <picture> mit AVIF/WebP-srcset für ein Bild, Fallback <img> auf das Original.
+
+        Args:
+            filename: wie bei url_for, z.B. 'screenshots/VVOSBeispiel1.png'
+            endpoint: 'static' oder 'serve_screenshots' (templates/Screenshots)
+            sizes: sizes-Attribut (Standard: RESPONSIVE_IMAGES_SIZES)
+            lazy: loading="lazy" (False für Bilder im ersten Viewport)
+            **attrs: weitere <img>-Attribute (class_ → class, z.B. onclick, onerror)
+        """
+        from flask import url_for
+
+        entry = self.manifest.get(manifest_key(endpoint, filename)) if self.enabled else None
+
+        img_attrs = {'src': url_for(endpoint, filename=filename), 'alt': alt}
+        if entry:
+            img_attrs['width'] = entry['width']
+            img_attrs['height'] = entry['height']
+        if lazy:
+            img_attrs['loading'] = 'lazy'
+        img_attrs['decoding'] = 'async'
+        for name, value in attrs.items():
+            img_attrs[name.rstrip('_').replace('_', '-')] = value
+
+        img = '<img ' + ' '.join(f'{name}="{escape(value)}"' for name, value in img_attrs.items()) + '>'
+        if not entry:
+            return Markup(img)
+
+        sizes = sizes or self.default_sizes
+        sources = []
+        for format_name in FORMATS:
+            variants = entry['variants'].get(format_name)
+            if not variants:
+                continue
+            srcset = ', '.join(f"{url_for('static', filename=path)} {width}w" for width, path in variants)
+            sources.append(
+                f'<source type="image/{format_name}" srcset="{escape(srcset)}" sizes="{escape(sizes)}">'
+            )
+        return Markup('<picture>' + ''.join(sources) + img + '</picture>')
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    stats = build_variants()
+    print(f"✅ {stats['images']} Bilder ({stats['built']} neu, {stats['skipped']} unverändert) → {OUTPUT_DIR}/{MANIFEST_NAME}")
+    print(f"   Originale: {stats['source_bytes'] / 1e6:.1f} MB, alle Varianten: {stats['variant_bytes'] / 1e6:.1f} MB")
@@ -3,12 +3,21 @@
 Scheduled Job für die automatische Modul-Freischaltung:
 - Läuft täglich um 00:05 UTC
 - Schaltet Module basierend auf Registrierungsdatum und Subscription-Level frei
+- Berechnet alle Freischaltungen mengenbasiert in einem Lauf (unlock_engine.py)
 - Sendet Email-Benachrichtigungen für neue Freischaltungen
+- Verdichtet stündlich die Visitor-Analytics zu Rollups (analytics_rollup.py)
+- Archiviert täglich alte Analytics-Rohdaten (analytics_retention.py)
+- Alle Jobs laufen unter einer DB-Lease mit Lauf-Historie (job_lock.py) -
+  sicher mit mehreren Workern/Replicas oder als eigener Prozess (python scheduler.py)
+- Fehlgeschlagene oder abgebrochene Läufe des aktuellen Slots werden beim Start und danach
+  alle SCHEDULER_RETRY_MINUTES nachgeholt (retry_failed_jobs)
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 import atexit
 import logging
 
@@ -126,6 +135,29 @@ def unlock_modules_for_user(user, db, LearningModule, UserModuleUnlock, send_unl
     return newly_unlocked
 
 
+def send_unlock_email(user, module, unlock_day, send_email_func, base_url):
+    """
+    Sendet die Freischaltungs-Email für ein Modul.
+    
+    Funktioniert mit ORM-Objekten und den Snapshots der Bulk-Engine (unlock_engine.py).
+    
+    Returns:
+        bool: Rückgabewert von send_email_func
+    """
+    return send_email_func(
+        to=user.email,
+        subject=f'🔓 Neues Modul freigeschaltet: {module.title}',
+        template='module_unlocked',
+        username=user.username,
+        first_name=user.first_name or user.username,
+        module_title=module.title,
+        module_description=module.description or '',
+        module_icon=module.icon or '📚',
+        module_url=f"{base_url}/module/{module.slug}",
+        unlock_day=unlock_day
+    )
+
+
 def send_unlock_notifications(user, newly_unlocked, send_email_func, base_url):
     """
     Sendet Email-Benachrichtigungen für neu freigeschaltete Module.
@@ -133,7 +165,7 @@ def send_unlock_notifications(user, newly_unlocked, send_email_func, base_url):
     Args:
         user: User-Objekt
         newly_unlocked: Liste von (module, unlock) Tupeln
-        send_email_func: send_email Funktion aus app.py
+        send_email_func: send_email/queue_email Funktion aus app.py (legt die Email in die Outbox)
         base_url: Basis-URL der App (z.B. https://didis-premium-app-production.up.railway.app)
     """
     for module, unlock in newly_unlocked:
@@ -142,23 +174,12 @@ def send_unlock_notifications(user, newly_unlocked, send_email_func, base_url):
         
         try:
             # Email senden
-            success = send_email_func(
-                to=user.email,
-                subject=f'🔓 Neues Modul freigeschaltet: {module.title}',
-                template='module_unlocked',
-                username=user.username,
-                first_name=user.first_name or user.username,
-                module_title=module.title,
-                module_description=module.description or '',
-                module_icon=module.icon or '📚',
-                module_url=f"{base_url}/module/{module.slug}",
-                unlock_day=unlock.unlock_day
-            )
+            success = send_unlock_email(user, module, unlock.unlock_day, send_email_func, base_url)
             
             if success:
                 unlock.notification_sent = True
                 unlock.notification_sent_at = datetime.utcnow()
-                logger.info(f"📧 Email gesendet: {module.title} → {user.email}")
+                logger.info(f"📧 Email eingereiht: {module.title} → {user.email}")
             else:
                 logger.warning(f"⚠️ Email konnte nicht gesendet werden: {module.title} → {user.email}")
                 
@@ -166,16 +187,22 @@ def send_unlock_notifications(user, newly_unlocked, send_email_func, base_url):
             logger.error(f"Fehler beim Email-Versand für {module.title} an {user.email}: {e}")
 
 
-def run_daily_unlock_job(app):
+def run_daily_unlock_job(app, slot=None):
     """
     Haupt-Job für die tägliche Modul-Freischaltung.
     Wird täglich um 00:05 UTC ausgeführt.
     
     Args:
         app: Flask App-Instanz
+        slot: Slot des geplanten Laufs - Checkpoint-Schlüssel, ein abgebrochener
+              Lauf setzt mit den offenen Shards fort (None = alle Shards)
+    
+    Returns:
+        dict: Ergebnis von unlock_engine.run()
     """
     with app.app_context():
-        from app import db, User, LearningModule, UserModuleUnlock, send_email
+        from app import db, unlock_engine, queue_email, mail_outbox, module_access
+        from functools import partial
         import os
         
         logger.info("="*60)
@@ -186,60 +213,173 @@ def run_daily_unlock_job(app):
         # Basis-URL aus Environment oder Fallback
         base_url = os.environ.get('BASE_URL', 'https://didis-premium-app-production.up.railway.app')
         
-        # Alle aktiven User laden
+        # Emails landen in der Outbox und werden mit dem Chunk-Commit gespeichert;
+        # der Worker-Pool versendet sie gebündelt über wenige SMTP-Verbindungen
+        send_email = partial(queue_email, commit=False)
+        
+        def notify(user, module, unlock_day):
+            return send_unlock_email(user, module, unlock_day, send_email, base_url)
+        
+        # Mengenbasiert und parallel: User-Shards im Thread-Pool, Einfügen in Chunks (unlock_engine.py)
         try:
-            active_users = User.query.filter_by(is_active=True).all()
-            logger.info(f"📊 Verarbeite {len(active_users)} aktive User...")
+            result = unlock_engine.run(notify=notify, run_key=slot)
         except Exception as e:
-            logger.error(f"Fehler beim Laden der User: {e}")
-            return
+            logger.error(f"Fehler bei der Modul-Freischaltung: {e}")
+            db.session.rollback()
+            raise
         
-        total_unlocks = 0
-        total_emails = 0
+        # Gecachte Freischaltungen verwerfen (andere Worker: nach UNLOCK_CACHE_TTL)
+        module_access.invalidate_unlocks()
         
-        for user in active_users:
-            try:
-                # Module für diesen User freischalten
-                newly_unlocked = unlock_modules_for_user(
-                    user=user,
-                    db=db,
-                    LearningModule=LearningModule,
-                    UserModuleUnlock=UserModuleUnlock
-                )
-                
-                if newly_unlocked:
-                    total_unlocks += len(newly_unlocked)
-                    
-                    # Email-Benachrichtigungen senden
-                    send_unlock_notifications(
-                        user=user,
-                        newly_unlocked=newly_unlocked,
-                        send_email_func=send_email,
-                        base_url=base_url
-                    )
-                    
-                    # Änderungen speichern (notification_sent Flags)
-                    db.session.commit()
-                    total_emails += len([u for m, u in newly_unlocked if u.notification_sent])
-                    
-            except Exception as e:
-                logger.error(f"Fehler bei User {user.username}: {e}")
-                db.session.rollback()
-                continue
+        # Outbox-Worker wecken (Emails sind committed)
+        mail_outbox.wake()
         
         logger.info("="*60)
         logger.info(f"✅ Tägliche Modul-Freischaltung abgeschlossen!")
-        logger.info(f"   Freigeschaltete Module: {total_unlocks}")
-        logger.info(f"   Gesendete Emails: {total_emails}")
+        logger.info(f"   User mit neuen Modulen: {result['users']}")
+        logger.info(f"   Freigeschaltete Module: {result['unlocks']}")
+        logger.info(f"   Eingereihte Emails: {result['emails']}")
+        logger.info(f"   Shards: {result['shards']} ({result['resumed_shards']} aus Checkpoint übersprungen)")
+        if result['failed']:
+            logger.info(f"   Fehlgeschlagen: {result['failed']}")
+        logger.info(f"   Dauer: {result['seconds']}s ({result['rows_per_second']} Zeilen/s)")
         logger.info("="*60)
+        
+        if result['failed']:
+            # Lauf als fehlgeschlagen protokollieren - der Slot wird nachgeholt und setzt
+            # mit den Shards ohne Checkpoint fort
+            raise RuntimeError(f"{result['failed']} Freischaltungen/Shards fehlgeschlagen")
+        
+        return result
+
+
+def run_analytics_rollup_job(app, slot=None):
+    """
+    Stündlicher Job: verdichtet abgeschlossene Stunden/Tage der Visitor-Analytics.
+    
+    Args:
+        app: Flask App-Instanz
+        slot: ungenutzt (Rollups setzen über ihre Watermarks fort)
+    """
+    with app.app_context():
+        from app import db, analytics_rollup
+        
+        try:
+            result = analytics_rollup.run()
+            logger.info(f"📊 Analytics-Rollup: {result['hours']} Stunden, {result['days']} Tage verdichtet")
+            return result
+        except Exception as e:
+            logger.error(f"Fehler beim Analytics-Rollup: {e}")
+            db.session.rollback()
+            raise
+
+
+def run_analytics_retention_job(app, slot=None):
+    """
+    Täglicher Job: archiviert und löscht Analytics-Rohdaten außerhalb der Aufbewahrungsfrist
+    und räumt alte Einträge der Lauf-Historie (job_runs) auf.
+    
+    Args:
+        app: Flask App-Instanz
+        slot: ungenutzt (die Archivierung ist idempotent)
+    """
+    with app.app_context():
+        from app import db, archive_old_analytics, job_runner
+        
+        try:
+            archived = archive_old_analytics()
+            pruned = job_runner.prune(app.config['SCHEDULER_RUN_HISTORY_DAYS'])
+            logger.info(f"🗄️ Analytics-Aufbewahrung: {archived} Einträge archiviert, {pruned} alte Job-Läufe gelöscht")
+            return {'rows': archived, 'job_runs_pruned': pruned}
+        except Exception as e:
+            logger.error(f"Fehler bei der Analytics-Aufbewahrung: {e}")
+            db.session.rollback()
+            raise
+
+
+# Job-ID → (Funktion, Slot-Format, Ergebnis-Schlüssel für die Zeilen in job_runs)
+JOBS = {
+    'daily_module_unlock': (run_daily_unlock_job, '%Y-%m-%d', 'unlocks'),
+    'analytics_rollup': (run_analytics_rollup_job, '%Y-%m-%dT%H', 'hours'),
+    'analytics_retention': (run_analytics_retention_job, '%Y-%m-%d', 'rows'),
+}
+
+
+def current_slot(job_id, now=None):
+    """Aktueller Slot eines Jobs (z.B. '2026-01-31' für tägliche Jobs)"""
+    return (now or datetime.utcnow()).strftime(JOBS[job_id][1])
+
+
+def run_locked_job(app, job_id, manual=False, slot=None):
+    """
+    Führt einen Job unter der DB-Lease aus (job_lock.py).
+    
+    Auch wenn mehrere Prozesse einen Scheduler starten, läuft jeder Job pro Slot
+    (z.B. Kalendertag) genau einmal erfolgreich - die anderen überspringen ihn.
+    
+    Args:
+        app: Flask App-Instanz
+        job_id: Schlüssel in JOBS
+        manual: True = manueller Lauf, Fehler werden weitergereicht
+        slot: Slot des Laufs (Standard: aktueller Slot, bei manual keiner)
+    
+    Returns:
+        Ergebnis des Jobs, None wenn übersprungen (oder fehlgeschlagen bei geplanten Läufen)
+    """
+    func, _, rows_key = JOBS[job_id]
+    
+    with app.app_context():
+        from app import job_runner
+        
+        if slot is None and not manual:
+            slot = current_slot(job_id)
+        try:
+            return job_runner.run(job_id, lambda: func(app, slot), slot=slot, rows_key=rows_key)
+        except Exception as e:
+            if manual:
+                raise
+            # Fehler ist in job_runs protokolliert; retry_failed_jobs() holt den Slot nach
+            logger.error(f"Job {job_id} fehlgeschlagen: {e}")
+            return None
 
 
-def init_scheduler(app):
+def retry_failed_jobs(app, now=None):
+    """
+    Holt fehlgeschlagene, abgebrochene oder nie beendete Läufe des aktuellen Slots nach.
+    
+    Läuft beim Scheduler-Start und danach alle SCHEDULER_RETRY_MINUTES. Der Slot bleibt
+    derselbe - der Unlock-Job setzt so an seinen Shard-Checkpoints wieder auf.
+    
+    Args:
+        app: Flask App-Instanz
+        now: Referenzzeitpunkt für den Slot (Standard: jetzt)
+    
+    Returns:
+        dict: job_id → Ergebnis für jeden nachgeholten Job
+    """
+    retried = {}
+    for job_id in JOBS:
+        slot = current_slot(job_id, now)
+        with app.app_context():
+            from app import job_runner
+            
+            if not job_runner.needs_retry(job_id, slot):
+                continue
+        logger.info(f"🔁 Job {job_id} für Slot {slot} wird nachgeholt")
+        retried[job_id] = run_locked_job(app, job_id, slot=slot)
+    return retried
+
+
+def init_scheduler(app, blocking=False):
     """
     Initialisiert den APScheduler für die tägliche Modul-Freischaltung.
     
+    Jeder Job läuft über run_locked_job() - der Scheduler darf daher in mehreren
+    Web-Workern (SCHEDULER_EMBEDDED) oder als eigener Prozess laufen.
+    
     Args:
         app: Flask App-Instanz
+        blocking: True = BlockingScheduler im Vordergrund (eigener Prozess, siehe main())
     """
     global scheduler
     
@@ -248,24 +388,52 @@ def init_scheduler(app):
         logger.info("⚠️ Scheduler läuft bereits")
         return scheduler
     
-    scheduler = BackgroundScheduler()
+    scheduler = BlockingScheduler() if blocking else BackgroundScheduler()
     
     # Job hinzufügen: Täglich um 00:05 UTC
     scheduler.add_job(
-        func=lambda: run_daily_unlock_job(app),
+        func=lambda: run_locked_job(app, 'daily_module_unlock'),
         trigger=CronTrigger(hour=0, minute=5, timezone='UTC'),
         id='daily_module_unlock',
         name='Tägliche Modul-Freischaltung',
         replace_existing=True
     )
     
-    # Scheduler starten
-    scheduler.start()
-    logger.info("🚀 APScheduler gestartet - Tägliche Modul-Freischaltung um 00:05 UTC")
+    # Job hinzufügen: Stündlich Analytics-Rollups aktualisieren
+    scheduler.add_job(
+        func=lambda: run_locked_job(app, 'analytics_rollup'),
+        trigger=CronTrigger(minute=2, timezone='UTC'),
+        id='analytics_rollup',
+        name='Stündliche Analytics-Rollups',
+        replace_existing=True
+    )
+    
+    # Job hinzufügen: Täglich um 03:15 UTC alte Analytics-Rohdaten archivieren
+    scheduler.add_job(
+        func=lambda: run_locked_job(app, 'analytics_retention'),
+        trigger=CronTrigger(hour=3, minute=15, timezone='UTC'),
+        id='analytics_retention',
+        name='Analytics-Aufbewahrung',
+        replace_existing=True
+    )
+    
+    # Job hinzufügen: Fehlgeschlagene Läufe nachholen - sofort beim Start, danach im Intervall
+    scheduler.add_job(
+        func=lambda: retry_failed_jobs(app),
+        trigger=IntervalTrigger(minutes=app.config['SCHEDULER_RETRY_MINUTES']),
+        next_run_time=datetime.now(timezone.utc),
+        id='retry_failed_jobs',
+        name='Fehlgeschlagene Jobs nachholen',
+        replace_existing=True
+    )
     
     # Scheduler beim App-Shutdown beenden
     atexit.register(lambda: shutdown_scheduler())
     
+    # Scheduler starten (blockiert bei BlockingScheduler bis zum Beenden)
+    logger.info("🚀 APScheduler gestartet - Tägliche Modul-Freischaltung um 00:05 UTC")
+    scheduler.start()
+    
     return scheduler
 
 
@@ -281,9 +449,46 @@ def trigger_manual_unlock(app):
     """
     Löst die Modul-Freischaltung manuell aus (z.B. für Tests).
     
+    Ist der heutige geplante Lauf fehlgeschlagen oder abgebrochen, wird er fortgesetzt
+    (gleicher Slot = gleiche Checkpoints); sonst läuft ein vollständiger Lauf ohne Slot.
+    
     Args:
         app: Flask App-Instanz
+    
+    Returns:
+        dict: Ergebnis, None wenn der Job gerade läuft
     """
-    logger.info("🔧 Manuelle Modul-Freischaltung ausgelöst...")
-    run_daily_unlock_job(app)
+    job_id = 'daily_module_unlock'
+    slot = current_slot(job_id)
+    with app.app_context():
+        from app import job_runner
+        
+        if not job_runner.needs_retry(job_id, slot):
+            slot = None
+    logger.info("🔧 Manuelle Modul-Freischaltung ausgelöst" + (f" (setzt Slot {slot} fort)" if slot else '') + "...")
+    return run_locked_job(app, job_id, manual=True, slot=slot)
+
+
+def main():
+    """
+    Eigenständiger Scheduler-Prozess: python scheduler.py
+    
+    Die Web-Worker bleiben frei vom nächtlichen Job und lassen sich beliebig skalieren
+    (Procfile: Prozess "scheduler").
+    """
+    logging.getLogger().setLevel(logging.INFO)
+    
+    from app import app, bootstrap_app_data
+    
+    # Tabellen (inkl. job_leases/job_runs) sicherstellen
+    with app.app_context():
+        bootstrap_app_data()
+    
+    try:
+        init_scheduler(app, blocking=True)
+    except (KeyboardInterrupt, SystemExit):
+        pass
+
 
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,385 @@
+# search_index.py - Volltext-Suche über Module (Titel, Beschreibung, Lerninhalte)
+"""
+In-Process-Suchindex für /api/modules/search (SQLite und Postgres gleichermaßen):
+- Invertierter Index über Titel, Beschreibung und den Text der Template-Datei
+  (extrahiert von module_content.py: ohne HTML, Jinja, <script>/<style>)
+- Deutsches Stemming (CISTEM) + Umlaut-Faltung: "Konsolidierungen" findet "Konsolidierung"
+- BM25F-Ranking mit Feldgewichten (Titel > Beschreibung > Inhalt)
+- Präfix-Suche für das letzte Wort (Type-ahead: "Vol" → Volume, Volatilität, ...)
+- Inkrementell: geänderte Module werden nach dem Commit als veraltet markiert
+  (Session-Events) und bei der nächsten Suche einzeln neu indexiert; andere Worker
+  gleichen spätestens nach SEARCH_INDEX_TTL Sekunden per Fingerprint-Abfrage ab
+- Zugriffsprüfung ohne DB-Zugriff: der Index hält die nötigen Modul-Metadaten
+"""
+
+import bisect
+import hashlib
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from types import SimpleNamespace
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+FIELD_WEIGHTS = {'title': 3.0, 'description': 2.0, 'content': 1.0}
+K1 = 1.2
+B = 0.75
+PREFIX_PENALTY = 0.8  # Präfix-Treffer zählen etwas weniger als exakte Treffer
+MIN_PREFIX = 2
+SNIPPET_CHARS = 160
+
+# Spalten die Suchtreffer/Zugriff beeinflussen (view_count & Co. lösen keinen Reindex aus)
+INDEXED_COLUMNS = (
+    'title', 'slug', 'description', 'icon', 'template_file', 'category_id',
+    'is_published', 'is_lead_magnet', 'required_subscription_levels'
+)
+
+TOKEN_RE = re.compile(r'[0-9a-zäöüß]+', re.I)
+
+STOPWORDS = frozenset("""
+aber als am an auch auf aus bei bin bis bist da dadurch daher darum das dass dein deine dem den der des
+dessen deshalb die dies diese dieser dieses doch dort du durch ein eine einem einen einer eines er es
+euer eure für hatte hatten hattest hattet hier hinter ich ihr ihre im in ist ja jede jedem jeden jeder
+jedes jener jenes jetzt kann kannst können könnt machen mein meine mit muss musst müssen müsst nach
+nachdem nein nicht nun oder seid sein seine sich sie sind soll sollen sollst sollt sonst soweit sowie
+und unser unsere unter vom von vor wann warum was weiter weitere wenn wer werde werden werdet weshalb
+wie wieder wieso wir wird wirst wo woher wohin zu zum zur über
+the and of to a in is for on with
+""".split())
+
+
+def cistem(word):
+    """
+    CISTEM-Stemmer für Deutsch (Weissweiler & Fraser, 2017), case-insensitive Variante.
+    Faltet Umlaute, entfernt ge-Präfix und typische Flexionsendungen.
+    """
+    word = word.lower().replace('ü', 'u').replace('ö', 'o').replace('ä', 'a').replace('ß', 'ss')
+    word = re.sub(r'^ge(.{4,})', r'\1', word)
+    word = word.replace('sch', '$').replace('ei', '%').replace('ie', '&')
+    word = re.sub(r'(.)\1', r'\1*', word)
+    while len(word) > 3:
+        if len(word) > 5:
+            word, count = re.subn(r'e[mr]$', '', word)
+            if count:
+                continue
+            word, count = re.subn(r'nd$', '', word)
+            if count:
+                continue
+        word, count = re.subn(r't$', '', word)
+        if count:
+            continue
+        word, count = re.subn(r'[esn]$', '', word)
+        if not count:
+            break
+    word = re.sub(r'(.)\*', r'\1\1', word)
+    return word.replace('&', 'ie').replace('%', 'ei').replace('$', 'sch')
+
+
+def tokenize(text):
+    """Text → Liste von Stämmen (ohne Stoppwörter)"""
+    return [cistem(token) for token in TOKEN_RE.findall(text or '') if token.lower() not in STOPWORDS]
+
+
+class SearchIndex:
+    """Invertierter Index mit BM25F-Ranking über alle veröffentlichten Module"""
+
+    def __init__(self, app=None, db=None, LearningModule=None, ModuleCategory=None, content=None, ttl=60):
+        self.ttl = ttl
+
+        self._lock = threading.RLock()
+        self._docs = {}          # module_id → Dokument (Metadaten, Feldlängen, Text)
+        self._postings = defaultdict(dict)  # term → {module_id: {field: tf}}
+        self._terms = []         # sortierte Terme für Präfix-Suche
+        self._terms_dirty = False
+        self._field_lengths = Counter()  # Summe der Feldlängen (für avgdl)
+        self._stale = set()
+        self._built = False
+        self._checked_at = 0.0
+
+        # Zähler für Monitoring
+        self.searches = 0
+        self.reindexed = 0
+        self.full_builds = 0
+
+        if app is not None:
+            self.init_app(app, db, LearningModule, ModuleCategory, content)
+
+    def init_app(self, app, db, LearningModule, ModuleCategory, content):
+        """
+        Args:
+            content: ModuleContentStore (module_content.py) für den Text der Templates
+        """
+        self.app = app
+        self.db = db
+        self.LearningModule = LearningModule
+        self.ModuleCategory = ModuleCategory
+        self.ttl = app.config.get('SEARCH_INDEX_TTL', self.ttl)
+        self.content = content
+
+        event.listen(Session, 'before_flush', self._on_before_flush)
+        event.listen(Session, 'after_commit', self._on_after_commit)
+        event.listen(Session, 'after_rollback', self._on_after_rollback)
+
+    # === INVALIDIERUNG ===
+
+    def _on_before_flush(self, session, flush_context, instances):
+        changed = session.info.setdefault('search_dirty', set())
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+            if isinstance(obj, self.LearningModule) and (obj in session.new or obj in session.deleted or self._touches_index(obj)):
+                changed.add(obj)
+            elif isinstance(obj, self.ModuleCategory) and self._touches_index(obj):
+                # Kategorie-Name steht in den Treffern
+                changed.add('all')
+
+    def _touches_index(self, obj):
+        state = inspect(obj)
+        return any(
+            state.attrs[attr.key].history.has_changes()
+            for attr in state.mapper.column_attrs
+            if attr.key in INDEXED_COLUMNS or isinstance(obj, self.ModuleCategory)
+        )
+
+    def _on_after_commit(self, session):
+        changed = session.info.pop('search_dirty', None)
+        if not changed:
+            return
+        with self._lock:
+            if 'all' in changed:
+                self._built = False
+                return
+            for obj in changed:
+                module_id = inspect(obj).identity[0] if inspect(obj).identity else None
+                if module_id is not None:
+                    self._stale.add(module_id)
+
+    def _on_after_rollback(self, session):
+        session.info.pop('search_dirty', None)
+
+    def invalidate(self, module_id=None):
+        """Einzelnes Modul (oder alles) bei der nächsten Suche neu indexieren"""
+        with self._lock:
+            if module_id is None:
+                self._built = False
+            else:
+                self._stale.add(module_id)
+
+    # === INDEXIERUNG ===
+
+    def _load_rows(self, module_ids=None):
+        """Metadaten veröffentlichter Module inkl. Kategorie-Name (eine Query)"""
+        LearningModule = self.LearningModule
+        ModuleCategory = self.ModuleCategory
+        columns = [getattr(LearningModule, name) for name in INDEXED_COLUMNS]
+        query = self.db.session.query(LearningModule.id, ModuleCategory.name, *columns).outerjoin(
+            ModuleCategory, ModuleCategory.id == LearningModule.category_id
+        ).filter(LearningModule.is_published == True)  # noqa: E712
+        if module_ids is not None:
+            query = query.filter(LearningModule.id.in_(module_ids))
+        return {row[0]: row for row in query.all()}
+
+    def _template_text(self, template_file):
+        """(Text, Datei-Hash) eines Templates"""
+        document = self.content.get(template_file)
+        if document is None:
+            return '', None
+        return document['text'], document['file_hash']
+
+    def _fingerprint(self, row):
+        payload = repr((tuple(row), self._template_text(row.template_file)[1]))
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def _remove(self, module_id):
+        doc = self._docs.pop(module_id, None)
+        if doc is None:
+            return
+        for term in doc.terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(module_id, None)
+                if not postings:
+                    del self._postings[term]
+                    self._terms_dirty = True
+        self._field_lengths.subtract(doc.lengths)
+
+    def _add(self, row):
+        content, _ = self._template_text(row.template_file)
+        fields = {'title': row.title, 'description': row.description or '', 'content': content}
+        lengths = Counter()
+        terms = set()
+        for field, text in fields.items():
+            tokens = tokenize(text)
+            lengths[field] = len(tokens)
+            for term, tf in Counter(tokens).items():
+                if term not in self._postings:
+                    self._terms_dirty = True
+                self._postings[term].setdefault(row.id, {})[field] = tf
+                terms.add(term)
+
+        self._docs[row.id] = SimpleNamespace(
+            id=row.id, title=row.title, slug=row.slug, description=row.description, icon=row.icon,
+            category=row.name or '', is_lead_magnet=row.is_lead_magnet,
+            required_subscription_levels=row.required_subscription_levels or [],
+            content=content, lengths=lengths, terms=terms, fingerprint=self._fingerprint(row)
+        )
+        self._field_lengths.update(lengths)
+
+    def rebuild(self):
+        """Kompletter Neuaufbau (erste Suche, Kategorie-Änderungen)"""
+        rows = self._load_rows()
+        with self._lock:
+            self._docs.clear()
+            self._postings.clear()
+            self._field_lengths.clear()
+            self._stale.clear()
+            for row in rows.values():
+                self._add(row)
+            self._terms = sorted(self._postings)
+            self._terms_dirty = False
+            self._built = True
+            self._checked_at = time.monotonic()
+        self.full_builds += 1
+        logger.info(f"🔎 Suchindex aufgebaut: {len(rows)} Module, {len(self._terms)} Terme")
+
+    def reindex(self, module_ids):
+        """Indexiert einzelne Module neu (gelöschte/unveröffentlichte fallen heraus)"""
+        rows = self._load_rows(module_ids)
+        with self._lock:
+            for module_id in module_ids:
+                self._remove(module_id)
+                if module_id in rows:
+                    self._add(rows[module_id])
+            self.reindexed += len(module_ids)
+
+    def _sync_with_database(self):
+        """Andere Worker: geänderte Module per Fingerprint finden (eine leichte Query)"""
+        rows = self._load_rows()
+        with self._lock:
+            changed = {module_id for module_id, row in rows.items()
+                       if module_id not in self._docs or self._docs[module_id].fingerprint != self._fingerprint(row)}
+            changed |= set(self._docs) - set(rows)
+            self._checked_at = time.monotonic()
+        if changed:
+            self.reindex(changed)
+
+    def ensure_current(self):
+        with self._lock:
+            built, stale = self._built, set(self._stale)
+            self._stale.clear()
+            due = time.monotonic() - self._checked_at >= self.ttl
+        if not built:
+            self.rebuild()
+            return
+        if stale:
+            self.reindex(stale)
+        if due:
+            self._sync_with_database()
+
+    # === SUCHE ===
+
+    def _expand(self, token, prefix):
+        """Query-Token → [(Term, Gewicht)]: exakter Stamm, beim letzten Wort auch Präfix-Treffer"""
+        stem = cistem(token)
+        expansions = [(stem, 1.0)] if stem in self._postings else []
+        if prefix and len(stem) >= MIN_PREFIX:
+            if self._terms_dirty:
+                self._terms = sorted(self._postings)
+                self._terms_dirty = False
+            start = bisect.bisect_left(self._terms, stem)
+            for term in self._terms[start:start + 200]:
+                if not term.startswith(stem):
+                    break
+                if term != stem:
+                    expansions.append((term, PREFIX_PENALTY))
+        return expansions
+
+    def search(self, query, limit=10, accessible=None):
+        """
+        Rangliste passender Module.
+
+        Args:
+            accessible: optional Filter (Liste von Dokumenten → zugängliche Dokumente),
+                        z.B. module_access.for_request().filter_accessible
+
+        Returns:
+            list[dict]: title, slug, description, icon, category, score, snippet
+        """
+        self.ensure_current()
+        self.searches += 1
+        words = [w for w in TOKEN_RE.findall(query or '') if w.lower() not in STOPWORDS]
+        if not words:
+            return []
+        prefix_last = not query.rstrip().endswith((' ', '"'))  # Type-ahead: letztes Wort unvollständig
+
+        with self._lock:
+            total_docs = len(self._docs) or 1
+            avg_lengths = {field: (self._field_lengths[field] / total_docs) or 1 for field in FIELD_WEIGHTS}
+            scores = defaultdict(float)
+            matched_all = None
+
+            for index, word in enumerate(words):
+                token_scores = {}
+                for term, weight in self._expand(word, prefix_last and index == len(words) - 1):
+                    postings = self._postings.get(term, {})
+                    idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for module_id, field_tfs in postings.items():
+                        doc = self._docs[module_id]
+                        # BM25F: gewichtete, längennormalisierte Term-Frequenz über alle Felder
+                        tf = sum(
+                            FIELD_WEIGHTS[field] * count / (1 - B + B * doc.lengths[field] / avg_lengths[field])
+                            for field, count in field_tfs.items()
+                        )
+                        score = weight * idf * tf * (K1 + 1) / (tf + K1)
+                        token_scores[module_id] = max(token_scores.get(module_id, 0.0), score)
+                # Alle Wörter müssen vorkommen (UND-Verknüpfung)
+                matched_all = set(token_scores) if matched_all is None else matched_all & set(token_scores)
+                for module_id, score in token_scores.items():
+                    scores[module_id] += score
+
+            ranked = sorted(matched_all or (), key=lambda module_id: (-scores[module_id], self._docs[module_id].title))
+            docs = [self._docs[module_id] for module_id in ranked]
+
+        if accessible is not None:
+            docs = accessible(docs)
+        return [
+            {
+                'title': doc.title,
+                'slug': doc.slug,
+                'description': doc.description,
+                'icon': doc.icon,
+                'category': doc.category,
+                'score': round(scores[doc.id], 3),
+                'snippet': self._snippet(doc, words)
+            }
+            for doc in docs[:limit]
+        ]
+
+    def _snippet(self, doc, words):
+        """Textausschnitt um den ersten Treffer im Lerninhalt"""
+        if not doc.content:
+            return ''
+        folded = doc.content.lower()
+        positions = [folded.find(word.lower()[:max(MIN_PREFIX, len(word) - 2)]) for word in words]
+        positions = [p for p in positions if p >= 0]
+        if not positions:
+            return ''
+        start = max(0, min(positions) - SNIPPET_CHARS // 3)
+        snippet = doc.content[start:start + SNIPPET_CHARS].strip()
+        return ('…' if start else '') + snippet + ('…' if start + SNIPPET_CHARS < len(doc.content) else '')
+
+    def stats(self):
+        """Zähler für Monitoring (dieser Prozess)"""
+        with self._lock:
+            return {
+                'modules': len(self._docs),
+                'terms': len(self._postings),
+                'ttl': self.ttl,
+                'searches': self.searches,
+                'reindexed': self.reindexed,
+                'full_builds': self.full_builds
+            }
@@ -41,9 +41,8 @@ def run_command(command, description=""):
         print(f"❌ Exception bei {description}: {str(e)}")
         return False, str(e)
 
-def validate_module_config():
-    """Validiert die Module-Konfiguration"""
-    config_file = "didis_streamlit_modules_config.json"
+def validate_module_config(config_file="didis_streamlit_modules_config.json"):
+    """Validiert die Module-Konfiguration (auch Katalog-Exporte aus flask --app app export-catalogue)"""
     
     if not os.path.exists(config_file):
         print(f"❌ Module-Konfiguration nicht gefunden: {config_file}")
@@ -55,9 +54,12 @@ def validate_module_config():
         
         modules = config.get('modules', [])
         print(f"✅ {len(modules)} Module in Konfiguration gefunden")
+        if config.get('format') == 'didis-catalogue':
+            print(f"   🗂️  Katalog v{config.get('version')} vom {config.get('exported_at')}: "
+                  f"{len(config.get('categories', []))} Kategorien, {len(config.get('subcategories', []))} Unterkategorien")
         
-        # Statistiken
-        html_modules = len([m for m in modules if m.get('content_type') == 'html'])
+        # Statistiken (im Katalog-Format fehlt content_type bei 'html')
+        html_modules = len([m for m in modules if m.get('content_type', 'html') == 'html'])
         streamlit_modules = len([m for m in modules if m.get('content_type') == 'streamlit'])
         lead_magnets = len([m for m in modules if m.get('is_lead_magnet', False)])
         
@@ -103,8 +105,15 @@ def check_git_status():
     
     return True
 
-def sync_to_railway():
-    """Hauptfunktion: Synchronisation zu Railway"""
+def sync_to_railway(catalogue_file=None):
+    """
+    Hauptfunktion: Synchronisation zu Railway
+    
+    Args:
+        catalogue_file: optional Katalog-Export (flask --app app export-catalogue -o ...),
+                        wird validiert und mit committed; Import auf Railway:
+                        python migrate_modules.py config <datei> --update
+    """
     print("\n" + "=" * 60)
     print("🚀 SYNC MODULES TO RAILWAY.APP")
     print("=" * 60)
@@ -116,6 +125,9 @@ def sync_to_railway():
     if not validate_module_config():
         print("❌ Module-Validierung fehlgeschlagen!")
         return False
+    if catalogue_file and not validate_module_config(catalogue_file):
+        print("❌ Katalog-Validierung fehlgeschlagen!")
+        return False
     
     # 2. Git-Status prüfen
     print("\n📋 SCHRITT 2: GIT-STATUS PRÜFEN")
@@ -132,6 +144,8 @@ def sync_to_railway():
         "templates/tirone_quadrant_lines.html",
         "templates/Screenshots/Tirone.png"
     ]
+    if catalogue_file:
+        files_to_add.append(catalogue_file)
     
     for file in files_to_add:
         if os.path.exists(file):
@@ -189,7 +203,10 @@ def sync_to_railway():
 def main():
     """Main function"""
     try:
-        if sync_to_railway():
+        catalogue_file = None
+        if '--catalogue' in sys.argv[1:-1]:
+            catalogue_file = sys.argv[sys.argv.index('--catalogue') + 1]
+        if sync_to_railway(catalogue_file):
             print("\n🎉 SYNC ZU RAILWAY ERFOLGREICH! 🎉")
             sys.exit(0)
         else:
@@ -0,0 +1,223 @@
+# template_bundles.py - Inline-CSS/JS großer Lernseiten als minifizierte, cachebare Bundles
+"""
+Optionaler Build-Schritt (python template_bundles.py bzw. flask --app app build-bundles):
+- Für alle großen Templates (>= MIN_TEMPLATE_SIZE) werden <style>- und klassische
+  <script>-Blöcke minifiziert (rcssmin/rjsmin, nur zur Build-Zeit nötig)
+- Blöcke ab BUNDLE_MIN_SIZE wandern in static/bundles/<hash>.css|js und werden per
+  <link>/<script src> eingebunden; gleiche Blöcke mehrerer Seiten teilen sich ein Bundle
+  (Name = Inhalts-Hash, passt zu ?v= aus asset_manifest.py → ein Jahr immutable)
+- Blöcke mit Jinja-Syntax bleiben inline (nur minifiziert bzw. unverändert)
+- Die umgeschriebenen Templates liegen unter templates/build/; TemplateBundles bevorzugt
+  sie, solange das Original unverändert ist (Quell-Hash in templates/build/bundles.json)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+
+from jinja2 import BaseLoader, ChoiceLoader, TemplateNotFound
+
+logger = logging.getLogger(__name__)
+
+BASEDIR = os.path.abspath(os.path.dirname(__file__))
+
+TEMPLATE_DIR = 'templates'
+BUILD_DIR = 'templates/build'
+BUNDLE_DIR = 'static/bundles'
+MANIFEST_NAME = 'bundles.json'
+
+MIN_TEMPLATE_SIZE = 40_000  # nur die großen Lernseiten
+BUNDLE_MIN_SIZE = 2_048     # kleinere Blöcke bleiben inline (eigener Request lohnt nicht)
+
+# Werden ohne Template-Engine ausgeliefert → Bundle-URLs als feste Pfade statt url_for
+RAW_TEMPLATES = ('better-volume-lernseite.html', 'trading_archetypen.html')
+
+# Ein Durchlauf für beide: ein '<style>' in einem JS-String gehört zum Script, nicht zum CSS
+BLOCK_RE = re.compile(
+    r'<(?P<tag>style|script)\b(?P<attrs>[^>]*)>(?P<body>.*?)</(?P=tag)>', re.S | re.I
+)
+JINJA_RE = re.compile(r'\{\{|\{%|\{#')
+CLASSIC_SCRIPT_TYPES = ('', 'text/javascript', 'application/javascript')
+
+
+def _hash(data):
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def _file_hash(path):
+    with open(path, 'rb') as handle:
+        return _hash(handle.read())
+
+
+def _script_type(attrs):
+    match = re.search(r'\btype\s*=\s*["\']?([^"\'\s>]+)', attrs, re.I)
+    return match.group(1).lower() if match else ''
+
+
+def build_bundles(basedir=BASEDIR, templates=None):
+    """
+    Minifiziert Inline-CSS/JS und schreibt Bundles + umgeschriebene Templates.
+
+    Args:
+        templates: Template-Namen (Standard: alle Top-Level-Templates >= MIN_TEMPLATE_SIZE)
+
+    Returns:
+        dict: templates, bundles, bytes_before, bytes_after
+    """
+    try:
+        import rcssmin
+        import rjsmin
+    except ImportError:
+        raise RuntimeError("rcssmin/rjsmin fehlen - Build-Schritt braucht: pip install rcssmin rjsmin")
+
+    template_dir = os.path.join(basedir, TEMPLATE_DIR)
+    build_dir = os.path.join(basedir, BUILD_DIR)
+    bundle_dir = os.path.join(basedir, BUNDLE_DIR)
+
+    if templates is None:
+        templates = sorted(
+            name for name in os.listdir(template_dir)
+            if name.endswith('.html') and os.path.getsize(os.path.join(template_dir, name)) >= MIN_TEMPLATE_SIZE
+        )
+
+    # Build-Ordner komplett neu: keine veralteten Kopien gelöschter/verkleinerter Templates
+    shutil.rmtree(build_dir, ignore_errors=True)
+    os.makedirs(build_dir)
+    os.makedirs(bundle_dir, exist_ok=True)
+
+    manifest = {}
+    bundles = set()
+    result = {'templates': 0, 'bundles': 0, 'bytes_before': 0, 'bytes_after': 0}
+
+    for name in templates:
+        with open(os.path.join(template_dir, name), encoding='utf-8') as handle:
+            source = handle.read()
+        raw = name in RAW_TEMPLATES
+
+        def bundle(body, extension):
+            data = body.encode('utf-8')
+            filename = f'{_hash(data)}.{extension}'
+            path = os.path.join(bundle_dir, filename)
+            if not os.path.exists(path):
+                with open(path, 'wb') as handle:
+                    handle.write(data)
+            bundles.add(filename)
+            if raw:
+                return f'/static/bundles/{filename}?v={_hash(data)}'
+            return "{{ url_for('static', filename='bundles/%s') }}" % filename
+
+        def replace_style(match):
+            body = match.group('body')
+            if JINJA_RE.search(body):
+                return match.group(0)
+            minified = rcssmin.cssmin(body).strip()
+            if len(minified) < BUNDLE_MIN_SIZE:
+                return f"<style{match.group('attrs')}>{minified}</style>"
+            return f'<link rel="stylesheet" href="{bundle(minified, "css")}">'
+
+        def replace_script(match):
+            attrs, body = match.group('attrs'), match.group('body')
+            if re.search(r'\bsrc\s*=', attrs, re.I) or _script_type(attrs) not in CLASSIC_SCRIPT_TYPES \
+                    or JINJA_RE.search(body) or not body.strip():
+                return match.group(0)
+            minified = rjsmin.jsmin(body).strip()
+            if len(minified) < BUNDLE_MIN_SIZE:
+                return f'<script{attrs}>{minified}</script>'
+            return f'<script src="{bundle(minified, "js")}"></script>'
+
+        output = BLOCK_RE.sub(
+            lambda match: (replace_style if match.group('tag').lower() == 'style' else replace_script)(match), source
+        )
+        with open(os.path.join(build_dir, name), 'w', encoding='utf-8') as handle:
+            handle.write(output)
+
+        manifest[name] = _hash(source.encode('utf-8'))
+        result['templates'] += 1
+        result['bytes_before'] += len(source.encode('utf-8'))
+        result['bytes_after'] += len(output.encode('utf-8'))
+
+    with open(os.path.join(build_dir, MANIFEST_NAME), 'w', encoding='utf-8') as handle:
+        json.dump(manifest, handle, indent=1, sort_keys=True)
+
+    for filename in os.listdir(bundle_dir):
+        if filename not in bundles:
+            os.remove(os.path.join(bundle_dir, filename))
+    result['bundles'] = len(bundles)
+    return result
+
+
+class _BuildLoader(BaseLoader):
+    """Lädt die gebaute Kopie eines Templates - nur solange das Original dazu passt"""
+
+    def __init__(self, build_dir, template_dir, sources, check_sources):
+        self.build_dir = build_dir
+        self.template_dir = template_dir
+        self.sources = sources
+        self.check_sources = check_sources
+
+    def is_current(self, template):
+        expected = self.sources.get(template)
+        if expected is None:
+            return False
+        if not self.check_sources:
+            return True
+        try:
+            return _file_hash(os.path.join(self.template_dir, template)) == expected
+        except OSError:
+            return False
+
+    def get_source(self, environment, template):
+        if not self.is_current(template):
+            raise TemplateNotFound(template)
+        path = os.path.join(self.build_dir, template)
+        with open(path, encoding='utf-8') as handle:
+            contents = handle.read()
+        mtime = os.path.getmtime(path)
+        return contents, path, lambda: (
+            os.path.exists(path) and os.path.getmtime(path) == mtime and self.is_current(template)
+        )
+
+
+class TemplateBundles:
+    """Bevorzugt die gebauten Templates (falls vorhanden) für render_template und Raw-Seiten"""
+
+    def __init__(self, app=None):
+        self.loader = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.template_dir = os.path.join(app.root_path, TEMPLATE_DIR)
+        self.build_dir = os.path.join(app.root_path, BUILD_DIR)
+        manifest_path = os.path.join(self.build_dir, MANIFEST_NAME)
+
+        if not app.config.get('TEMPLATE_BUNDLES', True) or not os.path.exists(manifest_path):
+            return
+        with open(manifest_path, encoding='utf-8') as handle:
+            sources = json.load(handle)
+
+        # Produktion: einmal beim Start prüfen; Debug: bei jedem Laden (Templates werden bearbeitet)
+        self.loader = _BuildLoader(self.build_dir, self.template_dir, sources, check_sources=True)
+        current = {name: source_hash for name, source_hash in sources.items() if self.loader.is_current(name)}
+        if len(current) < len(sources):
+            logger.warning(f"template_bundles: {len(sources) - len(current)} gebaute Templates veraltet - Originale werden genutzt")
+        self.loader = _BuildLoader(self.build_dir, self.template_dir, current, check_sources=app.debug)
+        app.jinja_loader = ChoiceLoader([self.loader, app.jinja_loader])
+
+    def page_directory(self, template_file):
+        """Ordner, aus dem eine Raw-Seite (ohne Template-Engine) ausgeliefert wird"""
+        if self.loader is not None and self.loader.is_current(template_file):
+            return self.build_dir
+        return self.template_dir
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    stats = build_bundles()
+    print(f"✅ {stats['templates']} Templates → {BUILD_DIR}/, {stats['bundles']} Bundles → {BUNDLE_DIR}/")
+    print(f"   HTML: {stats['bytes_before'] / 1e3:.0f} KB → {stats['bytes_after'] / 1e3:.0f} KB")
@@ -0,0 +1,185 @@
+# template_registry.py - Inkrementeller Abgleich templates/*.html ↔ learning_modules
+"""
+Template-Scan für /admin/scan-new-modules, init_db_tables.py und Deploy-Hooks
+(flask --app app scan-templates):
+- Manifest (Datei, mtime, Größe, SHA-256) ist die Tabelle module_contents
+  (module_content.py): nur neue/geänderte Templates werden gelesen und geparst
+- Alle bestehenden Slugs/Template-Dateien in EINER Query statt zwei Queries pro Datei
+- Ergebnis ist ein Diff aus create (neue Templates), update (Modul mit passendem Slug,
+  aber fehlendem/anderem template_file) und orphans (template_file existiert nicht mehr),
+  angewendet in einer einzigen Transaktion
+- dry_run zeigt nur den Diff; Waisen werden gemeldet und nur auf Wunsch depubliziert
+"""
+
+import logging
+import os
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+NEW_MODULES_CATEGORY = {
+    'name': '🆕 Neue Module',
+    'slug': 'neue-module',
+    'icon': '🆕',
+    'description': 'Neu gefundene Module - Bitte in richtige Kategorie verschieben',
+    'sort_order': 999,
+}
+
+
+def diff_templates(template_files, modules, template_exists):
+    """
+    Vergleicht Template-Dateien mit den registrierten Modulen.
+
+    Args:
+        template_files: Dateinamen in templates/ (ohne System-Templates)
+        modules: Zeilen mit id, slug, template_file, is_published
+        template_exists: Callable(template_file) → bool (auch für Unterordner)
+
+    Returns:
+        dict: create [Dateinamen], update [(Modul-Zeile, neues template_file)], orphans [Modul-Zeilen]
+    """
+    by_slug = {module.slug: module for module in modules}
+    registered_files = {module.template_file for module in modules if module.template_file}
+
+    create, update = [], []
+    relinked = set()
+    for name in sorted(template_files):
+        slug = name[:-len('.html')] if name.endswith('.html') else name
+        module = by_slug.get(slug)
+        if module is not None and module.template_file != name:
+            update.append((module, name))
+            relinked.add(module.id)
+        elif module is None and name not in registered_files:
+            create.append(name)
+
+    orphans = [
+        module for module in modules
+        if module.template_file and module.id not in relinked and not template_exists(module.template_file)
+    ]
+    return {'create': create, 'update': update, 'orphans': orphans}
+
+
+class TemplateRegistry:
+    """Registriert neue Templates als (unveröffentlichte) Module"""
+
+    def __init__(self, app=None, db=None, LearningModule=None, ModuleCategory=None, content=None):
+        self.last_scan = None
+
+        if app is not None:
+            self.init_app(app, db, LearningModule, ModuleCategory, content)
+
+    def init_app(self, app, db, LearningModule, ModuleCategory, content):
+        """
+        Args:
+            content: ModuleContentStore (module_content.py) - Manifest und extrahierte Titel/Beschreibungen
+        """
+        self.app = app
+        self.db = db
+        self.LearningModule = LearningModule
+        self.ModuleCategory = ModuleCategory
+        self.content = content
+
+    def _template_exists(self, template_file):
+        return os.path.isfile(os.path.join(self.content.template_dir, template_file))
+
+    def _new_module(self, template_file, category_id, sort_order):
+        document = self.content.get(template_file) or {}
+        slug = template_file[:-len('.html')]
+        title = document.get('title') or slug.replace('_', ' ').replace('-', ' ').title()
+        return self.LearningModule(
+            category_id=category_id,
+            title=title[:200],
+            slug=slug,
+            description=document.get('description') or f'Automatisch gefunden: {template_file} - Bitte Details ergänzen',
+            icon='📄',
+            template_file=template_file,
+            content_type='html',
+            is_published=False,  # Nicht veröffentlicht bis Admin prüft
+            is_lead_magnet=False,
+            required_subscription_levels=['premium', 'elite'],
+            estimated_duration=document.get('reading_minutes') or 30,
+            difficulty_level='intermediate',
+            sort_order=sort_order
+        )
+
+    def scan(self, dry_run=False, unpublish_orphans=False):
+        """
+        Gleicht templates/ mit den Modulen ab.
+
+        Args:
+            dry_run: nur den Diff berechnen, nichts an den Modulen ändern
+            unpublish_orphans: veröffentlichte Module ohne Template-Datei depublizieren
+
+        Returns:
+            dict: created/updated/orphans (Dateinamen bzw. Slugs), content (Manifest-Statistik), seconds
+        """
+        started = time.monotonic()
+        LearningModule = self.LearningModule
+
+        # 1. Manifest aktualisieren: nur neue/geänderte Dateien werden gelesen
+        content_stats = self.content.refresh()
+
+        # 2. Alle Module in einer Query
+        modules = self.db.session.query(
+            LearningModule.id, LearningModule.slug, LearningModule.template_file, LearningModule.is_published
+        ).all()
+        diff = diff_templates(self.content.template_files(), modules, self._template_exists)
+
+        result = {
+            'created': diff['create'],
+            'updated': [(module.slug, module.template_file, name) for module, name in diff['update']],
+            'orphans': [module.slug for module in diff['orphans']],
+            'unpublished': [],
+            'content': content_stats,
+            'dry_run': dry_run,
+        }
+
+        # 3. Diff in einer Transaktion anwenden
+        if not dry_run and (diff['create'] or diff['update'] or (unpublish_orphans and diff['orphans'])):
+            session = self.db.session
+            try:
+                if diff['create']:
+                    category = self.ModuleCategory.query.filter_by(slug=NEW_MODULES_CATEGORY['slug']).first()
+                    if category is None:
+                        category = self.ModuleCategory(is_active=True, **NEW_MODULES_CATEGORY)
+                        session.add(category)
+                        session.flush()
+                        result['category_created'] = True
+                    session.add_all(
+                        self._new_module(name, category.id, 100 + index) for index, name in enumerate(diff['create'])
+                    )
+
+                # Als ORM-Objekte ändern, damit Menü-/Render-Cache und Suchindex invalidiert werden
+                unpublish = [module for module in diff['orphans'] if module.is_published] if unpublish_orphans else []
+                changes = {module.id: {'template_file': name} for module, name in diff['update']}
+                for module in unpublish:
+                    changes.setdefault(module.id, {})['is_published'] = False
+                if changes:
+                    for module in LearningModule.query.filter(LearningModule.id.in_(changes)).all():
+                        for key, value in changes[module.id].items():
+                            setattr(module, key, value)
+                result['unpublished'] = [module.slug for module in unpublish]
+
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
+        result['seconds'] = round(time.monotonic() - started, 3)
+        self.last_scan = {
+            'at': datetime.utcnow().isoformat(),
+            'created': len(result['created']),
+            'updated': len(result['updated']),
+            'orphans': len(result['orphans']),
+            'parsed': content_stats['parsed'],
+            'seconds': result['seconds'],
+            'dry_run': dry_run,
+        }
+        logger.info(f"🗂️ Template-Scan: {len(result['created'])} neu, {len(result['updated'])} aktualisiert, "
+                    f"{len(result['orphans'])} ohne Datei, {content_stats['parsed']} geparst ({result['seconds']}s)")
+        return result
+
+    def stats(self):
+        """Letzter Scan in diesem Prozess (für Monitoring)"""
+        return {'last_scan': self.last_scan}
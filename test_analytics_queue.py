@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests für die gepufferte Analytics-Ingestion (analytics_queue.py)
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from analytics_queue import AnalyticsQueue
+
+
+@pytest.fixture
+def make_queue(app):
+    from app import db, VisitorAnalytics
+
+    queues = []
+
+    def make(**options):
+        # Ohne init_app: kein atexit-Hook, ANALYTICS_ASYNC=False der Tests greift nicht
+        analytics = AnalyticsQueue(**options)
+        analytics.app, analytics.db, analytics.model = app, db, VisitorAnalytics
+        queues.append(analytics)
+        return analytics
+
+    yield make
+    for analytics in queues:
+        analytics.shutdown(timeout=1.0)
+
+
+def row(index):
+    return {'ip_address': f'10.0.0.{index}', 'page_url': f'http://localhost/seite/{index}',
+            'visited_at': datetime.utcnow(), 'device_type': 'desktop'}
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def stored(app):
+    from app import VisitorAnalytics
+
+    with app.app_context():
+        return VisitorAnalytics.query.count()
+
+
+def test_flush_by_batch_size(app, make_queue):
+    analytics = make_queue(batch_size=5, flush_interval=30.0)
+    for index in range(5):
+        assert analytics.push(row(index))
+
+    # Das Zeitlimit (30s) ist noch lange nicht erreicht - die Batch-Größe löst aus
+    assert wait_for(lambda: analytics.stats()['flushed'] == 5)
+    assert analytics.stats()['batches'] == 1
+    assert stored(app) == 5
+
+
+def test_flush_by_interval(app, make_queue):
+    analytics = make_queue(batch_size=1000, flush_interval=0.2)
+    for index in range(3):
+        analytics.push(row(index))
+
+    assert wait_for(lambda: analytics.stats()['flushed'] == 3)
+    assert analytics.stats()['batches'] == 1
+    assert stored(app) == 3
+
+
+def test_full_queue_drops_events(app, make_queue, monkeypatch):
+    analytics = make_queue(maxsize=2, batch_size=10, flush_interval=30.0)
+    # Writer nicht starten, damit die Queue voll bleibt
+    monkeypatch.setattr(analytics, '_ensure_worker', lambda: None)
+
+    assert [analytics.push(row(index)) for index in range(4)] == [True, True, False, False]
+    stats = analytics.stats()
+    assert (stats['enqueued'], stats['dropped'], stats['queue_size']) == (2, 2, 2)
+
+    analytics.flush()
+    assert stored(app) == 2
+
+
+def test_shutdown_drains_pending_rows(app, make_queue):
+    analytics = make_queue(batch_size=1000, flush_interval=30.0)
+    for index in range(4):
+        analytics.push(row(index))
+    # Writer hält die Events in seinem angefangenen Batch (Zeitlimit 30s)
+    assert wait_for(lambda: analytics.stats()['queue_size'] == 0)
+
+    started = time.monotonic()
+    analytics.shutdown(timeout=5.0)
+    assert time.monotonic() - started < 2.0
+    assert analytics.stats()['flushed'] == 4
+    assert stored(app) == 4
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests für module_slug-Normalisierung, Migration und Archivierung (analytics_retention.py)
+"""
+
+import gzip
+import os
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import inspect, text
+
+from analytics_retention import module_slug_from_url, migrate_visitor_analytics
+
+
+def test_module_slug_from_url():
+    assert module_slug_from_url('https://example.com/module/magic-line') == 'magic-line'
+    assert module_slug_from_url('/module/magic-line/?tab=2') == 'magic-line'
+    assert module_slug_from_url('/modules') is None
+    assert module_slug_from_url('/vcp-pattern') is None
+    assert module_slug_from_url(None) is None
+
+
+def test_tracking_stores_module_slug(app, client):
+    from app import VisitorAnalytics
+
+    client.get('/module/unbekanntes-modul')
+    with app.app_context():
+        visit = VisitorAnalytics.query.order_by(VisitorAnalytics.id.desc()).first()
+        assert visit.module_slug == 'unbekanntes-modul'
+
+
+def test_migration_adds_column_indexes_and_backfills(app):
+    from app import db, VisitorAnalytics
+
+    with app.app_context():
+        # Alt-Schema simulieren: ohne Indizes und ohne module_slug
+        for index in VisitorAnalytics.__table__.indexes:
+            db.session.execute(text(f'DROP INDEX {index.name}'))
+        db.session.execute(text('ALTER TABLE visitor_analytics DROP COLUMN module_slug'))
+        db.session.execute(text(
+            "INSERT INTO visitor_analytics (ip_address, page_url, visited_at) VALUES "
+            "('1.1.1.1', 'https://example.com/module/magic-line', '2025-01-01 10:00:00'), "
+            "('1.1.1.1', 'https://example.com/modules', '2025-01-01 10:00:00')"
+        ))
+        db.session.commit()
+        # Wie nach einem Deploy: neue Verbindungen ohne gecachtes SQLite-Schema
+        db.session.remove()
+        db.engine.dispose()
+
+        migrate_visitor_analytics(db, VisitorAnalytics)
+
+        inspector = inspect(db.engine)
+        assert 'module_slug' in [col['name'] for col in inspector.get_columns('visitor_analytics')]
+        index_names = {index['name'] for index in inspector.get_indexes('visitor_analytics')}
+        assert {index.name for index in VisitorAnalytics.__table__.indexes} <= index_names
+        slugs = [row[0] for row in db.session.execute(text('SELECT module_slug FROM visitor_analytics ORDER BY id'))]
+        assert slugs == ['magic-line', None]
+
+
+def test_retention_archives_only_rolled_up_rows(app, tmp_path, monkeypatch):
+    from app import db, VisitorAnalytics, analytics_retention, archive_old_analytics
+
+    monkeypatch.setattr(analytics_retention, 'archive_dir', str(tmp_path))
+    monkeypatch.setattr(analytics_retention, 'archive_configured', True)
+    monkeypatch.setattr(analytics_retention, 'retention_days', 30)
+    monkeypatch.setattr(analytics_retention, 'batch_size', 7)
+
+    now = datetime.utcnow()
+    with app.app_context():
+        for days_ago in (100, 95, 60, 40, 10, 0):
+            for i in range(5):
+                db.session.add(VisitorAnalytics(ip_address=f'10.0.0.{i}', page_url='https://example.com/',
+                                                visited_at=now - timedelta(days=days_ago, minutes=i)))
+        db.session.commit()
+
+        assert archive_old_analytics() == 20
+        assert VisitorAnalytics.query.count() == 10
+
+    archived = []
+    for path in sorted(tmp_path.glob('visitor_analytics_*.jsonl.gz')):
+        with gzip.open(path, 'rt', encoding='utf-8') as archive:
+            archived.extend(json.loads(line) for line in archive)
+    assert len(archived) == 20
+    assert all(datetime.fromisoformat(row['visited_at']) < now - timedelta(days=30) for row in archived)
+
+
+def test_retention_requires_explicit_archive_dir(app, tmp_path, monkeypatch):
+    from app import db, VisitorAnalytics
+    from analytics_retention import AnalyticsRetention
+
+    monkeypatch.setitem(app.config, 'ANALYTICS_ARCHIVE_DIR', None)
+    retention = AnalyticsRetention(app, db, VisitorAnalytics)
+    assert retention.archive_dir == os.path.join(app.root_path, 'analytics_archive')  # nicht relativ zum CWD
+
+    now = datetime.utcnow()
+    with app.app_context():
+        db.session.add(VisitorAnalytics(ip_address='10.0.0.1', page_url='https://example.com/',
+                                        visited_at=now - timedelta(days=500)))
+        db.session.commit()
+
+        # Ohne gesetztes Verzeichnis: nichts löschen
+        assert retention.run(now) == 0
+        assert VisitorAnalytics.query.count() == 1
+
+        monkeypatch.setitem(app.config, 'ANALYTICS_ARCHIVE_DIR', str(tmp_path / 'archiv'))
+        retention = AnalyticsRetention(app, db, VisitorAnalytics)
+        assert retention.run(now) == 1
+        assert VisitorAnalytics.query.count() == 0
+        assert list((tmp_path / 'archiv').glob('visitor_analytics_*.jsonl.gz'))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests für Fingerprint-URLs und Langzeit-Caching (asset_manifest.py)
+"""
+
+import gzip
+import json
+
+import pytest
+
+from asset_manifest import MANIFEST_PATH, PRECOMPRESSED_DIR, build_manifest, manifest_key
+
+
+@pytest.fixture
+def assets(app, tmp_path, monkeypatch):
+    """AssetManifest der App mit eigenem Manifest und gzip-Variante im Temp-Ordner"""
+    import app as app_module
+
+    helper = app_module.asset_manifest
+    manifest = {
+        manifest_key('static', 'BO_CETX.png'): {'hash': 'abc123', 'encodings': ['gzip']},
+        manifest_key('serve_screenshots', 'A-Grade_Squeeze.jpg'): {'hash': 'def456', 'encodings': []},
+    }
+    (tmp_path / 'manifest.json').write_text(json.dumps(manifest), encoding='utf-8')
+    (tmp_path / 'static').mkdir()
+    (tmp_path / 'static' / 'BO_CETX.png.gz').write_bytes(gzip.compress(b'komprimiert'))
+
+    monkeypatch.setattr(helper, 'manifest_path', str(tmp_path / 'manifest.json'))
+    monkeypatch.setattr(helper, 'precompressed_dir', str(tmp_path))
+    monkeypatch.setattr(helper, '_manifest', None)
+    yield helper
+    helper._manifest = None
+
+
+def test_url_for_adds_fingerprint(app, assets):
+    from flask import url_for
+
+    with app.test_request_context():
+        assert url_for('static', filename='BO_CETX.png') == '/static/BO_CETX.png?v=abc123'
+        assert url_for('serve_screenshots', filename='A-Grade_Squeeze.jpg') == '/Screenshots/A-Grade_Squeeze.jpg?v=def456'
+        # Nicht im Manifest → URL unverändert
+        assert url_for('static', filename='unbekannt.css') == '/static/unbekannt.css'
+
+
+def test_fingerprinted_request_is_immutable(client, assets):
+    response = client.get('/Screenshots/A-Grade_Squeeze.jpg?v=def456')
+    assert response.status_code == 200
+    assert response.cache_control.max_age == 365 * 24 * 3600
+    assert response.cache_control.immutable
+    assert response.cache_control.public
+    response.close()
+
+    # Veralteter Hash: ausliefern, aber nicht langfristig cachen
+    stale = client.get('/Screenshots/A-Grade_Squeeze.jpg?v=alt')
+    assert stale.status_code == 200
+    assert not stale.cache_control.immutable
+    assert stale.cache_control.max_age is None
+    stale.close()
+
+
+def test_precompressed_variant_when_accepted(client, assets):
+    response = client.get('/static/BO_CETX.png?v=abc123', headers={'Accept-Encoding': 'br, gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.mimetype == 'image/png'
+    assert gzip.decompress(response.get_data()) == b'komprimiert'
+    assert 'Accept-Encoding' in response.vary
+    response.close()
+
+    plain = client.get('/static/BO_CETX.png?v=abc123')
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.get_data()[:4] == b'\x89PNG'
+    plain.close()
+
+
+def test_build_hashes_and_compresses(tmp_path):
+    static = tmp_path / 'static'
+    (static / 'css').mkdir(parents=True)
+    (static / 'css' / 'app.css').write_text('body { color: red; }\n' * 200)
+    (static / 'zufall.bin').write_bytes(bytes(range(256)) * 4)
+    (tmp_path / 'templates' / 'Screenshots').mkdir(parents=True)
+    (tmp_path / 'templates' / 'Screenshots' / 'Chart.png').write_bytes(b'png' * 10)
+
+    first = build_manifest(str(tmp_path))
+    manifest = json.loads((tmp_path / MANIFEST_PATH).read_text(encoding='utf-8'))
+    assert set(manifest) == {'static:css/app.css', 'static:zufall.bin', 'serve_screenshots:Chart.png'}
+    assert 'gzip' in manifest['static:css/app.css']['encodings']
+    assert (tmp_path / PRECOMPRESSED_DIR / 'static' / 'css' / 'app.css.gz').exists()
+    assert first['files'] == 3 and first['skipped'] == 0
+
+    # Unverändert → übersprungen; geändert → neuer Hash, alte Variante ersetzt
+    assert build_manifest(str(tmp_path))['skipped'] == 3
+    old_hash = manifest['static:css/app.css']['hash']
+    (static / 'css' / 'app.css').write_text('body { color: blue; }\n' * 200)
+    build_manifest(str(tmp_path))
+    manifest = json.loads((tmp_path / MANIFEST_PATH).read_text(encoding='utf-8'))
+    assert manifest['static:css/app.css']['hash'] != old_hash
+
+    # Gelöschte Datei → Varianten werden aufgeräumt
+    (static / 'css' / 'app.css').unlink()
+    build_manifest(str(tmp_path))
+    assert not (tmp_path / PRECOMPRESSED_DIR / 'static' / 'css' / 'app.css.gz').exists()
@@ -0,0 +1,74 @@
+"""
+Bootstrap-Tests: Demo-Module/Auto-Sync laufen einmal pro Content-Version,
+home() führt danach nur noch lesende Queries aus.
+"""
+
+from sqlalchemy import event
+
+
+def test_bootstrap_runs_once_per_content_version(app):
+    from app import db, AppState, LearningModule, CONTENT_VERSION, bootstrap_app_data
+
+    with app.app_context():
+        assert bootstrap_app_data() is True
+        assert AppState.get_value('content_version') == CONTENT_VERSION
+        module_count = LearningModule.query.count()
+        assert module_count > 0
+
+        # Zweiter Aufruf (z.B. weiterer Worker) überspringt den Bootstrap
+        assert bootstrap_app_data() is False
+        assert LearningModule.query.count() == module_count
+
+        # Geänderte Content-Version → erneuter Bootstrap
+        AppState.set_value('content_version', 'veraltet')
+        db.session.commit()
+        assert bootstrap_app_data() is True
+
+
+def test_home_only_reads(app, client):
+    from app import db, bootstrap_app_data
+
+    with app.app_context():
+        bootstrap_app_data()
+        engine = db.engine
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.strip().split()[0].upper())
+
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        response = client.get('/')
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+
+    assert response.status_code == 200
+    # Visitor-Tracking (INSERT in visitor_analytics) ist erlaubt, Schema/Sync-Arbeit nicht
+    writes = [s for s in statements if s in ('CREATE', 'UPDATE', 'DELETE', 'ALTER')]
+    assert writes == []
+    assert statements.count('INSERT') <= 1
+
+
+def test_failed_bootstrap_retries_with_backoff(app, client, monkeypatch):
+    import app as app_module
+
+    calls = []
+
+    def broken_bootstrap():
+        calls.append(1)
+        raise RuntimeError('Datenbank nicht erreichbar')
+
+    monkeypatch.setattr(app_module, 'bootstrap_app_data', broken_bootstrap)
+    monkeypatch.setattr(app_module, '_bootstrap_done', False)
+    monkeypatch.setattr(app_module, '_bootstrap_failed_at', None)
+    monkeypatch.setitem(app.config, 'BOOTSTRAP_RETRY_SECONDS', 30)
+
+    for _ in range(3):
+        client.get('/health')
+    assert len(calls) == 1
+
+    # Nach Ablauf der Wartezeit wird es erneut versucht
+    monkeypatch.setattr(app_module, '_bootstrap_failed_at', app_module._bootstrap_failed_at - 31)
+    client.get('/health')
+    assert len(calls) == 2
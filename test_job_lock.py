@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Tests für Scheduler-Lease und Lauf-Historie (job_lock.py)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+
+def test_lease_blocks_other_run_until_expired(app):
+    from app import db, job_runner, JobLease
+
+    with app.app_context():
+        now = datetime.utcnow()
+        assert job_runner.acquire('nightly', job_runner.new_token(), now)
+
+        # Anderer Prozess (gleiche DB): Lease ist belegt
+        assert not job_runner.acquire('nightly', 'other-host:42:beef', now)
+
+        # Nach Ablauf wird die Lease übernommen
+        later = now + timedelta(seconds=job_runner.lease_seconds + 1)
+        assert job_runner.acquire('nightly', 'other-host:42:beef', later)
+        assert db.session.get(JobLease, 'nightly').owner == 'other-host:42:beef'
+
+
+def test_lease_is_not_reentrant_within_process(app):
+    from app import job_runner
+
+    calls = []
+
+    def job():
+        # Zweiter Lauf desselben Prozesses (z.B. manueller Trigger während des Cron-Laufs)
+        calls.append(job_runner.run('daily_module_unlock', lambda: {'unlocks': 1}))
+        return {'unlocks': 2}
+
+    with app.app_context():
+        first, second = job_runner.new_token(), job_runner.new_token()
+        assert first != second
+        assert job_runner.acquire('nightly', first)
+        assert not job_runner.acquire('nightly', second)
+
+        assert job_runner.run('daily_module_unlock', job) == {'unlocks': 2}
+        assert calls == [None]
+
+
+def test_slot_runs_once_and_history_is_recorded(app):
+    from app import job_runner, JobRun, JobLease
+
+    calls = []
+
+    def job():
+        calls.append(1)
+        return {'unlocks': 12, 'emails': 10}
+
+    with app.app_context():
+        result = job_runner.run('daily_module_unlock', job, slot='2026-01-31', rows_key='unlocks')
+        assert result == {'unlocks': 12, 'emails': 10}
+
+        # Zweiter Scheduler im selben Slot überspringt den Job
+        assert job_runner.run('daily_module_unlock', job, slot='2026-01-31', rows_key='unlocks') is None
+        assert len(calls) == 1
+
+        run = JobRun.query.one()
+        assert run.status == 'success'
+        assert run.rows_processed == 12
+        assert run.emails_sent == 10
+        assert run.finished_at >= run.started_at
+        assert run.duration_seconds is not None
+        assert JobLease.query.count() == 0  # Lease wieder freigegeben
+
+
+def test_failed_run_is_retried_in_same_slot(app):
+    from app import job_runner, JobRun
+
+    def broken():
+        raise RuntimeError('SMTP weg')
+
+    with app.app_context():
+        with pytest.raises(RuntimeError):
+            job_runner.run('analytics_retention', broken, slot='2026-01-31')
+        assert JobRun.query.one().status == 'failed'
+
+        assert job_runner.run('analytics_retention', lambda: {'rows': 3}, slot='2026-01-31') == {'rows': 3}
+        run = JobRun.query.one()
+        assert run.status == 'success'
+        assert run.error is None
+        assert run.rows_processed == 3
+
+
+def test_locked_unlock_job_skips_while_lease_is_held(app):
+    from app import job_runner
+    from scheduler import run_locked_job, trigger_manual_unlock
+
+    with app.app_context():
+        assert job_runner.acquire('daily_module_unlock', 'other-host:42:beef')
+
+    assert run_locked_job(app, 'daily_module_unlock') is None
+    assert trigger_manual_unlock(app) is None
+
+
+def test_failed_slot_is_retried_by_scheduler(app, monkeypatch):
+    import scheduler
+    from app import db, JobRun
+
+    now = datetime(2026, 1, 31, 10, 30)
+    calls = []
+
+    def job(name):
+        def run(app, slot):
+            calls.append((name, slot))
+            return {'rows': 1}
+        return run
+
+    monkeypatch.setattr(scheduler, 'JOBS', {
+        'analytics_retention': (job('retention'), '%Y-%m-%d', 'rows'),
+        'analytics_rollup': (job('rollup'), '%Y-%m-%dT%H', 'rows'),
+        'daily_module_unlock': (job('unlock'), '%Y-%m-%d', 'rows'),
+    })
+    with app.app_context():
+        db.session.add_all([
+            JobRun(job_id='analytics_retention', slot='2026-01-31', owner='alt:1:beef', status='failed',
+                   started_at=now),
+            # Prozess während des Laufs abgestürzt
+            JobRun(job_id='analytics_rollup', slot='2026-01-31T10', owner='alt:1:beef', status='running',
+                   started_at=now),
+            JobRun(job_id='daily_module_unlock', slot='2026-01-31', owner='alt:1:beef', status='success',
+                   started_at=now),
+        ])
+        db.session.commit()
+
+    retried = scheduler.retry_failed_jobs(app, now)
+    assert set(retried) == {'analytics_retention', 'analytics_rollup'}
+    assert sorted(calls) == [('retention', '2026-01-31'), ('rollup', '2026-01-31T10')]
+
+    with app.app_context():
+        assert {run.status for run in JobRun.query} == {'success'}
+    # Nichts mehr nachzuholen
+    assert scheduler.retry_failed_jobs(app, now) == {}
+
+
+def test_heartbeat_extends_lease_while_job_runs(app, monkeypatch):
+    import time
+    from app import db, job_runner, JobLease
+
+    monkeypatch.setattr(job_runner, 'heartbeat_seconds', 0.05)
+    renewed = []
+
+    def long_job():
+        db.session.expire_all()
+        first = db.session.get(JobLease, 'analytics_retention').expires_at
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            db.session.expire_all()
+            expires_at = db.session.get(JobLease, 'analytics_retention').expires_at
+            if expires_at > first:
+                renewed.append(expires_at)
+                break
+        db.session.rollback()
+        return {'rows': 1}
+
+    with app.app_context():
+        assert job_runner.run('analytics_retention', long_job, slot='2026-01-31') == {'rows': 1}
+    assert renewed
+
+
+def test_run_that_lost_its_lease_does_not_report_success(app):
+    from app import db, job_runner, JobLease, JobRun
+
+    def overtaken():
+        # Lease abgelaufen, ein anderer Worker hat übernommen und den Slot neu gestartet
+        db.session.get(JobLease, 'analytics_retention').owner = 'other-host:42:beef'
+        JobRun.query.one().owner = 'other-host:42:beef'
+        db.session.commit()
+        return {'rows': 1}
+
+    with app.app_context():
+        with pytest.raises(RuntimeError, match='Lease'):
+            job_runner.run('analytics_retention', overtaken, slot='2026-01-31')
+        run = JobRun.query.one()
+        assert (run.owner, run.status) == ('other-host:42:beef', 'running')
+        # Fremde Lease bleibt bestehen
+        assert db.session.get(JobLease, 'analytics_retention').owner == 'other-host:42:beef'
+
+
+def test_prune_removes_old_finished_runs(app):
+    from app import db, job_runner, JobRun
+
+    now = datetime(2026, 6, 1)
+    with app.app_context():
+        db.session.add_all([
+            JobRun(job_id='analytics_rollup', slot='2026-01-01T10', owner='a:1:beef', status='success',
+                   started_at=now - timedelta(days=120)),
+            JobRun(job_id='analytics_rollup', slot='2026-01-01T11', owner='a:1:beef', status='running',
+                   started_at=now - timedelta(days=120)),
+            JobRun(job_id='analytics_rollup', slot='2026-05-31T10', owner='a:1:beef', status='success',
+                   started_at=now - timedelta(days=1)),
+        ])
+        db.session.commit()
+
+        assert job_runner.prune(90, now) == 1
+        assert job_runner.prune(0, now) == 0
+        assert sorted(run.slot for run in JobRun.query) == ['2026-01-01T11', '2026-05-31T10']
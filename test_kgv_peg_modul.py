@@ -3,6 +3,7 @@ Test-Script für KGV/PEG Trading Modul
 Prüft Template, Navigation und Datenbank-Registrierung
 """
 
+import json
 import os
 import sys
 
@@ -73,22 +74,23 @@ def test_database_module():
                 return True
             else:
                 print("[INFO] Modul noch nicht in Datenbank registriert")
-                print("[INFO] Fuehre aus: python migrations/register_kgv_peg_modul.py")
+                print("[INFO] Fuehre aus: flask --app app sync-catalogue")
                 return False
                 
     except Exception as e:
         print(f"[FAIL] Fehler beim Datenbankcheck: {e}")
         return False
 
-def test_migration_script():
-    """Prüft ob das Migrations-Script existiert"""
-    migration_path = "migrations/register_kgv_peg_modul.py"
+def test_catalogue_entry():
+    """Prüft ob das Modul im Modul-Katalog steht"""
+    with open("module_catalogue.json", encoding="utf-8") as handle:
+        slugs = {module["slug"] for module in json.load(handle)["modules"]}
     
-    if os.path.exists(migration_path):
-        print("[OK] Migrations-Script existiert: register_kgv_peg_modul.py")
+    if "kgv-peg-trading" in slugs:
+        print("[OK] Katalog-Eintrag existiert: kgv-peg-trading (module_catalogue.json)")
         return True
     else:
-        print(f"[FAIL] Migrations-Script nicht gefunden: {migration_path}")
+        print("[FAIL] Modul nicht im Katalog: module_catalogue.json")
         return False
 
 def run_all_tests():
@@ -101,7 +103,7 @@ def run_all_tests():
     tests = [
         ("Template Check", test_template_exists),
         ("Navigation Check", test_navigation_template),
-        ("Migration Script Check", test_migration_script),
+        ("Catalogue Check", test_catalogue_entry),
         ("Database Check", test_database_module),
     ]
     
@@ -134,7 +136,7 @@ def run_all_tests():
     if passed == total:
         print("\n[OK] Alle Tests erfolgreich!")
         print("\nNaechste Schritte:")
-        print("1. Falls noch nicht registriert: python migrations/register_kgv_peg_modul.py")
+        print("1. Falls noch nicht registriert: flask --app app sync-catalogue")
         print("2. App starten: python app.py")
         print("3. Testen: http://localhost:5000/module/kgv-peg-trading")
     else:
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests für die Mail-Outbox (mail_outbox.py)
+"""
+
+import smtplib
+from datetime import datetime, timedelta
+
+
+class FakeConnection:
+    def __init__(self, mail):
+        self.mail = mail
+
+    def __enter__(self):
+        self.mail.connections += 1
+        if self.mail.fail_connect:
+            self.mail.fail_connect -= 1
+            raise smtplib.SMTPConnectError(421, 'Service not available')
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def send(self, message):
+        if message.recipients[0] in self.mail.rejected:
+            raise smtplib.SMTPRecipientsRefused({message.recipients[0]: (550, 'Unknown user')})
+        self.mail.sent.append(message)
+
+
+class FakeMail:
+    """SMTP-Grenze für Tests: zählt Verbindungen und versendete Nachrichten"""
+
+    def __init__(self, fail_connect=0, rejected=()):
+        self.connections = 0
+        self.fail_connect = fail_connect
+        self.rejected = set(rejected)
+        self.sent = []
+
+    def connect(self):
+        return FakeConnection(self)
+
+
+def test_batch_reuses_one_connection(app, monkeypatch):
+    from app import mail_outbox, queue_email, db, OutboxEmail
+
+    fake = FakeMail()
+    monkeypatch.setattr(mail_outbox, 'mail', fake)
+    monkeypatch.setattr(mail_outbox, 'batch_size', 50)
+
+    with app.app_context():
+        for i in range(120):
+            assert queue_email(f'user{i}@example.com', 'Test', 'welcome', commit=False, username='u', first_name='U')
+        db.session.commit()
+        mail_outbox.process_pending()
+
+        assert len(fake.sent) == 120
+        assert fake.connections == 3
+        assert OutboxEmail.query.filter_by(status='sent').count() == 120
+
+
+def test_retry_with_backoff_and_final_failure(app, monkeypatch):
+    from app import mail_outbox, queue_email, db, OutboxEmail
+
+    fake = FakeMail(fail_connect=1, rejected={'weg@example.com'})
+    monkeypatch.setattr(mail_outbox, 'mail', fake)
+    monkeypatch.setattr(mail_outbox, 'max_attempts', 2)
+
+    with app.app_context():
+        queue_email('ok@example.com', 'Test', 'welcome', username='u', first_name='U')
+
+        # Erster Versuch: Verbindung schlägt fehl → Retry mit Backoff
+        email = OutboxEmail.query.filter_by(recipient='ok@example.com').one()
+        assert email.status == 'pending'
+        assert email.attempts == 1
+        assert email.next_attempt_at > datetime.utcnow()
+        assert fake.sent == []
+
+        # Nach Ablauf des Backoffs wird zugestellt
+        email.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+        mail_outbox.process_pending()
+        assert OutboxEmail.query.filter_by(recipient='ok@example.com').one().status == 'sent'
+
+        # Dauerhaft abgelehnte Empfänger landen nach max_attempts auf "failed"
+        queue_email('weg@example.com', 'Test', 'welcome', username='u', first_name='U')
+        rejected = OutboxEmail.query.filter_by(recipient='weg@example.com').one()
+        rejected.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+        mail_outbox.process_pending()
+
+        rejected = OutboxEmail.query.filter_by(recipient='weg@example.com').one()
+        assert rejected.status == 'failed'
+        assert rejected.attempts == 2
+        assert '550' in rejected.last_error
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests für den versionierten Menü-Cache (menu_cache.py, inject_menu)
+"""
+
+from sqlalchemy import event
+
+from conftest import login_as
+
+
+def add_menu(db):
+    from app import ModuleCategory, ModuleSubcategory, LearningModule
+
+    trading = ModuleCategory(name='Trading', slug='trading', sort_order=1)
+    psychologie = ModuleCategory(name='Psychologie', slug='psychologie', sort_order=2)
+    db.session.add_all([trading, psychologie])
+    db.session.flush()
+    setups = ModuleSubcategory(category_id=psychologie.id, name='Setups', slug='setups')
+    db.session.add(setups)
+    db.session.flush()
+    modules = [
+        LearningModule(category_id=trading.id, title='Volumen', slug='volumen', is_published=True, sort_order=1,
+                       required_subscription_levels=['premium']),
+        LearningModule(category_id=trading.id, title='Konsolidierung', slug='konsolidierung', is_published=True,
+                       sort_order=2, is_lead_magnet=True),
+        LearningModule(category_id=trading.id, title='Entwurf', slug='entwurf', is_published=False),
+    ]
+    db.session.add_all(modules)
+    db.session.commit()
+    ids = {module.slug: module.id for module in modules}
+    ids.update(trading=trading.id, psychologie=psychologie.id, setups=setups.id)
+    return ids
+
+
+def render_menu(app):
+    """Template-Kontext wie bei einem Seitenaufruf"""
+    from app import inject_menu
+
+    with app.test_request_context('/'):
+        return inject_menu()
+
+
+def menu_modules(context, slug):
+    category = next(category for category in context['menu_structure'] if category['slug'] == slug)
+    return category['direct_modules'] + [module for sub in category['subcategories'] for module in sub['modules']]
+
+
+def titles(context, slug):
+    return [module['title'] for module in menu_modules(context, slug)]
+
+
+def test_warm_cache_renders_without_queries(app):
+    from app import db, menu_cache
+
+    with app.app_context():
+        add_menu(db)
+        render_menu(app)  # Cache aufwärmen
+        engine = db.engine
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        hits = menu_cache.stats()['hits']
+        context = render_menu(app)
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+
+    assert statements == []
+    assert menu_cache.stats()['hits'] > hits
+    assert titles(context, 'trading') == ['Volumen', 'Konsolidierung']
+    assert (context['total_modules'], context['accessible_modules'], context['lead_magnets']) == (2, 1, 1)
+
+
+def test_admin_mutations_bump_version(app, client):
+    from app import db, menu_cache
+
+    with app.app_context():
+        ids = add_menu(db)
+    login_as(client, 'admin', 'admin', 'elite')
+    render_menu(app)
+
+    def mutate(request):
+        version = menu_cache.version
+        request()
+        assert menu_cache.version > version
+        return render_menu(app)
+
+    # toggle_published: Entwurf erscheint im Menü
+    context = mutate(lambda: client.get(f"/admin/toggle-published/{ids['entwurf']}"))
+    assert 'Entwurf' in titles(context, 'trading')
+
+    # update_sort_order: neue Reihenfolge im Menübaum
+    context = mutate(lambda: client.post('/admin/update-sort-order', json={
+        'type': 'module', 'items': [{'id': ids['konsolidierung'], 'order': 0}]
+    }))
+    orders = {module['slug']: module['sort_order'] for module in menu_modules(context, 'trading')}
+    assert orders['konsolidierung'] == 0
+
+    # admin_move_module: Modul wandert in eine andere Kategorie/Unterkategorie
+    context = mutate(lambda: client.post('/admin/move-module', data={
+        'module_id': ids['volumen'], 'category_id': ids['psychologie'], 'subcategory_id': ids['setups']
+    }))
+    assert 'Volumen' not in titles(context, 'trading')
+    assert titles(context, 'psychologie') == ['Volumen']
+
+    # add_module: neues veröffentlichtes Modul
+    context = mutate(lambda: client.post('/admin/add-module', data={
+        'category_id': ids['trading'], 'title': 'Neues Modul', 'description': 'Frisch angelegt',
+        'is_published': 'on', 'req_premium': 'on'
+    }))
+    assert 'Neues Modul' in titles(context, 'trading')
+    assert context['total_modules'] == 4
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests für die zentrale Modul-Zugriffskontrolle (module_access.py)
+"""
+
+from types import SimpleNamespace
+
+from module_access import required_rank, OPEN, ELITE_PRO_ONLY, LEVEL_RANK
+
+
+def make_module(module_id, levels, is_lead_magnet=False):
+    return SimpleNamespace(id=module_id, required_subscription_levels=levels, is_lead_magnet=is_lead_magnet)
+
+
+def test_required_rank_normalization():
+    assert required_rank(True, ('elite',)) == OPEN
+    assert required_rank(False, ()) == OPEN
+    assert required_rank(False, ('premium', 'elite')) == LEVEL_RANK['premium']
+    assert required_rank(False, ('Elite',)) == LEVEL_RANK['elite']
+    # 'free' ist ein Datenfehler: nur ['free'] wird wie Premium behandelt
+    assert required_rank(False, ('free',)) == LEVEL_RANK['premium']
+    assert required_rank(False, ('free', 'elite')) == LEVEL_RANK['elite']
+    assert required_rank(False, ('elite', 'elite_pro')) == ELITE_PRO_ONLY
+
+
+def test_access_context_matches_subscription_rules(app):
+    from app import module_access
+
+    premium = make_module(1, ['premium', 'elite'])
+    elite_pro = make_module(2, ['elite_pro'])
+    lead = make_module(3, ['elite'], is_lead_magnet=True)
+    modules = [premium, elite_pro, lead]
+
+    assert module_access.for_user('free').filter_accessible(modules) == [lead]
+    assert module_access.for_user('premium').filter_accessible(modules) == [premium, lead]
+    assert module_access.for_user('masterclass').filter_accessible(modules) == [premium, lead]
+    assert module_access.for_user('elite_pro').filter_accessible(modules) == modules
+    assert module_access.for_user('free', is_admin=True).filter_accessible(modules) == modules
+
+
+def test_unlocks_are_loaded_once(app):
+    from sqlalchemy import event
+    from app import db, module_access, User, ModuleCategory, LearningModule, UserModuleUnlock
+
+    with app.app_context():
+        user = User(email='unlock@example.com', username='unlock')
+        user.set_password('Sicher!123')
+        category = ModuleCategory(name='Kategorie', slug='kategorie')
+        db.session.add_all([user, category])
+        db.session.flush()
+
+        modules = [
+            LearningModule(category_id=category.id, title=f'Modul {i}', slug=f'modul-{i}',
+                           is_published=True, required_subscription_levels=['premium'])
+            for i in range(5)
+        ]
+        db.session.add_all(modules)
+        db.session.flush()
+        db.session.add(UserModuleUnlock(user_id=user.id, module_id=modules[0].id, unlock_day=1, subscription_level='premium'))
+        db.session.commit()
+        module_access.invalidate_unlocks()
+
+        # Abgelaufene Objekte vor dem Zählen neu laden
+        user_id = user.id
+        for module in modules:
+            db.session.refresh(module)
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            access = module_access.for_user('premium', str(user_id), check_unlocks=True)
+            accessible = access.filter_accessible(modules)
+            # Legacy-API nutzt denselben Cache
+            assert modules[0].user_has_access('premium', user_id)
+            assert not modules[1].is_unlocked_for_user(user_id)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+        assert accessible == [modules[0]]
+        assert len(statements) == 1
+
+
+def test_unlock_cache_is_bounded(app, monkeypatch):
+    from app import module_access
+
+    monkeypatch.setattr(module_access, 'max_users', 3)
+    module_access.invalidate_unlocks()
+    with app.app_context():
+        for user_id in (1, 2, 3):
+            module_access.unlocked_module_ids(user_id)
+        module_access.unlocked_module_ids(1)  # zuletzt genutzt → bleibt
+        module_access.unlocked_module_ids(4)
+
+    assert list(module_access._unlocks) == [3, 1, 4]
+    module_access.invalidate_unlocks()
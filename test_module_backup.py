@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests für das Append-only-Backup der Modul-Definitionen (module_backup.py)
+"""
+
+import json
+
+import pytest
+from flask import Flask
+
+from module_backup import JOURNAL_NAME, SNAPSHOT_NAME, ModuleBackupStore
+
+
+@pytest.fixture
+def backup(app, tmp_path):
+    from app import module_backup
+
+    original = (module_backup.directory, module_backup.legacy_file, module_backup.snapshot_every)
+    module_backup.directory = str(tmp_path / 'backups')
+    module_backup.legacy_file = str(tmp_path / 'modules_backup.json')
+    module_backup._loaded = False
+    yield module_backup
+    module_backup.directory, module_backup.legacy_file, module_backup.snapshot_every = original
+    module_backup._loaded = False
+
+
+def journal_lines(store):
+    with open(store.journal_path, encoding='utf-8') as handle:
+        return [json.loads(line) for line in handle]
+
+
+def add_category():
+    from app import db, ModuleCategory
+
+    category = ModuleCategory(name='Trading', slug='trading')
+    db.session.add(category)
+    db.session.commit()
+    return category.id
+
+
+def test_commits_are_journaled_once_per_commit(app, backup):
+    from app import db, LearningModule
+
+    with app.app_context():
+        category_id = add_category()
+        db.session.add_all([
+            LearningModule(category_id=category_id, title=f'Modul {i}', slug=f'modul-{i}') for i in range(3)
+        ])
+        db.session.commit()
+        assert [entry['slug'] for entry in journal_lines(backup)] == ['modul-0', 'modul-1', 'modul-2']
+        assert backup.get('modul-1')['category_slug'] == 'trading'
+
+        # Bulk-Änderung: ein Anhängen; view_count allein ist keine Definitionsänderung
+        for module in LearningModule.query.all():
+            module.is_published = True
+        db.session.commit()
+        LearningModule.query.filter_by(slug='modul-0').one().view_count = 10
+        db.session.commit()
+        db.session.delete(LearningModule.query.filter_by(slug='modul-2').one())
+        db.session.commit()
+
+        # Rollback schreibt nichts
+        LearningModule.query.filter_by(slug='modul-1').one().title = 'Verworfen'
+        db.session.flush()
+        db.session.rollback()
+
+    entries = journal_lines(backup)
+    assert len(entries) == 7
+    assert len({entry['at'] for entry in entries[3:6]}) == 1
+    assert entries[-1] == {'op': 'delete', 'slug': 'modul-2', 'at': entries[-1]['at']}
+    assert backup.get('modul-1')['is_published'] is True
+    assert backup.get('modul-1')['title'] == 'Modul 1'
+    assert backup.get('modul-2') is None
+
+
+def test_compaction_is_visible_to_other_workers(app, backup, tmp_path):
+    from app import db, LearningModule
+
+    backup.snapshot_every = 3
+    # Zweiter Worker mit demselben Verzeichnis
+    worker_app = Flask('app', root_path=app.root_path)
+    worker_app.config.update(MODULE_BACKUP=False, MODULE_BACKUP_DIR=backup.directory)
+    other = ModuleBackupStore(worker_app, db, LearningModule, None)
+
+    with app.app_context():
+        category_id = add_category()
+        for i in range(4):
+            db.session.add(LearningModule(category_id=category_id, title=f'Modul {i}', slug=f'modul-{i}'))
+            db.session.commit()
+            assert other.get(f'modul-{i}')['title'] == f'Modul {i}'
+
+    snapshot = json.loads((tmp_path / 'backups' / SNAPSHOT_NAME).read_text(encoding='utf-8'))
+    assert sorted(snapshot['modules']) == ['modul-0', 'modul-1', 'modul-2']
+    assert len(journal_lines(backup)) == 1
+    assert sorted(other.all()) == ['modul-0', 'modul-1', 'modul-2', 'modul-3']
+    assert not list((tmp_path / 'backups').glob('*.tmp'))
+
+
+def test_restore_from_legacy_file_in_one_pass(app, backup, tmp_path):
+    from app import db, LearningModule
+
+    legacy = {'modules': [
+        {'slug': 'vorhanden', 'title': 'Vorhanden', 'category_slug': 'trading'},
+        {'slug': 'geloescht', 'title': 'Gelöscht', 'category_slug': 'trading', 'is_published': True,
+         'required_subscription_levels': ['premium'], 'template_file': 'geloescht.html'},
+        {'slug': 'ohne-kategorie', 'title': 'Ohne Kategorie', 'category_slug': 'unbekannt'},
+    ], 'last_updated': None}
+    (tmp_path / 'modules_backup.json').write_text(json.dumps(legacy), encoding='utf-8')
+
+    with app.app_context():
+        category_id = add_category()
+        db.session.add(LearningModule(category_id=category_id, title='Vorhanden', slug='vorhanden'))
+        db.session.commit()
+
+        assert backup.restore(dry_run=True)['restored'] == ['geloescht']
+        assert LearningModule.query.count() == 1
+
+        result = backup.restore()
+        assert (result['restored'], result['existing'], result['missing_category']) == (
+            ['geloescht'], 1, ['ohne-kategorie']
+        )
+        restored = LearningModule.query.filter_by(slug='geloescht').one()
+        assert (restored.is_published, restored.required_subscription_levels) == (True, ['premium'])
+
+    # Wiederhergestelltes Modul landet selbst im Journal
+    assert [entry['slug'] for entry in journal_lines(backup)][-1:] == ['geloescht']
+    assert (tmp_path / 'backups' / JOURNAL_NAME).exists()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Tests für den deklarativen Modul-Katalog (module_catalogue.py, flask sync-catalogue)
+"""
+
+import json
+
+import pytest
+from sqlalchemy import event
+
+from module_catalogue import CatalogueError
+
+CATALOGUE = {
+    'format': 'didis-catalogue',
+    'version': 1,
+    'categories': [
+        {'name': 'Technische Analyse', 'slug': 'technische-analyse', 'icon': '📈', 'sort_order': 2},
+        {'name': 'Psychologie', 'slug': 'psychologie', 'sort_order': 4},
+    ],
+    'subcategories': [
+        {'name': 'Chartmuster', 'slug': 'chartmuster', 'sort_order': 1, 'category': 'technische-analyse'},
+    ],
+    'modules': [
+        {'title': 'VCP-Pattern', 'slug': 'vcp-pattern', 'template_file': 'vcp-pattern.html', 'is_published': True,
+         'required_subscription_levels': ['elite'], 'category': 'technische-analyse', 'subcategory': 'chartmuster'},
+        {'title': 'Magic Line', 'slug': 'magic-line', 'is_published': True, 'sort_order': 1,
+         'category': 'technische-analyse'},
+        {'title': 'Trader-Reise', 'slug': 'traders-journey', 'difficulty_level': 'beginner', 'category': 'psychologie'},
+    ],
+}
+
+
+@pytest.fixture
+def catalogue_file(tmp_path):
+    def write(data=CATALOGUE):
+        path = tmp_path / 'module_catalogue.json'
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        return str(path)
+    return write
+
+
+def count_selects(engine):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.strip().split()[0].upper())
+
+    event.listen(engine, 'before_cursor_execute', count)
+    return statements, lambda: event.remove(engine, 'before_cursor_execute', count)
+
+
+def test_shipped_catalogue_is_valid(app):
+    from app import module_catalogue
+
+    catalogue = module_catalogue.load()
+    assert len(catalogue['modules']) == len({module['slug'] for module in catalogue['modules']})
+    assert module_catalogue.version()
+
+
+def test_invalid_catalogue(app, catalogue_file):
+    from app import module_catalogue
+
+    data = dict(CATALOGUE, modules=CATALOGUE['modules'] + [
+        {'title': 'Doppelt', 'slug': 'magic-line', 'category': 'technische-analyse'},
+        {'title': 'Ohne Kategorie', 'slug': 'waise', 'category': 'gibt-es-nicht'},
+        {'title': 'Tippfehler', 'slug': 'tippfehler', 'difficulty': 'beginner', 'category': 'psychologie'},
+    ])
+    with pytest.raises(CatalogueError) as error:
+        module_catalogue.load(catalogue_file(data))
+    message = str(error.value)
+    assert 'Modul doppelt: magic-line' in message
+    assert 'gibt-es-nicht' in message
+    assert 'unbekannte Felder difficulty' in message
+
+
+def test_sync_is_idempotent_with_bulk_queries(app, catalogue_file):
+    from app import db, module_catalogue, LearningModule, ModuleSubcategory
+
+    path = catalogue_file()
+    with app.app_context():
+        preview = module_catalogue.sync(dry_run=True, path=path)
+        assert preview['modules']['created'] == ['vcp-pattern', 'magic-line', 'traders-journey']
+        assert LearningModule.query.count() == 0
+
+        result = module_catalogue.sync(path=path)
+        assert result['categories']['created'] == ['technische-analyse', 'psychologie']
+        assert result['subcategories']['created'] == ['chartmuster']
+
+        vcp = LearningModule.query.filter_by(slug='vcp-pattern').one()
+        assert vcp.subcategory_id == ModuleSubcategory.query.filter_by(slug='chartmuster').one().id
+        assert vcp.required_subscription_levels == ['elite']
+        # Nicht angegebene Felder: Standardwerte der Modelle
+        journey = LearningModule.query.filter_by(slug='traders-journey').one()
+        assert (journey.is_published, journey.sort_order) == (False, 100)
+
+        statements, stop = count_selects(db.engine)
+        try:
+            result = module_catalogue.sync(update=True, path=path)
+        finally:
+            stop()
+        assert all(not result[kind]['created'] and not result[kind]['updated']
+                   for kind in ('categories', 'subcategories', 'modules'))
+        assert statements.count('SELECT') == 3
+        assert 'INSERT' not in statements and 'UPDATE' not in statements
+
+
+def test_update_enforces_catalogue_values(app, catalogue_file):
+    from app import db, module_catalogue, LearningModule, ModuleCategory
+
+    with app.app_context():
+        module_catalogue.sync(path=catalogue_file())
+        magic_line = LearningModule.query.filter_by(slug='magic-line').one()
+        magic_line.title = 'Im Admin geändert'
+        magic_line.estimated_duration = 99  # nicht im Katalog → Standardwert 30
+        db.session.commit()
+
+        # Ohne update bleiben Admin-Änderungen erhalten
+        assert module_catalogue.sync(path=catalogue_file())['modules']['updated'] == []
+
+        # Modul wandert in eine neue Kategorie, Titel wird zurückgesetzt
+        data = json.loads(json.dumps(CATALOGUE))
+        data['categories'].append({'name': 'Setups', 'slug': 'setups'})
+        data['modules'][1]['category'] = 'setups'
+        data['modules'][0]['title'] = 'VCP-Pattern nach Minervini'
+        path = catalogue_file(data)
+
+        preview = module_catalogue.sync(update=True, dry_run=True, path=path)
+        updated = dict(preview['modules']['updated'])
+        assert updated['magic-line']['title'] == ('Im Admin geändert', 'Magic Line')
+        assert updated['magic-line']['category'] == ('technische-analyse', 'setups')
+        assert updated['magic-line']['estimated_duration'] == (99, 30)
+        assert set(updated['vcp-pattern']) == {'title'}
+        assert ModuleCategory.query.filter_by(slug='setups').first() is None
+
+        module_catalogue.sync(update=True, path=path)
+        db.session.expire_all()
+        magic_line = LearningModule.query.filter_by(slug='magic-line').one()
+        assert magic_line.title == 'Magic Line'
+        assert magic_line.estimated_duration == 30
+        assert magic_line.category.slug == 'setups'
+        assert module_catalogue.stats()['last_sync']['updated'] == 2
+
+
+
+def test_update_restores_default_values(app, catalogue_file):
+    from app import db, module_catalogue, LearningModule, ModuleCategory
+
+    path = catalogue_file()
+    with app.app_context():
+        module_catalogue.sync(path=path)
+        # Nur Felder mit Standardwert weichen ab (im Katalog weggelassen)
+        journey = LearningModule.query.filter_by(slug='traders-journey').one()
+        journey.is_published, journey.sort_order = True, 7
+        ModuleCategory.query.filter_by(slug='psychologie').one().is_active = False
+        db.session.commit()
+
+        result = module_catalogue.sync(update=True, path=path)
+        assert dict(result['modules']['updated']) == {
+            'traders-journey': {'is_published': (True, False), 'sort_order': (7, 100)}
+        }
+        assert dict(result['categories']['updated']) == {'psychologie': {'is_active': (False, True)}}
+
+        db.session.expire_all()
+        journey = LearningModule.query.filter_by(slug='traders-journey').one()
+        assert (journey.is_published, journey.sort_order) == (False, 100)
+        assert ModuleCategory.query.filter_by(slug='psychologie').one().is_active
+
+
+def test_cli_dry_run(app, catalogue_file):
+    from app import LearningModule
+
+    result = app.test_cli_runner().invoke(args=['sync-catalogue', '--dry-run', '--file', catalogue_file()])
+    assert result.exit_code == 0
+    assert '+ Modul vcp-pattern' in result.output
+    assert '(Dry-Run)' in result.output
+    with app.app_context():
+        assert LearningModule.query.count() == 0
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests für die Extraktion der Lerninhalte aus den Templates (module_content.py)
+"""
+
+import os
+
+import pytest
+
+import module_content as pipeline
+
+PAGE = """{% extends "base.html" %}
+<head><title>VCP-Pattern | Didis Trading Academy</title>
+<meta name="description" content="Volatility Contraction Pattern verstehen"></head>
+<style>.hero { color: red; }</style>
+<h1>VCP <em>Pattern</em></h1>
+<p class="hero-subtitle">Der Untertitel</p>
+<h2>Kontraktionen</h2><p>Jede Kontraktion ist kleiner als die vorherige &amp; das Volumen trocknet aus.</p>
+<img src="{{ url_for('serve_screenshots', filename='vcp.png') }}" alt="VCP">
+{{ responsive_image('screenshots/pivot.jpg', alt='Pivot') }}
+<img src="/static/screenshots/breakout.jpg"><img src="data:image/png;base64,xyz">
+<script>var title = "{{ module.title }}"; var hidden = 'Skripttext';</script>
+<svg><text>Achse</text></svg>
+{% if user %}<p>Hallo {{ user.name }}</p>{% endif %}
+"""
+
+
+@pytest.fixture
+def store(app, tmp_path):
+    from app import module_content
+
+    original_dir = module_content.template_dir
+    module_content.template_dir = str(tmp_path)
+    module_content._cache.clear()
+    yield module_content
+    module_content.template_dir = original_dir
+    module_content._cache.clear()
+
+
+def test_parse_template_extracts_content(tmp_path, monkeypatch):
+    # Winzige Chunks: Jinja-Tags und HTML-Tags liegen über Chunk-Grenzen
+    monkeypatch.setattr(pipeline, 'CHUNK_SIZE', 7)
+    path = tmp_path / 'vcp.html'
+    path.write_text(PAGE, encoding='utf-8')
+
+    content = pipeline.parse_template(str(path))
+
+    assert content['title'] == 'VCP-Pattern'
+    assert content['description'] == 'Volatility Contraction Pattern verstehen'
+    assert content['headings'] == [{'level': 1, 'text': 'VCP Pattern'}, {'level': 2, 'text': 'Kontraktionen'}]
+    assert 'kleiner als die vorherige & das Volumen trocknet aus.' in content['text']
+    assert 'Hallo' in content['text']
+    for hidden in ('Skripttext', 'color', 'Achse', 'Didis Trading Academy', 'module.title', 'user.name'):
+        assert hidden not in content['text']
+    assert content['images'] == ['/Screenshots/vcp.png', '/static/screenshots/pivot.jpg', '/static/screenshots/breakout.jpg']
+    assert content['reading_minutes'] == 1
+
+
+def test_refresh_skips_unchanged_templates(app, store, tmp_path, monkeypatch):
+    from app import ModuleContent
+
+    (tmp_path / 'vcp.html').write_text(PAGE, encoding='utf-8')
+    (tmp_path / 'breakout.html').write_text('<h2>Breakout</h2><p>' + 'Wort ' * 399 + '</p>', encoding='utf-8')
+    (tmp_path / 'base.html').write_text('<p>System</p>', encoding='utf-8')
+
+    with app.app_context():
+        assert store.refresh()['parsed'] == 2
+        assert ModuleContent.query.count() == 2
+        assert store.get('breakout.html')['reading_minutes'] == 2
+
+        parsed = []
+        original = pipeline.parse_template
+        monkeypatch.setattr(pipeline, 'parse_template', lambda path: parsed.append(path) or original(path))
+
+        # Nur berührt (gleicher Hash) → nicht neu geparst
+        os.utime(tmp_path / 'vcp.html', (1, 1))
+        stats = store.refresh()
+        assert (stats['parsed'], stats['unchanged']) == (0, 2)
+
+        # Geändert → neu geparst; gelöscht → entfernt
+        (tmp_path / 'vcp.html').write_text(PAGE.replace('Kontraktionen', 'Pivot Point'), encoding='utf-8')
+        (tmp_path / 'breakout.html').unlink()
+        stats = store.refresh()
+        assert (stats['parsed'], stats['removed']) == (1, 1)
+        assert len(parsed) == 1
+        assert {'level': 2, 'text': 'Pivot Point'} in store.get('vcp.html')['headings']
+        assert store.get('breakout.html') is None
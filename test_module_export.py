@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests für den gestreamten Struktur-Export und den Katalog-Import (module_export.py)
+"""
+
+import json
+
+import pytest
+from sqlalchemy import event
+
+from conftest import login_as
+from module_export import import_catalogue
+
+
+def add_structure():
+    from app import db, ModuleCategory, ModuleSubcategory, LearningModule
+
+    trading = ModuleCategory(name='Trading', slug='trading', sort_order=1)
+    psycho = ModuleCategory(name='Psychologie', slug='psychologie', sort_order=2)
+    db.session.add_all([trading, psycho])
+    db.session.flush()
+    setups = ModuleSubcategory(category_id=trading.id, name='Setups', slug='setups')
+    db.session.add(setups)
+    db.session.flush()
+    db.session.add_all([
+        LearningModule(category_id=trading.id, title='VCP', slug='vcp', template_file='vcp-pattern.html',
+                       is_published=True, required_subscription_levels=['premium'], sort_order=2),
+        LearningModule(category_id=trading.id, title='Entwurf', slug='entwurf', is_published=False),
+        LearningModule(category_id=trading.id, subcategory_id=setups.id, title='Bouncy Ball', slug='bouncy-ball',
+                       is_published=True, is_lead_magnet=True),
+        LearningModule(category_id=psycho.id, title='Hormone', slug='hormone', is_published=True),
+    ])
+    db.session.commit()
+
+
+@pytest.fixture
+def admin(app, client):
+    with app.app_context():
+        add_structure()
+    login_as(client, 1, 'admin', 'elite')
+    return client
+
+
+def count_queries(app, func):
+    from app import db
+
+    statements = []
+    with app.app_context():
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            func()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+    return statements
+
+
+def test_json_export_keeps_format_and_filters(app, admin):
+    from app import structure_export
+
+    response = admin.get('/admin/export-structure')
+    assert response.is_streamed
+    data = json.loads(response.get_data(as_text=True))
+    assert data['success'] is True
+    trading, psycho = data['structure']
+    assert [module['slug'] for module in trading['modules']] == ['vcp']
+    assert trading['subcategories'][0]['modules'][0]['slug'] == 'bouncy-ball'
+    assert psycho['modules'][0]['title'] == 'Hormone'
+
+    data = admin.get('/admin/export-structure?include_unpublished=1&category=trading').get_json()
+    assert [category['slug'] for category in data['structure']] == ['trading']
+    assert [module['slug'] for module in data['structure'][0]['modules']] == ['vcp', 'entwurf']
+
+    # Kategorien, Unterkategorien, Module - keine Lazy-Loads pro Beziehung
+    statements = count_queries(app, lambda: structure_export.stream('json', include_unpublished=True))
+    assert len(statements) == 3  # schon beim Aufruf, nicht erst beim Iterieren
+
+
+def test_export_query_error_returns_json_error(app, admin, monkeypatch):
+    from app import structure_export
+
+    def broken(*args, **kwargs):
+        raise RuntimeError('DB weg')
+
+    monkeypatch.setattr(structure_export, 'load', broken)
+    response = admin.get('/admin/export-structure?format=import')
+    assert response.status_code == 500
+    assert 'Content-Disposition' not in response.headers
+    assert response.get_json() == {'success': False, 'error': 'DB weg'}
+
+
+def test_ndjson_export_has_one_record_per_line(admin):
+    response = admin.get('/admin/export-structure?format=ndjson')
+    assert response.mimetype == 'application/x-ndjson'
+    records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [(record['type'], record['slug']) for record in records] == [
+        ('category', 'trading'), ('module', 'vcp'), ('subcategory', 'setups'), ('module', 'bouncy-ball'),
+        ('category', 'psychologie'), ('module', 'hormone'),
+    ]
+    assert records[3]['subcategory'] == 'setups'
+
+
+def test_catalogue_round_trip(app, admin):
+    from app import db, ModuleCategory, ModuleSubcategory, LearningModule
+
+    response = admin.get('/admin/export-structure?format=import&include_unpublished=1')
+    assert 'attachment' in response.headers['Content-Disposition']
+    text = response.get_data(as_text=True)
+    catalogue = json.loads(text)
+    assert catalogue['format'] == 'didis-catalogue'
+    vcp = next(module for module in catalogue['modules'] if module['slug'] == 'vcp')
+    # Kompakt: Standardwerte fehlen
+    assert vcp == {'title': 'VCP', 'slug': 'vcp', 'template_file': 'vcp-pattern.html', 'is_published': True,
+                   'required_subscription_levels': ['premium'], 'sort_order': 2, 'category': 'trading'}
+    assert len(text.splitlines()) > len(catalogue['modules'])
+
+    with app.app_context():
+        # Andere Umgebung: leere Datenbank
+        db.drop_all()
+        db.create_all()
+        result = import_catalogue(catalogue, db, ModuleCategory, ModuleSubcategory, LearningModule)
+        assert (len(result['categories_created']), len(result['created']), result['errors']) == (2, 4, [])
+        assert LearningModule.query.filter_by(slug='bouncy-ball').one().subcategory.slug == 'setups'
+
+        # Zweiter Import: nichts zu tun; mit update werden geänderte Module angepasst
+        assert import_catalogue(catalogue, db, ModuleCategory, ModuleSubcategory, LearningModule)['created'] == []
+        LearningModule.query.filter_by(slug='vcp').one().title = 'Lokal geändert'
+        db.session.commit()
+        result = import_catalogue(catalogue, db, ModuleCategory, ModuleSubcategory, LearningModule, update=True)
+        assert (result['updated'], result['unchanged']) == (['vcp'], 3)
+        assert LearningModule.query.filter_by(slug='vcp').one().title == 'VCP'
+
+    reexported = json.loads(admin.get('/admin/export-structure?format=import&include_unpublished=1').get_data(as_text=True))
+    assert reexported['modules'] == catalogue['modules']
+
+
+def test_catalogue_update_restores_default_values(app, admin):
+    from app import db, ModuleCategory, ModuleSubcategory, LearningModule
+
+    catalogue = json.loads(admin.get('/admin/export-structure?format=import&include_unpublished=1').get_data(as_text=True))
+    # Entwurf hat nur Standardwerte (unveröffentlicht, sort_order 100) - im Export weggelassen
+    assert next(module for module in catalogue['modules'] if module['slug'] == 'entwurf') == {
+        'title': 'Entwurf', 'slug': 'entwurf', 'category': 'trading'
+    }
+
+    with app.app_context():
+        draft = LearningModule.query.filter_by(slug='entwurf').one()
+        draft.is_published, draft.sort_order = True, 7
+        db.session.commit()
+
+        result = import_catalogue(catalogue, db, ModuleCategory, ModuleSubcategory, LearningModule, update=True)
+        assert (result['updated'], result['unchanged']) == (['entwurf'], 3)
+        draft = LearningModule.query.filter_by(slug='entwurf').one()
+        assert (draft.is_published, draft.sort_order) == (False, 100)
+
+
+def test_legacy_config_keeps_old_defaults(app, tmp_path):
+    from app import db, ModuleCategory, LearningModule
+    from migrate_modules import ModuleMigrator
+
+    config = tmp_path / 'modules_config.json'
+    config.write_text(json.dumps({'modules': [
+        {'title': 'Erstes', 'slug': 'erstes', 'category': 'trading'},
+        {'title': 'Zweites', 'slug': 'zweites', 'category': 'trading', 'sort_order': 5},
+        {'title': 'Drittes', 'slug': 'drittes', 'category': 'trading'},
+    ]}), encoding='utf-8')
+
+    with app.app_context():
+        db.session.add(ModuleCategory(name='Trading', slug='trading'))
+        db.session.commit()
+        ModuleMigrator().migrate_from_config(str(config))
+
+        modules = {module.slug: module for module in LearningModule.query}
+        assert {slug: module.sort_order for slug, module in modules.items()} == {'erstes': 100, 'zweites': 5, 'drittes': 102}
+        assert {(module.icon, module.description, module.is_published) for module in modules.values()} == {('📊', '', True)}
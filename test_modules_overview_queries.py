@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Regressionstest: /modules darf keine N+1-Queries erzeugen.
+Die Anzahl der SQL-Statements muss unabhängig von der Anzahl der Module konstant bleiben.
+"""
+
+from sqlalchemy import event
+
+from conftest import login_as
+
+
+def add_catalogue(db, models, prefix, n_categories=2, n_subcategories=2, n_modules=3):
+    """Legt Kategorien mit Unterkategorien und veröffentlichten Modulen an"""
+    ModuleCategory, ModuleSubcategory, LearningModule = models
+    for c in range(n_categories):
+        category = ModuleCategory(name=f'{prefix} Kategorie {c}', slug=f'{prefix}-cat-{c}', sort_order=c)
+        db.session.add(category)
+        db.session.flush()
+
+        for m in range(n_modules):
+            db.session.add(LearningModule(
+                category_id=category.id, title=f'{prefix} Direkt {c}.{m}', slug=f'{prefix}-direkt-{c}-{m}',
+                description='Direktes Modul', is_published=True, required_subscription_levels=['premium']
+            ))
+
+        for s in range(n_subcategories):
+            subcategory = ModuleSubcategory(category_id=category.id, name=f'{prefix} Sub {c}.{s}', slug=f'{prefix}-sub-{c}-{s}')
+            db.session.add(subcategory)
+            db.session.flush()
+            for m in range(n_modules):
+                db.session.add(LearningModule(
+                    category_id=category.id, subcategory_id=subcategory.id,
+                    title=f'{prefix} Modul {c}.{s}.{m}', slug=f'{prefix}-modul-{c}-{s}-{m}',
+                    description='Modul in Unterkategorie', is_published=True,
+                    is_lead_magnet=(m == 0), required_subscription_levels=['premium', 'elite']
+                ))
+    db.session.commit()
+
+
+def count_overview_queries(app, client):
+    """Zählt die SQL-Statements eines (warmen) /modules-Aufrufs"""
+    from app import db
+
+    client.get('/modules')  # Menü-Cache aufwärmen
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response = client.get('/modules')
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+    assert response.status_code == 200
+    return len(statements)
+
+
+def test_modules_overview_query_count_is_constant(app, client):
+    from app import db, User, ModuleCategory, ModuleSubcategory, LearningModule, ModuleProgress
+
+    models = (ModuleCategory, ModuleSubcategory, LearningModule)
+
+    with app.app_context():
+        user = User(email='trader@example.com', username='trader')
+        user.set_password('Sicher!123')
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+
+        add_catalogue(db, models, 'klein')
+        first_module = LearningModule.query.first()
+        db.session.add(ModuleProgress(user_id=str(user_id), module_id=first_module.id))
+        db.session.commit()
+
+    login_as(client, user_id, 'trader', membership='premium')
+    small_catalogue = count_overview_queries(app, client)
+
+    with app.app_context():
+        add_catalogue(db, models, 'gross', n_categories=4, n_subcategories=3, n_modules=6)
+        assert LearningModule.query.count() > 100
+
+    large_catalogue = count_overview_queries(app, client)
+
+    assert large_catalogue == small_catalogue
+    assert large_catalogue <= 10
@@ -57,7 +57,7 @@ def test_position_vergroessern_module():
                     print(f"     Required Subscription: {module.required_subscription_levels}")
             else:
                 print("  ❌ Modul NICHT in Datenbank gefunden!")
-                print("     Führe aus: python migrations/register_position_vergroessern.py")
+                print("     Führe aus: flask --app app sync-catalogue")
                 return False
         except Exception as e:
             print(f"  ❌ Fehler beim DB-Zugriff: {str(e)}")
@@ -106,8 +106,8 @@ if __name__ == '__main__':
         print("❌ TESTS FEHLGESCHLAGEN!")
         print("=" * 60)
         print("\n💡 Behebung:")
-        print("   1. Führe Migration aus:")
-        print("      python migrations/register_position_vergroessern.py")
+        print("   1. Synchronisiere den Modul-Katalog:")
+        print("      flask --app app sync-catalogue")
         print("   2. Führe diesen Test erneut aus:")
         print("      python test_position_modul.py")
         print()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests für den gemeinsamen Rate-Limit-Speicher (ratelimit_storage.py)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+
+import ratelimit_storage
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Steuerbare Uhr für die Fenster-Logik"""
+    fake = SimpleNamespace(now=1_000_000.0)
+    fake.time = lambda: fake.now
+    monkeypatch.setattr(ratelimit_storage, 'time', fake)
+    return fake
+
+
+@pytest.fixture
+def url(tmp_path):
+    return 'sqlite:///' + str(tmp_path / 'ratelimit.db')
+
+
+def make_storage(url, **options):
+    storage = storage_from_string('sql://', url=url, **options)
+    # Kein Hintergrund-Thread: Flush wird im Test explizit ausgelöst
+    storage._ensure_worker = lambda: None
+    return storage
+
+
+def test_short_windows_are_exact_across_workers(url, clock):
+    worker_a = make_storage(url)
+    worker_b = make_storage(url)
+    login = parse('5 per minute')
+
+    limiter_a = FixedWindowRateLimiter(worker_a)
+    limiter_b = FixedWindowRateLimiter(worker_b)
+    results = [limiter.hit(login, '10.0.0.1', 'login') for limiter in [limiter_a, limiter_b] * 4]
+
+    # Mit memory:// hätte jeder Worker 5 eigene Versuche
+    assert results == [True] * 5 + [False] * 3
+    assert worker_b.get(login.key_for('10.0.0.1', 'login')) == 8
+
+    # Neues Fenster nach Ablauf
+    clock.now += 61
+    assert limiter_a.hit(login, '10.0.0.1', 'login')
+    assert worker_a.get(login.key_for('10.0.0.1', 'login')) == 1
+
+
+def test_long_windows_are_batched_per_process(url, clock):
+    worker_a = make_storage(url, sync_interval=1.0)
+    worker_b = make_storage(url, sync_interval=1.0)
+    key = parse('50 per hour').key_for('10.0.0.2')
+
+    assert worker_a.incr(key, 3600) == 1  # erster Treffer: Roundtrip, danach Cache
+    round_trips = worker_a.round_trips
+    assert [worker_a.incr(key, 3600) for _ in range(4)] == [2, 3, 4, 5]
+    assert worker_a.round_trips == round_trips
+    assert worker_a.stats()['pending_hits'] == 4
+
+    # Noch nicht geschrieben → anderer Worker sieht nur den ersten Treffer
+    assert worker_b.get(key) == 1
+
+    assert worker_a.flush() == 1
+    assert worker_b.get(key) == 5
+
+    # Nach sync_interval liest Worker A den gemeinsamen Stand inkl. Worker B
+    worker_b.incr(key, 3600)
+    clock.now += 1.5
+    assert worker_a.incr(key, 3600) == 7
+
+
+def test_flush_cleans_up_expired_windows(url, clock):
+    storage = make_storage(url, cleanup_interval=0)
+    storage.incr('kurz', 10)
+    storage.incr('lang', 7200)
+    clock.now += 11
+
+    storage.flush()
+    with storage.engine.connect() as connection:
+        keys = [row.key for row in connection.execute(ratelimit_storage.rate_limits.select())]
+    assert keys == ['lang']
+
+    assert storage.reset() == 1
+    assert storage.get('lang') == 0
+    assert storage.check()
+
+
+def test_app_uses_shared_storage_by_default(app):
+    from app import limiter
+
+    # Standard: gemeinsam in der App-Datenbank (memory:// nur als Opt-out)
+    assert app.config['RATELIMIT_STORAGE'] == 'sql'
+    assert isinstance(limiter.storage, ratelimit_storage.SQLRateLimitStorage)
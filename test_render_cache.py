@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests für den Ganzseiten-Cache der Modulseiten (render_cache.py)
+"""
+
+import pytest
+from flask import Flask, render_template_string
+
+from render_cache import RenderCache
+
+
+@pytest.fixture
+def cache(app):
+    from app import render_cache, view_counter
+
+    render_cache.clear()
+    for counter in ('hits', 'disk_hits', 'misses', 'bypassed', 'uncacheable'):
+        setattr(render_cache, counter, 0)
+    yield render_cache
+    render_cache.clear()
+    # Gezählte Aufrufe schreiben, solange die Test-Tabellen noch existieren
+    with app.app_context():
+        view_counter.flush()
+
+
+def make_module(slug='cache-modul', title='Cache-Modul'):
+    from app import db, ModuleCategory, LearningModule
+
+    category = ModuleCategory(name='Kategorie', slug='kategorie')
+    db.session.add(category)
+    db.session.flush()
+    module = LearningModule(category_id=category.id, title=title, slug=slug, is_published=True,
+                            is_lead_magnet=True, required_subscription_levels=['premium'])
+    db.session.add(module)
+    db.session.commit()
+    return module.id
+
+
+def login(client, username, membership='free'):
+    with client.session_transaction() as sess:
+        sess['logged_in'] = True
+        sess['user'] = {'username': username, 'membership': membership}
+
+
+def test_anonymous_views_are_served_from_cache(app, client, cache):
+    with app.app_context():
+        make_module()
+
+    first = client.get('/module/cache-modul')
+    second = client.get('/module/cache-modul')
+
+    assert first.status_code == second.status_code == 200
+    assert first.get_data() == second.get_data()
+    assert b'Cache-Modul' in second.get_data()
+    stats = cache.stats()
+    assert (stats['misses'], stats['hits']) == (1, 1)
+
+
+def test_user_fragments_are_filled_per_request(app, client, cache):
+    with app.app_context():
+        make_module()
+
+    login(client, 'anna')
+    anna = client.get('/module/cache-modul').get_data(as_text=True)
+    login(client, 'bernd')
+    bernd = client.get('/module/cache-modul').get_data(as_text=True)
+
+    # Gleicher Tier → gleicher Cache-Eintrag, aber jeweils der eigene Name
+    assert cache.stats()['hits'] == 1
+    assert 'Eingeloggt als:</strong> anna' in anna
+    assert 'Eingeloggt als:</strong> bernd' in bernd
+    assert 'anna' not in bernd
+    assert '\x00' not in bernd
+
+
+def test_tiers_admins_and_changes_get_separate_renders(app, client, cache):
+    from app import db, LearningModule
+
+    with app.app_context():
+        module_id = make_module()
+
+    client.get('/module/cache-modul')
+    login(client, 'carla', 'premium')
+    client.get('/module/cache-modul')
+    assert cache.stats()['misses'] == 2
+
+    login(client, 'admin', 'elite')
+    client.get('/module/cache-modul')
+    client.get('/module/cache-modul')
+    assert cache.stats()['bypassed'] == 2
+
+    with app.app_context():
+        db.session.get(LearningModule, module_id).title = 'Neuer Titel'
+        db.session.commit()
+    login(client, 'carla', 'premium')
+    assert 'Neuer Titel' in client.get('/module/cache-modul').get_data(as_text=True)
+    assert cache.stats()['misses'] == 3
+
+
+def test_pages_reading_other_session_values_are_not_cached(app, cache):
+    template = "{{ session.get('pinch_step', 0) }} {{ session.get('logged_in') }}"
+
+    with app.test_request_context():
+        from flask import session
+        session['pinch_step'] = 3
+        html = cache.render('quiz', None, 'base.html', 'anonymous', lambda: render_template_string(template))
+        cache.render('quiz', None, 'base.html', 'anonymous', lambda: render_template_string(template))
+
+    assert html.startswith('3 ')
+    stats = cache.stats()
+    assert (stats['uncacheable'], stats['hits'], stats['entries']) == (2, 0, 0)
+
+
+def test_disk_tier_is_shared_between_workers(app, tmp_path):
+    # Eigene App-Instanzen = zwei Worker-Prozesse mit gemeinsamem RENDER_CACHE_DIR
+    workers = []
+    for _ in range(2):
+        worker_app = Flask('app', root_path=app.root_path)
+        worker_app.config['RENDER_CACHE_DIR'] = str(tmp_path)
+        workers.append(RenderCache(worker_app))
+    worker_a, worker_b = workers
+
+    with worker_app.test_request_context():
+        renders = []
+        page = lambda: renders.append(1) or '<p>Seite</p>'  # noqa: E731
+        assert worker_a.render('seite', None, 'base.html', 'free', page) == '<p>Seite</p>'
+        assert worker_b.render('seite', None, 'base.html', 'free', page) == '<p>Seite</p>'
+
+    assert len(renders) == 1
+    assert worker_b.stats()['disk_hits'] == 1
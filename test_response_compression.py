@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests für Antwort-Kompression (response_compression.py) und CSS/JS-Bundles (template_bundles.py)
+"""
+
+import gzip
+import json
+
+import pytest
+from flask import Response
+
+from response_compression import ResponseCompression
+from template_bundles import BUILD_DIR, BUNDLE_DIR, MANIFEST_NAME, TemplateBundles, build_bundles
+
+PAGE = '<html><body>' + '<p>Bouncy Ball Setup</p>' * 200 + '</body></html>'
+
+
+@pytest.fixture
+def compression():
+    helper = ResponseCompression(min_size=1024)
+    helper.enabled = True
+    helper.brotli = None  # deterministisch gzip
+    return helper
+
+
+def test_large_html_is_gzipped(app, compression):
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip, deflate, br'}):
+        response = Response(PAGE, mimetype='text/html')
+        response.set_etag('seite')
+        response = compression.compress(response)
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.get_data()).decode() == PAGE
+    assert int(response.headers['Content-Length']) == len(response.get_data())
+    assert response.get_etag() == ('seite-gzip', False)
+    assert 'Accept-Encoding' in response.vary
+
+
+def test_small_encoded_and_unaccepted_responses_stay_plain(app, compression):
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+        small = compression.compress(Response('<p>kurz</p>', mimetype='text/html'))
+        image = compression.compress(Response(b'\x89PNG' * 1000, mimetype='image/png'))
+        precompressed = Response(gzip.compress(PAGE.encode()), mimetype='text/html')
+        precompressed.headers['Content-Encoding'] = 'gzip'
+        precompressed = compression.compress(precompressed)
+    with app.test_request_context():
+        unaccepted = compression.compress(Response(PAGE, mimetype='text/html'))
+
+    assert 'Content-Encoding' not in small.headers
+    assert 'Content-Encoding' not in image.headers
+    assert gzip.decompress(precompressed.get_data()).decode() == PAGE
+    assert 'Content-Encoding' not in unaccepted.headers
+    assert unaccepted.get_data(as_text=True) == PAGE
+
+
+def test_streamed_response_is_compressed_chunkwise(app, compression):
+    def generate():
+        for i in range(50):
+            yield f'kapitel,{i}\n'
+
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+        response = compression.compress(Response(generate(), mimetype='text/csv'))
+        chunks = list(response.response)
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in response.headers
+    assert len(chunks) > 1
+    assert gzip.decompress(b''.join(chunks)).decode() == ''.join(f'kapitel,{i}\n' for i in range(50))
+    assert compression.stats()['streamed'] == 1
+
+
+def test_brotli_preferred_when_available(app):
+    brotli = pytest.importorskip('brotli')
+    helper = ResponseCompression()
+    helper.enabled = True
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip, br'}):
+        response = helper.compress(Response(PAGE, mimetype='text/html'))
+    assert response.headers['Content-Encoding'] == 'br'
+    assert brotli.decompress(response.get_data()).decode() == PAGE
+
+
+def test_build_bundles_extracts_and_shares_blocks(tmp_path, app):
+    pytest.importorskip('rjsmin')
+    pytest.importorskip('rcssmin')
+
+    css = '.chart-card {\n    padding: 20px;\n}\n' * 150
+    js = 'function openLightbox(src) {\n    // Kommentar\n    return src;\n}\n' * 80
+    templates = tmp_path / 'templates'
+    templates.mkdir()
+    (templates / 'seite-a.html').write_text(
+        f'<style>{css}</style><p>{{{{ module.title }}}}</p><script>{js}</script>'
+        '<script>var x = "{{ module.slug }}";</script><script src="/static/app.js"></script>',
+        encoding='utf-8'
+    )
+    (templates / 'better-volume-lernseite.html').write_text(f'<style>{css}</style><p>raw</p>', encoding='utf-8')
+
+    stats = build_bundles(str(tmp_path), templates=['seite-a.html', 'better-volume-lernseite.html'])
+    assert stats['templates'] == 2
+    assert stats['bundles'] == 2  # CSS beider Seiten identisch → ein gemeinsames Bundle
+
+    built = (tmp_path / BUILD_DIR / 'seite-a.html').read_text(encoding='utf-8')
+    assert "<link rel=\"stylesheet\" href=\"{{ url_for('static', filename='bundles/" in built
+    assert "<script src=\"{{ url_for('static', filename='bundles/" in built
+    assert 'var x = "{{ module.slug }}";' in built  # Jinja im Script bleibt inline
+    assert '<script src="/static/app.js"></script>' in built
+    raw = (tmp_path / BUILD_DIR / 'better-volume-lernseite.html').read_text(encoding='utf-8')
+    assert '<link rel="stylesheet" href="/static/bundles/' in raw and '?v=' in raw
+    bundle_js = next((tmp_path / BUNDLE_DIR).glob('*.js')).read_text(encoding='utf-8')
+    assert 'Kommentar' not in bundle_js
+
+    # Loader nutzt die gebaute Kopie nur, solange das Original unverändert ist
+    app.debug = True
+    try:
+        bundles = TemplateBundles()
+        app.root_path, original_root = str(tmp_path), app.root_path
+        original_loader = app.jinja_loader
+        bundles.init_app(app)
+    finally:
+        app.root_path = original_root
+        app.jinja_loader = original_loader
+        app.debug = False
+    assert bundles.page_directory('better-volume-lernseite.html') == str(tmp_path / BUILD_DIR)
+    (templates / 'better-volume-lernseite.html').write_text('<p>geändert</p>', encoding='utf-8')
+    assert bundles.page_directory('better-volume-lernseite.html') == str(templates)
+    assert json.loads((tmp_path / BUILD_DIR / MANIFEST_NAME).read_text(encoding='utf-8')).keys() == {
+        'seite-a.html', 'better-volume-lernseite.html'
+    }
+
+
+
+def test_compressed_page_revalidates_with_its_etag(app, compression):
+    from app import send_standalone_page
+
+    def fetch(headers):
+        with app.test_request_context(headers=headers) as ctx:
+            response = compression.compress(send_standalone_page('trading_archetypen.html'))
+            response.body = b''.join(response.get_app_iter(ctx.request.environ))  # wie über WSGI gesendet
+            return response
+
+    first = fetch({'Accept-Encoding': 'gzip'})
+    assert first.status_code == 200
+    assert first.headers['Content-Encoding'] == 'gzip'
+    etag = first.headers['ETag']
+    assert etag.endswith('-gzip"')
+
+    second = fetch({'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert second.status_code == 304
+    assert second.body == b''
+
+    # Klartext ist eine andere Repräsentation → kein 304 auf das gzip-ETag
+    plain = fetch({'If-None-Match': etag})
+    assert plain.status_code == 200
+    assert 'Content-Encoding' not in plain.headers
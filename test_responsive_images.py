@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests für die responsive Screenshots (responsive_images.py)
+"""
+
+import json
+import os
+
+import pytest
+
+import responsive_images
+from responsive_images import MANIFEST_NAME, OUTPUT_DIR, ResponsiveImages, build_variants, manifest_key
+
+
+@pytest.fixture
+def helper(app, tmp_path):
+    """ResponsiveImages mit eigenem Manifest im Temp-Ordner"""
+    manifest = {
+        manifest_key('static', 'screenshots/Chart.png'): {
+            'hash': 'abc', 'width': 1600, 'height': 900,
+            'variants': {
+                'avif': [[480, 'responsive/screenshots/Chart-abc-480.avif'],
+                         [1440, 'responsive/screenshots/Chart-abc-1440.avif']],
+                'webp': [[480, 'responsive/screenshots/Chart-abc-480.webp'],
+                         [1440, 'responsive/screenshots/Chart-abc-1440.webp']],
+            }
+        }
+    }
+    path = tmp_path / MANIFEST_NAME
+    path.write_text(json.dumps(manifest), encoding='utf-8')
+
+    images = ResponsiveImages(app)
+    images.manifest_path = str(path)
+    return images
+
+
+def test_picture_with_srcset_and_dimensions(app, helper):
+    with app.test_request_context():
+        html = helper.render('screenshots/Chart.png', alt='Chart "A"', class_='chart-image',
+                             onclick='openLightbox(this.src)')
+
+    assert html.startswith('<picture><source type="image/avif"')
+    assert html.index('image/avif') < html.index('image/webp')
+    assert '/static/responsive/screenshots/Chart-abc-480.webp 480w' in html
+    assert 'sizes="(max-width: 768px) 100vw, 900px"' in html
+    # Fallback-<img> zeigt aufs Original (Lightbox bekommt volle Auflösung)
+    assert 'src="/static/screenshots/Chart.png"' in html
+    assert 'width="1600" height="900"' in html
+    assert 'loading="lazy"' in html
+    assert 'class="chart-image"' in html
+    assert 'alt="Chart &#34;A&#34;"' in html
+
+
+def test_plain_img_without_manifest_entry(app, helper):
+    with app.test_request_context():
+        html = helper.render('Unbekannt.png', endpoint='serve_screenshots', lazy=False)
+        helper.enabled = False
+        disabled = helper.render('screenshots/Chart.png')
+
+    assert html == '<img src="/Screenshots/Unbekannt.png" alt="" decoding="async">'
+    assert '<picture>' not in disabled
+
+
+def test_template_renders_picture_elements(app, helper, monkeypatch):
+    monkeypatch.setitem(app.jinja_env.globals, 'responsive_image', helper.render)
+    with app.test_request_context():
+        html = app.jinja_env.from_string("{{ responsive_image('screenshots/Chart.png', alt='x') }}").render()
+    assert html.startswith('<picture>')
+
+
+def test_build_skips_unchanged_images(tmp_path, monkeypatch):
+    Image = pytest.importorskip('PIL.Image')
+
+    source = tmp_path / 'static' / 'screenshots'
+    source.mkdir(parents=True)
+    Image.new('RGB', (1200, 600), 'white').save(source / 'Chart.png')
+    Image.new('RGB', (300, 200), 'black').save(source / 'Klein.png')
+    monkeypatch.setattr(responsive_images, 'SOURCES', {'static/screenshots': ('static', 'screenshots/')})
+    formats = {'webp': responsive_images.FORMATS['webp']}
+
+    first = build_variants(str(tmp_path), formats=formats)
+    assert (first['images'], first['built'], first['skipped']) == (2, 2, 0)
+
+    manifest = json.loads((tmp_path / OUTPUT_DIR / MANIFEST_NAME).read_text(encoding='utf-8'))
+    chart = manifest[manifest_key('static', 'screenshots/Chart.png')]
+    assert (chart['width'], chart['height']) == (1200, 600)
+    assert [width for width, _ in chart['variants']['webp']] == [480, 960, 1200]
+    # Kleine Bilder werden nicht hochskaliert
+    klein = manifest[manifest_key('static', 'screenshots/Klein.png')]
+    assert [width for width, _ in klein['variants']['webp']] == [300]
+
+    second = build_variants(str(tmp_path), formats=formats)
+    assert (second['built'], second['skipped']) == (0, 2)
+
+    # Geändertes Bild → neue Varianten, alte werden aufgeräumt
+    old_files = [path for _, path in chart['variants']['webp']]
+    Image.new('RGB', (1200, 600), 'red').save(source / 'Chart.png')
+    third = build_variants(str(tmp_path), formats=formats)
+    assert (third['built'], third['skipped']) == (1, 1)
+    assert not any(os.path.exists(tmp_path / 'static' / path) for path in old_files)
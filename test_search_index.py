@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests für die Volltext-Suche der Module (search_index.py, /api/modules/search)
+"""
+
+import pytest
+
+from conftest import login_as
+from search_index import cistem
+
+
+@pytest.fixture
+def index(app, tmp_path):
+    from app import module_content, search_index
+
+    original_dir = module_content.template_dir
+    module_content.template_dir = str(tmp_path)
+    module_content._cache.clear()
+    search_index.invalidate()
+    yield search_index
+    module_content.template_dir = original_dir
+    module_content._cache.clear()
+    search_index.invalidate()
+
+
+def add_modules(tmp_path):
+    from app import db, ModuleCategory, LearningModule
+
+    (tmp_path / 'volumen.html').write_text(
+        '{% extends "base.html" %}<style>.konsolidierung{}</style>'
+        '<h2>Grundlagen</h2><p>Hohe Umsätze in der Konsolidierung zeigen Akkumulation &amp; Verteilung.</p>'
+        '<script>var volume = "{{ module.title }}";</script>',
+        encoding='utf-8'
+    )
+    category = ModuleCategory(name='Trading', slug='trading')
+    db.session.add(category)
+    db.session.flush()
+    modules = [
+        LearningModule(category_id=category.id, title='Volumen verstehen', slug='volumen',
+                       description='Wie Volumen Bewegungen bestätigt', template_file='volumen.html',
+                       is_published=True, is_lead_magnet=True),
+        LearningModule(category_id=category.id, title='Konsolidierungen handeln', slug='konsolidierung',
+                       description='Ausbrüche aus Seitwärtsphasen', is_published=True, is_lead_magnet=True),
+        LearningModule(category_id=category.id, title='Volatilität', slug='volatilitaet',
+                       description='ATR und Positionsgröße', is_published=True,
+                       required_subscription_levels=['premium']),
+        LearningModule(category_id=category.id, title='Entwurf Konsolidierung', slug='entwurf',
+                       is_published=False, is_lead_magnet=True),
+    ]
+    db.session.add_all(modules)
+    db.session.commit()
+    return {module.slug: module.id for module in modules}
+
+
+def slugs(results):
+    return [result['slug'] for result in results]
+
+
+def test_stemming():
+    assert cistem('Konsolidierungen') == cistem('Konsolidierung')
+    assert cistem('Umsätze') == cistem('umsatze')
+
+
+def test_ranking_content_and_prefix_matches(app, index, tmp_path):
+    with app.app_context():
+        add_modules(tmp_path)
+        # Titel-Treffer vor Inhalts-Treffer, unveröffentlichte Module fehlen
+        results = index.search('konsolidierung')
+        assert slugs(results) == ['konsolidierung', 'volumen']
+        assert results[0]['score'] > results[1]['score']
+        assert 'Konsolidierung' in results[1]['snippet']
+
+        # Lerninhalt (ohne Markup/Scripts), Umlaut-Faltung und Präfix des letzten Wortes
+        assert slugs(index.search('Umsätze Akkumulation')) == ['volumen']
+        assert slugs(index.search('vol')) == ['volatilitaet', 'volumen']
+        assert index.search('var') == []
+
+
+def test_changes_are_reindexed_incrementally(app, index, tmp_path):
+    from app import db, LearningModule
+
+    with app.app_context():
+        ids = add_modules(tmp_path)
+        index.search('volumen')
+        builds = index.stats()['full_builds']
+
+        module = db.session.get(LearningModule, ids['volatilitaet'])
+        module.title = 'Schwankungsbreite'
+        module.view_count = 5
+        db.session.commit()
+        db.session.get(LearningModule, ids['entwurf']).is_published = True
+        db.session.commit()
+
+        assert slugs(index.search('schwankung')) == ['volatilitaet']
+        assert 'entwurf' in slugs(index.search('konsolidierung'))
+        assert index.stats()['full_builds'] == builds
+        assert index.stats()['reindexed'] == 2
+
+
+def test_api_filters_by_subscription(app, client, index, tmp_path):
+    with app.app_context():
+        add_modules(tmp_path)
+
+    anonymous = client.get('/api/modules/search?q=vol').get_json()['modules']
+    assert slugs(anonymous) == ['volumen']
+    assert anonymous[0]['url'] == '/module/volumen'
+
+    login_as(client, 'premium-user', 'paula', 'premium')
+    assert slugs(client.get('/api/modules/search?q=vol').get_json()['modules']) == ['volatilitaet', 'volumen']
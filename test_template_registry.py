@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests für den inkrementellen Template-Scan (template_registry.py, /admin/scan-new-modules)
+"""
+
+import pytest
+
+from conftest import login_as
+
+
+@pytest.fixture
+def registry(app, tmp_path):
+    from app import module_content, template_registry
+
+    original_dir = module_content.template_dir
+    module_content.template_dir = str(tmp_path)
+    module_content._cache.clear()
+    yield template_registry
+    module_content.template_dir = original_dir
+    module_content._cache.clear()
+
+
+def write_templates(tmp_path):
+    (tmp_path / 'vcp-pattern.html').write_text(
+        '<title>VCP-Pattern | Didis Trading Academy</title><p class="hero-subtitle">Minervinis Setup</p>'
+        '<p>' + 'Kontraktion ' * 600 + '</p>', encoding='utf-8'
+    )
+    (tmp_path / 'breakout.html').write_text('<h2>Breakout</h2>', encoding='utf-8')
+    (tmp_path / 'base.html').write_text('<p>System</p>', encoding='utf-8')
+
+
+def add_existing_modules():
+    from app import db, ModuleCategory, LearningModule
+
+    category = ModuleCategory(name='Trading', slug='trading')
+    db.session.add(category)
+    db.session.flush()
+    db.session.add_all([
+        # Slug passt, template_file fehlt → update
+        LearningModule(category_id=category.id, title='Breakout', slug='breakout', is_published=True),
+        # Template-Datei gelöscht → Waise
+        LearningModule(category_id=category.id, title='Alt', slug='alt', template_file='alt.html', is_published=True),
+    ])
+    db.session.commit()
+
+
+def test_scan_applies_create_update_orphan_diff(app, registry, tmp_path):
+    from app import LearningModule
+
+    write_templates(tmp_path)
+    with app.app_context():
+        add_existing_modules()
+
+        preview = registry.scan(dry_run=True)
+        assert preview['created'] == ['vcp-pattern.html']
+        assert preview['updated'] == [('breakout', None, 'breakout.html')]
+        assert preview['orphans'] == ['alt']
+        assert LearningModule.query.count() == 2
+
+        result = registry.scan(unpublish_orphans=True)
+        assert result['content']['parsed'] == 0  # Manifest schon beim Dry-Run aktualisiert
+        assert result['unpublished'] == ['alt']
+
+        vcp = LearningModule.query.filter_by(slug='vcp-pattern').one()
+        assert (vcp.title, vcp.description, vcp.is_published) == ('VCP-Pattern', 'Minervinis Setup', False)
+        assert vcp.estimated_duration == 4
+        assert vcp.category.slug == 'neue-module'
+        assert LearningModule.query.filter_by(slug='breakout').one().template_file == 'breakout.html'
+        assert LearningModule.query.filter_by(slug='alt').one().is_published is False
+
+        # Nichts geändert → leerer Diff, keine Datei gelesen
+        again = registry.scan()
+        assert (again['created'], again['updated'], again['content']['parsed']) == ([], [], 0)
+        assert again['content']['unchanged'] == 2
+
+
+def test_admin_route_reports_scan(app, client, registry, tmp_path):
+    write_templates(tmp_path)
+    login_as(client, 1, 'admin', 'elite')
+
+    response = client.get('/admin/scan-new-modules', follow_redirects=False)
+    assert response.status_code == 302
+    with client.session_transaction() as sess:
+        messages = [message for _, message in sess['_flashes']]
+    assert any('2 neue Module gefunden' in message for message in messages)
+    assert any('2 neu geparst' in message for message in messages)
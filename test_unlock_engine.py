@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Tests für die mengenbasierte tägliche Modul-Freischaltung (unlock_engine.py)
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+
+def make_user(User, SubscriptionType, name, level, started_days_ago, now):
+    user = User(email=f'{name}@example.com', username=name, password_hash='x',
+                subscription_type=SubscriptionType(level))
+    user.set_subscription_start_date(level, now - timedelta(days=started_days_ago - 1))
+    return user
+
+
+def make_category(db, ModuleCategory):
+    category = ModuleCategory(name='Kategorie', slug='kategorie')
+    db.session.add(category)
+    db.session.flush()
+    return category.id
+
+
+def test_bulk_unlock_matches_per_user_rules(app):
+    from app import db, User, SubscriptionType, ModuleCategory, LearningModule, UserModuleUnlock, unlock_engine, OutboxEmail
+    from scheduler import run_daily_unlock_job
+
+    now = datetime.utcnow()
+    with app.app_context():
+        category_id = make_category(db, ModuleCategory)
+        modules = [
+            LearningModule(category_id=category_id, title='Lead', slug='lead', is_published=True, is_lead_magnet=True, sort_order=1),
+            LearningModule(category_id=category_id, title='Premium A', slug='premium-a', is_published=True,
+                           required_subscription_levels=['premium', 'elite'], sort_order=2),
+            LearningModule(category_id=category_id, title='Elite', slug='elite', is_published=True,
+                           required_subscription_levels=['elite'], sort_order=3),
+            LearningModule(category_id=category_id, title='Premium B', slug='premium-b', is_published=True,
+                           required_subscription_levels=['premium'], sort_order=4),
+            LearningModule(category_id=category_id, title='Entwurf', slug='draft', is_published=False,
+                           required_subscription_levels=['premium'], sort_order=5),
+        ]
+        users = [
+            make_user(User, SubscriptionType, 'p2', 'premium', 2, now),
+            make_user(User, SubscriptionType, 'p9', 'premium', 9, now),
+            make_user(User, SubscriptionType, 'e1', 'elite', 1, now),
+            User(email='nostart@example.com', username='nostart', password_hash='x',
+                 subscription_type=SubscriptionType.ELITE, subscription_started_at={}),
+        ]
+        db.session.add_all(modules + users)
+        db.session.commit()
+        # p9 hat Premium A schon (z.B. aus einem früheren Lauf)
+        db.session.add(UserModuleUnlock(user_id=users[1].id, module_id=modules[1].id,
+                                        unlock_day=2, subscription_level='premium'))
+        db.session.commit()
+
+        # Nur lesende Queries für den Plan - unabhängig von der Anzahl User/Module
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            pending = unlock_engine.plan(now)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+        assert len(statements) == 3
+
+        planned = {(unlock.user.username, unlock.module.slug, unlock.unlock_day) for unlock in pending}
+        assert planned == {
+            ('p2', 'lead', 1), ('p2', 'premium-a', 2),
+            ('p9', 'lead', 1), ('p9', 'premium-b', 3),
+            ('e1', 'lead', 1),
+        }
+
+    result = run_daily_unlock_job(app)
+    assert result['unlocks'] == 5
+    assert result['emails'] == 5
+    assert result['users'] == 3
+    assert result['rows_per_second'] is not None
+
+    with app.app_context():
+        assert UserModuleUnlock.query.count() == 6
+        assert UserModuleUnlock.query.filter_by(notification_sent=True).count() == 5
+        assert OutboxEmail.query.count() == 5
+
+        # Zweiter Lauf am selben Tag: nichts mehr zu tun
+        assert unlock_engine.plan(now) == []
+
+
+def test_failed_chunk_is_rolled_back(app):
+    from app import db, User, SubscriptionType, ModuleCategory, LearningModule, UserModuleUnlock, unlock_engine
+
+    now = datetime.utcnow()
+    with app.app_context():
+        category_id = make_category(db, ModuleCategory)
+        db.session.add(LearningModule(category_id=category_id, title='Lead', slug='lead', is_published=True, is_lead_magnet=True, sort_order=1))
+        db.session.add_all([make_user(User, SubscriptionType, f'u{i}', 'premium', 3, now) for i in range(5)])
+        db.session.commit()
+
+        def notify(user, module, unlock_day):
+            if user.username == 'u3':
+                raise RuntimeError('Template kaputt')
+            return True
+
+        chunk_size = unlock_engine.chunk_size
+        unlock_engine.chunk_size = 2
+        try:
+            result = unlock_engine.run(now, notify=notify)
+        finally:
+            unlock_engine.chunk_size = chunk_size
+
+        # Chunk [u2, u3] scheitert komplett, die anderen Chunks sind gespeichert
+        assert result['unlocks'] == 3
+        assert result['failed'] == 2
+        assert UserModuleUnlock.query.count() == 3
+
+
+def test_shards_resume_from_checkpoint(app, monkeypatch):
+    from app import db, User, SubscriptionType, ModuleCategory, LearningModule, UserModuleUnlock, UnlockCheckpoint, unlock_engine
+
+    now = datetime.utcnow()
+    with app.app_context():
+        category_id = make_category(db, ModuleCategory)
+        db.session.add(LearningModule(category_id=category_id, title='Lead', slug='lead',
+                                      is_published=True, is_lead_magnet=True, sort_order=1))
+        db.session.add_all([make_user(User, SubscriptionType, f'u{i}', 'premium', 3, now) for i in range(1, 8)])
+        db.session.commit()
+
+    monkeypatch.setattr(unlock_engine, 'shard_size', 3)  # IDs 1-2 | 3-5 | 6-7
+    monkeypatch.setattr(unlock_engine, 'workers', 2)
+    monkeypatch.setattr(unlock_engine, 'incremental', False)  # alle Shards, nur Checkpoints entscheiden
+
+    crashed = {'u4'}
+
+    def notify(user, module, unlock_day):
+        if user.username in crashed:
+            raise RuntimeError('Worker abgestürzt')
+        return True
+
+    with app.app_context():
+        first = unlock_engine.run(now, notify=notify, run_key='2026-01-31')
+        assert first['shards'] == 3
+        assert first['unlocks'] == 4
+        assert UnlockCheckpoint.query.count() == 2
+
+        # Wiederholung im selben Slot: nur der offene Shard wird bearbeitet
+        crashed.clear()
+        second = unlock_engine.run(now, notify=notify, run_key='2026-01-31')
+        assert second['resumed_shards'] == 2
+        assert second['unlocks'] == 3
+        assert UserModuleUnlock.query.count() == 7
+
+        # Nächster Tag: alte Checkpoints werden aufgeräumt
+        third = unlock_engine.run(now, notify=notify, run_key='2026-02-01')
+        assert third['resumed_shards'] == 0
+        assert third['unlocks'] == 0
+        assert {row.run_key for row in UnlockCheckpoint.query} == {'2026-02-01'}
+
+
+def test_incremental_run_only_evaluates_due_users(app):
+    from app import db, User, SubscriptionType, ModuleCategory, LearningModule, UserModuleUnlock, UserUnlockState, unlock_engine
+
+    now = datetime(2026, 3, 10, 0, 5)
+    with app.app_context():
+        category_id = make_category(db, ModuleCategory)
+        db.session.add_all([
+            LearningModule(category_id=category_id, title=f'Premium {i}', slug=f'premium-{i}', is_published=True,
+                           required_subscription_levels=['premium'], sort_order=i)
+            for i in range(1, 4)
+        ])
+        early = make_user(User, SubscriptionType, 'early', 'premium', 30, now)  # alle 3 Module fällig
+        fresh = make_user(User, SubscriptionType, 'fresh', 'premium', 1, now)
+        db.session.add_all([early, fresh])
+        db.session.commit()
+
+        first = unlock_engine.run(now)
+        assert first['due_users'] == 2
+        assert first['unlocks'] == 4
+
+        state = db.session.get(UserUnlockState, (fresh.id, SubscriptionType.PREMIUM))
+        assert state.last_unlock_day == 1
+        assert state.next_unlock_at == fresh.get_subscription_start_date('premium') + timedelta(days=1)
+        # Alle Module frei → nie wieder fällig (bis sich der Katalog ändert)
+        assert db.session.get(UserUnlockState, (early.id, SubscriptionType.PREMIUM)).next_unlock_at is None
+
+        # Gleicher Tag: niemand fällig
+        assert unlock_engine.due_user_ids(now + timedelta(hours=12)) == []
+
+        # Nächster Tag: nur "fresh" wird ausgewertet
+        second = unlock_engine.run(now + timedelta(days=1))
+        assert second['due_users'] == 1
+        assert second['unlocks'] == 1
+        assert UserModuleUnlock.query.filter_by(user_id=fresh.id).count() == 2
+
+        # Neues Modul im Katalog → alle Premium-User werden einmal neu bewertet
+        db.session.add(LearningModule(category_id=category_id, title='Premium 0', slug='premium-0', is_published=True,
+                                      required_subscription_levels=['premium'], sort_order=0))
+        db.session.commit()
+        third = unlock_engine.run(now + timedelta(days=1, hours=1))
+        assert third['due_users'] == 2
+        assert UserModuleUnlock.query.filter_by(user_id=early.id).count() == 4
+
+        # Neues Start-Datum verwirft den Stand → wieder fällig
+        early.set_subscription_start_date('premium', now)
+        db.session.commit()
+        assert early.id in unlock_engine.due_user_ids(now + timedelta(days=1, hours=2))
+
+
+def test_crashed_slot_resumes_from_checkpoints(app, monkeypatch):
+    import scheduler
+    from scheduler import run_locked_job, retry_failed_jobs, trigger_manual_unlock
+    from app import db, User, SubscriptionType, ModuleCategory, LearningModule, UserModuleUnlock, UnlockCheckpoint, JobRun, unlock_engine
+
+    now = datetime.utcnow()
+    with app.app_context():
+        category_id = make_category(db, ModuleCategory)
+        db.session.add(LearningModule(category_id=category_id, title='Lead', slug='lead',
+                                      is_published=True, is_lead_magnet=True, sort_order=1))
+        db.session.add_all([make_user(User, SubscriptionType, f'u{i}', 'premium', 3, now) for i in range(1, 8)])
+        db.session.commit()
+
+    monkeypatch.setattr(unlock_engine, 'shard_size', 3)  # IDs 1-2 | 3-5 | 6-7
+    monkeypatch.setattr(unlock_engine, 'workers', 1)
+    monkeypatch.setattr(unlock_engine, 'incremental', False)
+
+    crashed = {'u4'}
+    send_unlock_email = scheduler.send_unlock_email
+
+    def flaky_email(user, *args):
+        if user.username in crashed:
+            raise RuntimeError('SMTP weg')
+        return send_unlock_email(user, *args)
+
+    monkeypatch.setattr(scheduler, 'send_unlock_email', flaky_email)
+
+    # Geplanter Lauf: ein Shard stürzt ab, der Slot wird als fehlgeschlagen protokolliert
+    assert run_locked_job(app, 'daily_module_unlock') is None
+    slot = scheduler.current_slot('daily_module_unlock')
+    with app.app_context():
+        assert JobRun.query.one().status == 'failed'
+        assert {row.run_key for row in UnlockCheckpoint.query} == {slot}
+        assert UnlockCheckpoint.query.count() == 2
+
+    # Manueller Trigger setzt den Slot fort: nur der offene Shard läuft
+    crashed.clear()
+    result = trigger_manual_unlock(app)
+    assert result['resumed_shards'] == 2
+    assert result['unlocks'] == 3
+    with app.app_context():
+        run = JobRun.query.one()
+        assert (run.slot, run.status) == (slot, 'success')
+        assert UserModuleUnlock.query.count() == 7
+
+    assert retry_failed_jobs(app) == {}
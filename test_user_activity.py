@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests für /admin/user-activity: feste Anzahl Queries unabhängig von der User-Zahl,
+serverseitige Pagination und Sortierung
+"""
+
+import re
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+from werkzeug.security import generate_password_hash
+
+from conftest import login_as
+
+
+def seed_users(db, User, VisitorAnalytics, ModuleProgress, count):
+    now = datetime.utcnow()
+    # Passwort-Hashing ist absichtlich langsam - ein Hash für alle Test-User reicht
+    password_hash = generate_password_hash('Sicher!123')
+    for i in range(count):
+        user = User(email=f'user{i}@example.com', username=f'user{i:03d}', password_hash=password_hash)
+        db.session.add(user)
+        db.session.flush()
+        for j in range(i % 7):
+            db.session.add(VisitorAnalytics(
+                ip_address='10.0.0.1', page_url=f'https://example.com/module/modul-{j}',
+                user_id=user.id, visited_at=now - timedelta(hours=j)
+            ))
+        if i % 2:
+            db.session.add(ModuleProgress(user_id=str(user.id), module_id=1))
+    db.session.commit()
+
+
+def count_queries(app, client, url):
+    from app import db
+
+    with app.app_context():
+        engine = db.engine
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+    assert response.status_code == 200
+    return len(statements), response.get_data(as_text=True)
+
+
+def test_query_count_independent_of_user_count(app, client):
+    from app import db, User, VisitorAnalytics, ModuleProgress
+
+    login_as(client, 1, 'admin', 'elite_pro')
+
+    with app.app_context():
+        seed_users(db, User, VisitorAnalytics, ModuleProgress, 5)
+    client.get('/admin/user-activity')
+    small, _ = count_queries(app, client, '/admin/user-activity')
+
+    with app.app_context():
+        db.session.query(User).delete()
+        db.session.commit()
+        seed_users(db, User, VisitorAnalytics, ModuleProgress, 120)
+    large, html = count_queries(app, client, '/admin/user-activity?per_page=50')
+
+    assert large == small
+    assert '120 User' in html
+    assert 'Seite 1 von 3' in html
+
+
+def test_sorting_and_paging(app, client):
+    from app import db, User, VisitorAnalytics, ModuleProgress
+
+    with app.app_context():
+        seed_users(db, User, VisitorAnalytics, ModuleProgress, 30)
+    login_as(client, 1, 'admin', 'elite_pro')
+
+    _, html = count_queries(app, client, '/admin/user-activity?sort=username&order=asc&per_page=10&page=2')
+    usernames = re.findall(r'user\d{3}', html)
+    assert usernames[:10] == [f'user{i:03d}' for i in range(10, 20)]
+
+    # Standard: meiste Aufrufe zuerst (i % 7 == 6 → 6 Aufrufe)
+    _, html = count_queries(app, client, '/admin/user-activity?per_page=5')
+    first = re.findall(r'user(\d{3})', html)[0]
+    assert int(first) % 7 == 6
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests für die Write-Behind-Zähler (view_counter.py)
+"""
+
+from sqlalchemy import event
+
+from conftest import login_as
+
+
+def seed_module(db, ModuleCategory, LearningModule, slug='zaehler-modul'):
+    category = ModuleCategory(name='Kategorie', slug='kategorie')
+    db.session.add(category)
+    db.session.flush()
+    module = LearningModule(category_id=category.id, title='Zähler-Modul', slug=slug,
+                            is_published=True, is_lead_magnet=True, view_count=3)
+    db.session.add(module)
+    db.session.commit()
+    return module.id
+
+
+def test_views_are_aggregated_into_one_flush(app, monkeypatch):
+    from app import db, view_counter, menu_cache, ModuleCategory, LearningModule, ModuleProgress
+
+    with app.app_context():
+        module_id = seed_module(db, ModuleCategory, LearningModule)
+        engine = db.engine
+
+    # Kein Hintergrund-Thread: Flush wird im Test explizit ausgelöst
+    monkeypatch.setattr(view_counter, 'enabled', True)
+    monkeypatch.setattr(view_counter, '_ensure_worker', lambda: None)
+
+    for _ in range(50):
+        view_counter.record(module_id, user_id='7')
+    view_counter.record(module_id)
+    view_counter.record(module_id, user_id='8')
+    assert view_counter.stats()['pending_views'] == 52
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.strip().split()[0].upper())
+
+    menu_version = menu_cache.version
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        view_counter.flush()
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+
+    # Ein Inkrement-UPDATE, ein SELECT für bestehende Fortschritte, ein Bulk-INSERT
+    assert statements.count('UPDATE') == 1
+    assert statements.count('INSERT') == 1
+    assert menu_cache.version == menu_version
+
+    with app.app_context():
+        assert db.session.get(LearningModule, module_id).view_count == 55
+        progress = ModuleProgress.query.filter_by(module_id=module_id).all()
+        assert sorted(p.user_id for p in progress) == ['7', '8']
+
+    # Zweiter Flush aktualisiert bestehende Fortschritte statt Duplikate anzulegen
+    view_counter.record(module_id, user_id='7')
+    view_counter.flush()
+    with app.app_context():
+        assert ModuleProgress.query.filter_by(module_id=module_id, user_id='7').count() == 1
+        assert db.session.get(LearningModule, module_id).view_count == 56
+
+
+def test_module_view_does_not_commit(app, client, monkeypatch):
+    from app import db, view_counter, ModuleCategory, LearningModule
+
+    with app.app_context():
+        seed_module(db, ModuleCategory, LearningModule, slug='ohne-commit')
+        engine = db.engine
+
+    monkeypatch.setattr(view_counter, 'enabled', True)
+    monkeypatch.setattr(view_counter, '_ensure_worker', lambda: None)
+    login_as(client, 5, 'leser')
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.strip().split()[0].upper())
+
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        client.get('/module/ohne-commit')
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+
+    # Nur das Visitor-Tracking schreibt (eigener Pfad), keine View-/Fortschritts-Writes
+    assert statements.count('UPDATE') == 0
+    assert view_counter.stats()['pending_views'] == 1
+    view_counter.flush()
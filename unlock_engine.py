@@ -0,0 +1,402 @@
+# unlock_engine.py - Mengenbasierte tägliche Modul-Freischaltung
+"""
+Bulk-Engine für den täglichen Unlock-Job statt User × Module Einzel-Queries:
+- Die sortierte Modul-Liste wird EINMAL pro Lauf und Subscription-Level berechnet
+- Die User werden nach ID-Bereichen in Shards aufgeteilt (user.id // shard_size)
+- Shards laufen parallel in einem Thread-Pool, jeder mit eigener Session
+  (eigener App-Context) und eigenen Commits
+- Pro Shard: bestehende Freischaltungen in EINER Query, fehlende (User, Modul, Tag)-Tupel
+  im Speicher, Einfügen per executemany in Chunks; Outbox-Emails im selben Commit
+- Fertige Shards werden als Checkpoint gespeichert - ein abgebrochener Lauf
+  (gleicher run_key) macht beim nächsten Versuch mit den offenen Shards weiter
+- Inkrementell: pro User und Level werden last_unlock_day und ein indiziertes
+  next_unlock_at gespeichert (user_unlock_states) - ausgewertet werden nur User,
+  die seit dem letzten Lauf einen neuen Tag erreicht haben (oder noch keinen Zustand haben)
+- Ändert sich die Modul-Reihenfolge eines Levels, werden dessen User einmal komplett neu bewertet
+- Der Lauf meldet Durchsatz (Zeilen/Sekunde)
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, bindparam, distinct, or_
+
+logger = logging.getLogger(__name__)
+
+# Schlanke Snapshots: bleiben nach Chunk-Commits gültig und sind zwischen Threads teilbar
+UnlockModule = namedtuple('UnlockModule', 'id title slug description icon')
+UnlockUser = namedtuple('UnlockUser', 'id username email first_name subscription_level started_at days_since_start')
+PendingUnlock = namedtuple('PendingUnlock', 'user module unlock_day')
+
+CATALOG_STATE_KEY = 'unlock_catalog'  # AppState: Signatur der Modul-Reihenfolge pro Level
+
+
+class UnlockEngine:
+    """Berechnet und schreibt alle fälligen Modul-Freischaltungen eines Tages gebündelt"""
+
+    def __init__(self, app=None, db=None, User=None, LearningModule=None, UserModuleUnlock=None,
+                 UnlockCheckpoint=None, UserUnlockState=None, AppState=None,
+                 chunk_size=1000, shard_size=1000, workers=4, incremental=True):
+        self.chunk_size = chunk_size
+        self.shard_size = shard_size
+        self.workers = workers
+        self.incremental = incremental
+
+        # Zähler für Monitoring
+        self.last_run = None
+
+        if app is not None:
+            self.init_app(app, db, User, LearningModule, UserModuleUnlock, UnlockCheckpoint, UserUnlockState, AppState)
+
+    def init_app(self, app, db, User, LearningModule, UserModuleUnlock, UnlockCheckpoint, UserUnlockState, AppState):
+        self.app = app
+        self.db = db
+        self.User = User
+        self.LearningModule = LearningModule
+        self.UserModuleUnlock = UserModuleUnlock
+        self.UnlockCheckpoint = UnlockCheckpoint
+        self.UserUnlockState = UserUnlockState
+        self.AppState = AppState
+        self.chunk_size = app.config.get('UNLOCK_CHUNK_SIZE', self.chunk_size)
+        self.shard_size = app.config.get('UNLOCK_SHARD_SIZE', self.shard_size)
+        self.workers = app.config.get('UNLOCK_WORKERS', self.workers)
+        self.incremental = app.config.get('UNLOCK_INCREMENTAL', self.incremental)
+
+    # === PLANUNG (nur lesende Queries) ===
+
+    def modules_by_level(self, levels):
+        """
+        Sortierte Modul-Listen pro Subscription-Level aus EINER Query.
+
+        Gleiche Logik wie get_modules_for_subscription_level(): Lead-Magnete für alle,
+        sonst muss das Level in required_subscription_levels stehen.
+        """
+        LearningModule = self.LearningModule
+        modules = LearningModule.query.filter_by(is_published=True).order_by(LearningModule.sort_order).all()
+
+        by_level = {}
+        for level in levels:
+            by_level[level] = [
+                UnlockModule(module.id, module.title, module.slug, module.description, module.icon)
+                for module in modules
+                if module.is_lead_magnet or level in (module.required_subscription_levels or [])
+            ]
+        return by_level
+
+    def active_levels(self):
+        """Subscription-Levels der aktiven User (eine Query)"""
+        User = self.User
+        rows = self.db.session.query(distinct(User.subscription_type)).filter(User.is_active.is_(True))
+        return {row[0].value for row in rows}
+
+    def active_users(self, now, user_range=None, user_ids=None):
+        """Aktive User (optional ID-Bereich/-Auswahl) als Snapshot inkl. Tage seit Subscription-Start"""
+        User = self.User
+        query = User.query.filter_by(is_active=True)
+        if user_range is not None:
+            query = query.filter(User.id >= user_range[0], User.id < user_range[1])
+        if user_ids is not None:
+            query = query.filter(User.id.in_(user_ids))
+
+        users = []
+        for user in query.order_by(User.id):
+            level = user.subscription_type.value
+            users.append(UnlockUser(
+                user.id, user.username, user.email, user.first_name, level,
+                user.get_subscription_start_date(level),
+                user.get_days_since_subscription_start(level, now=now)
+            ))
+        return users
+
+    def due_user_ids(self, now):
+        """
+        User, die einen neuen Freischaltungs-Tag erreicht haben (inkrementeller Modus).
+
+        Eine Query über den Index auf next_unlock_at; User ohne Zustand für ihr
+        aktuelles Level (neu, Level-Wechsel, neues Start-Datum) sind immer fällig.
+        """
+        User = self.User
+        UserUnlockState = self.UserUnlockState
+        rows = self.db.session.query(User.id).outerjoin(UserUnlockState, and_(
+            UserUnlockState.user_id == User.id,
+            UserUnlockState.subscription_type == User.subscription_type
+        )).filter(
+            User.is_active.is_(True),
+            or_(UserUnlockState.user_id.is_(None), UserUnlockState.next_unlock_at <= now)
+        )
+        return sorted(row.id for row in rows)
+
+    def existing_unlocks(self, user_range=None, user_ids=None):
+        """Bestehende Freischaltungen als {user_id: {module_id, ...}} (eine Query)"""
+        table = self.UserModuleUnlock.__table__
+        query = table.select().with_only_columns(table.c.user_id, table.c.module_id)
+        if user_range is not None:
+            query = query.where(table.c.user_id >= user_range[0], table.c.user_id < user_range[1])
+        if user_ids is not None:
+            query = query.where(table.c.user_id.in_(user_ids))
+
+        unlocked = defaultdict(set)
+        for row in self.db.session.execute(query):
+            unlocked[row.user_id].add(row.module_id)
+        return unlocked
+
+    def plan(self, now=None, user_range=None, by_level=None, user_ids=None, users=None):
+        """
+        Ermittelt alle fehlenden Freischaltungen.
+
+        Args:
+            user_range: (von, bis) - nur User mit von <= id < bis (ein Shard)
+            by_level: vorberechnete Modul-Listen (sonst aus einer Query)
+            user_ids: nur diese User (fällige User im inkrementellen Modus)
+            users: bereits geladene User-Snapshots (statt active_users())
+
+        Returns:
+            list[PendingUnlock]: nach User und Tag sortiert
+        """
+        now = now or datetime.utcnow()
+        if users is None:
+            users = self.active_users(now, user_range, user_ids)
+        if by_level is None:
+            by_level = self.modules_by_level({user.subscription_level for user in users})
+        unlocked = self.existing_unlocks(user_range, user_ids)
+
+        pending = []
+        for user in users:
+            if user.days_since_start <= 0:
+                continue
+            # unique_user_module_unlock gilt levelübergreifend → alle Freischaltungen des Users zählen
+            existing = unlocked.get(user.id, ())
+            for idx, module in enumerate(by_level[user.subscription_level][:user.days_since_start]):
+                if module.id not in existing:
+                    pending.append(PendingUnlock(user, module, idx + 1))
+        return pending
+
+    def shards(self, user_ids=None):
+        """Shard-Anfänge der (fälligen) aktiven User (feste ID-Bereiche → stabil über Wiederholungen)"""
+        if user_ids is None:
+            User = self.User
+            user_ids = [row.id for row in self.db.session.query(User.id).filter(User.is_active.is_(True))]
+        return sorted({user_id // self.shard_size * self.shard_size for user_id in user_ids})
+
+    # === AUSFÜHRUNG ===
+
+    def run(self, now=None, notify=None, run_key=None, incremental=None):
+        """
+        Schaltet alle fälligen Module frei (Shards parallel).
+
+        Args:
+            now: Referenzzeitpunkt (Standard: jetzt)
+            notify: Optional - notify(user, module, unlock_day) → bool, legt die Email
+                    in die Outbox (ohne Commit; wird mit dem Chunk gespeichert)
+            run_key: Schlüssel für Checkpoints (z.B. Tag des Laufs); None = alle Shards neu
+            incremental: nur fällige User auswerten (Standard: UNLOCK_INCREMENTAL)
+
+        Returns:
+            dict: due_users, users, unlocks, emails, failed, shards, resumed_shards, seconds, rows_per_second
+        """
+        now = now or datetime.utcnow()
+        started = time.monotonic()
+        if incremental is None:
+            incremental = self.incremental
+
+        by_level = self.modules_by_level(self.active_levels())
+        self._refresh_catalog(by_level, now)
+
+        due_ids = self.due_user_ids(now) if incremental else None
+        shards = self.shards(due_ids)
+        done = self._completed_shards(run_key)
+        todo = [shard_start for shard_start in shards if shard_start not in done]
+
+        shard_ids = defaultdict(list)
+        for user_id in due_ids or ():
+            shard_ids[user_id // self.shard_size * self.shard_size].append(user_id)
+
+        totals = {'users': 0, 'unlocks': 0, 'emails': 0, 'failed': 0}
+        workers = max(1, min(self.workers, len(todo)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='unlock-shard') as executor:
+            futures = [executor.submit(self._run_shard, shard_start, now, by_level, notify, run_key,
+                                       shard_ids[shard_start] if incremental else None)
+                       for shard_start in todo]
+            for future in futures:
+                for key, value in future.result().items():
+                    totals[key] += value
+
+        duration = time.monotonic() - started
+        self.last_run = {
+            'at': now.isoformat(),
+            'run_key': run_key,
+            'incremental': incremental,
+            'due_users': len(due_ids) if incremental else None,
+            **totals,
+            'shards': len(shards),
+            'resumed_shards': len(shards) - len(todo),
+            'workers': workers,
+            'seconds': round(duration, 3),
+            'rows_per_second': round(totals['unlocks'] / duration, 1) if duration > 0 else None
+        }
+        logger.info(
+            f"🔓 Bulk-Unlock: {totals['unlocks']} Freischaltungen für {totals['users']} User "
+            f"in {len(todo)}/{len(shards)} Shards, {duration:.2f}s ({self.last_run['rows_per_second']} Zeilen/s)"
+        )
+        return dict(self.last_run)
+
+    def _run_shard(self, shard_start, now, by_level, notify, run_key, user_ids=None):
+        """Ein Shard in eigenem App-Context (= eigene Session); Checkpoint/Zustände nur wenn alles gespeichert"""
+        shard_end = shard_start + self.shard_size
+        pending = []
+        unlocks = 0
+        emails = 0
+        failed = 0
+
+        with self.app.app_context():
+            try:
+                users = self.active_users(now, (shard_start, shard_end), user_ids)
+                pending = self.plan(now, (shard_start, shard_end), by_level, user_ids, users)
+                for offset in range(0, len(pending), self.chunk_size):
+                    chunk = pending[offset:offset + self.chunk_size]
+                    try:
+                        chunk_emails = self._write_chunk(chunk, now, notify)
+                        self.db.session.commit()
+                        unlocks += len(chunk)
+                        emails += chunk_emails
+                    except Exception as e:
+                        logger.error(f"Fehler beim Speichern von {len(chunk)} Freischaltungen (Shard {shard_start}): {e}")
+                        self.db.session.rollback()
+                        failed += len(chunk)
+
+                if not failed:
+                    # Fehlgeschlagene User bleiben fällig (Zustand wird nicht fortgeschrieben)
+                    self._write_states(users, by_level)
+                    if run_key is not None:
+                        self.db.session.add(self.UnlockCheckpoint(
+                            run_key=run_key, shard_start=shard_start, shard_end=shard_end,
+                            unlocks=unlocks, emails=emails, finished_at=datetime.utcnow()
+                        ))
+                    self.db.session.commit()
+            except Exception as e:
+                # Ohne Checkpoint: der nächste Lauf mit gleichem run_key wiederholt den Shard
+                logger.error(f"Fehler in Unlock-Shard {shard_start}-{shard_end}: {e}")
+                self.db.session.rollback()
+                failed += 1
+            finally:
+                self.db.session.remove()
+
+        return {
+            'users': len({unlock.user.id for unlock in pending}) if unlocks else 0,
+            'unlocks': unlocks,
+            'emails': emails,
+            'failed': failed
+        }
+
+    def _write_chunk(self, chunk, now, notify):
+        """Outbox-Emails + ein executemany-INSERT für den Chunk (Commit beim Aufrufer)"""
+        rows = []
+        emails = 0
+        for unlock in chunk:
+            sent = bool(notify and notify(unlock.user, unlock.module, unlock.unlock_day))
+            emails += sent
+            rows.append({
+                'user_id': unlock.user.id,
+                'module_id': unlock.module.id,
+                'unlock_day': unlock.unlock_day,
+                'subscription_level': unlock.user.subscription_level,
+                'unlocked_at': now,
+                'notification_sent': sent,
+                'notification_sent_at': now if sent else None
+            })
+        self.db.session.execute(self.UserModuleUnlock.__table__.insert(), rows)
+        return emails
+
+    def _write_states(self, users, by_level):
+        """
+        Schreibt last_unlock_day/next_unlock_at der ausgewerteten User (Bulk-Upsert).
+
+        next_unlock_at ist der Zeitpunkt, an dem der nächste Tag erreicht wird;
+        None wenn alle Module des Levels freigeschaltet sind oder kein Start-Datum existiert.
+        """
+        if not users:
+            return
+        table = self.UserUnlockState.__table__
+        levels = table.c.subscription_type.type.enum_class
+
+        existing = {
+            (row.user_id, row.subscription_type.value)
+            for row in self.db.session.execute(
+                table.select().with_only_columns(table.c.user_id, table.c.subscription_type)
+                .where(table.c.user_id.in_([user.id for user in users]))
+            )
+        }
+
+        updates = []
+        inserts = []
+        for user in users:
+            module_count = len(by_level.get(user.subscription_level, ()))
+            last_day = min(user.days_since_start, module_count)
+            next_unlock_at = None
+            if user.started_at is not None and last_day < module_count:
+                next_unlock_at = user.started_at + timedelta(days=last_day)
+
+            values = {'level': levels(user.subscription_level), 'last_day': last_day, 'next_at': next_unlock_at}
+            if (user.id, user.subscription_level) in existing:
+                updates.append({'state_user_id': user.id, **values})
+            else:
+                inserts.append({'user_id': user.id, 'subscription_type': values['level'],
+                                'last_unlock_day': last_day, 'next_unlock_at': next_unlock_at})
+
+        if updates:
+            self.db.session.execute(
+                table.update().where(table.c.user_id == bindparam('state_user_id'),
+                                     table.c.subscription_type == bindparam('level'))
+                .values(last_unlock_day=bindparam('last_day'), next_unlock_at=bindparam('next_at')),
+                updates
+            )
+        if inserts:
+            self.db.session.execute(table.insert(), inserts)
+
+    def _refresh_catalog(self, by_level, now):
+        """Neue/umsortierte Module eines Levels → alle User des Levels einmal neu bewerten"""
+        AppState = self.AppState
+        stored = json.loads(AppState.get_value(CATALOG_STATE_KEY) or '{}')
+        table = self.UserUnlockState.__table__
+        levels = table.c.subscription_type.type.enum_class
+
+        changed = []
+        for level, modules in by_level.items():
+            signature = hashlib.sha256(','.join(str(module.id) for module in modules).encode()).hexdigest()[:16]
+            if stored.get(level) != signature:
+                stored[level] = signature
+                changed.append(level)
+
+        if not changed:
+            return
+        self.db.session.execute(
+            table.update().where(table.c.subscription_type.in_([levels(level) for level in changed]))
+            .values(next_unlock_at=now)
+        )
+        AppState.set_value(CATALOG_STATE_KEY, json.dumps(stored, sort_keys=True))
+        self.db.session.commit()
+        logger.info(f"🔓 Modul-Katalog geändert für {', '.join(sorted(changed))} - User werden neu bewertet")
+
+    def _completed_shards(self, run_key):
+        """Fertige Shards dieses Laufs; Checkpoints älterer Läufe werden aufgeräumt"""
+        if run_key is None:
+            return set()
+        UnlockCheckpoint = self.UnlockCheckpoint
+        UnlockCheckpoint.query.filter(UnlockCheckpoint.run_key != run_key).delete(synchronize_session=False)
+        self.db.session.commit()
+        return {row.shard_start for row in self.db.session.query(UnlockCheckpoint.shard_start).filter_by(run_key=run_key)}
+
+    def stats(self):
+        """Letzter Lauf für Monitoring"""
+        return {
+            'chunk_size': self.chunk_size,
+            'shard_size': self.shard_size,
+            'workers': self.workers,
+            'incremental': self.incremental,
+            'last_run': self.last_run
+        }
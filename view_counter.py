@@ -0,0 +1,223 @@
+# view_counter.py - Write-Behind-Zähler für Modul-Aufrufe
+"""
+Gepufferte Zähler für Modul-Views und Lernfortschritt:
+- Jeder Modul-Aufruf erhöht nur einen In-Memory-Zähler (kein Commit im Request)
+- Pro (User, Modul) wird nur der letzte Zugriffszeitpunkt gemerkt
+- Ein Hintergrund-Thread schreibt periodisch gesammelt:
+  * ein UPDATE ... SET view_count = view_count + n pro Modul (executemany)
+  * einen Bulk-Upsert für ModuleProgress.last_accessed
+- Beliebte Lead-Magnete blockieren sich so nicht mehr gegenseitig auf einer Zeile
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import bindparam, func
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """Aggregiert View-Inkremente und last_accessed-Zeitpunkte und schreibt sie gebündelt"""
+
+    def __init__(self, app=None, db=None, LearningModule=None, ModuleProgress=None, flush_interval=10.0):
+        self.flush_interval = flush_interval
+        self.enabled = True
+
+        self.app = None
+        self.db = None
+        self.LearningModule = None
+        self.ModuleProgress = None
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._views = Counter()   # module_id → Anzahl neuer Views
+        self._accessed = {}       # (user_id, module_id) → letzter Zugriff
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._pid = None
+
+        # Zähler für Monitoring
+        self.recorded = 0
+        self.flushed_views = 0
+        self.flushed_progress = 0
+        self.failed = 0
+        self.flushes = 0
+        self.last_flush_at = None
+
+        if app is not None:
+            self.init_app(app, db, LearningModule, ModuleProgress)
+
+    def init_app(self, app, db, LearningModule, ModuleProgress):
+        """Konfiguriert den Zähler aus app.config und registriert den Shutdown-Flush"""
+        self.app = app
+        self.db = db
+        self.LearningModule = LearningModule
+        self.ModuleProgress = ModuleProgress
+
+        self.enabled = app.config.get('VIEW_COUNTER_ASYNC', True)
+        self.flush_interval = app.config.get('VIEW_COUNTER_FLUSH_INTERVAL', self.flush_interval)
+
+        atexit.register(self.shutdown)
+
+    # === REQUEST-SEITE ===
+
+    def record(self, module_id, user_id=None):
+        """
+        Merkt einen Modul-Aufruf vor.
+
+        Args:
+            module_id: ID des LearningModule
+            user_id: Session-User-ID (None = nur View zählen, kein Fortschritt)
+        """
+        now = datetime.utcnow()
+        with self._lock:
+            self._views[module_id] += 1
+            if user_id is not None:
+                self._accessed[(str(user_id), module_id)] = now
+            self.recorded += 1
+
+        if not self.enabled:
+            self.flush()
+            return
+
+        self._ensure_worker()
+
+    # === HINTERGRUND-FLUSH ===
+
+    def _ensure_worker(self):
+        """Startet den Flush-Thread lazy - auch nach einem Gunicorn-Fork neu"""
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+
+            self._pid = os.getpid()
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='view-counter')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def _take_pending(self):
+        """Übernimmt die gesammelten Zähler und setzt den Puffer zurück"""
+        with self._lock:
+            views, self._views = self._views, Counter()
+            accessed, self._accessed = self._accessed, {}
+        return views, accessed
+
+    def flush(self):
+        """Schreibt alle gesammelten Zähler in einer Transaktion"""
+        with self._flush_lock:
+            views, accessed = self._take_pending()
+            if not views and not accessed:
+                return
+
+            with self.app.app_context():
+                try:
+                    self._write_views(views)
+                    self._write_progress(accessed)
+                    self.db.session.commit()
+                    with self._lock:
+                        self.flushed_views += sum(views.values())
+                        self.flushed_progress += len(accessed)
+                        self.flushes += 1
+                        self.last_flush_at = time.time()
+                except Exception as e:
+                    # Zähler sind Statistik - bei Fehlern verwerfen statt die App zu blockieren
+                    logger.error(f"View-Counter Flush Fehler ({len(views)} Module, {len(accessed)} Fortschritte): {e}")
+                    self.db.session.rollback()
+                    with self._lock:
+                        self.failed += sum(views.values())
+                finally:
+                    self.db.session.remove()
+
+    def _write_views(self, views):
+        """Ein atomares Inkrement pro Modul (UPDATE ... SET view_count = view_count + n)"""
+        if not views:
+            return
+        table = self.LearningModule.__table__
+        statement = table.update().where(table.c.id == bindparam('module_id')).values(
+            view_count=func.coalesce(table.c.view_count, 0) + bindparam('increment')
+        )
+        # Modul-IDs sortiert → gleiche Lock-Reihenfolge in allen Workern (keine Deadlocks)
+        self.db.session.execute(statement, [
+            {'module_id': module_id, 'increment': increment}
+            for module_id, increment in sorted(views.items())
+        ])
+
+    def _write_progress(self, accessed):
+        """Bulk-Upsert: bestehende Fortschritte aktualisieren, fehlende anlegen"""
+        if not accessed:
+            return
+        table = self.ModuleProgress.__table__
+
+        user_ids = {user_id for user_id, _ in accessed}
+        module_ids = {module_id for _, module_id in accessed}
+        existing = {}
+        for row in self.db.session.execute(
+            table.select().with_only_columns(table.c.id, table.c.user_id, table.c.module_id)
+            .where(table.c.user_id.in_(user_ids), table.c.module_id.in_(module_ids))
+        ):
+            existing.setdefault((row.user_id, row.module_id), row.id)
+
+        updates = []
+        inserts = []
+        for key, accessed_at in sorted(accessed.items()):
+            progress_id = existing.get(key)
+            if progress_id is not None:
+                updates.append({'progress_id': progress_id, 'accessed_at': accessed_at})
+            else:
+                inserts.append({
+                    'user_id': key[0],
+                    'module_id': key[1],
+                    'progress_percentage': 0,
+                    'started_at': accessed_at,
+                    'last_accessed': accessed_at
+                })
+
+        if updates:
+            self.db.session.execute(
+                table.update().where(table.c.id == bindparam('progress_id'))
+                .values(last_accessed=bindparam('accessed_at')),
+                updates
+            )
+        if inserts:
+            self.db.session.execute(table.insert(), inserts)
+
+    # === STEUERUNG & MONITORING ===
+
+    def shutdown(self, timeout=5.0):
+        """Stoppt den Flush-Thread und schreibt verbleibende Zähler (atexit)"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and self._pid == os.getpid():
+            thread.join(timeout)
+        self.flush()
+
+    def stats(self):
+        """Zähler für Monitoring/Admin-Dashboard"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'flush_interval': self.flush_interval,
+                'pending_modules': len(self._views),
+                'pending_views': sum(self._views.values()),
+                'pending_progress': len(self._accessed),
+                'recorded': self.recorded,
+                'flushed_views': self.flushed_views,
+                'flushed_progress': self.flushed_progress,
+                'failed': self.failed,
+                'flushes': self.flushes,
+                'last_flush_at': self.last_flush_at
+            }